@@ -0,0 +1,115 @@
+"""Serialization of task request/response payloads stored in S3.
+
+Task payloads (``request.json`` / ``response.json``) carry full word-level
+transcripts and diarization turns and are read again by later stages and
+by the gateway. Two encodings are supported:
+
+- ``json``: compact JSON without indentation (default).
+- ``msgpack-zstd``: MessagePack compressed with zstd. Needs the optional
+  ``msgpack`` and ``zstandard`` packages (``pip install dalston[compact-payloads]``).
+
+Writers pick the encoding from ``DALSTON_TASK_PAYLOAD_FORMAT`` and store its
+content type on the object. Object keys keep their ``.json`` names so that
+every key builder and reader keeps working. Readers choose the decoder from
+the content type when they have it and otherwise from the zstd frame magic,
+so objects written before this module existed (indented JSON) still decode.
+
+Switch writers to ``msgpack-zstd`` only once every reader (orchestrator,
+engines, gateway) runs a version that can decode it.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from enum import StrEnum
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_ZSTD_CONTENT_TYPE = "application/vnd.dalston.msgpack+zstd"
+
+# Every zstd frame starts with this magic number (RFC 8878, section 3.1.1).
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+
+
+class PayloadFormat(StrEnum):
+    """Encoding used when writing task payloads."""
+
+    JSON = "json"
+    MSGPACK_ZSTD = "msgpack-zstd"
+
+
+@functools.lru_cache(maxsize=1)
+def get_payload_format() -> PayloadFormat:
+    """Write format from DALSTON_TASK_PAYLOAD_FORMAT (default: json).
+
+    Unknown values, or ``msgpack-zstd`` without its packages installed,
+    fall back to JSON with a warning. Read once per process.
+    """
+    raw = os.environ.get("DALSTON_TASK_PAYLOAD_FORMAT", PayloadFormat.JSON)
+    try:
+        payload_format = PayloadFormat(raw.strip().lower())
+    except ValueError:
+        logger.warning("unknown_task_payload_format", value=raw, fallback="json")
+        return PayloadFormat.JSON
+    if payload_format is PayloadFormat.MSGPACK_ZSTD and not _msgpack_zstd_available():
+        logger.warning(
+            "task_payload_format_unavailable",
+            value=raw,
+            fallback="json",
+            hint="pip install dalston[compact-payloads]",
+        )
+        return PayloadFormat.JSON
+    return payload_format
+
+
+def encode_payload(
+    data: Any, payload_format: PayloadFormat | None = None
+) -> tuple[bytes, str]:
+    """Serialize ``data``; returns the body and its content type.
+
+    Values that are not natively serializable are written as ``str(value)``.
+    """
+    if payload_format is None:
+        payload_format = get_payload_format()
+    if payload_format is PayloadFormat.MSGPACK_ZSTD:
+        import msgpack
+        import zstandard
+
+        packed = msgpack.packb(data, default=str, use_bin_type=True)
+        body = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(packed)
+        return body, MSGPACK_ZSTD_CONTENT_TYPE
+    body = json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+    return body, JSON_CONTENT_TYPE
+
+
+def decode_payload(body: bytes, content_type: str | None = None) -> Any:
+    """Deserialize a payload written by :func:`encode_payload` or as JSON."""
+    if content_type == MSGPACK_ZSTD_CONTENT_TYPE or body[:4] == _ZSTD_MAGIC:
+        try:
+            import msgpack
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError(
+                "Task payload is msgpack+zstd encoded but msgpack/zstandard are "
+                "not installed. Install dalston[compact-payloads]."
+            ) from exc
+
+        packed = zstandard.ZstdDecompressor().decompress(body)
+        return msgpack.unpackb(packed, raw=False, strict_map_key=False)
+    return json.loads(body)
+
+
+def _msgpack_zstd_available() -> bool:
+    try:
+        import msgpack  # noqa: F401
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
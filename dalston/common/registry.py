@@ -17,6 +17,7 @@ Heartbeats refresh TTL. Missing key triggers re-registration from stored info.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
     from dalston.engine_sdk.types import EngineCapabilities
 
 from dalston.common.pipeline_types import VocabularySupport
+from dalston.common.streams_types import CONSUMER_GROUP, STREAM_PREFIX
 
 logger = structlog.get_logger()
 
@@ -109,6 +111,9 @@ class EngineRecord:
         capabilities: Full engine capabilities from engine.yaml
         loaded_model: Currently loaded model ID (batch engines, M36)
         execution_profile: Execution profile (container, lite, etc.)
+        rtf_ewma: Rolling mean observed real-time factor of batch tasks
+            (seconds from dequeue to completion per second of audio; None
+            until the first task with a known audio duration finishes)
     """
 
     instance: str
@@ -139,6 +144,7 @@ class EngineRecord:
     deploy_env: str = "local"
     aws_az: str | None = None
     aws_instance_type: str | None = None
+    rtf_ewma: float | None = None
 
     @property
     def available_capacity(self) -> int:
@@ -223,6 +229,8 @@ def _record_to_mapping(record: EngineRecord) -> dict[str, str]:
         mapping["loaded_model"] = record.loaded_model
     if record.vocabulary_support is not None:
         mapping["vocabulary_support"] = record.vocabulary_support.model_dump_json()
+    if record.rtf_ewma is not None:
+        mapping["rtf_ewma"] = str(record.rtf_ewma)
     if record.schema_version is not None:
         mapping["schema_version"] = record.schema_version
 
@@ -265,6 +273,11 @@ def _mapping_to_record(instance: str, data: dict[str, str]) -> EngineRecord | No
     except (ValueError, TypeError):
         active_realtime = 0
 
+    try:
+        rtf_ewma = float(data["rtf_ewma"])
+    except (KeyError, ValueError, TypeError):
+        rtf_ewma = None
+
     # Parse JSON list fields
     models_loaded = _parse_json_list(data.get("models_loaded"))
 
@@ -324,6 +337,7 @@ def _mapping_to_record(instance: str, data: dict[str, str]) -> EngineRecord | No
         deploy_env=data.get("deploy_env", "local"),
         aws_az=data.get("aws_az"),
         aws_instance_type=data.get("aws_instance_type"),
+        rtf_ewma=rtf_ewma,
     )
 
 
@@ -416,6 +430,7 @@ class UnifiedEngineRegistry:
         hostname: str | None = None,
         node_id: str | None = None,
         deploy_env: str | None = None,
+        rtf_ewma: float | None = None,
     ) -> None:
         """Update heartbeat and dynamic fields.
 
@@ -475,6 +490,8 @@ class UnifiedEngineRegistry:
             mapping["node_id"] = node_id
         if deploy_env is not None:
             mapping["deploy_env"] = deploy_env
+        if rtf_ewma is not None:
+            mapping["rtf_ewma"] = str(rtf_ewma)
 
         await self._redis.hset(instance_key, mapping=mapping)
         await self._redis.expire(instance_key, HEARTBEAT_TTL)
@@ -612,6 +629,40 @@ class UnifiedEngineRegistry:
 
         return available
 
+    async def get_queue_depths(self, engine_ids: Iterable[str]) -> dict[str, int]:
+        """Batch tasks queued or in flight on each engine_id's stream.
+
+        Counts undelivered messages (consumer group lag) plus delivered but
+        unacknowledged ones. Engines without a stream or group report 0.
+        """
+        engine_ids = list(dict.fromkeys(engine_ids))
+        if not engine_ids:
+            return {}
+        pipe = self._redis.pipeline(transaction=False)
+        for engine_id in engine_ids:
+            pipe.xinfo_groups(f"{STREAM_PREFIX}{engine_id}")
+        results = await pipe.execute(raise_on_error=False)
+
+        depths: dict[str, int] = {}
+        for engine_id, groups in zip(engine_ids, results, strict=True):
+            depths[engine_id] = 0
+            if isinstance(groups, Exception):
+                continue
+            for group in groups:
+                name = group.get("name")
+                if isinstance(name, bytes):
+                    name = name.decode()
+                if name != CONSUMER_GROUP:
+                    continue
+                depth = 0
+                for field in ("lag", "pending"):
+                    try:
+                        depth += max(0, int(group.get(field) or 0))
+                    except (TypeError, ValueError):
+                        pass
+                depths[engine_id] = depth
+        return depths
+
     async def get_engine(self, engine_id: str) -> EngineRecord | None:
         """Get first available instance for a engine_id (compat with batch registry)."""
         instances = await self.get_by_engine_id(engine_id)
@@ -687,6 +738,7 @@ class UnifiedRegistryWriter:
         hostname: str | None = None,
         node_id: str | None = None,
         deploy_env: str | None = None,
+        rtf_ewma: float | None = None,
     ) -> None:
         """Update heartbeat (sync).
 
@@ -739,6 +791,8 @@ class UnifiedRegistryWriter:
             mapping["node_id"] = node_id
         if deploy_env is not None:
             mapping["deploy_env"] = deploy_env
+        if rtf_ewma is not None:
+            mapping["rtf_ewma"] = str(rtf_ewma)
 
         r.hset(instance_key, mapping=mapping)
         r.expire(instance_key, HEARTBEAT_TTL)
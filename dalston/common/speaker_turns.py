@@ -0,0 +1,131 @@
+"""Sorted index over diarization turns for speaker-assignment lookups.
+
+Transcript assembly asks "which turns overlap [start, end)?" and "which
+turn is nearest to t?" once per word, window and segment. Scanning every
+turn for each query is O(words x turns), which dominates assembly on
+multi-hour recordings with thousands of turns.
+
+``SpeakerTurnIndex`` sorts turns by start once and keeps a running maximum
+of their ends, so both queries become two bisects plus a walk over the
+turns that can actually match. Diarization turns are close to disjoint, so
+that walk is a handful of turns; a single turn spanning much of the
+recording widens it for queries after its start, degrading towards a
+linear scan but never below it.
+
+Results match a linear scan over the original list, including ties:
+whenever several turns qualify equally, the one earliest in the input
+list wins.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from dalston.common.pipeline_types import SpeakerTurn
+
+
+class SpeakerTurnIndex:
+    """Immutable sorted view of speaker turns with bisect-based queries."""
+
+    __slots__ = ("turns", "_order", "_starts", "_ends", "_max_end", "_max_end_pos")
+
+    def __init__(self, turns: Sequence[SpeakerTurn]) -> None:
+        self.turns = list(turns)
+        # Sorting by (start, input position) makes the first of equal
+        # starts the earliest in the input, which tie-breaking relies on.
+        self._order = sorted(
+            range(len(self.turns)), key=lambda i: (self.turns[i].start, i)
+        )
+        self._starts = [self.turns[i].start for i in self._order]
+        self._ends = [self.turns[i].end for i in self._order]
+
+        # _max_end[p] = max end over sorted positions 0..p, and
+        # _max_end_pos[p] the position holding it (earliest input on ties).
+        self._max_end: list[float] = []
+        self._max_end_pos: list[int] = []
+        best_end = float("-inf")
+        best_pos = -1
+        for pos, end in enumerate(self._ends):
+            if end > best_end or (
+                end == best_end and self._order[pos] < self._order[best_pos]
+            ):
+                best_end, best_pos = end, pos
+            self._max_end.append(best_end)
+            self._max_end_pos.append(best_pos)
+
+    @classmethod
+    def of(cls, turns: Sequence[SpeakerTurn] | SpeakerTurnIndex) -> SpeakerTurnIndex:
+        """Return ``turns`` if already indexed, else index it."""
+        if isinstance(turns, SpeakerTurnIndex):
+            return turns
+        return cls(turns)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def __bool__(self) -> bool:
+        return bool(self.turns)
+
+    def overlapping(self, start: float, end: float) -> list[SpeakerTurn]:
+        """Turns with positive overlap with ``[start, end]``, in input order."""
+        return [self.turns[i] for i in sorted(self._overlap_candidates(start, end))]
+
+    def best_overlap_speaker(self, start: float, end: float) -> str | None:
+        """Speaker of the single turn overlapping ``[start, end]`` the most."""
+        best_idx = -1
+        best_overlap = 0.0
+        for idx in self._overlap_candidates(start, end):
+            turn = self.turns[idx]
+            overlap = min(end, turn.end) - max(start, turn.start)
+            if overlap > best_overlap or (overlap == best_overlap and idx < best_idx):
+                best_overlap, best_idx = overlap, idx
+        return self.turns[best_idx].speaker if best_idx >= 0 else None
+
+    def containing_speaker(self, at_time: float) -> str | None:
+        """Speaker of the turn whose ``[start, end]`` contains ``at_time``."""
+        idx = self._first_containing(at_time)
+        return self.turns[idx].speaker if idx is not None else None
+
+    def nearest_speaker(self, at_time: float) -> str | None:
+        """Speaker of the turn containing ``at_time``, else the closest one."""
+        if not self.turns:
+            return None
+        idx = self._first_containing(at_time)
+        if idx is not None:
+            return self.turns[idx].speaker
+
+        # Nothing contains at_time, so every turn starting at or before it
+        # ends before it: the closest on the left has the largest end, the
+        # closest on the right the smallest start.
+        hi = bisect_right(self._starts, at_time)
+        best_idx = -1
+        best_distance = float("inf")
+        if hi > 0:
+            best_distance = at_time - self._max_end[hi - 1]
+            best_idx = self._order[self._max_end_pos[hi - 1]]
+        if hi < len(self._starts):
+            distance = self._starts[hi] - at_time
+            right_idx = self._order[hi]
+            if distance < best_distance or (
+                distance == best_distance and right_idx < best_idx
+            ):
+                best_idx = right_idx
+        return self.turns[best_idx].speaker
+
+    def _first_containing(self, at_time: float) -> int | None:
+        hi = bisect_right(self._starts, at_time)
+        lo = bisect_left(self._max_end, at_time, hi=hi)
+        found: int | None = None
+        for pos in range(lo, hi):
+            if self._ends[pos] >= at_time:
+                idx = self._order[pos]
+                if found is None or idx < found:
+                    found = idx
+        return found
+
+    def _overlap_candidates(self, start: float, end: float) -> list[int]:
+        # Positive overlap needs turn.start < end and turn.end > start.
+        hi = bisect_left(self._starts, end)
+        lo = bisect_right(self._max_end, start, hi=hi)
+        return [self._order[pos] for pos in range(lo, hi) if self._ends[pos] > start]
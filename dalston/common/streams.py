@@ -98,16 +98,7 @@ async def add_task(
     # Ensure consumer group exists before adding
     await ensure_stream_group(redis, stage)
 
-    now = datetime.now(UTC)
-    timeout_at = datetime.fromtimestamp(now.timestamp() + timeout_s, tz=UTC)
-
-    fields = {
-        "task_id": task_id,
-        "job_id": job_id,
-        "enqueued_at": now.isoformat(),
-        "timeout_at": timeout_at.isoformat(),
-    }
-
+    fields = _task_fields(task_id, job_id, timeout_s)
     message_id = await redis.xadd(stream_key, fields)  # type: ignore[arg-type]
 
     logger.debug(
@@ -120,6 +111,40 @@ async def add_task(
     return message_id
 
 
+def add_task_to_pipeline(
+    pipe: Any,
+    stage: str,
+    task_id: str,
+    job_id: str,
+    timeout_s: int,
+) -> None:
+    """Queue an XADD for a task on a Redis pipeline.
+
+    Same stream entry as :func:`add_task`; the message ID is in the
+    pipeline's ``execute()`` results. The caller must have run
+    :func:`ensure_stream_group` for the stage.
+
+    Args:
+        pipe: Async Redis pipeline
+        stage: Pipeline stage name
+        task_id: Task UUID string
+        job_id: Job UUID string
+        timeout_s: Task timeout in seconds
+    """
+    pipe.xadd(_stream_key(stage), _task_fields(task_id, job_id, timeout_s))
+
+
+def _task_fields(task_id: str, job_id: str, timeout_s: int) -> dict[str, str]:
+    now = datetime.now(UTC)
+    timeout_at = datetime.fromtimestamp(now.timestamp() + timeout_s, tz=UTC)
+    return {
+        "task_id": task_id,
+        "job_id": job_id,
+        "enqueued_at": now.isoformat(),
+        "timeout_at": timeout_at.isoformat(),
+    }
+
+
 async def add_task_once(
     redis: Redis,
     stage: str,
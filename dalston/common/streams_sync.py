@@ -9,6 +9,7 @@ Consumer group: "engines"
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 
 import redis
@@ -120,6 +121,7 @@ def read_own_pending(
     r: redis.Redis,
     stage: str,
     consumer: str,
+    exclude: Collection[str] = (),
 ) -> StreamMessage | None:
     """Read this consumer's own pending (unACKed) messages.
 
@@ -132,6 +134,8 @@ def read_own_pending(
         r: Sync Redis client
         stage: Pipeline stage name
         consumer: Consumer ID
+        exclude: Message IDs to skip. Concurrent runners pass the IDs
+            they are still processing, which are also unACKed.
 
     Returns:
         StreamMessage if a pending task exists, None otherwise
@@ -143,7 +147,7 @@ def read_own_pending(
             CONSUMER_GROUP,
             consumer,
             {stream_key: "0"},
-            count=1,
+            count=len(exclude) + 1,
         )
     except ResponseError as e:
         if "NOGROUP" in str(e):
@@ -158,6 +162,8 @@ def read_own_pending(
             if not fields:
                 # Empty fields = message already ACKed but still in history
                 continue
+            if msg_id in exclude:
+                continue
             return _parse_message(msg_id, fields, delivery_count=2)
 
     return None
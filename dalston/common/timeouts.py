@@ -11,6 +11,7 @@ consistency and make configuration changes easier.
 
 SYNC_OPERATION_TIMEOUT_SECONDS = 300  # 5 minutes - max wait for sync transcription
 SYNC_POLL_INTERVAL_SECONDS = 1.0  # interval between DB polls during sync wait
+SYNC_NOTIFY_FALLBACK_POLL_SECONDS = 10.0  # DB poll backstop when event-driven
 
 # =============================================================================
 # WebSocket Connection Timeouts
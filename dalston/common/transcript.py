@@ -27,6 +27,8 @@ from dalston.common.pipeline_types import (
     TranscriptSegment,
     Word,
 )
+from dalston.common.speaker_turns import SpeakerTurnIndex
+from dalston.common.word_columns import expand_transcript_words
 
 logger = structlog.get_logger()
 
@@ -626,7 +628,7 @@ def _extract_transcribe_data(
 
 def _parse_transcript(data: dict[str, Any]) -> Transcript:
     """Parse transcribe data into a Transcript. Raises on invalid data."""
-    return Transcript.model_validate(data)
+    return Transcript.model_validate(expand_transcript_words(data))
 
 
 def _try_parse_align(data: dict[str, Any]) -> AlignmentResponse | None:
@@ -848,30 +850,15 @@ def _merge_adjacent_turns(turns: list[SpeakerTurn]) -> list[SpeakerTurn]:
 def _find_speaker_by_overlap(
     seg_start: float,
     seg_end: float,
-    turns: list[SpeakerTurn],
+    turns: list[SpeakerTurn] | SpeakerTurnIndex,
 ) -> str | None:
     """Find the speaker with maximum overlap for a segment time range.
 
     This is the same overlap-matching logic previously in the merge engine.
-
-    Complexity is O(segments * turns). For very long recordings with many
-    diarization turns, an interval tree (e.g. ``intervaltree``) would
-    reduce per-segment lookup to O(log n + k). Not needed at current
-    workload sizes.
+    Pass a :class:`SpeakerTurnIndex` when querying the same turns
+    repeatedly; a plain list is indexed on every call.
     """
-    best_speaker = None
-    best_overlap = 0.0
-
-    for turn in turns:
-        overlap_start = max(seg_start, turn.start)
-        overlap_end = min(seg_end, turn.end)
-        overlap = max(0.0, overlap_end - overlap_start)
-
-        if overlap > best_overlap:
-            best_overlap = overlap
-            best_speaker = turn.speaker
-
-    return best_speaker
+    return SpeakerTurnIndex.of(turns).best_overlap_speaker(seg_start, seg_end)
 
 
 def _normalize_words(words: list) -> list[Word]:
@@ -918,16 +905,15 @@ def _normalize_transcript_words(words: list) -> list[Word]:
 def _build_speaker_windows(
     seg_start: float,
     seg_end: float,
-    turns: list[SpeakerTurn],
+    turns: list[SpeakerTurn] | SpeakerTurnIndex,
 ) -> list[tuple[float, float, str | None]]:
     """Build non-overlapping windows across a segment using diarization boundaries."""
     if seg_end <= seg_start:
         return []
 
+    index = SpeakerTurnIndex.of(turns)
     boundaries = {seg_start, seg_end}
-    for turn in turns:
-        if turn.end <= seg_start or turn.start >= seg_end:
-            continue
+    for turn in index.overlapping(seg_start, seg_end):
         boundaries.add(max(seg_start, turn.start))
         boundaries.add(min(seg_end, turn.end))
 
@@ -938,7 +924,7 @@ def _build_speaker_windows(
         win_end = ordered[idx + 1]
         if win_end <= win_start:
             continue
-        speaker = _find_speaker_by_overlap(win_start, win_end, turns)
+        speaker = index.best_overlap_speaker(win_start, win_end)
         if windows and windows[-1][2] == speaker:
             prev_start, _, prev_speaker = windows[-1]
             windows[-1] = (prev_start, win_end, prev_speaker)
@@ -948,23 +934,11 @@ def _build_speaker_windows(
     return windows
 
 
-def _find_nearest_turn_speaker(at_time: float, turns: list[SpeakerTurn]) -> str | None:
+def _find_nearest_turn_speaker(
+    at_time: float, turns: list[SpeakerTurn] | SpeakerTurnIndex
+) -> str | None:
     """Find nearest speaker turn to a timestamp."""
-    nearest_speaker: str | None = None
-    nearest_distance: float | None = None
-
-    for turn in turns:
-        if turn.start <= at_time <= turn.end:
-            return turn.speaker
-        if at_time < turn.start:
-            distance = turn.start - at_time
-        else:
-            distance = at_time - turn.end
-        if nearest_distance is None or distance < nearest_distance:
-            nearest_distance = distance
-            nearest_speaker = turn.speaker
-
-    return nearest_speaker
+    return SpeakerTurnIndex.of(turns).nearest_speaker(at_time)
 
 
 def _is_sentence_ending(text: str) -> bool:
@@ -973,15 +947,16 @@ def _is_sentence_ending(text: str) -> bool:
     return stripped.endswith((".", "!", "?"))
 
 
-def _find_start_turn_speaker(word_start: float, turns: list[SpeakerTurn]) -> str | None:
+def _find_start_turn_speaker(
+    word_start: float, turns: list[SpeakerTurn] | SpeakerTurnIndex
+) -> str | None:
     """Find the speaker whose turn contains the word's start time."""
-    for turn in turns:
-        if turn.start <= word_start <= turn.end:
-            return turn.speaker
-    return None
+    return SpeakerTurnIndex.of(turns).containing_speaker(word_start)
 
 
-def _assign_speaker_to_word(word: Word, turns: list[SpeakerTurn]) -> str | None:
+def _assign_speaker_to_word(
+    word: Word, turns: list[SpeakerTurn] | SpeakerTurnIndex
+) -> str | None:
     """Assign speaker to a word using overlap, then nearest-turn fallback.
 
     For sentence-ending words (trailing ``.``, ``!``, ``?``), the speaker
@@ -996,34 +971,38 @@ def _assign_speaker_to_word(word: Word, turns: list[SpeakerTurn]) -> str | None:
     if word.end < word.start:
         return None
 
+    index = SpeakerTurnIndex.of(turns)
+
     # Zero-duration words are common at segment tails; treat as point assignments.
     if word.end == word.start:
-        return _find_nearest_turn_speaker(word.start, turns)
+        return index.nearest_speaker(word.start)
 
     # Sentence-ending words: prefer the speaker whose turn contains the
     # word onset.  The trailing acoustic energy (release, silence) often
     # bleeds past the diarization boundary, making pure overlap unreliable.
     if _is_sentence_ending(word.text):
-        start_speaker = _find_start_turn_speaker(word.start, turns)
+        start_speaker = index.containing_speaker(word.start)
         if start_speaker is not None:
             return start_speaker
 
-    speaker = _find_speaker_by_overlap(word.start, word.end, turns)
+    speaker = index.best_overlap_speaker(word.start, word.end)
     if speaker is not None:
         return speaker
 
     midpoint = (word.start + word.end) / 2.0
-    return _find_nearest_turn_speaker(midpoint, turns)
+    return index.nearest_speaker(midpoint)
 
 
 def _split_words_by_speaker(
     words: list[Word],
-    turns: list[SpeakerTurn],
+    turns: list[SpeakerTurn] | SpeakerTurnIndex,
 ) -> list[dict[str, Any]]:
     """Split words into contiguous runs by assigned speaker."""
     if not words:
         return []
 
+    turns = SpeakerTurnIndex.of(turns)
+
     sorted_words = sorted(words, key=lambda w: (w.start, w.end))
     split_parts: list[dict[str, Any]] = []
 
@@ -1175,9 +1154,10 @@ def _split_segment_by_diarization(
     seg_end: float,
     seg_text: str,
     words: list[Word] | None,
-    diarization_turns: list[SpeakerTurn],
+    diarization_turns: list[SpeakerTurn] | SpeakerTurnIndex,
 ) -> list[dict[str, Any]]:
     """Split one transcript segment by diarization speaker windows."""
+    diarization_turns = SpeakerTurnIndex.of(diarization_turns)
     if not diarization_turns:
         return [
             {
@@ -1273,6 +1253,7 @@ def _build_merged_segments(
 ) -> list[MergedSegment]:
     """Build MergedSegment list with IDs and speaker assignments."""
     segments: list[MergedSegment] = []
+    turn_index = SpeakerTurnIndex(diarization_turns)
 
     for seg in segments_source:
         seg_words: Any = None
@@ -1321,7 +1302,7 @@ def _build_merged_segments(
             seg_end=seg_end,
             seg_text=seg_text,
             words=normalized_words,
-            diarization_turns=diarization_turns,
+            diarization_turns=turn_index,
         )
 
         for part in split_parts:
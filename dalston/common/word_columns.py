@@ -0,0 +1,233 @@
+"""Columnar encoding for transcript words.
+
+A transcribe response stores every word as its own JSON object. For a
+multi-hour recording that is tens of thousands of dicts repeating the same
+keys. Response bodies run to several MB and parse into as many dicts.
+
+``WordColumns`` keeps the same words as parallel columns: start, end and
+confidence as float arrays, and text, alignment method and language as
+indexes into one shared string table. Rarely-present fields (characters,
+phonemes, metadata) stay sparse, keyed by word position.
+
+A transcribe response can carry its words in this form instead of per
+segment. ``encode_transcript_words`` moves all words into one top-level
+``word_columns`` block and gives each segment a ``word_range`` into it.
+``expand_transcript_words`` restores the plain form for readers that expect
+it.
+
+Words are still validated once when read. With pydantic-core, validating a
+plain dict measured faster than ``model_construct`` (about 2us against 4us
+per word), so there is no unvalidated shortcut; the savings are in payload
+size and in the memory taken by the parsed JSON.
+
+Times are kept as float64 rather than float32 so that timestamps round-trip
+exactly; float32 loses millisecond precision after about 2.3 hours.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from dalston.common.pipeline_types import TranscriptWord, Word
+
+WORD_COLUMNS_KEY = "word_columns"
+WORD_RANGE_KEY = "word_range"
+WORD_COLUMNS_VERSION = 1
+
+# Fields that stay per-word objects, stored only for words that have them.
+_SPARSE_FIELDS = ("characters", "phonemes", "metadata")
+_NO_STRING = -1
+
+
+class WordColumns:
+    """Words stored as parallel columns over a shared string table."""
+
+    __slots__ = (
+        "strings",
+        "text",
+        "start",
+        "end",
+        "confidence",
+        "alignment_method",
+        "language",
+        "extras",
+        "_string_ids",
+    )
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.text = array("l")
+        self.start = array("d")
+        self.end = array("d")
+        self.confidence = array("d")  # NaN when absent
+        self.alignment_method = array("l")  # _NO_STRING when absent
+        self.language = array("l")
+        self.extras: dict[int, dict[str, Any]] = {}
+        self._string_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @classmethod
+    def from_words(cls, words: Iterable[Mapping[str, Any] | Word | TranscriptWord]):
+        """Build columns from word dicts or word models."""
+        columns = cls()
+        columns.extend(words)
+        return columns
+
+    def extend(self, words: Iterable[Mapping[str, Any] | Word | TranscriptWord]):
+        """Append words, given as dicts or models."""
+        string_ids = self._string_ids
+
+        def intern(value: Any) -> int:
+            if value is None:
+                return _NO_STRING
+            value = str(value)
+            idx = string_ids.get(value)
+            if idx is None:
+                idx = string_ids[value] = len(self.strings)
+                self.strings.append(value)
+            return idx
+
+        for word in words:
+            if not isinstance(word, Mapping):
+                word = word.model_dump(mode="json", exclude_none=True)
+            confidence = word.get("confidence")
+            self.text.append(intern(word["text"]))
+            self.start.append(word["start"])
+            self.end.append(word["end"])
+            self.confidence.append(math.nan if confidence is None else confidence)
+            self.alignment_method.append(intern(word.get("alignment_method")))
+            self.language.append(intern(word.get("language")))
+            extra = {f: word[f] for f in _SPARSE_FIELDS if word.get(f)}
+            if extra:
+                self.extras[len(self.text) - 1] = extra
+
+    # -- wire form -----------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form; all-empty optional columns are omitted."""
+        data: dict[str, Any] = {
+            "version": WORD_COLUMNS_VERSION,
+            "strings": self.strings,
+            "text": self.text.tolist(),
+            "start": self.start.tolist(),
+            "end": self.end.tolist(),
+        }
+        if any(not math.isnan(c) for c in self.confidence):
+            data["confidence"] = [None if math.isnan(c) else c for c in self.confidence]
+        for name in ("alignment_method", "language"):
+            column = getattr(self, name)
+            if any(idx != _NO_STRING for idx in column):
+                data[name] = column.tolist()
+        if self.extras:
+            data["extras"] = {str(i): extra for i, extra in self.extras.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> WordColumns:
+        """Inverse of :meth:`to_dict`."""
+        version = data.get("version")
+        if version != WORD_COLUMNS_VERSION:
+            raise ValueError(f"Unsupported word_columns version: {version!r}")
+        columns = cls()
+        count = len(data["text"])
+        columns.strings = list(data["strings"])
+        columns._string_ids = {s: i for i, s in enumerate(columns.strings)}
+        columns.text = array("l", data["text"])
+        columns.start = array("d", data["start"])
+        columns.end = array("d", data["end"])
+        raw_confidence = data.get("confidence")
+        columns.confidence = (
+            array("d", (math.nan if c is None else c for c in raw_confidence))
+            if raw_confidence is not None
+            else array("d", [math.nan]) * count
+        )
+        for name in ("alignment_method", "language"):
+            raw = data.get(name)
+            setattr(
+                columns,
+                name,
+                array("l", raw)
+                if raw is not None
+                else array("l", [_NO_STRING]) * count,
+            )
+        columns.extras = {int(i): extra for i, extra in data.get("extras", {}).items()}
+        if not (
+            len(columns.start) == len(columns.end) == len(columns.confidence) == count
+        ):
+            raise ValueError("word_columns columns have different lengths")
+        return columns
+
+    # -- materialization -----------------------------------------------------
+
+    def to_dicts(self, lo: int = 0, hi: int | None = None) -> list[dict[str, Any]]:
+        """Plain word dicts for positions ``lo:hi``, as in the original JSON."""
+        words = []
+        for i in range(lo, len(self) if hi is None else hi):
+            word: dict[str, Any] = {
+                "text": self.strings[self.text[i]],
+                "start": self.start[i],
+                "end": self.end[i],
+            }
+            confidence = self.confidence[i]
+            if not math.isnan(confidence):
+                word["confidence"] = confidence
+            if (method := self.alignment_method[i]) != _NO_STRING:
+                word["alignment_method"] = self.strings[method]
+            if (language := self.language[i]) != _NO_STRING:
+                word["language"] = self.strings[language]
+            if i in self.extras:
+                word.update(self.extras[i])
+            words.append(word)
+        return words
+
+
+# =============================================================================
+# Transcript-level encoding
+# =============================================================================
+
+
+def is_columnar_transcript(data: Any) -> bool:
+    """True when ``data`` is a transcript dict with columnar words."""
+    return isinstance(data, dict) and WORD_COLUMNS_KEY in data
+
+
+def encode_transcript_words(data: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a transcript dict with words moved into columns.
+
+    Segments keep every other field. A segment whose ``words`` was ``None``
+    or missing gets no ``word_range``.
+    """
+    columns = WordColumns()
+    segments = []
+    for segment in data.get("segments", []):
+        encoded = {k: v for k, v in segment.items() if k != "words"}
+        words = segment.get("words")
+        if words is not None:
+            lo = len(columns)
+            columns.extend(words)
+            encoded[WORD_RANGE_KEY] = [lo, len(columns)]
+        segments.append(encoded)
+    return {**data, "segments": segments, WORD_COLUMNS_KEY: columns.to_dict()}
+
+
+def expand_transcript_words(data: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of :func:`encode_transcript_words`; plain dicts pass through."""
+    if not is_columnar_transcript(data):
+        return data
+    columns = WordColumns.from_dict(data[WORD_COLUMNS_KEY])
+    segments = []
+    for segment in data.get("segments", []):
+        expanded = {k: v for k, v in segment.items() if k != WORD_RANGE_KEY}
+        word_range = segment.get(WORD_RANGE_KEY)
+        if word_range is not None:
+            expanded["words"] = columns.to_dicts(*word_range)
+        segments.append(expanded)
+    return {
+        **{k: v for k, v in data.items() if k != WORD_COLUMNS_KEY},
+        "segments": segments,
+    }
@@ -46,6 +46,24 @@ class Settings(BaseSettings):
             "before they are moved to the DLQ"
         ),
     )
+    events_concurrency: int = Field(
+        default=8,
+        ge=1,
+        alias="DALSTON_EVENTS_CONCURRENCY",
+        description=(
+            "Number of jobs whose durable events the orchestrator handles "
+            "concurrently (events within one job stay ordered)"
+        ),
+    )
+    events_max_pending: int = Field(
+        default=256,
+        ge=1,
+        alias="DALSTON_EVENTS_MAX_PENDING",
+        description=(
+            "Durable events queued or running in the orchestrator before it "
+            "stops reading new ones"
+        ),
+    )
     events_dlq_stream: str = Field(
         default="dalston:events:dlq",
         alias="DALSTON_EVENTS_DLQ_STREAM",
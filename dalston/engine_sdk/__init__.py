@@ -94,12 +94,18 @@ from dalston.engine_sdk.context import BatchTaskContext
 from dalston.engine_sdk.device import detect_device
 from dalston.engine_sdk.local_runner import LocalRunner
 from dalston.engine_sdk.model_manager import LoadedModel, ModelManager
+from dalston.engine_sdk.prepared_audio import PreparedAudio, open_prepared_audio
 from dalston.engine_sdk.types import (
     EngineCapabilities,
     TaskRequest,
     TaskResponse,
 )
-from dalston.engine_sdk.vad import AudioChunk, SpeechSegment, VadChunker
+from dalston.engine_sdk.vad import (
+    AudioArrayChunk,
+    AudioChunk,
+    SpeechSegment,
+    VadChunker,
+)
 
 
 def __getattr__(name: str):
@@ -137,6 +143,8 @@ __all__ = [
     "EngineAudioError",
     "SPEECH_STANDARD",
     "ensure_audio_format",
+    "PreparedAudio",
+    "open_prepared_audio",
     # Core SDK
     "BaseBatchTranscribeEngine",
     "Engine",
@@ -149,6 +157,7 @@ __all__ = [
     # Composite engine
     "CompositeEngine",
     # VAD chunking (M86)
+    "AudioArrayChunk",
     "AudioChunk",
     "SpeechSegment",
     "VadChunker",
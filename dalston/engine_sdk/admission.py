@@ -3,22 +3,72 @@
 Prevents realtime session starvation under batch load by reserving
 capacity for RT sessions and capping concurrent batch tasks.
 
+With a realtime latency target set, the controller also adapts: it
+watches realtime inference latency (p95 over a sliding window) and the
+number of realtime inferences in flight, shrinks the batch limit while RT
+misses its target, grows it back when RT has headroom, and asks running
+batch work to yield at its next chunk boundary (see
+:func:`batch_checkpoint`) while RT is well over target.
+
 Configuration via environment variables:
     DALSTON_RT_RESERVATION: Minimum slots reserved for realtime (default: 2)
     DALSTON_BATCH_MAX_INFLIGHT: Maximum concurrent batch tasks (default: 4)
     DALSTON_TOTAL_CAPACITY: Total engine capacity (default: 6)
+    DALSTON_RT_LATENCY_TARGET_MS: Realtime p95 inference latency target;
+        unset keeps the static batch/RT split
+    DALSTON_BATCH_MIN_INFLIGHT: Batch limit floor when adapting (default: 1)
+    DALSTON_BATCH_YIELD_MAX_S: Longest a batch task pauses at one chunk
+        boundary, so batch always progresses (default: 10)
+    DALSTON_BATCH_ADMIT_WAIT_S: How long unified runners wait for a batch
+        slot before deferring the task (default: 0)
 """
 
 from __future__ import annotations
 
 import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from threading import Lock
+from threading import Condition, Lock
 
 import structlog
 
+import dalston.metrics
+
 logger = structlog.get_logger()
 
+# Latency samples older than this are ignored, so an idle RT side stops
+# holding batch back.
+RT_SAMPLE_TTL_S = 30.0
+# Minimum samples in the window before the batch limit is adjusted.
+RT_MIN_SAMPLES = 5
+# Batch yields at chunk boundaries above target * this factor.
+RT_YIELD_FACTOR = 1.5
+# Batch limit grows back below target * this factor.
+RT_HEADROOM_FACTOR = 0.7
+# Seconds between limit adjustments.
+ADJUST_INTERVAL_S = 1.0
+
+_batch_checkpoint: ContextVar[Callable[[], None] | None] = ContextVar(
+    "dalston_batch_checkpoint", default=None
+)
+
+
+def batch_checkpoint() -> None:
+    """Let the admission controller pause batch work at a chunk boundary.
+
+    Inference code calls this between chunks (decoding windows, VAD
+    batches). Inside :meth:`AdmissionController.preemptible` it blocks
+    while realtime work needs the device, for at most ``batch_yield_max_s``;
+    elsewhere (realtime calls, plain batch engines) it does nothing.
+    """
+    checkpoint = _batch_checkpoint.get()
+    if checkpoint is not None:
+        checkpoint()
+
 
 @dataclass(frozen=True)
 class AdmissionConfig:
@@ -27,6 +77,11 @@ class AdmissionConfig:
     rt_reservation: int = 2
     batch_max_inflight: int = 4
     total_capacity: int = 6
+    rt_latency_target_s: float | None = None
+    batch_min_inflight: int = 1
+    rt_latency_window: int = 100
+    batch_yield_max_s: float = 10.0
+    batch_admit_wait_s: float = 0.0
 
     @classmethod
     def from_env(
@@ -42,6 +97,7 @@ class AdmissionConfig:
         let callers (e.g. calibration-aware runners) supply computed
         defaults that are used when the env var is absent.
         """
+        target_ms = os.environ.get("DALSTON_RT_LATENCY_TARGET_MS")
         return cls(
             rt_reservation=int(
                 os.environ.get("DALSTON_RT_RESERVATION") or default_rt_reservation
@@ -53,6 +109,10 @@ class AdmissionConfig:
             total_capacity=int(
                 os.environ.get("DALSTON_TOTAL_CAPACITY") or default_total_capacity
             ),
+            rt_latency_target_s=float(target_ms) / 1000 if target_ms else None,
+            batch_min_inflight=int(os.environ.get("DALSTON_BATCH_MIN_INFLIGHT", "1")),
+            batch_yield_max_s=float(os.environ.get("DALSTON_BATCH_YIELD_MAX_S", "10")),
+            batch_admit_wait_s=float(os.environ.get("DALSTON_BATCH_ADMIT_WAIT_S", "0")),
         )
 
 
@@ -69,6 +129,12 @@ class AdmissionController:
     2. **Batch cap**: A hard limit on concurrent batch tasks prevents
        a flood of batch work from monopolizing the engine.
 
+    3. **Latency target** (optional): With ``rt_latency_target_s`` set,
+       the batch cap shrinks (down to ``batch_min_inflight``) while RT
+       p95 latency or RT queue depth is over target and grows back once
+       RT has headroom. Batch work running under :meth:`preemptible`
+       pauses at :func:`batch_checkpoint` while RT is well over target.
+
     Usage:
         controller = AdmissionController(AdmissionConfig.from_env())
 
@@ -93,17 +159,31 @@ class AdmissionController:
             reject_with_503(session)
     """
 
-    def __init__(self, config: AdmissionConfig) -> None:
+    def __init__(self, config: AdmissionConfig, engine_id: str | None = None) -> None:
         self._config = config
+        self._engine_id = engine_id or os.environ.get("DALSTON_ENGINE_ID", "unknown")
         self._lock = Lock()
+        # Woken on release and limit changes: batch admit waits and yields
+        self._changed = Condition(self._lock)
         self._active_batch: int = 0
         self._active_rt: int = 0
 
+        # Adaptive state (only used with a latency target)
+        self._batch_limit = config.batch_max_inflight
+        self._yield_batch = False
+        self._rt_inflight = 0
+        self._rt_latencies: deque[tuple[float, float]] = deque(
+            maxlen=config.rt_latency_window
+        )
+        self._rt_p95: float | None = None
+        self._last_adjust = 0.0
+
         logger.info(
             "admission_controller_init",
             rt_reservation=config.rt_reservation,
             batch_max_inflight=config.batch_max_inflight,
             total_capacity=config.total_capacity,
+            rt_latency_target_s=config.rt_latency_target_s,
         )
 
     @property
@@ -133,11 +213,22 @@ class AdmissionController:
 
     # -- Admission methods (thread-safe) -------------------------------------
 
-    def admit_batch(self) -> bool:
-        """Admit a batch task. Returns True if admitted, False if rejected."""
+    def admit_batch(self, wait_s: float = 0.0) -> bool:
+        """Admit a batch task. Returns True if admitted, False if rejected.
+
+        Args:
+            wait_s: Wait up to this long for a slot before rejecting
+        """
+        deadline = time.monotonic() + wait_s
         with self._lock:
-            if not self._can_accept_batch_unlocked():
-                return False
+            while not self._can_accept_batch_unlocked():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    dalston.metrics.inc_engine_admission_decision(
+                        self._engine_id, "batch_deferred"
+                    )
+                    return False
+                self._changed.wait(remaining)
             self._active_batch += 1
             logger.debug(
                 "batch_admitted",
@@ -163,6 +254,7 @@ class AdmissionController:
         """Release a batch task slot."""
         with self._lock:
             self._active_batch = max(0, self._active_batch - 1)
+            self._changed.notify_all()
             logger.debug(
                 "batch_released",
                 active_batch=self._active_batch,
@@ -173,12 +265,65 @@ class AdmissionController:
         """Release a realtime session slot."""
         with self._lock:
             self._active_rt = max(0, self._active_rt - 1)
+            self._changed.notify_all()
             logger.debug(
                 "rt_released",
                 active_batch=self._active_batch,
                 active_rt=self._active_rt,
             )
 
+    # -- Adaptive scheduling (thread-safe) -----------------------------------
+
+    def rt_inference_started(self) -> None:
+        """Count a realtime inference as in flight (RT queue depth)."""
+        with self._lock:
+            self._rt_inflight += 1
+            self._adjust_unlocked(force=self._rt_inflight > self._rt_queue_limit())
+
+    def rt_inference_finished(self, latency_s: float) -> None:
+        """Record a finished realtime inference and its latency."""
+        with self._lock:
+            self._rt_inflight = max(0, self._rt_inflight - 1)
+            self._rt_latencies.append((time.monotonic(), latency_s))
+            self._adjust_unlocked()
+
+    @contextmanager
+    def preemptible(self) -> Iterator[None]:
+        """Run admitted batch work with :func:`batch_checkpoint` enabled."""
+        token = _batch_checkpoint.set(self.wait_for_batch_turn)
+        try:
+            yield
+        finally:
+            _batch_checkpoint.reset(token)
+
+    def wait_for_batch_turn(self) -> float:
+        """Block while batch is asked to yield; returns seconds paused.
+
+        Pauses at most ``batch_yield_max_s`` so batch always progresses.
+        """
+        if self._config.rt_latency_target_s is None:
+            return 0.0
+        start = time.monotonic()
+        deadline = start + self._config.batch_yield_max_s
+        with self._lock:
+            self._adjust_unlocked()
+            if not self._yield_batch:
+                return 0.0
+            dalston.metrics.inc_engine_admission_decision(
+                self._engine_id, "batch_preempted"
+            )
+            while self._yield_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Wake periodically: stale samples age out without RT events
+                self._changed.wait(min(remaining, ADJUST_INTERVAL_S))
+                self._adjust_unlocked()
+        paused = time.monotonic() - start
+        dalston.metrics.observe_engine_batch_yield(self._engine_id, paused)
+        logger.debug("batch_yielded_to_rt", paused_s=round(paused, 3))
+        return paused
+
     # -- Reconfiguration -----------------------------------------------------
 
     def reconfigure(self, config: AdmissionConfig) -> None:
@@ -191,6 +336,18 @@ class AdmissionController:
         with self._lock:
             old = self._config
             self._config = config
+            self._batch_limit = min(
+                max(self._batch_limit, config.batch_min_inflight),
+                config.batch_max_inflight,
+            )
+            if config.rt_latency_target_s is None:
+                self._batch_limit = config.batch_max_inflight
+                self._yield_batch = False
+            if config.rt_latency_window != old.rt_latency_window:
+                self._rt_latencies = deque(
+                    self._rt_latencies, maxlen=config.rt_latency_window
+                )
+            self._changed.notify_all()
             logger.info(
                 "admission_reconfigured",
                 old_capacity=old.total_capacity,
@@ -217,13 +374,82 @@ class AdmissionController:
                 "can_accept_rt": self._can_accept_rt_unlocked(),
                 "rt_reservation": self._config.rt_reservation,
                 "batch_max_inflight": self._config.batch_max_inflight,
+                "batch_limit": self._batch_limit,
+                "batch_yielding": self._yield_batch,
+                "rt_inflight": self._rt_inflight,
+                "rt_latency_p95_s": self._rt_p95,
+                "rt_latency_target_s": self._config.rt_latency_target_s,
             }
 
     # -- Internal (must be called with lock held) ----------------------------
 
+    def _rt_queue_limit(self) -> int:
+        return max(1, self._config.rt_reservation)
+
+    def _adjust_unlocked(self, force: bool = False) -> None:
+        """Reshape the batch limit from RT p95 latency and RT queue depth."""
+        target = self._config.rt_latency_target_s
+        if target is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_adjust < ADJUST_INTERVAL_S:
+            return
+        self._last_adjust = now
+
+        while self._rt_latencies and now - self._rt_latencies[0][0] > RT_SAMPLE_TTL_S:
+            self._rt_latencies.popleft()
+        if len(self._rt_latencies) >= RT_MIN_SAMPLES:
+            latencies = sorted(latency for _, latency in self._rt_latencies)
+            self._rt_p95 = latencies[
+                min(len(latencies) - 1, int(0.95 * len(latencies)))
+            ]
+        else:
+            self._rt_p95 = None
+
+        p95 = self._rt_p95
+        queue_backed_up = self._rt_inflight > self._rt_queue_limit()
+        over_target = queue_backed_up or (p95 is not None and p95 > target)
+        under_target = not queue_backed_up and (
+            p95 is None or p95 < target * RT_HEADROOM_FACTOR
+        )
+
+        limit = self._batch_limit
+        if over_target:
+            # Multiplicative decrease: RT misses are costlier than batch delay
+            floor = min(
+                self._config.batch_min_inflight, self._config.batch_max_inflight
+            )
+            limit = max(floor, limit // 2)
+        elif under_target:
+            limit = min(self._config.batch_max_inflight, limit + 1)
+        if limit != self._batch_limit:
+            dalston.metrics.inc_engine_admission_decision(
+                self._engine_id,
+                "batch_limit_down" if limit < self._batch_limit else "batch_limit_up",
+            )
+            logger.info(
+                "admission_batch_limit_changed",
+                old_limit=self._batch_limit,
+                new_limit=limit,
+                rt_latency_p95_s=p95,
+                rt_inflight=self._rt_inflight,
+            )
+            self._batch_limit = limit
+
+        yield_batch = queue_backed_up or (
+            p95 is not None and p95 > target * RT_YIELD_FACTOR
+        )
+        if yield_batch != self._yield_batch:
+            self._yield_batch = yield_batch
+            dalston.metrics.inc_engine_admission_decision(
+                self._engine_id, "batch_yield" if yield_batch else "batch_resume"
+            )
+        dalston.metrics.set_engine_admission_state(self._engine_id, limit, p95)
+        self._changed.notify_all()
+
     def _can_accept_batch_unlocked(self) -> bool:
-        # Hard cap on batch inflight
-        if self._active_batch >= self._config.batch_max_inflight:
+        # Hard cap on batch inflight (adaptive when a latency target is set)
+        if self._active_batch >= self._batch_limit:
             return False
 
         total = self._active_batch + self._active_rt
@@ -0,0 +1,193 @@
+"""Node-local content-addressed cache for task artifacts.
+
+Engines running on the same host share a cache directory (typically a host
+volume mounted into every engine container).  Artifacts are stored once per
+node, keyed by their SHA-256 checksum — or by artifact ID when no checksum
+was recorded — and hardlinked into task temp dirs, falling back to a copy
+when the cache and temp dir live on different filesystems.
+
+Produced artifacts are added as they are uploaded, so prepared audio written
+by audio-prepare is served locally to transcribe, align, diarize and merge
+engines on the same node instead of being re-downloaded from S3 by each.
+
+Entries are made read-only since they share an inode with the linked task
+files; engines must treat materialized inputs as immutable.  Least-recently
+used entries (by mtime, refreshed on every hit) are evicted once the cache
+exceeds its size budget.
+
+Environment variables:
+    DALSTON_ARTIFACT_CACHE_DIR: Cache directory (default: unset = disabled)
+    DALSTON_ARTIFACT_CACHE_MAX_GB: Max disk usage in GB (default: 10)
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import threading
+import uuid
+from pathlib import Path
+
+import structlog
+
+import dalston.metrics
+from dalston.common.artifacts import ArtifactReference
+
+logger = structlog.get_logger()
+
+_TMP_DIR = ".tmp"
+
+
+class NodeArtifactCache:
+    """Size-capped LRU cache of artifact files shared by co-located engines.
+
+    Safe for concurrent use by threads and by other processes sharing the
+    directory: entries are published with an atomic rename, and a lookup
+    racing an eviction simply counts as a miss.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_gb: float = 10,
+        engine_id: str = "unknown",
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_gb * 1024 * 1024 * 1024)
+        self.engine_id = engine_id
+        self._evict_lock = threading.Lock()
+        (self.root / _TMP_DIR).mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls, engine_id: str = "unknown") -> NodeArtifactCache | None:
+        """Create a cache from environment variables, or None if disabled."""
+        root = os.environ.get("DALSTON_ARTIFACT_CACHE_DIR", "")
+        if not root:
+            return None
+        max_gb = float(os.environ.get("DALSTON_ARTIFACT_CACHE_MAX_GB", "10"))
+        if max_gb <= 0:
+            return None
+        try:
+            return cls(Path(root), max_gb=max_gb, engine_id=engine_id)
+        except OSError:
+            logger.warning("artifact_cache_unavailable", path=root, exc_info=True)
+            return None
+
+    @staticmethod
+    def cache_key(checksum: str | None, artifact_id: str | None) -> str | None:
+        """Return the cache key for an artifact, or None if it can't be keyed."""
+        if checksum:
+            return f"sha256-{checksum}"
+        if artifact_id:
+            digest = hashlib.sha256(artifact_id.encode()).hexdigest()
+            return f"id-{digest}"
+        return None
+
+    def fetch(self, ref: ArtifactReference, destination: Path) -> bool:
+        """Materialize a cached artifact at destination.
+
+        Returns:
+            True on a cache hit, False if the caller must download it.
+        """
+        key = self.cache_key(ref.checksum, ref.artifact_id)
+        if key is None:
+            return False
+
+        entry = self._entry_path(key)
+        try:
+            _link_or_copy(entry, destination)
+            os.utime(entry)
+        except FileNotFoundError:
+            dalston.metrics.inc_engine_artifact_cache(self.engine_id, "miss")
+            return False
+
+        dalston.metrics.inc_engine_artifact_cache(self.engine_id, "hit")
+        logger.debug("artifact_cache_hit", artifact_id=ref.artifact_id, cache_key=key)
+        return True
+
+    def put(
+        self,
+        source: Path,
+        *,
+        checksum: str | None = None,
+        artifact_id: str | None = None,
+    ) -> None:
+        """Add a verified local file to the cache.
+
+        Failures are logged and swallowed; the cache is an optimisation and
+        must never fail a task.
+        """
+        key = self.cache_key(checksum, artifact_id)
+        if key is None:
+            return
+
+        entry = self._entry_path(key)
+        if entry.exists():
+            return
+
+        tmp = self.root / _TMP_DIR / f"{key}.{uuid.uuid4().hex}"
+        try:
+            _link_or_copy(source, tmp)
+            tmp.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, entry)
+        except OSError:
+            logger.warning("artifact_cache_put_failed", cache_key=key, exc_info=True)
+            tmp.unlink(missing_ok=True)
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least-recently used entries until within budget.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._evict_lock:
+            entries: list[tuple[float, int, Path]] = []
+            for path in self.root.glob("??/*"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _mtime, size, _path in entries)
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        dalston.metrics.inc_engine_artifact_cache(self.engine_id, "evicted", removed)
+        logger.info(
+            "artifact_cache_evicted",
+            evicted=removed,
+            remaining_mb=round(total / (1024 * 1024), 1),
+        )
+        return removed
+
+    def _entry_path(self, key: str) -> Path:
+        # Fan out on the last hex chars to keep directories small
+        return self.root / key[-2:] / key
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hardlink source to destination, copying across filesystems."""
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        shutil.copyfile(source, destination)
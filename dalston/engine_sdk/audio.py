@@ -66,35 +66,21 @@ def _probe_format(audio_path: Path) -> AudioFormat | None:
     """Read WAV/FLAC/OGG header and return the detected format.
 
     Returns None for formats that soundfile cannot read (MP3, M4A, etc.),
-    signalling that conversion is always required.
+    signalling that conversion is always required.  Probes are cached
+    by path and mtime (see :func:`~dalston.engine_sdk.prepared_audio.probe_audio`).
     """
-    try:
-        import soundfile as sf
-
-        info = sf.info(str(audio_path))
-    except Exception:
-        return None
+    from dalston.engine_sdk.prepared_audio import probe_audio
 
-    # Map soundfile subtype strings to bit depth
-    subtype_to_bits: dict[str, int] = {
-        "PCM_16": 16,
-        "PCM_24": 24,
-        "PCM_32": 32,
-        "PCM_S8": 8,
-        "PCM_U8": 8,
-        "FLOAT": 32,
-        "DOUBLE": 64,
-    }
-    bit_depth = subtype_to_bits.get(info.subtype)
-    if bit_depth is None:
+    probe = probe_audio(audio_path)
+    if probe is None or probe.bit_depth is None:
         # Lossy codecs (MP3, OGG vorbis, etc.) don't have a meaningful
         # bit depth.  Return None so the caller always converts them.
         return None
 
     return AudioFormat(
-        sample_rate=info.samplerate,
-        channels=info.channels,
-        bit_depth=bit_depth,
+        sample_rate=probe.sample_rate,
+        channels=probe.channels,
+        bit_depth=probe.bit_depth,
     )
 
 
@@ -11,6 +11,11 @@ dispatches to a chunked path that uses :class:`VadChunker` to split at
 speech boundaries, calls ``transcribe_audio()`` per chunk, halves the
 chunk cap and retries on CUDA OOM, and merges the resulting transcripts
 with timestamps offset to the original timeline.
+
+Engines that can transcribe in-memory audio may also implement
+``transcribe_audio_batch()``. The chunked path then decodes and runs VAD
+once, keeps chunks as array views instead of temp WAV files, and sends
+them to the engine in batches sized by the adaptive VRAM parameters.
 """
 
 from __future__ import annotations
@@ -26,7 +31,11 @@ import structlog
 import dalston.telemetry
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from dalston.engine_sdk.http_server import EngineHTTPServer
+    from dalston.engine_sdk.prepared_audio import PreparedAudio
+    from dalston.engine_sdk.vram_budget import EngineVRAMParams
 
 from dalston.common.pipeline_types import (
     AlignmentMethod,
@@ -40,8 +49,9 @@ from dalston.common.pipeline_types import (
 from dalston.engine_sdk.base import Engine
 from dalston.engine_sdk.context import BatchTaskContext
 from dalston.engine_sdk.inference.gpu_guard import clear_gpu_cache, is_oom_error
+from dalston.engine_sdk.speech_regions import load_speech_regions
 from dalston.engine_sdk.types import TaskRequest, TaskResponse
-from dalston.engine_sdk.vad import VadChunker
+from dalston.engine_sdk.vad import AudioArrayChunk, SpeechSegment, VadChunker
 
 logger = structlog.get_logger()
 
@@ -58,6 +68,22 @@ class _ChunkedRunResult:
     final_max_s: float
 
 
+def _take_batch(
+    chunks: list[AudioArrayChunk], start: int, budget_s: float
+) -> list[AudioArrayChunk]:
+    """Take chunks from ``start`` while their total duration fits the budget.
+
+    Always takes at least one chunk, so a chunk longer than the budget
+    (or a zero budget) yields a batch of one.
+    """
+    end = start + 1
+    total_s = chunks[start].duration
+    while end < len(chunks) and total_s + chunks[end].duration <= budget_s:
+        total_s += chunks[end].duration
+        end += 1
+    return chunks[start:end]
+
+
 class BaseBatchTranscribeEngine(Engine):
     """Base class for batch transcription engines.
 
@@ -155,6 +181,36 @@ class BaseBatchTranscribeEngine(Engine):
         """
         raise NotImplementedError
 
+    def transcribe_audio_batch(
+        self,
+        task_request: TaskRequest,
+        audio: list[np.ndarray],
+        ctx: BatchTaskContext,
+    ) -> list[Transcript]:
+        """Transcribe several in-memory audio chunks in one call.
+
+        Optional. Engines that implement it get file-free, batched
+        long-audio chunking; the default chunked path writes each chunk
+        to a WAV file and calls ``transcribe_audio()`` on it instead.
+
+        Args:
+            task_request: The original task request (for parameters; its
+                ``audio_path`` is the unchunked source and must not be read)
+            audio: Float32 mono 16 kHz arrays, one per chunk
+            ctx: Batch task context for tracing/logging
+
+        Returns:
+            One transcript per chunk, in order, with chunk-relative timestamps
+        """
+        raise NotImplementedError
+
+    def _supports_batched_chunks(self) -> bool:
+        """Whether the subclass implements ``transcribe_audio_batch()``."""
+        return (
+            type(self).transcribe_audio_batch
+            is not BaseBatchTranscribeEngine.transcribe_audio_batch
+        )
+
     # ------------------------------------------------------------------
     # Chunked path (M86)
     # ------------------------------------------------------------------
@@ -184,13 +240,18 @@ class BaseBatchTranscribeEngine(Engine):
                 "dalston.audio_duration_s": round(audio_duration_s, 3),
             },
         ):
-            with tempfile.TemporaryDirectory(prefix="dalston_chunks_") as tmp_str:
-                result = self._transcribe_chunks_with_backoff(
-                    task_request,
-                    ctx,
-                    effective_max_s,
-                    Path(tmp_str),
+            if self._supports_batched_chunks():
+                result = self._transcribe_chunk_batches_with_backoff(
+                    task_request, ctx, effective_max_s
                 )
+            else:
+                with tempfile.TemporaryDirectory(prefix="dalston_chunks_") as tmp_str:
+                    result = self._transcribe_chunks_with_backoff(
+                        task_request,
+                        ctx,
+                        effective_max_s,
+                        Path(tmp_str),
+                    )
 
             dalston.telemetry.set_span_attribute(
                 "dalston.chunk_count", result.chunk_count
@@ -210,12 +271,13 @@ class BaseBatchTranscribeEngine(Engine):
     ) -> _ChunkedRunResult:
         """Run VAD chunking + per-chunk transcribe + OOM backoff.
 
-        Every pass splits the *original* source file from scratch. The
-        ``remaining_start_s`` boundary marks the earliest absolute
-        offset that still needs work — chunks whose offset lies before
-        it were already completed by an earlier pass and are filtered
-        out, so timestamps remain absolute in the source's timeline and
-        no audio is reprocessed after an OOM retry.
+        The source is decoded and its speech regions resolved once (see
+        :meth:`_load_speech`); every pass re-groups them from the
+        *original* timeline. The ``remaining_start_s`` boundary marks the
+        earliest absolute offset that still needs work — chunks whose
+        offset lies before it were already completed by an earlier pass
+        and are filtered out, so timestamps remain absolute in the
+        source's timeline and no audio is reprocessed after an OOM retry.
 
         Returns a dict with ``transcript`` (merged Transcript),
         ``chunk_count`` (total chunks processed), and ``final_max_s``
@@ -223,6 +285,17 @@ class BaseBatchTranscribeEngine(Engine):
         """
         assert task_request.audio_path is not None
         source_audio_path = task_request.audio_path
+        try:
+            audio, speech = self._load_speech(task_request, max_chunk_s)
+        except Exception:
+            logger.exception(
+                "vad_split_failed",
+                audio_path=str(source_audio_path),
+                max_chunk_s=max_chunk_s,
+            )
+            raise
+        if not speech:
+            logger.info("vad_no_speech_detected", audio_path=str(source_audio_path))
 
         completed_transcripts: list[tuple[Transcript, float]] = []
         current_max_s = max_chunk_s
@@ -234,10 +307,10 @@ class BaseBatchTranscribeEngine(Engine):
             retry_pass += 1
             chunker = VadChunker(max_chunk_duration_s=current_max_s)
             sub_tmp = tmp_dir / f"pass_{retry_pass}_max_{int(current_max_s)}"
-            sub_tmp.mkdir(parents=True, exist_ok=True)
             try:
-                chunks = chunker.split(
-                    source_audio_path,
+                chunks = chunker.write_chunks(
+                    audio,
+                    speech,
                     sub_tmp,
                     start_offset_s=remaining_start_s,
                 )
@@ -280,27 +353,136 @@ class BaseBatchTranscribeEngine(Engine):
             if oom_index is None:
                 break
 
-            new_max_s = max(current_max_s / 2.0, _MIN_CHUNK_FLOOR_S)
-            if new_max_s >= current_max_s:
-                logger.error(
-                    "chunked_oom_floor_reached",
-                    floor_s=_MIN_CHUNK_FLOOR_S,
-                    chunk_index=total_chunks,
-                )
-                raise RuntimeError(
-                    "CUDA OOM at chunk floor "
-                    f"{_MIN_CHUNK_FLOOR_S}s — cannot reduce chunk size further"
+            remaining_start_s = chunks[oom_index].offset
+            current_max_s = self._halve_chunk_cap(
+                current_max_s, remaining_start_s, total_chunks
+            )
+
+        return _ChunkedRunResult(
+            transcript=self._merge_chunk_transcripts(completed_transcripts),
+            chunk_count=total_chunks,
+            final_max_s=current_max_s,
+        )
+
+    def _load_speech(
+        self, task_request: TaskRequest, max_chunk_s: float
+    ) -> tuple[np.ndarray | PreparedAudio, list[SpeechSegment]]:
+        """Decode the source once and resolve its speech regions.
+
+        Uses the prepare stage's speech-regions artifact when one is bound
+        to the task and matches this engine's VAD settings; otherwise runs
+        VAD here. Either way detection happens once per task, not once per
+        OOM backoff pass.
+        """
+        assert task_request.audio_path is not None
+        chunker = VadChunker(max_chunk_duration_s=max_chunk_s)
+        return chunker.load_and_detect(
+            task_request.audio_path,
+            speech=load_speech_regions(task_request, chunker),
+        )
+
+    def _transcribe_chunk_batches_with_backoff(
+        self,
+        task_request: TaskRequest,
+        ctx: BatchTaskContext,
+        max_chunk_s: float,
+    ) -> _ChunkedRunResult:
+        """Run VAD chunking + batched in-memory transcribe + OOM backoff.
+
+        The source is decoded and its speech regions resolved once (see
+        :meth:`_load_speech`); speech regions do not depend on the chunk
+        cap, so OOM retries only re-group them.
+        Chunks are array views grouped into batches whose total duration
+        stays within the adaptive VRAM budget (``vad_batch_size`` x
+        ``vad_max_speech_s`` seconds, at least one chunk per batch).
+        A memory-mapped prepared WAV is converted to float32 one batch
+        at a time, so only the batch in flight is held in memory.
+
+        On CUDA OOM a multi-chunk batch is retried at half the budget;
+        once a single chunk OOMs, the chunk cap is halved and the
+        remaining audio re-split from that chunk's offset, exactly as in
+        :meth:`_transcribe_chunks_with_backoff`.
+        """
+        import numpy as np
+
+        assert task_request.audio_path is not None
+        audio, speech = self._load_speech(task_request, max_chunk_s)
+
+        vram_params = self._resolve_adaptive_params()
+        batch_budget_s = (
+            vram_params.vad_batch_size * vram_params.vad_max_speech_s
+            if vram_params is not None
+            else 0.0
+        )
+
+        completed_transcripts: list[tuple[Transcript, float]] = []
+        current_max_s = max_chunk_s
+        remaining_start_s = 0.0
+        total_chunks = 0
+
+        while True:
+            chunker = VadChunker(max_chunk_duration_s=current_max_s)
+            chunks = chunker.split_audio(
+                audio, speech, start_offset_s=remaining_start_s
+            )
+            if not chunks:
+                break
+
+            oom_chunk: AudioArrayChunk | None = None
+            idx = 0
+            while idx < len(chunks):
+                batch = _take_batch(chunks, idx, batch_budget_s)
+                try:
+                    with dalston.telemetry.create_span(
+                        "engine.chunk_recognize",
+                        attributes={
+                            "dalston.chunk_index": total_chunks,
+                            "dalston.batch_size": len(batch),
+                            "dalston.chunk_duration_s": round(
+                                sum(c.duration for c in batch), 3
+                            ),
+                            "dalston.chunk_offset_s": round(batch[0].offset, 3),
+                        },
+                    ):
+                        transcripts = self.transcribe_audio_batch(
+                            task_request,
+                            [np.asarray(c.audio, dtype=np.float32) for c in batch],
+                            ctx,
+                        )
+                except Exception as exc:
+                    if not is_oom_error(exc):
+                        raise
+                    clear_gpu_cache()
+                    if len(batch) > 1:
+                        batch_budget_s = sum(c.duration for c in batch) / 2.0
+                        logger.warning(
+                            "chunk_batch_oom_backoff",
+                            batch_size=len(batch),
+                            new_budget_s=round(batch_budget_s, 3),
+                        )
+                        continue
+                    oom_chunk = batch[0]
+                    break
+
+                if len(transcripts) != len(batch):
+                    raise RuntimeError(
+                        f"transcribe_audio_batch returned {len(transcripts)} "
+                        f"transcripts for {len(batch)} chunks"
+                    )
+                completed_transcripts.extend(
+                    (transcript, chunk.offset)
+                    for transcript, chunk in zip(transcripts, batch, strict=True)
                 )
-            logger.warning(
-                "chunked_oom_backoff",
-                old_max_s=current_max_s,
-                new_max_s=new_max_s,
-                remaining_start_s=round(chunks[oom_index].offset, 3),
-                chunks_completed=total_chunks,
+                total_chunks += len(batch)
+                idx += len(batch)
+
+            if oom_chunk is None:
+                break
+
+            remaining_start_s = oom_chunk.offset
+            current_max_s = self._halve_chunk_cap(
+                current_max_s, remaining_start_s, total_chunks
             )
-            self._cache_chunk_cap(new_max_s)
-            current_max_s = new_max_s
-            remaining_start_s = chunks[oom_index].offset
 
         return _ChunkedRunResult(
             transcript=self._merge_chunk_transcripts(completed_transcripts),
@@ -308,6 +490,34 @@ class BaseBatchTranscribeEngine(Engine):
             final_max_s=current_max_s,
         )
 
+    def _halve_chunk_cap(
+        self,
+        current_max_s: float,
+        remaining_start_s: float,
+        chunks_completed: int,
+    ) -> float:
+        """Halve the chunk cap after an OOM, raising once at the floor."""
+        new_max_s = max(current_max_s / 2.0, _MIN_CHUNK_FLOOR_S)
+        if new_max_s >= current_max_s:
+            logger.error(
+                "chunked_oom_floor_reached",
+                floor_s=_MIN_CHUNK_FLOOR_S,
+                chunk_index=chunks_completed,
+            )
+            raise RuntimeError(
+                "CUDA OOM at chunk floor "
+                f"{_MIN_CHUNK_FLOOR_S}s — cannot reduce chunk size further"
+            )
+        logger.warning(
+            "chunked_oom_backoff",
+            old_max_s=current_max_s,
+            new_max_s=new_max_s,
+            remaining_start_s=round(remaining_start_s, 3),
+            chunks_completed=chunks_completed,
+        )
+        self._cache_chunk_cap(new_max_s)
+        return new_max_s
+
     def _merge_chunk_transcripts(
         self,
         chunk_results: list[tuple[Transcript, float]],
@@ -453,14 +663,19 @@ class BaseBatchTranscribeEngine(Engine):
         Returns:
             Batch size from VRAM budget, or *fallback*.
         """
+        vram_params = self._resolve_adaptive_params()
+        if vram_params is not None:
+            return vram_params.vad_batch_size
+        return fallback
+
+    def _resolve_adaptive_params(self) -> EngineVRAMParams | None:
+        """Return the runner's adaptive VRAM params for this task, if any."""
         runner = getattr(self, "_runner", None)
         if runner is not None:
             adaptive = runner.get_adaptive_params()
             if adaptive is not None:
-                queue_depth = runner.get_queue_depth()
-                vram_params = adaptive.select(queue_depth)
-                return vram_params.vad_batch_size
-        return fallback
+                return adaptive.select(runner.get_queue_depth())
+        return None
 
     # ------------------------------------------------------------------
     # Helper builders
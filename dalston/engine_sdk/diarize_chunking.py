@@ -12,22 +12,38 @@ Environment variables
 ---------------------
 DALSTON_MAX_DIARIZE_CHUNK_S : float
     Maximum chunk duration in seconds (default 900 = 15 min).
+DALSTON_DIARIZE_CHUNK_WORKERS : int
+    Worker processes for diarizing chunks concurrently on CPU
+    (default 1 = sequential, in-process).  Read by the engines.
 
 Design notes
 ------------
 * ``torch.cuda.empty_cache()`` is called between chunks on CUDA to free
   the pyannote reconstruction spike.  This does NOT reduce peak VRAM
   within a single chunk — if a chunk still OOMs, reduce the chunk size.
-* Audio splitting uses ``ffmpeg -c copy`` which is valid because the
-  input has already been through the prepare stage (16 kHz mono PCM WAV).
+* The prepared 16 kHz mono PCM16 WAV is memory-mapped through
+  :mod:`dalston.engine_sdk.prepared_audio` and each chunk is passed to
+  pyannote as an in-memory waveform slice, so no chunk files are written.  Other inputs fall back to ``ffmpeg -c copy`` chunk files.
+* Speaker embeddings are extracted in a separate phase after all chunks
+  are segmented, batching equal-length turn crops across chunks.
 * Speaker linking uses ``pyannote/wespeaker-voxceleb-resnet34-LM``
   embeddings (already cached from the diarization pipeline).
+* Per-phase wall-clock timings (segmentation, embedding, linking, merge)
+  are logged and exported as ``dalston_engine_diarize_phase_seconds``.
 """
 
 from __future__ import annotations
 
+import bisect
+import multiprocessing
+import os
 import subprocess
 import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -35,7 +51,13 @@ from typing import Any
 import numpy as np
 import structlog
 
+import dalston.metrics
 from dalston.common.pipeline_types import SpeakerTurn
+from dalston.engine_sdk.prepared_audio import (
+    PreparedAudio,
+    open_prepared_audio,
+    probe_audio,
+)
 
 logger = structlog.get_logger()
 
@@ -47,6 +69,8 @@ DEFAULT_MAX_CHUNK_S: float = 900.0  # 15 minutes
 DEFAULT_OVERLAP_S: float = 30.0
 DEFAULT_MIN_CHUNK_S: float = 60.0
 _SPEAKER_LINK_THRESHOLD: float = 0.3  # cosine distance for agglomerative clustering
+_MIN_EMBEDDING_TURN_S: float = 1.0  # shorter turns give degenerate embeddings
+_EMBEDDING_BATCH_SIZE: int = 32
 
 
 # ---------------------------------------------------------------------------
@@ -61,7 +85,7 @@ class ChunkSpec:
     index: int
     start: float  # seconds into original audio
     end: float  # seconds into original audio
-    path: Path
+    path: Path | None = None  # chunk file; None when sliced in memory
 
 
 @dataclass
@@ -85,11 +109,17 @@ def compute_chunk_boundaries(
     max_chunk_s: float = DEFAULT_MAX_CHUNK_S,
     overlap_s: float = DEFAULT_OVERLAP_S,
     min_chunk_s: float = DEFAULT_MIN_CHUNK_S,
+    speech_regions: Sequence[tuple[float, float]] | None = None,
 ) -> list[tuple[float, float]]:
     """Compute (start, end) boundaries for overlapping chunks.
 
     If the remaining tail would be shorter than *min_chunk_s*, it is
     absorbed into the previous chunk.
+
+    With *speech_regions* (sorted ``(start, end)`` pairs, e.g. from the
+    prepare stage's speech-regions artifact), a chunk end that falls
+    inside speech is pulled back to that region's start when the region
+    begins inside the overlap, so no chunk cuts a speech region short.
     """
     if duration <= max_chunk_s:
         return [(0.0, duration)]
@@ -114,6 +144,8 @@ def compute_chunk_boundaries(
             and extended_len <= max_chunk_s + min_chunk_s
         ):
             end = duration
+        elif end < duration and speech_regions:
+            end = _snap_to_speech_start(end, next_start, speech_regions)
 
         boundaries.append((start, end))
         if end >= duration:
@@ -123,30 +155,37 @@ def compute_chunk_boundaries(
     return boundaries
 
 
-def get_audio_duration(audio_path: Path) -> float:
-    """Probe audio duration.
+def _snap_to_speech_start(
+    t: float,
+    lower: float,
+    speech_regions: Sequence[tuple[float, float]],
+) -> float:
+    """Move *t* back to the start of the speech region containing it.
 
-    Uses the ``wave`` stdlib module for WAV files (the common case after
-    the prepare stage).  Falls back to ``soundfile`` for other formats.
+    Only moves when that start lies after *lower*; otherwise returns *t*.
     """
-    import wave
+    idx = bisect.bisect_right([start for start, _ in speech_regions], t) - 1
+    if idx >= 0:
+        start, end = speech_regions[idx]
+        if start < t < end and start > lower:
+            return start
+    return t
 
-    try:
-        with wave.open(str(audio_path), "rb") as wf:
-            return wf.getnframes() / wf.getframerate()
-    except wave.Error:
-        pass
 
-    # Fallback for non-WAV formats
-    try:
-        import soundfile as sf
+def get_audio_duration(audio_path: Path) -> float:
+    """Probe audio duration.
 
-        return sf.info(str(audio_path)).duration
-    except ImportError:
+    Reads WAV headers directly (the common case after the prepare stage)
+    and falls back to ``soundfile`` for other formats.  Probes are cached
+    by path and mtime, so the OOM backoff passes do not re-read the file.
+    """
+    probe = probe_audio(audio_path)
+    if probe is None:
         raise RuntimeError(
             f"Cannot probe duration of {audio_path}: "
-            "not a WAV file and soundfile is not installed"
-        ) from None
+            "not a WAV file and soundfile could not read it"
+        )
+    return probe.duration_s
 
 
 def extract_chunk(
@@ -191,6 +230,77 @@ def extract_chunk(
     return out
 
 
+def _waveform_input(waveform: np.ndarray, sample_rate: int) -> dict[str, Any]:
+    """pyannote in-memory audio input for a mono float32 waveform."""
+    import torch
+
+    return {"waveform": torch.from_numpy(waveform)[None], "sample_rate": sample_rate}
+
+
+# ---------------------------------------------------------------------------
+# CPU worker pool
+# ---------------------------------------------------------------------------
+
+# Pools are keyed by (model_id, workers) and kept for the life of the
+# process, so each worker loads the pipeline once rather than per task.
+_pools: dict[tuple[str, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+_worker_pipeline: Any = None
+
+
+def _init_diarize_worker(model_id: str, hf_token: str, torch_threads: int) -> None:
+    """Load the pipeline once in each worker process."""
+    global _worker_pipeline
+
+    import torch
+    from pyannote.audio import Pipeline
+
+    torch.set_num_threads(torch_threads)
+    _worker_pipeline = Pipeline.from_pretrained(
+        model_id, token=hf_token, revision="main"
+    )
+
+
+def _diarize_chunk_in_worker(
+    audio_path: str,
+    start_s: float,
+    end_s: float,
+    diarization_params: dict[str, Any],
+) -> Any:
+    """Segment one chunk in a worker, slicing the memory-mapped WAV."""
+    prepared = open_prepared_audio(Path(audio_path))
+    if prepared is None:
+        raise RuntimeError(f"{audio_path} is not a mono PCM16 WAV")
+    return _worker_pipeline(
+        _waveform_input(prepared.window(start_s, end_s), prepared.sample_rate),
+        **diarization_params,
+    )
+
+
+def _get_worker_pool(model_id: str, hf_token: str, workers: int) -> ProcessPoolExecutor:
+    key = (model_id, workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            torch_threads = max(1, (os.cpu_count() or 1) // workers)
+            # spawn, not fork: torch thread pools do not survive fork
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_diarize_worker,
+                initargs=(model_id, hf_token, torch_threads),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def _discard_worker_pool(model_id: str, workers: int) -> None:
+    with _pools_lock:
+        pool = _pools.pop((model_id, workers), None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ---------------------------------------------------------------------------
 # Speaker embedding extraction
 # ---------------------------------------------------------------------------
@@ -252,22 +362,14 @@ def extract_speaker_embeddings(
 
     for turn, _, speaker in annotation.itertracks(yield_label=True):
         # Skip very short segments — degenerate embeddings
-        if turn.duration < 1.0:
+        if turn.duration < _MIN_EMBEDDING_TURN_S:
             continue
         try:
             emb = embedding_model.crop(
                 {"audio": str(audio_path)},
                 Segment(turn.start, turn.end),
             )
-            # Result may be SlidingWindowFeature (.data attr), tensor, or ndarray
-            if hasattr(emb, "data") and isinstance(emb.data, np.ndarray):
-                emb_np = np.squeeze(emb.data)
-            elif hasattr(emb, "numpy"):
-                emb_np = np.squeeze(emb.numpy())
-            elif hasattr(emb, "squeeze"):
-                emb_np = np.atleast_1d(emb.squeeze())
-            else:
-                emb_np = np.squeeze(np.array(emb))
+            emb_np = _embedding_vector(emb)
             if emb_np.ndim == 1 and emb_np.shape[0] > 0:
                 embeddings_per_speaker.setdefault(speaker, []).append(emb_np)
         except Exception:
@@ -284,6 +386,119 @@ def extract_speaker_embeddings(
     return centroids
 
 
+def _embedding_vector(emb: Any) -> np.ndarray:
+    """Squeeze an Inference result into a 1-D numpy vector."""
+    # Result may be SlidingWindowFeature (.data attr), tensor, or ndarray
+    if hasattr(emb, "data") and isinstance(emb.data, np.ndarray):
+        return np.squeeze(emb.data)
+    if hasattr(emb, "numpy"):
+        return np.squeeze(emb.numpy())
+    if hasattr(emb, "squeeze"):
+        return np.atleast_1d(emb.squeeze())
+    return np.squeeze(np.array(emb))
+
+
+def extract_speaker_embeddings_batched(
+    chunks: Sequence[tuple[int, np.ndarray | PreparedAudio, Any]],
+    embedding_model: Any,
+    sample_rate: int,
+    batch_size: int = _EMBEDDING_BATCH_SIZE,
+) -> dict[int, dict[str, np.ndarray]]:
+    """Extract per-speaker centroid embeddings for many chunks at once.
+
+    Each turn of at least one second contributes the central
+    ``floor(duration)`` seconds of its audio.  Crops of equal length are
+    stacked, across chunks, into batches for ``embedding_model.infer``,
+    so the embedding network runs once per batch instead of once per
+    turn.  A batch that fails falls back to per-turn ``crop`` calls on
+    the in-memory waveform.
+
+    Args:
+        chunks: ``(chunk_index, waveform, annotation)`` triples, with the
+            mono chunk audio (a float32 array or a memory-mapped
+            :class:`PreparedAudio` view) and the chunk's pyannote
+            Annotation (times relative to the chunk).
+        embedding_model: ``pyannote.audio.Inference`` instance.
+        sample_rate: Sample rate of the waveforms.
+        batch_size: Maximum crops per ``infer`` call.
+
+    Returns:
+        Mapping of ``{chunk_index: {speaker_label: centroid_embedding}}``.
+    """
+    # (chunk_index, speaker, waveform, turn) grouped by crop length
+    by_length: dict[int, list[tuple[int, str, np.ndarray | PreparedAudio, Any]]] = {}
+    for chunk_index, waveform, annotation in chunks:
+        for turn, _, speaker in annotation.itertracks(yield_label=True):
+            if turn.duration < _MIN_EMBEDDING_TURN_S:
+                continue
+            seconds = int(turn.duration)
+            by_length.setdefault(seconds, []).append(
+                (chunk_index, speaker, waveform, turn)
+            )
+
+    vectors: dict[tuple[int, str], list[np.ndarray]] = {}
+    for seconds, items in sorted(by_length.items()):
+        crop_len = seconds * sample_rate
+        for lo in range(0, len(items), batch_size):
+            batch = items[lo : lo + batch_size]
+            crops = []
+            for _, _, waveform, turn in batch:
+                center = int((turn.start + turn.end) / 2 * sample_rate)
+                begin = max(0, min(center - crop_len // 2, len(waveform) - crop_len))
+                crops.append(
+                    np.asarray(waveform[begin : begin + crop_len], dtype=np.float32)
+                )
+            try:
+                if any(len(c) != crop_len for c in crops):
+                    raise ValueError("turn extends past the chunk audio")
+                embs: list[np.ndarray | None] = list(
+                    _infer_batch(embedding_model, np.stack(crops))
+                )
+            except Exception:
+                logger.debug("embedding_batch_failed", crop_s=seconds, size=len(batch))
+                embs = [
+                    _crop_embedding(embedding_model, waveform, sample_rate, turn)
+                    for _, _, waveform, turn in batch
+                ]
+            for (chunk_index, speaker, _, _), emb in zip(batch, embs, strict=True):
+                if emb is not None and emb.ndim == 1 and emb.shape[0] > 0:
+                    vectors.setdefault((chunk_index, speaker), []).append(emb)
+
+    centroids: dict[int, dict[str, np.ndarray]] = {
+        chunk_index: {} for chunk_index, _, _ in chunks
+    }
+    for (chunk_index, speaker), speaker_vectors in vectors.items():
+        centroids[chunk_index][speaker] = np.mean(speaker_vectors, axis=0)
+    return centroids
+
+
+def _infer_batch(embedding_model: Any, crops: np.ndarray) -> list[np.ndarray]:
+    """Embed a ``(batch, samples)`` array of equal-length crops."""
+    import torch
+
+    embs = embedding_model.infer(torch.from_numpy(crops)[:, None, :])
+    return [np.squeeze(row) for row in np.asarray(embs)]
+
+
+def _crop_embedding(
+    embedding_model: Any,
+    waveform: np.ndarray | PreparedAudio,
+    sample_rate: int,
+    turn: Any,
+) -> np.ndarray | None:
+    from pyannote.core import Segment
+
+    try:
+        emb = embedding_model.crop(
+            _waveform_input(np.asarray(waveform, dtype=np.float32), sample_rate),
+            Segment(turn.start, turn.end),
+        )
+        return _embedding_vector(emb)
+    except Exception:
+        logger.debug("embedding_crop_failed", start=turn.start, end=turn.end)
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Cross-chunk speaker linking
 # ---------------------------------------------------------------------------
@@ -526,15 +741,15 @@ def overlap_stats_from_turns(
     total_speech = 0.0
     prev_time = 0.0
 
-    for time, delta in events:
-        if time > prev_time:
-            dt = time - prev_time
+    for event_time, delta in events:
+        if event_time > prev_time:
+            dt = event_time - prev_time
             if active >= 2:
                 overlap_duration += dt
             if active >= 1:
                 total_speech += dt
         active += delta
-        prev_time = time
+        prev_time = event_time
 
     overlap_ratio = overlap_duration / total_speech if total_speech > 0 else 0.0
     return overlap_duration, overlap_ratio
@@ -556,6 +771,9 @@ def run_chunked_diarization(
     exclusive: bool = False,
     max_chunk_s: float = DEFAULT_MAX_CHUNK_S,
     overlap_s: float = DEFAULT_OVERLAP_S,
+    speech_regions: Sequence[tuple[float, float]] | None = None,
+    cpu_workers: int = 1,
+    pipeline_model_id: str | None = None,
     log: structlog.BoundLogger | None = None,
 ) -> tuple[list[str], list[SpeakerTurn]]:
     """Run diarization on long audio by chunking, diarizing, and merging.
@@ -574,6 +792,12 @@ def run_chunked_diarization(
             engine's existing ``_convert_annotation`` method.
         max_chunk_s: Maximum chunk duration in seconds.
         overlap_s: Overlap between adjacent chunks in seconds.
+        speech_regions: Optional sorted ``(start, end)`` speech regions;
+            chunk ends are kept out of speech where the overlap allows.
+        cpu_workers: Worker processes for segmenting chunks concurrently.
+            Only used on CPU, for memory-mapped input, and when
+            *pipeline_model_id* is given so workers can load the pipeline.
+        pipeline_model_id: Model id *pipeline* was loaded from.
         log: Optional structured logger.
 
     Returns:
@@ -583,15 +807,29 @@ def run_chunked_diarization(
     _log = log or logger
 
     duration = get_audio_duration(audio_path)
-    boundaries = compute_chunk_boundaries(duration, max_chunk_s, overlap_s)
+    boundaries = compute_chunk_boundaries(
+        duration, max_chunk_s, overlap_s, speech_regions=speech_regions
+    )
+    prepared = open_prepared_audio(audio_path)
+    workers = min(cpu_workers, len(boundaries))
+    use_pool = (
+        device == "cpu"
+        and workers > 1
+        and prepared is not None
+        and pipeline_model_id is not None
+    )
     _log.info(
         "chunked_diarization_start",
         duration=round(duration, 1),
         num_chunks=len(boundaries),
         max_chunk_s=max_chunk_s,
         overlap_s=overlap_s,
+        in_memory=prepared is not None,
+        workers=workers if use_pool else 1,
     )
 
+    timings: dict[str, float] = {}
+
     # Load embedding model (lazy, once)
     embedding_model = load_embedding_model(hf_token, device)
 
@@ -600,18 +838,45 @@ def run_chunked_diarization(
     with tempfile.TemporaryDirectory(prefix="dalston_diarize_chunks_") as tmp_dir:
         work_dir = Path(tmp_dir)
 
+        # Phase 1: segmentation and clustering within each chunk
+        phase_start = time.perf_counter()
+        if use_pool:
+            assert pipeline_model_id is not None
+            pool = _get_worker_pool(pipeline_model_id, hf_token, workers)
+            futures: list[Future[Any]] = [
+                pool.submit(
+                    _diarize_chunk_in_worker,
+                    str(audio_path),
+                    start,
+                    end,
+                    diarization_params,
+                )
+                for start, end in boundaries
+            ]
         for i, (start, end) in enumerate(boundaries):
             _log.info(
                 "diarize_chunk", chunk=i, start=round(start, 1), end=round(end, 1)
             )
-
-            # Extract chunk audio
-            chunk_path = extract_chunk(audio_path, start, end, work_dir, i)
-            spec = ChunkSpec(index=i, start=start, end=end, path=chunk_path)
-
+            spec = ChunkSpec(index=i, start=start, end=end)
             try:
-                # Run pyannote on chunk
-                raw_result = pipeline(str(chunk_path), **diarization_params)
+                if use_pool:
+                    try:
+                        raw_result = futures[i].result()
+                    except BrokenProcessPool:
+                        # A worker died (e.g. OOM-killed); start fresh next time
+                        _discard_worker_pool(pipeline_model_id, workers)
+                        raise
+                elif prepared is not None:
+                    raw_result = pipeline(
+                        _waveform_input(
+                            prepared.window(start, end), prepared.sample_rate
+                        ),
+                        **diarization_params,
+                    )
+                else:
+                    chunk_path = extract_chunk(audio_path, start, end, work_dir, i)
+                    spec = ChunkSpec(index=i, start=start, end=end, path=chunk_path)
+                    raw_result = pipeline(str(chunk_path), **diarization_params)
 
                 # Apply exclusive mode if requested (single speaker per segment)
                 if exclusive and hasattr(raw_result, "exclusive_speaker_diarization"):
@@ -626,20 +891,12 @@ def run_chunked_diarization(
                 # Convert to our types
                 speakers, turns = convert_annotation(raw_result)
 
-                # Extract speaker embeddings for cross-chunk linking
-                embeddings: dict[str, np.ndarray] = {}
-                if embedding_model is not None:
-                    embeddings = extract_speaker_embeddings(
-                        chunk_path, annotation, embedding_model
-                    )
-
                 chunk_results.append(
                     ChunkResult(
                         spec=spec,
                         speakers=speakers,
                         turns=turns,
                         annotation=annotation,
-                        embeddings=embeddings,
                     )
                 )
 
@@ -648,7 +905,6 @@ def run_chunked_diarization(
                     chunk=i,
                     speakers=len(speakers),
                     turns=len(turns),
-                    embeddings=len(embeddings),
                 )
             except Exception:
                 _log.warning("chunk_diarization_failed", chunk=i, exc_info=True)
@@ -662,15 +918,50 @@ def run_chunked_diarization(
                     torch.cuda.empty_cache()
                 except Exception:
                     pass
-
-    if not chunk_results:
-        raise RuntimeError("All chunks failed during chunked diarization")
+        timings["segmentation"] = time.perf_counter() - phase_start
+
+        if not chunk_results:
+            raise RuntimeError("All chunks failed during chunked diarization")
+
+        # Phase 2: speaker embeddings for cross-chunk linking
+        phase_start = time.perf_counter()
+        if embedding_model is not None:
+            if prepared is not None:
+                centroids = extract_speaker_embeddings_batched(
+                    [
+                        (
+                            chunk.spec.index,
+                            prepared.view(chunk.spec.start, chunk.spec.end),
+                            chunk.annotation,
+                        )
+                        for chunk in chunk_results
+                    ],
+                    embedding_model,
+                    prepared.sample_rate,
+                )
+                for chunk in chunk_results:
+                    chunk.embeddings = centroids.get(chunk.spec.index, {})
+            else:
+                for chunk in chunk_results:
+                    assert chunk.spec.path is not None
+                    chunk.embeddings = extract_speaker_embeddings(
+                        chunk.spec.path, chunk.annotation, embedding_model
+                    )
+        timings["embedding"] = time.perf_counter() - phase_start
 
     # Link speakers across chunks
+    phase_start = time.perf_counter()
     label_maps = link_speakers(chunk_results)
+    timings["linking"] = time.perf_counter() - phase_start
 
     # Merge into single timeline
+    phase_start = time.perf_counter()
     speakers, turns = merge_chunks(chunk_results, label_maps, overlap_s)
+    timings["merge"] = time.perf_counter() - phase_start
+
+    engine_id = os.environ.get("DALSTON_ENGINE_ID", "unknown")
+    for phase, seconds in timings.items():
+        dalston.metrics.observe_engine_diarize_phase(engine_id, phase, seconds)
 
     _log.info(
         "chunked_diarization_complete",
@@ -678,6 +969,8 @@ def run_chunked_diarization(
         total_turns=len(turns),
         chunks_succeeded=len(chunk_results),
         chunks_total=len(boundaries),
+        embeddings=sum(len(c.embeddings) for c in chunk_results),
+        timings_s={phase: round(t, 3) for phase, t in timings.items()},
     )
 
     return speakers, turns
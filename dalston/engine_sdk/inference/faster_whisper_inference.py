@@ -23,6 +23,7 @@ import structlog
 
 import dalston.metrics
 import dalston.telemetry
+from dalston.engine_sdk.admission import batch_checkpoint
 from dalston.engine_sdk.managers import FasterWhisperModelManager
 
 if TYPE_CHECKING:
@@ -369,9 +370,14 @@ class FasterWhisperInference:
 
     @staticmethod
     def _collect_segments(segments_generator) -> list[SegmentResult]:  # noqa: ANN001
-        """Iterate faster-whisper segment generator into neutral result types."""
+        """Iterate faster-whisper segment generator into neutral result types.
+
+        The generator decodes lazily, one window at a time, so each
+        iteration is a chunk boundary where batch work may yield to RT.
+        """
         segments: list[SegmentResult] = []
         for segment in segments_generator:
+            batch_checkpoint()
             words: list[WordResult] = []
             if segment.words:
                 words = [
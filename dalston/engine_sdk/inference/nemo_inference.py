@@ -151,6 +151,32 @@ class NemoInference:
             self._manager.release(model_id)
             self._current_model_id = None
 
+    def transcribe_batch(
+        self,
+        audios: list[str | np.ndarray],
+        model_id: str,
+    ) -> list[NeMoTranscriptionResult]:
+        """Run transcription on several inputs in one NeMo batch.
+
+        Args:
+            audios: File paths or numpy float32 arrays
+            model_id: Model identifier (e.g. "parakeet-tdt-1.1b")
+
+        Returns:
+            List of NeMoTranscriptionResult, one per input, in order.
+        """
+        if not audios:
+            return []
+        self._current_model_id = model_id
+        model = self._manager.acquire(model_id)
+        try:
+            return self.transcribe_batch_with_model(
+                model, audios, batch_size=len(audios), model_id=model_id
+            )
+        finally:
+            self._manager.release(model_id)
+            self._current_model_id = None
+
     def transcribe_with_model(
         self,
         model: Any,
@@ -164,6 +164,62 @@ class OnnxInference:
             self._manager.release(model_id)
             self._current_model_id = None
 
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        model_id: str,
+    ) -> list[OnnxTranscriptionResult]:
+        """Transcribe several short numpy arrays in one recognize() call.
+
+        onnx-asr pads the inputs and runs them through the encoder as one
+        batch. Used by the realtime engine to decode utterances from
+        concurrent sessions together.
+
+        Args:
+            audios: numpy float32 arrays (mono, 16kHz)
+            model_id: Model identifier (e.g. "parakeet-onnx-ctc-0.6b")
+
+        Returns:
+            One OnnxTranscriptionResult per input, in input order.
+        """
+        if not audios:
+            return []
+        self._current_model_id = model_id
+        model = self._manager.acquire(model_id)
+        try:
+            ts_model = model.with_timestamps()
+            batch = [
+                (a if a.dtype == np.float32 else a.astype(np.float32)).squeeze()
+                for a in audios
+            ]
+            audio_duration_s = sum(len(a) for a in batch) / 16000.0
+            engine_id = os.environ.get("DALSTON_ENGINE_ID", "onnx")
+
+            start = time.monotonic()
+            with dalston.telemetry.create_span(
+                "engine.recognize",
+                attributes={
+                    "dalston.device": self._device,
+                    "dalston.audio_duration_s": round(audio_duration_s, 3),
+                    "dalston.mode": "direct_batch",
+                    "dalston.batch_size": len(batch),
+                },
+            ):
+                results = ts_model.recognize(batch, sample_rate=16000)
+            recognize_time = time.monotonic() - start
+
+            dalston.metrics.observe_engine_recognize(
+                engine_id, model_id, self._device, recognize_time
+            )
+            if audio_duration_s > 0:
+                dalston.metrics.observe_engine_realtime_factor(
+                    engine_id, model_id, self._device, recognize_time / audio_duration_s
+                )
+            return [self._parse_result(result) for result in results]
+        finally:
+            self._manager.release(model_id)
+            self._current_model_id = None
+
     def transcribe_with_model(
         self,
         model: Any,
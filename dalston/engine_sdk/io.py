@@ -4,31 +4,68 @@ Engines use synchronous boto3 for simpler processing loops.
 Files are downloaded to local temp, processed, then results uploaded.
 """
 
-import json
+import hashlib
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import urlparse
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
+from dalston.common.payload_codec import decode_payload, encode_payload
+
+_MB = 1024 * 1024
+
+# Shared client, rebuilt only when its settings change (see get_s3_client).
+_s3_client_lock = threading.Lock()
+_s3_client_cache: dict[str, Any] = {}
+
 
 def get_s3_client():
-    """Create a boto3 S3 client using environment variables.
+    """Return the process-wide boto3 S3 client.
+
+    boto3 clients are thread-safe, so one client (and its HTTP connection
+    pool) is shared by the task loop, prefetch and artifact transfers instead
+    of building a new client and TLS connections for every object. A new
+    client is created only when the settings below change.
 
     Environment variables:
         DALSTON_S3_ENDPOINT_URL: Custom endpoint (e.g., MinIO for local dev)
         DALSTON_S3_REGION: AWS region (default: eu-west-2)
+        DALSTON_S3_MAX_POOL_CONNECTIONS: HTTP connection pool size; should
+            cover the transfer concurrency plus prefetch (default: 32)
+        DALSTON_S3_MAX_ATTEMPTS: Total attempts per request, standard retry
+            mode (default: 3)
         AWS_ACCESS_KEY_ID: AWS access key
         AWS_SECRET_ACCESS_KEY: AWS secret key
     """
-    endpoint_url = os.environ.get("DALSTON_S3_ENDPOINT_URL")
-    region = os.environ.get("DALSTON_S3_REGION", "eu-west-2")
-
+    settings = (
+        os.environ.get("DALSTON_S3_ENDPOINT_URL") or None,
+        os.environ.get("DALSTON_S3_REGION", "eu-west-2"),
+        int(os.environ.get("DALSTON_S3_MAX_POOL_CONNECTIONS", "32")),
+        int(os.environ.get("DALSTON_S3_MAX_ATTEMPTS", "3")),
+    )
+    with _s3_client_lock:
+        if _s3_client_cache.get("settings") != settings:
+            _s3_client_cache["client"] = _create_s3_client(*settings)
+            _s3_client_cache["settings"] = settings
+        return _s3_client_cache["client"]
+
+
+def _create_s3_client(
+    endpoint_url: str | None,
+    region: str,
+    max_pool_connections: int,
+    max_attempts: int,
+):
     config = Config(
-        retries={"max_attempts": 3, "mode": "standard"},
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={"max_attempts": max_attempts, "mode": "standard"},
     )
 
     kwargs: dict[str, Any] = {
@@ -42,6 +79,78 @@ def get_s3_client():
     return boto3.client("s3", **kwargs)
 
 
+def get_transfer_config() -> TransferConfig:
+    """Build the managed-transfer config used for artifact files.
+
+    Objects above the multipart threshold are fetched with parallel ranged
+    GETs and stored with parallel multipart PUTs.
+
+    Environment variables:
+        DALSTON_S3_MULTIPART_THRESHOLD_MB: Size above which transfers are
+            split into parts (default: 16)
+        DALSTON_S3_MULTIPART_CHUNKSIZE_MB: Part size (default: 16)
+        DALSTON_S3_TRANSFER_CONCURRENCY: Parallel parts per object (default: 8)
+    """
+    return TransferConfig(
+        multipart_threshold=int(
+            os.environ.get("DALSTON_S3_MULTIPART_THRESHOLD_MB", "16")
+        )
+        * _MB,
+        multipart_chunksize=int(
+            os.environ.get("DALSTON_S3_MULTIPART_CHUNKSIZE_MB", "16")
+        )
+        * _MB,
+        max_concurrency=int(os.environ.get("DALSTON_S3_TRANSFER_CONCURRENCY", "8")),
+    )
+
+
+class _HashingReader:
+    """File wrapper that feeds bytes into SHA-256 as the uploader reads them.
+
+    Only bytes read in order are hashed. If the reader ever seeks past the
+    hashed prefix (e.g. parallel part reads), ``hexdigest`` falls back to
+    re-reading the file so the result is always the full-file digest.
+    """
+
+    def __init__(self, raw: BinaryIO, path: Path) -> None:
+        self._raw = raw
+        self._path = path
+        self._digest = hashlib.sha256()
+        self._hashed_upto = 0
+
+    def read(self, size: int = -1) -> bytes:
+        position = self._raw.tell()
+        data = self._raw.read(size)
+        end = position + len(data)
+        if position <= self._hashed_upto < end:
+            self._digest.update(data[self._hashed_upto - position :])
+            self._hashed_upto = end
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def hexdigest(self) -> str:
+        if self._hashed_upto == self._path.stat().st_size:
+            return self._digest.hexdigest()
+        return sha256_file(self._path)
+
+
+def sha256_file(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a local file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(_MB)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def parse_s3_uri(uri: str) -> tuple[str, str]:
     """Parse an S3 URI into bucket and key.
 
@@ -84,7 +193,7 @@ def download_file(s3_uri: str, local_path: Path | None = None) -> Path:
         local_path = Path(temp_path)
 
     local_path.parent.mkdir(parents=True, exist_ok=True)
-    s3.download_file(bucket, key, str(local_path))
+    s3.download_file(bucket, key, str(local_path), Config=get_transfer_config())
 
     return local_path
 
@@ -102,16 +211,39 @@ def upload_file(local_path: Path, s3_uri: str) -> str:
     bucket, key = parse_s3_uri(s3_uri)
     s3 = get_s3_client()
 
-    s3.upload_file(str(local_path), bucket, key)
+    s3.upload_file(str(local_path), bucket, key, Config=get_transfer_config())
 
     return s3_uri
 
 
+def upload_file_with_sha256(local_path: Path, s3_uri: str) -> str:
+    """Upload a file to S3 and return its SHA-256 computed during the upload.
+
+    Args:
+        local_path: Local file path to upload
+        s3_uri: S3 URI to upload to
+
+    Returns:
+        Hex SHA-256 digest of the uploaded file
+    """
+    bucket, key = parse_s3_uri(s3_uri)
+    s3 = get_s3_client()
+
+    with local_path.open("rb") as f:
+        reader = _HashingReader(f, local_path)
+        s3.upload_fileobj(reader, bucket, key, Config=get_transfer_config())
+
+    return reader.hexdigest()
+
+
 def download_json(s3_uri: str) -> dict[str, Any]:
-    """Download and parse a JSON file from S3.
+    """Download and parse a task payload from S3.
+
+    Decodes compact or indented JSON and, when installed, msgpack+zstd
+    (see ``dalston.common.payload_codec``).
 
     Args:
-        s3_uri: S3 URI to the JSON file
+        s3_uri: S3 URI to the payload
 
     Returns:
         Parsed JSON as a dictionary
@@ -120,13 +252,14 @@ def download_json(s3_uri: str) -> dict[str, Any]:
     s3 = get_s3_client()
 
     response = s3.get_object(Bucket=bucket, Key=key)
-    content = response["Body"].read().decode("utf-8")
-
-    return json.loads(content)
+    return decode_payload(response["Body"].read(), response.get("ContentType"))
 
 
 def upload_json(data: dict[str, Any], s3_uri: str) -> str:
-    """Upload a dictionary as JSON to S3.
+    """Upload a dictionary to S3 as a task payload.
+
+    Encoded as compact JSON, or msgpack+zstd when DALSTON_TASK_PAYLOAD_FORMAT
+    selects it (see ``dalston.common.payload_codec``).
 
     Args:
         data: Dictionary to serialize and upload
@@ -138,12 +271,12 @@ def upload_json(data: dict[str, Any], s3_uri: str) -> str:
     bucket, key = parse_s3_uri(s3_uri)
     s3 = get_s3_client()
 
-    content = json.dumps(data, indent=2, default=str)
+    body, content_type = encode_payload(data)
     s3.put_object(
         Bucket=bucket,
         Key=key,
-        Body=content.encode("utf-8"),
-        ContentType="application/json",
+        Body=body,
+        ContentType=content_type,
     )
 
     return s3_uri
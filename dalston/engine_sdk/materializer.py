@@ -1,9 +1,22 @@
-"""Runner-side artifact materialization and persistence utilities."""
+"""Runner-side artifact materialization and persistence utilities.
+
+Slots are downloaded and produced artifacts uploaded concurrently on a
+process-wide transfer pool (``DALSTON_ARTIFACT_TRANSFER_WORKERS``, default
+8), so a merge task pulling several per-channel artifacts waits for the
+slowest object rather than the sum of all of them.
+
+An optional ``NodeArtifactCache`` serves downloads from a node-local copy
+and is populated with every verified download and produced artifact.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
+import os
 import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
 from pathlib import Path
@@ -15,6 +28,32 @@ from dalston.common.artifacts import (
     build_task_artifact_id,
 )
 from dalston.engine_sdk import io
+from dalston.engine_sdk.artifact_cache import NodeArtifactCache
+
+#: Observer for per-object transfer timings: (direction, seconds), where
+#: direction is "download" or "upload".
+TransferObserver = Callable[[str, float], None]
+
+_transfer_pool: concurrent.futures.ThreadPoolExecutor | None = None
+_transfer_pool_lock = threading.Lock()
+
+
+def get_transfer_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide thread pool used for artifact transfers."""
+    global _transfer_pool
+    with _transfer_pool_lock:
+        if _transfer_pool is None:
+            _transfer_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(
+                    os.environ.get("DALSTON_ARTIFACT_TRANSFER_WORKERS", "8")
+                ),
+                thread_name_prefix="artifact-transfer",
+            )
+        return _transfer_pool
+
+
+class ArtifactChecksumError(ValueError):
+    """Raised when a materialized artifact does not match its checksum."""
 
 
 class ArtifactStore(ABC):
@@ -28,6 +67,15 @@ class ArtifactStore(ABC):
     def upload(self, source: Path, locator: str) -> None:
         """Upload local file to remote storage locator."""
 
+    def upload_with_checksum(self, source: Path, locator: str) -> str:
+        """Upload a file and return its SHA-256 hex digest.
+
+        Stores that can hash while streaming should override this; the
+        default uploads and then re-reads the file.
+        """
+        self.upload(source, locator)
+        return io.sha256_file(source)
+
 
 class S3ArtifactStore(ArtifactStore):
     """Artifact transport using existing engine SDK I/O helpers."""
@@ -38,6 +86,9 @@ class S3ArtifactStore(ArtifactStore):
     def upload(self, source: Path, locator: str) -> None:
         io.upload_file(source, locator)
 
+    def upload_with_checksum(self, source: Path, locator: str) -> str:
+        return io.upload_file_with_sha256(source, locator)
+
 
 class LocalFilesystemArtifactStore(ArtifactStore):
     """Artifact transport that reads/writes directly from local filesystem."""
@@ -52,17 +103,48 @@ class LocalFilesystemArtifactStore(ArtifactStore):
         destination.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, destination)
 
+    def upload_with_checksum(self, source: Path, locator: str) -> str:
+        destination = Path(locator)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with source.open("rb") as src, destination.open("wb") as dst:
+            while chunk := src.read(1024 * 1024):
+                digest.update(chunk)
+                dst.write(chunk)
+        shutil.copystat(source, destination)
+        return digest.hexdigest()
+
 
 class ArtifactMaterializer:
-    """Materialize required artifacts and persist produced artifacts."""
+    """Materialize required artifacts and persist produced artifacts.
+
+    Args:
+        store: Transport for artifact bytes
+        locator_builder: Maps a produced artifact to its storage locator
+        transfer_pool: Executor for concurrent transfers (defaults to the
+            shared pool from ``get_transfer_pool``)
+        transfer_observer: Called with each object's transfer time
+        verify_checksums: Check downloaded files against
+            ``ArtifactReference.checksum`` when one is recorded
+        cache: Node-local artifact cache consulted before downloading
+    """
 
     def __init__(
         self,
         store: ArtifactStore,
         locator_builder: Callable[[str, str, ProducedArtifact], str] | None = None,
+        *,
+        transfer_pool: concurrent.futures.Executor | None = None,
+        transfer_observer: TransferObserver | None = None,
+        verify_checksums: bool = True,
+        cache: NodeArtifactCache | None = None,
     ) -> None:
         self.store = store
         self._locator_builder = locator_builder or self._default_locator_builder
+        self._transfer_pool = transfer_pool
+        self._transfer_observer = transfer_observer
+        self._verify_checksums = verify_checksums
+        self._cache = cache
 
     def materialize(
         self,
@@ -72,9 +154,11 @@ class ArtifactMaterializer:
         target_dir: Path,
     ) -> dict[str, MaterializedArtifact]:
         """Download task dependencies into local paths keyed by slot."""
-        materialized: dict[str, MaterializedArtifact] = {}
         target_dir.mkdir(parents=True, exist_ok=True)
 
+        # Resolve every slot before starting transfers so a bad binding
+        # fails fast without downloading anything.
+        downloads: list[tuple[str, ArtifactReference, Path]] = []
         for slot, artifact_id in resolved_artifact_ids.items():
             ref = artifact_index.get(artifact_id)
             if ref is None:
@@ -82,18 +166,20 @@ class ArtifactMaterializer:
 
             suffix = Path(ref.storage_locator).suffix or ".bin"
             destination = target_dir / f"{slot}_{artifact_id}{suffix}"
-            self.store.download(ref.storage_locator, destination)
-
-            materialized[slot] = MaterializedArtifact(
-                artifact_id=ref.artifact_id,
-                kind=ref.kind,
-                local_path=destination,
-                channel=ref.channel,
-                role=ref.role,
-                media_type=ref.media_type,
-            )
+            downloads.append((slot, ref, destination))
 
-        return materialized
+        results = self._run_transfers(
+            [
+                (self._download_one, (ref, destination))
+                for _slot, ref, destination in downloads
+            ]
+        )
+        return {
+            slot: materialized
+            for (slot, _ref, _destination), materialized in zip(
+                downloads, results, strict=True
+            )
+        }
 
     def persist_produced(
         self,
@@ -103,40 +189,103 @@ class ArtifactMaterializer:
         stage: str | None = None,
         produced_artifacts: Iterable[ProducedArtifact],
     ) -> list[ArtifactReference]:
-        """Upload produced files and return persisted artifact references."""
-        persisted: list[ArtifactReference] = []
-        for produced in produced_artifacts:
-            artifact_id = build_task_artifact_id(task_id, produced.logical_name)
-            storage_locator = self._locator_builder(job_id, task_id, produced)
-            self.store.upload(produced.local_path, storage_locator)
-
-            persisted.append(
-                ArtifactReference(
-                    artifact_id=artifact_id,
-                    kind=produced.kind,
-                    storage_locator=storage_locator,
-                    checksum=self._checksum(produced.local_path),
-                    size=produced.local_path.stat().st_size,
-                    media_type=produced.media_type,
-                    channel=produced.channel,
-                    role=produced.role,
-                    producer_task_id=task_id,
-                    producer_stage=stage,
-                )
+        """Upload produced files and return persisted artifact references.
+
+        The SHA-256 checksum is computed in the same pass as the upload.
+        """
+        produced_list = list(produced_artifacts)
+        uploads = [
+            (produced, self._locator_builder(job_id, task_id, produced))
+            for produced in produced_list
+        ]
+        checksums = self._run_transfers(
+            [
+                (self._upload_one, (produced.local_path, storage_locator))
+                for produced, storage_locator in uploads
+            ]
+        )
+
+        return [
+            ArtifactReference(
+                artifact_id=build_task_artifact_id(task_id, produced.logical_name),
+                kind=produced.kind,
+                storage_locator=storage_locator,
+                checksum=checksum,
+                size=produced.local_path.stat().st_size,
+                media_type=produced.media_type,
+                channel=produced.channel,
+                role=produced.role,
+                producer_task_id=task_id,
+                producer_stage=stage,
             )
+            for (produced, storage_locator), checksum in zip(
+                uploads, checksums, strict=True
+            )
+        ]
+
+    def _run_transfers(self, calls: list[tuple[Callable, tuple]]) -> list:
+        """Run transfer calls concurrently and return results in order.
+
+        Waits for every transfer to settle before raising the first error,
+        so no download is still writing into a temp dir being cleaned up.
+        """
+        if len(calls) <= 1:
+            return [fn(*args) for fn, args in calls]
+
+        pool = self._transfer_pool or get_transfer_pool()
+        futures = [pool.submit(fn, *args) for fn, args in calls]
+        concurrent.futures.wait(futures)
+        return [future.result() for future in futures]
+
+    def _download_one(
+        self, ref: ArtifactReference, destination: Path
+    ) -> MaterializedArtifact:
+        if self._cache is not None and self._cache.fetch(ref, destination):
+            return self._materialized(ref, destination)
 
-        return persisted
+        start = time.monotonic()
+        self.store.download(ref.storage_locator, destination)
+        self._observe("download", time.monotonic() - start)
+
+        if self._verify_checksums and ref.checksum:
+            actual = io.sha256_file(destination)
+            if actual != ref.checksum:
+                raise ArtifactChecksumError(
+                    f"Checksum mismatch for artifact {ref.artifact_id} "
+                    f"({ref.storage_locator}): expected {ref.checksum}, "
+                    f"got {actual}"
+                )
+
+        if self._cache is not None:
+            self._cache.put(
+                destination, checksum=ref.checksum, artifact_id=ref.artifact_id
+            )
+        return self._materialized(ref, destination)
 
     @staticmethod
-    def _checksum(path: Path) -> str:
-        digest = hashlib.sha256()
-        with path.open("rb") as f:
-            while True:
-                chunk = f.read(1024 * 1024)
-                if not chunk:
-                    break
-                digest.update(chunk)
-        return digest.hexdigest()
+    def _materialized(
+        ref: ArtifactReference, destination: Path
+    ) -> MaterializedArtifact:
+        return MaterializedArtifact(
+            artifact_id=ref.artifact_id,
+            kind=ref.kind,
+            local_path=destination,
+            channel=ref.channel,
+            role=ref.role,
+            media_type=ref.media_type,
+        )
+
+    def _upload_one(self, source: Path, storage_locator: str) -> str:
+        start = time.monotonic()
+        checksum = self.store.upload_with_checksum(source, storage_locator)
+        self._observe("upload", time.monotonic() - start)
+        if self._cache is not None:
+            self._cache.put(source, checksum=checksum)
+        return checksum
+
+    def _observe(self, direction: str, seconds: float) -> None:
+        if self._transfer_observer is not None:
+            self._transfer_observer(direction, seconds)
 
     @staticmethod
     def _bucket() -> str:
@@ -0,0 +1,111 @@
+"""Input prefetching for pipelined task processing.
+
+While the current task runs inference, a single background worker reserves
+the next stream message and downloads its request JSON and artifacts into a
+staging temp dir.  When the current task finishes, the runner picks up the
+staged task and goes straight into ``engine.process()``.
+
+The reserved message sits unACKed in this consumer's PEL exactly like a
+message being processed, so crash recovery (stale-task claiming) and
+deferral semantics are unchanged.  Prefetch depth is fixed at one message.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+
+from dalston.common.streams_types import StreamMessage
+from dalston.engine_sdk.types import TaskRequest
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class StagedTask:
+    """A reserved stream message, optionally with its inputs pre-loaded.
+
+    ``task_request`` is None when staging was skipped (cancelled job) or
+    failed; the runner then loads inputs inline as usual.
+    """
+
+    message: StreamMessage
+    temp_dir: Path | None = None
+    task_request: TaskRequest | None = None
+
+    def discard(self) -> None:
+        """Remove the staging directory if it still exists."""
+        if self.temp_dir is not None and self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TaskPrefetcher:
+    """Reserve and stage the next stream message in the background.
+
+    Args:
+        receive: Reads the next message, skipping the given in-flight
+            message IDs.  Returns None on poll timeout.
+        stage_inputs: Loads a message's inputs into a ``StagedTask``.
+            Must not raise; failures are reported by returning a
+            ``StagedTask`` without a ``task_request``.
+    """
+
+    def __init__(
+        self,
+        *,
+        receive: Callable[[frozenset[str]], StreamMessage | None],
+        stage_inputs: Callable[[StreamMessage], StagedTask],
+    ) -> None:
+        self._receive = receive
+        self._stage_inputs = stage_inputs
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="task-prefetch"
+        )
+        self._pending: concurrent.futures.Future[StagedTask | None] | None = None
+
+    def start(self, exclude: frozenset[str]) -> None:
+        """Begin reserving the next message unless a prefetch is pending."""
+        if self._pending is None:
+            self._pending = self._executor.submit(self._prefetch, exclude)
+
+    def collect(self) -> StagedTask | None:
+        """Wait for the pending prefetch and return its result.
+
+        Returns None when nothing was started or the read timed out.
+        Errors from the stream read (e.g. Redis connection loss) are
+        re-raised to the caller's poll loop.
+        """
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return None
+        return pending.result()
+
+    def shutdown(self) -> None:
+        """Stop prefetching and drop any staged inputs.
+
+        A message that was already reserved stays in the PEL and is
+        recovered by stale-task claiming once this instance stops
+        heartbeating.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None and pending.done() and pending.exception() is None:
+            staged = pending.result()
+            if staged is not None:
+                staged.discard()
+                logger.info(
+                    "prefetched_task_released",
+                    task_id=staged.message.task_id,
+                    message_id=staged.message.id,
+                )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch(self, exclude: frozenset[str]) -> StagedTask | None:
+        message = self._receive(exclude)
+        if message is None:
+            return None
+        return self._stage_inputs(message)
@@ -0,0 +1,290 @@
+"""Memory-mapped access to prepared audio for engine stages.
+
+The prepare stage writes 16 kHz mono PCM16 WAV, and several later
+stages (VAD chunking, alignment, diarization, format checks) read the
+same file again.  Decoding it to a float32 array costs 4 bytes per
+sample up front — hundreds of MB for multi-hour audio — even when a
+stage only ever looks at one window at a time.
+
+:func:`open_prepared_audio` memory-maps the file's PCM data instead and
+returns a :class:`PreparedAudio`.  Slicing it yields zero-copy int16
+views; float32 samples are produced per window (:meth:`PreparedAudio.window`,
+``np.asarray(view)``), so resident memory tracks the window being
+processed rather than the file's duration.  Pages are shared with the
+OS page cache and with every other process mapping the same file.
+
+:func:`probe_audio` reads format headers and caches the result by
+path, mtime and size, so repeated format checks on the same file do
+not re-open it.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# numpy is engine-only — see comment in engine_sdk/audio.py.
+if TYPE_CHECKING:
+    import numpy as np
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_PROBE_CACHE_SIZE = 256
+_probe_cache: OrderedDict[tuple[str, int, int], AudioProbe | None] = OrderedDict()
+_probe_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """Header-level description of an audio file.
+
+    ``bit_depth`` is None for lossy codecs.  ``pcm16_offset`` is the
+    byte offset of the sample data when the file is a PCM16 WAV that
+    can be memory-mapped, else None.
+    """
+
+    sample_rate: int
+    channels: int
+    bit_depth: int | None
+    num_frames: int
+    pcm16_offset: int | None = None
+
+    @property
+    def duration_s(self) -> float:
+        return self.num_frames / self.sample_rate if self.sample_rate else 0.0
+
+
+def probe_audio(audio_path: Path) -> AudioProbe | None:
+    """Probe an audio file's format, caching by path, mtime and size.
+
+    WAV headers are parsed directly; other formats go through
+    ``soundfile``.  Returns None for missing files and formats that
+    cannot be probed.
+    """
+    try:
+        stat = os.stat(audio_path)
+    except OSError:
+        return None
+    key = (os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
+    with _probe_lock:
+        if key in _probe_cache:
+            _probe_cache.move_to_end(key)
+            return _probe_cache[key]
+
+    probe = _probe_wav(audio_path, stat.st_size)
+    if probe is None:
+        probe = _probe_soundfile(audio_path)
+
+    with _probe_lock:
+        _probe_cache[key] = probe
+        while len(_probe_cache) > _PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+    return probe
+
+
+def _probe_wav(audio_path: Path, file_size: int) -> AudioProbe | None:
+    """Parse RIFF/WAVE chunk headers without reading the sample data."""
+    try:
+        with open(audio_path, "rb") as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            fmt: tuple[int, ...] | None = None
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id, size = struct.unpack("<4sI", chunk_header)
+                if chunk_id == b"fmt ":
+                    body = f.read(size + (size & 1))
+                    fmt = struct.unpack("<HHIIHH", body[:16])
+                    if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                        # Sub-format GUID starts with the real format tag
+                        (sub_format,) = struct.unpack("<H", body[24:26])
+                        fmt = (sub_format, *fmt[1:])
+                elif chunk_id == b"data":
+                    data_offset = f.tell()
+                    break
+                else:
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+    if fmt is None:
+        return None
+    format_tag, channels, sample_rate, _, block_align, bits = fmt
+    if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_IEEE_FLOAT):
+        return None
+    if channels <= 0 or sample_rate <= 0 or block_align <= 0:
+        return None
+
+    # Streaming writers leave the data size unset; trust the file length
+    data_size = min(size, file_size - data_offset)
+    is_pcm16 = format_tag == _WAVE_FORMAT_PCM and bits == 16
+    return AudioProbe(
+        sample_rate=sample_rate,
+        channels=channels,
+        bit_depth=bits,
+        num_frames=data_size // block_align,
+        pcm16_offset=data_offset if is_pcm16 else None,
+    )
+
+
+def _probe_soundfile(audio_path: Path) -> AudioProbe | None:
+    try:
+        import soundfile as sf
+
+        info = sf.info(str(audio_path))
+    except Exception:
+        return None
+
+    # Map soundfile subtype strings to bit depth
+    subtype_to_bits: dict[str, int] = {
+        "PCM_16": 16,
+        "PCM_24": 24,
+        "PCM_32": 32,
+        "PCM_S8": 8,
+        "PCM_U8": 8,
+        "FLOAT": 32,
+        "DOUBLE": 64,
+    }
+    return AudioProbe(
+        sample_rate=info.samplerate,
+        channels=info.channels,
+        bit_depth=subtype_to_bits.get(info.subtype),
+        num_frames=info.frames,
+    )
+
+
+class PreparedAudio:
+    """Read-only, memory-mapped view of mono PCM16 audio.
+
+    Behaves like a 1-D float32 sample array for the operations engine
+    code uses on decoded audio: ``len()``, ``.size``, slicing and
+    ``np.asarray()``.  Slicing returns another :class:`PreparedAudio`
+    sharing the same mapping; float32 conversion only happens when a
+    window is materialized.
+    """
+
+    def __init__(self, samples: np.ndarray, sample_rate: int) -> None:
+        self.samples = samples
+        self.sample_rate = sample_rate
+
+    @property
+    def size(self) -> int:
+        return int(self.samples.shape[0])
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (self.size,)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def dtype(self) -> Any:
+        import numpy as np
+
+        return np.dtype(np.float32)
+
+    @property
+    def duration_s(self) -> float:
+        return self.size / self.sample_rate
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, key: slice) -> PreparedAudio:
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("PreparedAudio only supports contiguous slices")
+        return PreparedAudio(self.samples[key], self.sample_rate)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        audio = self.to_float32()
+        return audio if dtype is None else audio.astype(dtype, copy=False)
+
+    def view(self, start_s: float, end_s: float) -> PreparedAudio:
+        """Zero-copy view of the samples between two times in seconds."""
+        lo = max(0, int(round(start_s * self.sample_rate)))
+        hi = min(self.size, int(round(end_s * self.sample_rate)))
+        return self[lo:hi]
+
+    def window(self, start_s: float, end_s: float) -> np.ndarray:
+        """Float32 samples between ``start_s`` and ``end_s`` seconds."""
+        return self.view(start_s, end_s).to_float32()
+
+    def to_float32(self) -> np.ndarray:
+        """Float32 copy of these samples in [-1, 1)."""
+        import numpy as np
+
+        return np.multiply(self.samples, 1.0 / 32768.0, dtype=np.float32)
+
+
+def open_prepared_audio(
+    audio_path: Path, sample_rate: int | None = None
+) -> PreparedAudio | None:
+    """Memory-map a mono PCM16 WAV file.
+
+    Returns None when the file is not a mono PCM16 WAV, or (if
+    ``sample_rate`` is given) is at a different rate; callers then fall
+    back to a full decode.
+    """
+    probe = probe_audio(audio_path)
+    if probe is None or probe.pcm16_offset is None or probe.channels != 1:
+        return None
+    if sample_rate is not None and probe.sample_rate != sample_rate:
+        return None
+    if probe.num_frames <= 0:
+        return None
+
+    import numpy as np
+
+    samples = np.memmap(
+        audio_path,
+        dtype="<i2",
+        mode="r",
+        offset=probe.pcm16_offset,
+        shape=(probe.num_frames,),
+    )
+    return PreparedAudio(samples, probe.sample_rate)
+
+
+def load_audio_f32(audio_path: Path, sample_rate: int) -> np.ndarray:
+    """Decode a whole file to float32 mono at ``sample_rate``.
+
+    Mono PCM16 WAV at the requested rate is converted straight from the
+    mapping.  Anything else is decoded with ``soundfile``, downmixed by
+    averaging and resampled with ``librosa``.
+    """
+    prepared = open_prepared_audio(audio_path, sample_rate)
+    if prepared is not None:
+        return prepared.to_float32()
+
+    import numpy as np
+
+    try:
+        import soundfile as sf
+    except ImportError as exc:
+        raise RuntimeError("soundfile is required to decode audio") from exc
+
+    data, sr = sf.read(str(audio_path), dtype="float32", always_2d=False)
+    if data.ndim > 1:
+        data = data.mean(axis=1).astype(np.float32, copy=False)
+    if sr != sample_rate:
+        try:
+            import librosa
+        except ImportError as exc:
+            raise RuntimeError(
+                f"librosa is required to resample {sr} Hz audio"
+            ) from exc
+        data = librosa.resample(data, orig_sr=sr, target_sr=sample_rate)
+        data = data.astype(np.float32, copy=False)
+    return data
@@ -40,10 +40,18 @@ from dalston.common.streams_sync import (
 )
 from dalston.common.streams_types import WAITING_ENGINE_TASKS_KEY
 from dalston.common.timeouts import TASK_UNKNOWN_DURATION_TIMEOUT_S
+from dalston.common.word_columns import encode_transcript_words
 from dalston.engine_sdk import io
-from dalston.engine_sdk.admission import TaskDeferredError
+from dalston.engine_sdk.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    TaskDeferredError,
+)
+from dalston.engine_sdk.artifact_cache import NodeArtifactCache
 from dalston.engine_sdk.context import BatchTaskContext
 from dalston.engine_sdk.materializer import ArtifactMaterializer, S3ArtifactStore
+from dalston.engine_sdk.prefetch import StagedTask, TaskPrefetcher
+from dalston.engine_sdk.prepared_audio import probe_audio
 from dalston.engine_sdk.types import TaskRequest, TaskResponse
 from dalston.orchestrator.catalog import get_catalog
 
@@ -66,6 +74,22 @@ class EngineRunner:
     5. Uploads task output to S3
     6. Publishes completion/failure events
     7. Cleans up temp files
+
+    By default one task is processed at a time.  Setting
+    ``DALSTON_ENGINE_TASK_CONCURRENCY`` above 1 switches to a bounded
+    concurrent mode: the poll loop admits up to N tasks through an
+    ``AdmissionController`` and hands each to a worker pool.  Every
+    in-flight task keeps its own stream message ID, ACK and temp dir.
+    Only enable it for engines whose ``process()`` is thread-safe —
+    typically I/O-heavy CPU stages (prepare, merge, PII, redact).
+
+    For serial engines (e.g. a single GPU model), ``DALSTON_ENGINE_PREFETCH``
+    pipelines input loading instead: the next message is reserved and its
+    artifacts are materialized into a staging dir while the current task
+    runs.  Prefetch is ignored in concurrent mode.
+
+    ``DALSTON_ARTIFACT_CACHE_DIR`` enables a node-local artifact cache shared
+    with co-located engines (see ``dalston.engine_sdk.artifact_cache``).
     """
 
     # Redis key patterns (display only - actual stream key built by streams module)
@@ -77,6 +101,8 @@ class EngineRunner:
     TEMP_DIR_PREFIX = "dalston_task_"
     HEARTBEAT_INTERVAL = 10  # seconds between heartbeats
     HEARTBEAT_TTL = 60  # auto-expire heartbeat if engine crashes
+    # Weight of the newest task in the rolling RTF sent on heartbeats
+    RTF_EWMA_ALPHA = 0.2
     DURABLE_EVENT_MAX_RETRIES = 5
     DURABLE_EVENT_BASE_BACKOFF_SECONDS = 0.1
     # Fallback when the task metadata has no parseable ``timeout_at``.
@@ -97,6 +123,10 @@ class EngineRunner:
     )
     TEMP_PURGE_INTERVAL_S = 3600  # check once per hour
 
+    # Concurrent mode: how long the poll loop waits for a worker to free a
+    # slot before re-checking ``_running``.
+    TASK_SLOT_WAIT_S = 1.0
+
     def __init__(self, engine: Engine) -> None:
         """Initialize the runner.
 
@@ -111,15 +141,46 @@ class EngineRunner:
         self._running = False
         self._http_thread: threading.Thread | None = None
         self._heartbeat_thread: threading.Thread | None = None
-        self._current_task_id: str | None = None
-        self._current_message_id: str | None = None  # Stream message ID for ack
-        self._current_stream_id: str | None = None  # Source stream for ack
-        self._task_lock = threading.Lock()  # Protects _current_task_id
+        self._task_lock = threading.Lock()  # Protects the in-flight sets below
+        self._active_task_ids: set[str] = set()  # Tasks inside _process_task
+        self._inflight_message_ids: set[str] = set()  # Dispatched, not yet ACKed
+        self._slot_released = threading.Condition(self._task_lock)
+        self._rtf_ewma: float | None = None  # Guarded by _task_lock
+        self._vram_profile_lock = threading.Lock()
+        self._max_concurrent_tasks = max(
+            1, int(os.environ.get("DALSTON_ENGINE_TASK_CONCURRENCY", "1"))
+        )
+        self._admission: AdmissionController | None = None
+        self._prefetcher: TaskPrefetcher | None = None
+        if self._max_concurrent_tasks > 1:
+            # Pure batch runner: nothing to reserve for realtime.
+            self._admission = AdmissionController(
+                AdmissionConfig(
+                    rt_reservation=0,
+                    batch_max_inflight=self._max_concurrent_tasks,
+                    total_capacity=self._max_concurrent_tasks,
+                )
+            )
+        elif os.environ.get("DALSTON_ENGINE_PREFETCH", "false").lower() == "true":
+            self._prefetcher = TaskPrefetcher(
+                receive=lambda exclude: self._receive_message(exclude=exclude),
+                stage_inputs=self._stage_task_inputs,
+            )
         self._stage: str = "unknown"  # Pipeline stage from capabilities
         self._execution_profile = "container"
         self._supports_realtime = bool(os.environ.get("DALSTON_WORKER_PORT"))
+        # Store transcribe-stage words column-wise in response.json (see
+        # dalston.common.word_columns). Off by default so that readers
+        # predating the encoding keep working during a rolling upgrade.
+        self._columnar_words = (
+            os.environ.get("DALSTON_COLUMNAR_WORDS", "false").lower() == "true"
+        )
         self._node: NodeIdentity | None = None
-        self._materializer = ArtifactMaterializer(store=S3ArtifactStore())
+        self._materializer = ArtifactMaterializer(
+            store=S3ArtifactStore(),
+            transfer_observer=self._observe_s3_transfer,
+            cache=NodeArtifactCache.from_env(engine.engine_id),
+        )
         self._tmp_root: Path = Path(tempfile.gettempdir()).resolve()
 
         self.engine_id = engine.engine_id
@@ -213,7 +274,7 @@ class EngineRunner:
                 stage=self._stage,
                 status="idle",
                 interfaces=interfaces,
-                capacity=1,
+                capacity=self._max_concurrent_tasks,
                 stream_name=self.stream_key,
                 endpoint=endpoint,
                 capabilities=capabilities,
@@ -246,12 +307,18 @@ class EngineRunner:
             engine_id=self.engine_id,
             queue=self.stream_key,
             execution_profile=self._execution_profile,
+            task_concurrency=self._max_concurrent_tasks,
+            prefetch=self._prefetcher is not None,
         )
 
+        executor = self._create_task_executor()
         try:
             while self._running:
                 try:
-                    self._poll_and_process()
+                    if executor is None:
+                        self._poll_and_process()
+                    else:
+                        self._poll_and_dispatch(executor)
                 except redis.ConnectionError as e:
                     logger.error("redis_connection_error", error=str(e))
                     time.sleep(5)  # Wait before reconnecting
@@ -260,6 +327,11 @@ class EngineRunner:
                     logger.exception("engine_loop_error", error=str(e))
                     time.sleep(1)
         finally:
+            # Let in-flight tasks finish (and ACK) before tearing down
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if self._prefetcher is not None:
+                self._prefetcher.shutdown()
             # Cleanup - ensure resources are released even on unexpected exit
             self._stop_heartbeat_thread()
             # Call engine shutdown hook for resource cleanup (M39.2)
@@ -325,7 +397,9 @@ class EngineRunner:
         budget_mb = getattr(self, "_vram_budget_mb", None)
         if budget_mb is None or not model_id:
             return
-        self._apply_vram_profile(model_id, budget_mb)
+        with self._vram_profile_lock:
+            if self._adaptive_params is None:
+                self._apply_vram_profile(model_id, budget_mb)
 
     def _apply_vram_profile(self, model_id: str, budget_mb: int) -> None:
         """Load a calibration profile and apply adaptive params."""
@@ -450,9 +524,10 @@ class EngineRunner:
 
         while self._running:
             try:
-                # Read current task with lock for thread safety
+                # Read in-flight task count with lock for thread safety
                 with self._task_lock:
-                    current_task = self._current_task_id
+                    active_tasks = len(self._active_task_ids)
+                    rtf_ewma = self._rtf_ewma
 
                 # M36: Get engine_id state including loaded model and engine status
                 runtime_state = self.engine.get_runtime_state()
@@ -463,7 +538,7 @@ class EngineRunner:
                 # otherwise use the engine's reported status.
                 # Unified engines use ready/busy vocabulary so the session
                 # coordinator treats them identically to pure-RT workers.
-                if current_task:
+                if active_tasks:
                     status = "busy" if self._supports_realtime else "processing"
                 elif engine_status == "idle" and self._supports_realtime:
                     status = "ready"
@@ -477,7 +552,7 @@ class EngineRunner:
                         self._unified_writer.heartbeat(
                             self.instance,
                             status=status,
-                            active_batch=1 if current_task else 0,
+                            active_batch=active_tasks,
                             loaded_model=loaded_model,
                             engine_id=self.engine_id,
                             stage=self._stage,
@@ -486,6 +561,7 @@ class EngineRunner:
                             node_id=self._node.node_id,
                             deploy_env=self._node.deploy_env,
                             gpu_memory_used=get_gpu_memory_used(),
+                            rtf_ewma=rtf_ewma,
                         )
                     except Exception as e:
                         logger.warning("unified_heartbeat_failed", error=str(e))
@@ -500,6 +576,32 @@ class EngineRunner:
                 logger.warning("heartbeat_failed", error=str(e))
             time.sleep(self.HEARTBEAT_INTERVAL)
 
+    def _record_task_rtf(self, seconds: float, audio_duration_s: float | None) -> None:
+        """Fold a finished task's real-time factor into the rolling mean.
+
+        Heartbeats publish the mean so the orchestrator can estimate how
+        long this engine takes for a task of a given audio duration when
+        choosing between engines. Tasks whose audio duration is unknown
+        are skipped rather than mixed in as raw wall time.
+        """
+        if not audio_duration_s or audio_duration_s <= 0:
+            return
+        rtf = seconds / audio_duration_s
+        with self._task_lock:
+            if self._rtf_ewma is None:
+                self._rtf_ewma = rtf
+            else:
+                alpha = self.RTF_EWMA_ALPHA
+                self._rtf_ewma += alpha * (rtf - self._rtf_ewma)
+
+    @staticmethod
+    def _task_audio_duration(task_request: TaskRequest) -> float | None:
+        """Duration of the task's input audio, from its (cached) header probe."""
+        if not isinstance(task_request.audio_path, Path):
+            return None
+        probe = probe_audio(task_request.audio_path)
+        return probe.duration_s if probe is not None else None
+
     # Directories that are safe to sweep.  If tempfile.gettempdir() resolves
     # to anything outside this set (e.g. "/" due to a misconfigured TMPDIR)
     # the sweeper refuses to run.
@@ -515,7 +617,7 @@ class EngineRunner:
         Guardrails:
         - Only runs if gettempdir() resolves to a known safe root.
         - Only targets directories matching TEMP_DIR_PREFIX exactly.
-        - Skips the directory used by the current active task.
+        - Skips directories used by in-flight tasks.
         - Caps the scan to 1 000 entries to avoid stalling on large dirs.
         """
         tmp_root = self._tmp_root
@@ -549,10 +651,10 @@ class EngineRunner:
                     continue
                 if mtime >= cutoff:
                     continue
-                # Don't remove the dir being used by the current task
+                # Don't remove dirs being used by in-flight tasks
                 with self._task_lock:
-                    current = self._current_task_id
-                if current and current in entry.name:
+                    active = list(self._active_task_ids)
+                if any(task_id in entry.name for task_id in active):
                     continue
                 try:
                     shutil.rmtree(entry)
@@ -584,6 +686,15 @@ class EngineRunner:
         signal.signal(signal.SIGTERM, handle_signal)
         signal.signal(signal.SIGINT, handle_signal)
 
+    def _create_task_executor(self) -> concurrent.futures.ThreadPoolExecutor | None:
+        """Create the worker pool for concurrent mode (None when serial)."""
+        if self._max_concurrent_tasks <= 1:
+            return None
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_concurrent_tasks,
+            thread_name_prefix=f"{self.engine_id}-task",
+        )
+
     def _poll_and_process(self) -> None:
         """Poll the stream and process one task.
 
@@ -591,6 +702,139 @@ class EngineRunner:
         1. Try to claim stale tasks from dead engines first (recovery)
         2. If no stale tasks, read new ones via XREADGROUP
         3. Always ACK after processing (success or failure)
+
+        With prefetch enabled, the message staged during the previous task
+        is used first, and the next one is staged while this one runs.
+        """
+        if self._prefetcher is None:
+            message = self._receive_message()
+            if message is None:
+                # Timeout, no task available
+                return
+            self._handle_message(message)
+            return
+
+        staged = self._prefetcher.collect()
+        if staged is None:
+            message = self._receive_message()
+            if message is None:
+                return
+            staged = StagedTask(message=message)
+
+        self._prefetcher.start(exclude=frozenset({staged.message.id}))
+        try:
+            self._handle_message(staged.message, staged=staged)
+        finally:
+            staged.discard()
+
+    def _stage_task_inputs(self, message: StreamMessage) -> StagedTask:
+        """Download a reserved message's request and artifacts (prefetch).
+
+        Cancelled jobs are not staged; ``_handle_message`` re-checks
+        cancellation and ACKs them when their turn comes.
+        """
+        staged = StagedTask(message=message)
+        try:
+            if is_job_cancelled(self.redis_client, message.job_id):
+                dalston.metrics.inc_engine_prefetch(self.engine_id, "cancelled")
+                return staged
+            staged.temp_dir = Path(tempfile.mkdtemp(prefix=self.TEMP_DIR_PREFIX))
+            download_start = time.time()
+            staged.task_request = self._load_task_request(
+                message.task_id, staged.temp_dir
+            )
+            dalston.metrics.inc_engine_prefetch(self.engine_id, "staged")
+            logger.info(
+                "task_inputs_prefetched",
+                task_id=message.task_id,
+                job_id=message.job_id,
+                download_s=round(time.time() - download_start, 3),
+            )
+        except Exception as e:
+            # Fall back to loading inline when the task's turn comes
+            logger.warning(
+                "task_prefetch_failed",
+                task_id=message.task_id,
+                error=str(e),
+            )
+            dalston.metrics.inc_engine_prefetch(self.engine_id, "failed")
+            staged.discard()
+            staged.temp_dir = None
+            staged.task_request = None
+        return staged
+
+    def _poll_and_dispatch(
+        self, executor: concurrent.futures.ThreadPoolExecutor
+    ) -> None:
+        """Reserve a task slot, read one message and hand it to the pool.
+
+        Admission happens before the read, so a saturated runner leaves new
+        messages in the stream for other replicas instead of claiming them
+        into its own PEL.
+        """
+        admission = self._admission
+        assert admission is not None
+        if not admission.admit_batch():
+            with self._slot_released:
+                if not admission.can_accept_batch():
+                    self._slot_released.wait(timeout=self.TASK_SLOT_WAIT_S)
+            return
+
+        try:
+            with self._task_lock:
+                inflight = frozenset(self._inflight_message_ids)
+            message = self._receive_message(exclude=inflight)
+        except BaseException:
+            self._release_task_slot(None)
+            raise
+
+        if message is None:
+            self._release_task_slot(None)
+            return
+
+        with self._task_lock:
+            self._inflight_message_ids.add(message.id)
+        executor.submit(self._handle_dispatched_message, message)
+
+    def _handle_dispatched_message(self, message: StreamMessage) -> None:
+        """Worker-pool entry point for concurrent mode.
+
+        Errors that escape ``_handle_message`` (e.g. Redis dropping during
+        the ACK) leave the message unACKed; it is picked up again through
+        ``read_own_pending`` once its slot is released.
+        """
+        try:
+            self._handle_message(message)
+        except Exception as e:
+            logger.exception(
+                "engine_task_worker_error",
+                task_id=message.task_id,
+                message_id=message.id,
+                error=str(e),
+            )
+        finally:
+            self._release_task_slot(message.id)
+
+    def _release_task_slot(self, message_id: str | None) -> None:
+        """Return a concurrent-mode slot and wake the poll loop."""
+        if self._admission is not None:
+            self._admission.release_batch()
+        with self._slot_released:
+            if message_id is not None:
+                self._inflight_message_ids.discard(message_id)
+            self._slot_released.notify()
+
+    def _receive_message(
+        self, exclude: frozenset[str] = frozenset()
+    ) -> StreamMessage | None:
+        """Read the next message to work on, or None on poll timeout.
+
+        Order: stale tasks from dead engines, then this consumer's own
+        deferred messages, then new messages.
+
+        Args:
+            exclude: Message IDs already being processed by this runner.
+                They are unACKed too, so ``read_own_pending`` must skip them.
         """
         message: StreamMessage | None = None
         stream_id = self.engine_id
@@ -624,6 +868,7 @@ class EngineRunner:
                 self.redis_client,
                 stage=stream_id,
                 consumer=self.instance,
+                exclude=exclude,
             )
             if message is not None:
                 logger.info(
@@ -643,9 +888,21 @@ class EngineRunner:
                 block_ms=self.STREAM_POLL_TIMEOUT * 1000,
             )
 
-        if message is None:
-            # Timeout, no task available
-            return
+        return message
+
+    def _handle_message(
+        self, message: StreamMessage, staged: StagedTask | None = None
+    ) -> None:
+        """Run one received message through checks, processing and ACK.
+
+        All per-message state (message ID, source stream) is local, so
+        several calls can run side by side in concurrent mode.
+
+        Args:
+            message: Stream message to handle
+            staged: Prefetched inputs for this message, if any
+        """
+        stream_id = self.engine_id
 
         logger.info(
             "task_received",
@@ -656,10 +913,6 @@ class EngineRunner:
             stream_id=stream_id,
         )
 
-        # Store message ID for ack in finally block
-        self._current_message_id = message.id
-        self._current_stream_id = stream_id
-
         # 3. Check if job is cancelled before processing
         if is_job_cancelled(self.redis_client, message.job_id):
             self._clear_waiting_engine_marker(message.task_id)
@@ -670,13 +923,7 @@ class EngineRunner:
             )
             dalston.metrics.inc_tasks_skipped_cancelled(self._stage)
             # ACK the task so it's removed from PEL
-            ack_task(
-                self.redis_client,
-                self._current_stream_id or self.engine_id,
-                self._current_message_id,
-            )
-            self._current_message_id = None
-            self._current_stream_id = None
+            ack_task(self.redis_client, stream_id, message.id)
             return
 
         try:
@@ -688,13 +935,7 @@ class EngineRunner:
                 error=str(e),
             )
             self._publish_task_failed(message.task_id, message.job_id, str(e))
-            ack_task(
-                self.redis_client,
-                self._current_stream_id or self.engine_id,
-                self._current_message_id,
-            )
-            self._current_message_id = None
-            self._current_stream_id = None
+            ack_task(self.redis_client, stream_id, message.id)
             return
 
         blocked_reason = task_metadata.get("blocked_reason")
@@ -704,53 +945,40 @@ class EngineRunner:
                 task_id=message.task_id,
                 blocked_reason=blocked_reason,
             )
-            ack_task(
-                self.redis_client,
-                self._current_stream_id or self.engine_id,
-                self._current_message_id,
-            )
-            self._current_message_id = None
-            self._current_stream_id = None
+            ack_task(self.redis_client, stream_id, message.id)
             return
 
         # Task is now claimed by an engine instance; clear wait markers.
         self._clear_waiting_engine_marker(message.task_id)
 
         try:
-            self._process_task(message.task_id, task_metadata)
+            self._process_task(message.task_id, task_metadata, staged=staged)
         except TaskDeferredError:
             # Task was deferred (e.g. admission control rejection).
             # Skip ACK so the message stays in the PEL for redelivery.
             logger.info(
                 "task_deferred_skipping_ack",
                 task_id=message.task_id,
-                stream_id=self._current_stream_id or self.engine_id,
+                stream_id=stream_id,
             )
-            self._current_message_id = None
-            self._current_stream_id = None
         else:
             # 4. ACK on success or failure — failure handling is via task.failed event
-            if self._current_message_id:
-                ack_task(
-                    self.redis_client,
-                    self._current_stream_id or self.engine_id,
-                    self._current_message_id,
-                )
-                self._current_message_id = None
-                self._current_stream_id = None
+            ack_task(self.redis_client, stream_id, message.id)
 
     def _clear_waiting_engine_marker(self, task_id: str) -> None:
         """Clear wait-for-engine markers once a task is claimed."""
         key = f"dalston:task:{task_id}"
         try:
-            self.redis_client.hdel(
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hdel(
                 key,
                 "waiting_for_engine",
                 "wait_deadline_at",
                 "wait_timeout_s",
                 "wait_enqueued_at",
             )
-            self.redis_client.srem(WAITING_ENGINE_TASKS_KEY, task_id)
+            pipe.srem(WAITING_ENGINE_TASKS_KEY, task_id)
+            pipe.execute()
         except Exception:
             logger.debug("clear_waiting_engine_marker_failed", task_id=task_id)
 
@@ -770,19 +998,22 @@ class EngineRunner:
         self,
         task_id: str,
         task_metadata: dict[str, Any],
+        staged: StagedTask | None = None,
     ) -> None:
         """Process a single task.
 
         Args:
             task_id: ID of the task to process
             task_metadata: Pre-fetched task metadata from Redis
+            staged: Prefetched inputs; when it carries a task request the
+                S3 download is skipped and its staging dir is reused
         """
         temp_dir = None
         start_time = time.time()
 
-        # Track current task for heartbeat status (thread-safe)
+        # Track in-flight task for heartbeat status (thread-safe)
         with self._task_lock:
-            self._current_task_id = task_id
+            self._active_task_ids.add(task_id)
 
         # Extract model from task config (set by orchestrator's engine selector)
         task_model = task_metadata.get("loaded_model_id", "")
@@ -821,18 +1052,19 @@ class EngineRunner:
             },
         ):
             try:
-                # Create temp directory for this task
-                temp_dir = Path(tempfile.mkdtemp(prefix=self.TEMP_DIR_PREFIX))
-
-                # Load task request from S3
-                download_start = time.time()
-                with dalston.telemetry.create_span("engine.download_input"):
-                    task_request = self._load_task_request(task_id, temp_dir)
-                dalston.metrics.observe_engine_s3_download(
-                    self.engine_id,
-                    time.time() - download_start,
-                    self._execution_profile,
-                )
+                if staged is not None and staged.task_request is not None:
+                    # Inputs were materialized while the previous task ran
+                    temp_dir = staged.temp_dir
+                    task_request = staged.task_request
+                else:
+                    # Create temp directory for this task
+                    temp_dir = Path(tempfile.mkdtemp(prefix=self.TEMP_DIR_PREFIX))
+
+                    # Load task request from S3
+                    with dalston.telemetry.create_span("engine.download_input"):
+                        task_request = self._load_task_request(
+                            task_id, temp_dir, task_metadata
+                        )
                 job_id = task_request.job_id
 
                 # Resolve model from task request config if not in metadata
@@ -926,16 +1158,10 @@ class EngineRunner:
                 total_task_time = time.time() - start_time
 
                 # Upload output to S3
-                upload_start = time.time()
                 with dalston.telemetry.create_span("engine.upload_output"):
                     self._save_task_output(
                         task_id, job_id, output, total_task_time, task_request.stage
                     )
-                dalston.metrics.observe_engine_s3_upload(
-                    self.engine_id,
-                    time.time() - upload_start,
-                    self._execution_profile,
-                )
 
                 # Record task success metrics (M20)
                 dalston.metrics.observe_engine_task_duration(
@@ -954,7 +1180,21 @@ class EngineRunner:
                 # Publish success event
                 self._publish_task_completed(task_id, job_id)
 
-                logger.info("task_completed", processing_time=round(total_task_time, 2))
+                # Everything but engine.process: S3 transfers, Redis and events
+                elapsed = time.time() - start_time
+                overhead = elapsed - process_time
+                self._record_task_rtf(elapsed, self._task_audio_duration(task_request))
+                dalston.metrics.observe_engine_task_overhead(
+                    self.engine_id,
+                    overhead,
+                    self._execution_profile,
+                )
+
+                logger.info(
+                    "task_completed",
+                    processing_time=round(total_task_time, 2),
+                    overhead_s=round(overhead, 3),
+                )
 
             except TaskDeferredError:
                 # Task was deferred (e.g. admission control rejection).
@@ -984,9 +1224,9 @@ class EngineRunner:
                 self._publish_task_failed(task_id, job_id, str(e))
 
             finally:
-                # Clear current task tracking for heartbeat (thread-safe)
+                # Clear in-flight task tracking for heartbeat (thread-safe)
                 with self._task_lock:
-                    self._current_task_id = None
+                    self._active_task_ids.discard(task_id)
                 # Cleanup temp directory
                 if temp_dir and temp_dir.exists():
                     shutil.rmtree(temp_dir, ignore_errors=True)
@@ -998,14 +1238,26 @@ class EngineRunner:
                     "request_id",
                 )
 
-    def _load_task_request(self, task_id: str, temp_dir: Path) -> TaskRequest:
-        """Load task request from S3 and materialize required artifacts."""
-        task_metadata = self._get_task_metadata(task_id)
+    def _load_task_request(
+        self,
+        task_id: str,
+        temp_dir: Path,
+        task_metadata: dict[str, Any] | None = None,
+    ) -> TaskRequest:
+        """Load task request from S3 and materialize required artifacts.
+
+        ``task_metadata`` is read from Redis when the caller has not already
+        fetched it.
+        """
+        if task_metadata is None:
+            task_metadata = self._get_task_metadata(task_id)
         job_id = task_metadata["job_id"]
         stage = task_metadata.get("stage", "unknown")
 
         request_uri = io.build_task_request_uri(self.s3_bucket, job_id, task_id)
+        download_start = time.monotonic()
         request_data = io.download_json(request_uri)
+        self._observe_s3_transfer("download", time.monotonic() - download_start)
 
         # Canonical M51 fields.
         payload = request_data.get("payload")
@@ -1041,6 +1293,17 @@ class EngineRunner:
             metadata={"resolved_artifact_ids": resolved_artifact_ids},
         )
 
+    def _observe_s3_transfer(self, direction: str, seconds: float) -> None:
+        """Record one S3 object transfer (request/response JSON or artifact)."""
+        if direction == "download":
+            dalston.metrics.observe_engine_s3_download(
+                self.engine_id, seconds, self._execution_profile
+            )
+        else:
+            dalston.metrics.observe_engine_s3_upload(
+                self.engine_id, seconds, self._execution_profile
+            )
+
     def _get_task_metadata(self, task_id: str) -> dict[str, Any]:
         """Get task metadata from Redis.
 
@@ -1099,11 +1362,21 @@ class EngineRunner:
         """
         response_uri = io.build_task_response_uri(self.s3_bucket, job_id, task_id)
 
+        data = output.to_dict()
+        # Only transcribe output is a Transcript, the shape readers expand.
+        if (
+            self._columnar_words
+            and stage.startswith("transcribe")
+            and isinstance(data, dict)
+            and isinstance(data.get("segments"), list)
+        ):
+            data = encode_transcript_words(data)
+
         response_data = {
             "task_id": task_id,
             "completed_at": datetime.now(UTC).isoformat(),
             "processing_time_seconds": round(processing_time, 2),
-            "data": output.to_dict(),
+            "data": data,
         }
 
         task_stage = stage
@@ -1134,24 +1407,28 @@ class EngineRunner:
                 canonical_transcript.storage_locator
             )
 
+        upload_start = time.monotonic()
         io.upload_json(response_data, response_uri)
+        self._observe_s3_transfer("upload", time.monotonic() - upload_start)
         logger.info("response_uploaded", response_uri=response_uri)
 
         if persisted_artifacts:
+            # Task and job artifact records are written in one round trip
             metadata_key = f"dalston:task:{task_id}"
             produced_ids = [artifact.artifact_id for artifact in persisted_artifacts]
-            self.redis_client.hset(
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hset(
                 metadata_key,
                 mapping={"produced_artifact_ids_json": json.dumps(produced_ids)},
             )
-
-            artifact_key = f"dalston:job:{job_id}:artifacts"
-            for artifact in persisted_artifacts:
-                self.redis_client.hset(
-                    artifact_key,
-                    artifact.artifact_id,
-                    artifact.model_dump_json(exclude_none=True),
-                )
+            pipe.hset(
+                f"dalston:job:{job_id}:artifacts",
+                mapping={
+                    artifact.artifact_id: artifact.model_dump_json(exclude_none=True)
+                    for artifact in persisted_artifacts
+                },
+            )
+            pipe.execute()
 
     def _publish_durable_event(
         self,
@@ -0,0 +1,170 @@
+"""Speech-regions artifact shared between pipeline stages.
+
+When speech-region detection is enabled, the prepare stage runs Silero
+VAD once per prepared audio file and publishes the result as a small
+JSON artifact (kind ``speech_regions``, one per channel). Transcribe and
+diarize tasks bind it through an optional ``speech_regions`` slot, so
+VAD chunking and chunk planning reuse the regions instead of running
+VAD again.
+
+The artifact records a format version and the detection parameters it
+was produced with. Readers ignore (and fall back to their own VAD pass
+for) artifacts with an unknown version or parameters that differ from
+their own chunker's, so a changed ``DALSTON_VAD_THRESHOLD`` on one
+engine never silently mixes two detection settings.
+
+Artifact layout::
+
+    {
+      "version": 1,
+      "duration_s": 3600.0,
+      "detection": {"sample_rate": 16000, "vad_threshold": 0.5, ...},
+      "regions": [[0.52, 4.1], [4.9, 12.33], ...]
+    }
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from dalston.common.audio_defaults import DEFAULT_SAMPLE_RATE
+from dalston.engine_sdk.vad import SpeechSegment, VadChunker
+
+if TYPE_CHECKING:
+    from dalston.engine_sdk.types import TaskRequest
+
+logger = structlog.get_logger()
+
+SPEECH_REGIONS_KIND = "speech_regions"
+SPEECH_REGIONS_SLOT = "speech_regions"
+SPEECH_REGIONS_MEDIA_TYPE = "application/json"
+SPEECH_REGIONS_VERSION = 1
+
+# Parsed artifacts keyed by artifact id, so OOM retry passes and task
+# redeliveries on the same worker read each artifact once.
+_MEMO_SIZE = 16
+_memo: OrderedDict[str, list[SpeechSegment] | None] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def detection_params(chunker: VadChunker) -> dict[str, Any]:
+    """Detection settings that determine a chunker's speech regions."""
+    return {
+        "sample_rate": DEFAULT_SAMPLE_RATE,
+        "vad_threshold": chunker.vad_threshold,
+        "min_speech_duration_s": chunker.min_speech_duration_s,
+        "min_silence_duration_s": chunker.min_silence_duration_s,
+    }
+
+
+def write_speech_regions(
+    path: Path,
+    segments: list[SpeechSegment],
+    duration_s: float,
+    chunker: VadChunker,
+) -> Path:
+    """Write ``segments`` detected by ``chunker`` as a speech-regions artifact."""
+    document = {
+        "version": SPEECH_REGIONS_VERSION,
+        "duration_s": round(duration_s, 3),
+        "detection": detection_params(chunker),
+        "regions": [[round(s.start, 3), round(s.end, 3)] for s in segments],
+    }
+    path.write_text(json.dumps(document, separators=(",", ":")))
+    return path
+
+
+def read_speech_regions(
+    path: Path, chunker: VadChunker | None = None
+) -> list[SpeechSegment] | None:
+    """Parse a speech-regions artifact.
+
+    Returns None when the artifact has an unsupported version or, if
+    ``chunker`` is given, was detected with different parameters.
+    """
+    document = json.loads(path.read_text())
+    version = document.get("version")
+    if version != SPEECH_REGIONS_VERSION:
+        logger.warning(
+            "speech_regions_version_unsupported",
+            version=version,
+            supported=SPEECH_REGIONS_VERSION,
+        )
+        return None
+    if chunker is not None and not _same_detection(
+        document.get("detection", {}), detection_params(chunker)
+    ):
+        logger.info(
+            "speech_regions_detection_mismatch",
+            artifact=document.get("detection"),
+            local=detection_params(chunker),
+        )
+        return None
+    return [
+        SpeechSegment(start=float(start), end=float(end))
+        for start, end in document["regions"]
+    ]
+
+
+def load_speech_regions(
+    task_request: TaskRequest, chunker: VadChunker | None = None
+) -> list[SpeechSegment] | None:
+    """Speech regions bound to this task, or None if there are none usable.
+
+    Reads the ``speech_regions`` slot materialized for the task. A missing
+    slot, an unreadable file and a rejected artifact all return None, and
+    the caller runs VAD itself.
+    """
+    artifact = task_request.materialized_artifacts.get(SPEECH_REGIONS_SLOT)
+    if artifact is None:
+        return None
+
+    key = artifact.artifact_id
+    if chunker is not None:
+        key = f"{key}|{sorted(detection_params(chunker).items())}"
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    try:
+        segments = read_speech_regions(artifact.local_path, chunker)
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning(
+            "speech_regions_unreadable",
+            artifact_id=artifact.artifact_id,
+            exc_info=True,
+        )
+        segments = None
+
+    with _memo_lock:
+        _memo[key] = segments
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+    if segments is not None:
+        logger.info(
+            "speech_regions_reused",
+            artifact_id=artifact.artifact_id,
+            region_count=len(segments),
+        )
+    return segments
+
+
+def _same_detection(artifact: dict[str, Any], local: dict[str, Any]) -> bool:
+    if artifact.keys() != local.keys():
+        return False
+    for name, value in local.items():
+        other = artifact[name]
+        if isinstance(value, float) or isinstance(other, float):
+            if not math.isclose(float(value), float(other), abs_tol=1e-9):
+                return False
+        elif value != other:
+            return False
+    return True
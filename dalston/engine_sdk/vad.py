@@ -53,6 +53,11 @@ from dalston.common.audio_defaults import (
     get_vad_threshold,
 )
 from dalston.engine_sdk.audio import write_wav_file
+from dalston.engine_sdk.prepared_audio import (
+    PreparedAudio,
+    load_audio_f32,
+    open_prepared_audio,
+)
 from dalston.engine_sdk.silero_vad import (
     WINDOW_SAMPLES_16K,
     SileroOnnxModel,
@@ -94,6 +99,21 @@ class AudioChunk:
     duration: float
 
 
+@dataclass
+class AudioArrayChunk:
+    """An in-memory chunk of audio ready for transcription.
+
+    Like :class:`AudioChunk`, but ``audio`` is a 16 kHz mono view into
+    the source instead of a WAV file on disk: a float32 array for decoded
+    audio, or a :class:`PreparedAudio` slice of a memory-mapped prepared
+    WAV (materialize it with ``np.asarray``).
+    """
+
+    audio: np.ndarray | PreparedAudio
+    offset: float
+    duration: float
+
+
 class VadChunker:
     """Split audio into speech-bounded chunks using Silero VAD.
 
@@ -285,20 +305,31 @@ class VadChunker:
             List of :class:`SpeechSegment` in ascending time order.
             Empty list if no speech is detected.
         """
-        _, segments = self._load_and_detect(audio_path)
+        _, segments = self.load_and_detect(audio_path)
         return segments
 
-    def _load_and_detect(
-        self, audio_path: Path
-    ) -> tuple[np.ndarray, list[SpeechSegment]]:
+    def load_and_detect(
+        self,
+        audio_path: Path,
+        speech: list[SpeechSegment] | None = None,
+    ) -> tuple[np.ndarray | PreparedAudio, list[SpeechSegment]]:
         """Decode the audio file once and run VAD on it.
 
-        Returns both the decoded f32 mono 16 kHz array and the speech
-        regions so that :meth:`split` can reuse the array for slicing
-        without a second decode pass.
+        Returns both the mono 16 kHz audio and the speech regions so that
+        :meth:`split` and :meth:`split_audio` can reuse it for slicing
+        without a second decode pass. A prepared 16 kHz mono PCM16 WAV is
+        memory-mapped and returned as a :class:`PreparedAudio`; anything
+        else is decoded to a float32 array.
+
+        When ``speech`` is given (regions detected earlier, e.g. the
+        prepare stage's speech-regions artifact) the VAD model is never
+        loaded and a prepared WAV is never decoded in full.
         """
+        audio = self._load_audio_mono_16k(audio_path)
+        if speech is not None:
+            return audio, speech
+
         self._ensure_model()
-        audio = self._load_audio_f32_mono_16k(audio_path)
         if audio.size == 0:
             return audio, []
 
@@ -310,12 +341,17 @@ class VadChunker:
         # loaded are numpy-native ones, so passing the array through is
         # safe (and lets the chunker run in environments that don't
         # ship torch at all, including the CI unit tests).
+        # The offline scanner reads a PreparedAudio window by window;
+        # the other backends need the whole waveform as one array.
         audio_input: Any = audio
         if self._get_speech_timestamps is not _get_speech_timestamps_offline:
+            import numpy as np
+
+            audio_input = np.asarray(audio)
             try:
                 import torch
 
-                audio_input = torch.from_numpy(audio)
+                audio_input = torch.from_numpy(audio_input)
             except ImportError:
                 pass
 
@@ -373,14 +409,94 @@ class VadChunker:
             List of :class:`AudioChunk` in temporal order. Empty list
             if the source has no speech past ``start_offset_s``.
         """
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        audio_full, segments = self._load_and_detect(audio_path)
+        audio_full, segments = self.load_and_detect(audio_path)
         if not segments:
             logger.info("vad_no_speech_detected", audio_path=str(audio_path))
             return []
+        return self.write_chunks(audio_full, segments, temp_dir, start_offset_s)
+
+    def write_chunks(
+        self,
+        audio_full: np.ndarray,
+        segments: list[SpeechSegment],
+        temp_dir: Path,
+        start_offset_s: float = 0.0,
+    ) -> list[AudioChunk]:
+        """Write speech-bounded chunks of decoded audio as WAV files.
+
+        The file-writing half of :meth:`split`, for callers that already
+        hold the output of :meth:`load_and_detect`.
+        """
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        chunks: list[AudioChunk] = []
+        for idx, start_s, start_sample, end_sample in self._plan_chunks(
+            segments, audio_full.size, start_offset_s
+        ):
+            slice_ = audio_full[start_sample:end_sample]
+            out_path = temp_dir / f"chunk_{idx:04d}.wav"
+            write_wav_file(out_path, slice_, sample_rate=_SAMPLE_RATE)
+            chunks.append(
+                AudioChunk(
+                    audio_path=out_path,
+                    offset=start_s,
+                    duration=(end_sample - start_sample) / _SAMPLE_RATE,
+                )
+            )
+
+        logger.info(
+            "vad_chunks_prepared",
+            chunk_count=len(chunks),
+            total_audio_s=round(audio_full.size / _SAMPLE_RATE, 3),
+            max_chunk_duration_s=self.max_chunk_duration_s,
+            start_offset_s=round(start_offset_s, 3),
+        )
+        return chunks
 
-        total_samples = audio_full.size
+    def split_audio(
+        self,
+        audio: np.ndarray,
+        segments: list[SpeechSegment],
+        start_offset_s: float = 0.0,
+    ) -> list[AudioArrayChunk]:
+        """Split decoded audio into in-memory chunks at speech boundaries.
+
+        Same grouping and resume-boundary semantics as :meth:`split`, but
+        takes the output of :meth:`load_and_detect` and returns views into
+        ``audio`` instead of writing WAV files (zero-copy int16 views when
+        ``audio`` is a :class:`PreparedAudio`). Because the speech regions
+        do not depend on ``max_chunk_duration_s``, callers can detect once
+        and re-split with a smaller cap after an OOM.
+        """
+        chunks = [
+            AudioArrayChunk(
+                audio=audio[start_sample:end_sample],
+                offset=start_s,
+                duration=(end_sample - start_sample) / _SAMPLE_RATE,
+            )
+            for _idx, start_s, start_sample, end_sample in self._plan_chunks(
+                segments, audio.size, start_offset_s
+            )
+        ]
+        logger.info(
+            "vad_chunks_prepared",
+            chunk_count=len(chunks),
+            total_audio_s=round(audio.size / _SAMPLE_RATE, 3),
+            max_chunk_duration_s=self.max_chunk_duration_s,
+            start_offset_s=round(start_offset_s, 3),
+        )
+        return chunks
 
+    def _plan_chunks(
+        self,
+        segments: list[SpeechSegment],
+        total_samples: int,
+        start_offset_s: float,
+    ) -> list[tuple[int, float, int, int]]:
+        """Group speech segments into chunks within the duration cap.
+
+        Returns ``(group_index, offset_s, start_sample, end_sample)`` per
+        chunk, after applying the ``start_offset_s`` resume boundary.
+        """
         capped: list[SpeechSegment] = []
         for seg in segments:
             if seg.duration <= self.max_chunk_duration_s:
@@ -417,7 +533,7 @@ class VadChunker:
         if current:
             groups.append(current)
 
-        chunks: list[AudioChunk] = []
+        planned: list[tuple[int, float, int, int]] = []
         for idx, group in enumerate(groups):
             start_s = group[0].start
             end_s = group[-1].end
@@ -433,31 +549,21 @@ class VadChunker:
             end_sample = min(total_samples, int(round(end_s * _SAMPLE_RATE)))
             if end_sample <= start_sample:
                 continue
-            slice_ = audio_full[start_sample:end_sample]
-            out_path = temp_dir / f"chunk_{idx:04d}.wav"
-            write_wav_file(out_path, slice_, sample_rate=_SAMPLE_RATE)
-            chunks.append(
-                AudioChunk(
-                    audio_path=out_path,
-                    offset=start_s,
-                    duration=(end_sample - start_sample) / _SAMPLE_RATE,
-                )
-            )
-
-        logger.info(
-            "vad_chunks_prepared",
-            audio_path=str(audio_path),
-            chunk_count=len(chunks),
-            total_audio_s=round(total_samples / _SAMPLE_RATE, 3),
-            max_chunk_duration_s=self.max_chunk_duration_s,
-            start_offset_s=round(start_offset_s, 3),
-        )
-        return chunks
+            planned.append((idx, start_s, start_sample, end_sample))
+        return planned
 
     # ------------------------------------------------------------------
     # Audio I/O helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _load_audio_mono_16k(audio_path: Path) -> np.ndarray | PreparedAudio:
+        """Memory-map a prepared WAV, or decode anything else to float32."""
+        prepared = open_prepared_audio(audio_path, _SAMPLE_RATE)
+        if prepared is not None:
+            return prepared
+        return VadChunker._load_audio_f32_mono_16k(audio_path)
+
     @staticmethod
     def _load_audio_f32_mono_16k(audio_path: Path) -> np.ndarray:
         """Load an audio file as float32 mono at 16 kHz.
@@ -465,26 +571,7 @@ class VadChunker:
         Uses ``soundfile`` for decode; resamples to 16 kHz via ``librosa``
         if needed. Downmixes multichannel to mono by averaging.
         """
-        import numpy as np
-
-        try:
-            import soundfile as sf
-        except ImportError as exc:
-            raise RuntimeError("VadChunker requires soundfile to load audio") from exc
-
-        data, sr = sf.read(str(audio_path), dtype="float32", always_2d=False)
-        if data.ndim > 1:
-            data = data.mean(axis=1).astype(np.float32, copy=False)
-        if sr != _SAMPLE_RATE:
-            try:
-                import librosa
-            except ImportError as exc:
-                raise RuntimeError(
-                    "VadChunker requires librosa to resample non-16 kHz audio"
-                ) from exc
-            data = librosa.resample(data, orig_sr=sr, target_sr=_SAMPLE_RATE)
-            data = data.astype(np.float32, copy=False)
-        return data
+        return load_audio_f32(audio_path, _SAMPLE_RATE)
 
 
 # ---------------------------------------------------------------------------
@@ -525,14 +612,19 @@ def _get_speech_timestamps_offline(
     """
     import numpy as np
 
-    # Accept either a torch tensor or a numpy array.
-    if hasattr(audio, "detach"):
+    # Accept a torch tensor, a numpy array or a memory-mapped
+    # PreparedAudio (converted to float32 one block at a time).
+    audio_np: Any
+    if isinstance(audio, PreparedAudio):
+        audio_np = audio
+    elif hasattr(audio, "detach"):
         audio_np = audio.detach().cpu().numpy()
     else:
         audio_np = np.asarray(audio)
     if audio_np.ndim > 1:
         audio_np = audio_np.reshape(-1)
-    audio_np = audio_np.astype(np.float32, copy=False)
+    if not isinstance(audio_np, PreparedAudio):
+        audio_np = audio_np.astype(np.float32, copy=False)
 
     if hasattr(model, "reset_states"):
         model.reset_states()
@@ -542,9 +634,13 @@ def _get_speech_timestamps_offline(
     min_silence_samples = int(min_silence_duration_ms * sampling_rate / 1000)
 
     probs: list[float] = []
-    for start in range(0, total - _WINDOW_SAMPLES + 1, _WINDOW_SAMPLES):
-        window = audio_np[start : start + _WINDOW_SAMPLES]
-        probs.append(model(window, sampling_rate))
+    block_samples = _WINDOW_SAMPLES * 1024
+    for block_start in range(0, total, block_samples):
+        block = np.asarray(
+            audio_np[block_start : block_start + block_samples], dtype=np.float32
+        )
+        for start in range(0, block.size - _WINDOW_SAMPLES + 1, _WINDOW_SAMPLES):
+            probs.append(model(block[start : start + _WINDOW_SAMPLES], sampling_rate))
 
     regions: list[dict[str, int]] = []
     in_speech = False
@@ -39,6 +39,7 @@ from dalston.gateway.dependencies import (
     get_db,
     get_export_service,
     get_ingestion_service,
+    get_job_completion_notifier,
     get_jobs_service,
     get_principal_with_job_rate_limit,
     get_rate_limiter,
@@ -139,10 +140,10 @@ async def create_translation_openai(
         )
 
     # Enforce OpenAI 25MB file size limit
-    if len(ingested.content) > OPENAI_MAX_FILE_SIZE:
+    if ingested.size > OPENAI_MAX_FILE_SIZE:
         raise_openai_error(
             400,
-            f"File size exceeds 25MB limit ({len(ingested.content) / 1024 / 1024:.1f}MB)",
+            f"File size exceeds 25MB limit ({ingested.size / 1024 / 1024:.1f}MB)",
             param="file",
             code="file_too_large",
         )
@@ -170,7 +171,7 @@ async def create_translation_openai(
     # Upload audio to S3
     audio_uri = await storage.upload_audio(
         job_id=job_id,
-        file_content=ingested.content,
+        stream=ingested.open(),
         filename=ingested.filename,
     )
 
@@ -209,7 +210,9 @@ async def create_translation_openai(
     )
 
     # Wait for completion (synchronous)
-    result = await wait_for_job_completion(db, job)
+    result = await wait_for_job_completion(
+        db, job, notifier=get_job_completion_notifier()
+    )
 
     if result.completed:
         transcript = await storage.get_transcript(job_id)
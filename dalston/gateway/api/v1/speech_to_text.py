@@ -51,6 +51,7 @@ from dalston.gateway.dependencies import (
     get_db,
     get_export_service,
     get_ingestion_service,
+    get_job_completion_notifier,
     get_jobs_service,
     get_principal,
     get_principal_with_job_rate_limit,
@@ -438,7 +439,7 @@ async def create_transcription(
     # Upload audio to S3
     audio_uri = await storage.upload_audio(
         job_id=job_id,
-        file_content=ingested.content,
+        stream=ingested.open(),
         filename=ingested.filename,
     )
 
@@ -488,7 +489,9 @@ async def create_transcription(
         )
 
     # For sync mode, wait for completion (with timeout)
-    result = await wait_for_job_completion(db, job)
+    result = await wait_for_job_completion(
+        db, job, notifier=get_job_completion_notifier()
+    )
 
     if result.completed:
         # Fetch transcript and return ElevenLabs format
@@ -71,6 +71,7 @@ from dalston.gateway.dependencies import (
     get_db,
     get_export_service,
     get_ingestion_service,
+    get_job_completion_notifier,
     get_jobs_service,
     get_principal,
     get_principal_with_job_rate_limit,
@@ -425,12 +426,10 @@ async def create_transcription(
         raise
 
     # Enforce OpenAI 25MB file size limit
-    if openai_mode and len(ingested.content) > OPENAI_MAX_FILE_SIZE:
+    if openai_mode and ingested.size > OPENAI_MAX_FILE_SIZE:
         raise_openai_error(
             400,
-            Err.OPENAI_FILE_TOO_LARGE.format(
-                size_mb=len(ingested.content) / 1024 / 1024
-            ),
+            Err.OPENAI_FILE_TOO_LARGE.format(size_mb=ingested.size / 1024 / 1024),
             param="file",
             code="file_too_large",
         )
@@ -706,7 +705,7 @@ async def create_transcription(
     # Upload audio to configured artifact backend (S3 in distributed, file in lite).
     audio_uri = await storage.upload_audio(
         job_id=job_id,
-        file_content=ingested.content,
+        stream=ingested.open(),
         filename=ingested.filename,
     )
 
@@ -842,7 +841,9 @@ async def create_transcription(
         )
 
     # OpenAI mode: wait for completion and return result
-    result = await wait_for_job_completion(db, job)
+    result = await wait_for_job_completion(
+        db, job, notifier=get_job_completion_notifier()
+    )
 
     if result.completed:
         transcript = await storage.get_transcript(job.id)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     from dalston.gateway.services.autoscale_overrides_mirror import (
         AutoscaleOverridesMirror,
     )
+    from dalston.gateway.services.job_notifications import JobCompletionNotifier
     from dalston.orchestrator.session_coordinator import SessionCoordinator
 
 logger = structlog.get_logger()
@@ -205,12 +206,17 @@ def get_storage_service(
 
 def get_ingestion_service(
     settings: Settings = Depends(get_settings),
-) -> AudioIngestionService:
-    """Get AudioIngestionService instance.
+) -> Generator[AudioIngestionService, None, None]:
+    """Yield a request-scoped AudioIngestionService.
 
     Not a singleton since it depends on Settings which may vary in tests.
+    Spooled uploads are released when the request finishes.
     """
-    return AudioIngestionService(settings)
+    service = AudioIngestionService(settings)
+    try:
+        yield service
+    finally:
+        service.close()
 
 
 def get_audit_service() -> AuditService:
@@ -256,6 +262,24 @@ def get_autoscale_overrides_mirror() -> AutoscaleOverridesMirror | None:
     return _autoscale_overrides_mirror
 
 
+# Job completion notifier, set by main.py lifespan (distributed mode only).
+_job_completion_notifier: JobCompletionNotifier | None = None
+
+
+def set_job_completion_notifier(notifier: JobCompletionNotifier | None) -> None:
+    """Register the notifier instance (called from the lifespan)."""
+    global _job_completion_notifier
+    _job_completion_notifier = notifier
+
+
+def get_job_completion_notifier() -> JobCompletionNotifier | None:
+    """The job completion notifier, or None when absent (lite mode, startup).
+
+    Sync endpoints fall back to DB polling without it.
+    """
+    return _job_completion_notifier
+
+
 def get_session_router() -> SessionCoordinator:
     """Get session coordinator instance.
 
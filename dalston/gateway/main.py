@@ -25,7 +25,10 @@ from dalston.db.session import DEFAULT_TENANT_ID, async_session, engine, init_db
 from dalston.gateway.api.auth import router as auth_router
 from dalston.gateway.api.console import router as console_router
 from dalston.gateway.api.v1 import router as v1_router
-from dalston.gateway.dependencies import set_autoscale_overrides_mirror
+from dalston.gateway.dependencies import (
+    set_autoscale_overrides_mirror,
+    set_job_completion_notifier,
+)
 from dalston.gateway.middleware import setup_exception_handlers
 from dalston.gateway.middleware.correlation import CorrelationIdMiddleware
 from dalston.gateway.middleware.metrics import MetricsMiddleware
@@ -36,6 +39,7 @@ from dalston.gateway.services.auth import AuthService, Scope
 from dalston.gateway.services.autoscale_overrides_mirror import (
     AutoscaleOverridesMirror,
 )
+from dalston.gateway.services.job_notifications import JobCompletionNotifier
 from dalston.orchestrator.session_coordinator import SessionCoordinator
 
 # Configure structured logging
@@ -57,6 +61,10 @@ session_router: SessionCoordinator | None = None
 # (initialized in lifespan, distributed mode only).
 autoscale_overrides_mirror: AutoscaleOverridesMirror | None = None
 
+# Wakes sync-endpoint waiters on job terminal events
+# (initialized in lifespan, distributed mode only).
+job_completion_notifier: JobCompletionNotifier | None = None
+
 
 def _should_eager_init_db(settings: Settings) -> bool:
     """Decide whether to initialize DB eagerly at startup.
@@ -152,9 +160,11 @@ async def lifespan(app: FastAPI):
     - Ensure default tenant exists
     - Ensure S3 bucket exists
     - Start Session Router (for real-time transcription)
+    - Start job completion notifier (for sync endpoints)
 
     Shutdown:
     - Stop Session Router
+    - Stop job completion notifier
     - Close Redis connections
     - Dispose database engine
     """
@@ -255,6 +265,11 @@ async def lifespan(app: FastAPI):
         await autoscale_overrides_mirror.start()
         set_autoscale_overrides_mirror(autoscale_overrides_mirror)
 
+        global job_completion_notifier
+        job_completion_notifier = JobCompletionNotifier(redis=await get_redis())
+        await job_completion_notifier.start()
+        set_job_completion_notifier(job_completion_notifier)
+
     # Auto-bootstrap admin key if no keys exist
     await _ensure_admin_key_exists()
 
@@ -274,6 +289,11 @@ async def lifespan(app: FastAPI):
         await autoscale_overrides_mirror.stop()
         set_autoscale_overrides_mirror(None)
 
+    # Stop job completion notifier
+    if job_completion_notifier:
+        await job_completion_notifier.stop()
+        set_job_completion_notifier(None)
+
     # Close Redis provider
     if settings.runtime_mode == "distributed":
         await reset_provider()
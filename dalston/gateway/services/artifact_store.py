@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import shutil
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from dalston.common.s3 import get_s3_client
 from dalston.config import Settings
 
+# Streaming uploads buffer at most (queue + concurrency) parts in memory.
+_MB = 1024 * 1024
+STREAM_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * _MB,
+    multipart_chunksize=8 * _MB,
+    max_concurrency=2,
+    max_io_queue=2,
+)
+
 
 class StorageFullError(Exception):
     """Raised when the storage backend has no space left."""
@@ -24,6 +35,10 @@ class ArtifactStore(Protocol):
         self, key: str, payload: bytes, content_type: str | None = None
     ) -> str: ...
 
+    async def write_stream(
+        self, key: str, stream: BinaryIO, content_type: str | None = None
+    ) -> str: ...
+
     async def read_bytes(self, uri: str) -> bytes: ...
 
     async def exists(self, uri: str) -> bool: ...
@@ -67,6 +82,27 @@ class S3ArtifactStoreAdapter:
                 raise
         return await self.uri_for_key(key)
 
+    async def write_stream(
+        self, key: str, stream: BinaryIO, content_type: str | None = None
+    ) -> str:
+        """Stream a file object to S3, using multipart upload above 8MB."""
+        async with get_s3_client(self._settings) as s3:
+            extra_args = {"ContentType": content_type} if content_type else None
+            try:
+                await s3.upload_fileobj(
+                    stream,
+                    self._bucket,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=STREAM_UPLOAD_CONFIG,
+                )
+            except ClientError as exc:
+                code = exc.response["Error"]["Code"]
+                if code in ("XMinioStorageFull", "StorageFull"):
+                    raise StorageFullError from exc
+                raise
+        return await self.uri_for_key(key)
+
     async def read_bytes(self, uri: str) -> bytes:
         bucket, key = self._parse_s3_uri(uri)
         async with get_s3_client(self._settings) as s3:
@@ -148,6 +184,19 @@ class LocalFilesystemArtifactStoreAdapter:
         path.write_bytes(payload)
         return await self.uri_for_key(key)
 
+    async def write_stream(
+        self, key: str, stream: BinaryIO, content_type: str | None = None
+    ) -> str:
+        path = self._path_for_key(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        def _copy() -> None:
+            with path.open("wb") as dst:
+                shutil.copyfileobj(stream, dst)
+
+        await asyncio.to_thread(_copy)
+        return await self.uri_for_key(key)
+
     async def read_bytes(self, uri: str) -> bytes:
         return self._path_for_uri(uri).read_bytes()
 
@@ -217,6 +266,11 @@ class InMemoryArtifactStoreAdapter:
         self._objects[normalized] = bytes(payload)
         return await self.uri_for_key(normalized)
 
+    async def write_stream(
+        self, key: str, stream: BinaryIO, content_type: str | None = None
+    ) -> str:
+        return await self.write_bytes(key, stream.read(), content_type)
+
     async def read_bytes(self, uri: str) -> bytes:
         key = self._key_for_uri(uri)
         if key not in self._objects:
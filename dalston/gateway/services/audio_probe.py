@@ -6,6 +6,7 @@ Validates audio before job creation to provide immediate feedback on invalid fil
 
 from dataclasses import dataclass
 from io import BytesIO
+from typing import BinaryIO
 
 import structlog
 from tinytag import TinyTag, TinyTagException
@@ -42,11 +43,15 @@ class InvalidAudioError(AudioProbeError):
     pass
 
 
-def probe_audio(data: bytes, filename: str | None = None) -> AudioMetadata:
+def probe_audio(data: bytes | BinaryIO, filename: str | None = None) -> AudioMetadata:
     """Probe audio data to extract metadata.
 
+    Given a seekable file object, tinytag only reads the container headers
+    (and seeks past the payload), so large spooled uploads are never loaded
+    into memory.  The file position is rewound afterwards.
+
     Args:
-        data: Raw audio file bytes
+        data: Raw audio file bytes or a seekable binary file object
         filename: Original filename (helps with format detection)
 
     Returns:
@@ -56,8 +61,9 @@ def probe_audio(data: bytes, filename: str | None = None) -> AudioMetadata:
         InvalidAudioError: If file is not valid audio or unsupported
         AudioProbeError: If probing fails unexpectedly
     """
+    file_obj = BytesIO(data) if isinstance(data, bytes | bytearray) else data
     try:
-        tag = TinyTag.get(file_obj=BytesIO(data), filename=filename)
+        tag = TinyTag.get(file_obj=file_obj, filename=filename)
     except TinyTagException as e:
         raise InvalidAudioError(
             f"Unable to read audio file: {e}. "
@@ -65,6 +71,8 @@ def probe_audio(data: bytes, filename: str | None = None) -> AudioMetadata:
         ) from e
     except Exception as e:
         raise AudioProbeError(f"Unexpected error probing audio: {e}") from e
+    finally:
+        file_obj.seek(0)
 
     # Validate duration
     if tag.duration is None:
@@ -0,0 +1,78 @@
+"""Bounded-memory buffer for incoming audio payloads.
+
+Uploads and URL downloads are written chunk by chunk into an ``AudioSpool``.
+Up to ``SPOOL_MAX_MEMORY_BYTES`` stay in memory; larger payloads spill to an
+anonymous temp file, so gateway memory per request stays at a few MB no
+matter how large the file is.  Size and SHA-256 are tracked as chunks arrive
+so nothing has to re-read the payload to get them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from typing import BinaryIO
+
+SPOOL_MAX_MEMORY_BYTES = 4 * 1024 * 1024  # 4MB, then spill to disk
+
+
+class AudioSpool:
+    """Write-once, read-many spooled audio payload.
+
+    Usage:
+        spool = AudioSpool()
+        spool.write(chunk)  # repeatedly
+        reader = spool.open()  # rewound file object
+        spool.close()
+    """
+
+    def __init__(self, max_memory_bytes: int = SPOOL_MAX_MEMORY_BYTES) -> None:
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> AudioSpool:
+        """Create a spool pre-filled with data."""
+        spool = cls()
+        spool.write(data)
+        return spool
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of everything written so far."""
+        return self._digest.hexdigest()
+
+    @property
+    def rolled_to_disk(self) -> bool:
+        """True once the payload has spilled out of memory."""
+        return bool(getattr(self._file, "_rolled", False))
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, updating size and checksum."""
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        self._file.write(chunk)
+
+    def open(self) -> BinaryIO:
+        """Return the underlying file object rewound to the start."""
+        self._file.seek(0)
+        return self._file  # type: ignore[return-value]
+
+    def read_bytes(self) -> bytes:
+        """Read the whole payload into memory.
+
+        Only for in-process consumers that need ``bytes`` (lite pipeline);
+        the distributed path streams from ``open()`` instead.
+        """
+        return self.open().read()
+
+    def close(self) -> None:
+        """Release the buffer and any spilled temp file."""
+        self._file.close()
+
+    def __enter__(self) -> AudioSpool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -10,6 +10,9 @@ Security:
 - Maximum file size limit
 - Download timeout
 - Content-Type validation
+
+Downloads are streamed into an ``AudioSpool`` so the response body is never
+held in memory as a whole.
 """
 
 import asyncio
@@ -23,6 +26,7 @@ import httpx
 import structlog
 
 from dalston import __version__ as _dalston_version
+from dalston.gateway.services.audio_spool import AudioSpool
 
 logger = structlog.get_logger()
 
@@ -133,12 +137,18 @@ class UnsupportedContentTypeError(AudioUrlError):
 
 @dataclass
 class DownloadedAudio:
-    """Result of downloading audio from URL."""
+    """Result of downloading audio from URL.
+
+    The caller owns ``audio`` and must close it.
+    """
 
-    content: bytes
+    audio: AudioSpool
     filename: str
     content_type: str | None
-    size: int
+
+    @property
+    def size(self) -> int:
+        return self.audio.size
 
 
 def _extract_google_drive_file_id(url: str) -> str | None:
@@ -323,6 +333,7 @@ async def download_audio_from_url(
     url: str,
     max_size: int = MAX_DOWNLOAD_SIZE_BYTES,
     timeout: float = DOWNLOAD_TIMEOUT_SECONDS,
+    spool: AudioSpool | None = None,
 ) -> DownloadedAudio:
     """Download audio file from URL.
 
@@ -330,9 +341,11 @@ async def download_audio_from_url(
         url: URL to download audio from (HTTPS, Google Drive, Dropbox, etc.)
         max_size: Maximum allowed file size in bytes
         timeout: Download timeout in seconds
+        spool: Buffer to stream the body into (a new one is created if None;
+            it is closed on failure)
 
     Returns:
-        DownloadedAudio with content, filename, content_type, and size
+        DownloadedAudio with the spooled body, filename and content_type
 
     Raises:
         InvalidUrlError: URL is invalid or unsupported
@@ -353,6 +366,9 @@ async def download_audio_from_url(
         url=normalized_url[:100],  # Truncate for logging
     )
 
+    if spool is None:
+        spool = AudioSpool()
+    completed = False
     try:
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
@@ -390,32 +406,27 @@ async def download_audio_from_url(
                 # Validate content type
                 _validate_content_type(content_type, filename)
 
-                # Download content with size check
-                chunks: list[bytes] = []
-                total_size = 0
-
+                # Stream content into the spool with size check
                 async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
-                    total_size += len(chunk)
-                    if total_size > max_size:
+                    if spool.size + len(chunk) > max_size:
                         raise FileTooLargeError(
                             f"Download exceeded maximum size: {max_size / (1024**3):.1f} GB"
                         )
-                    chunks.append(chunk)
-
-                content = b"".join(chunks)
+                    spool.write(chunk)
 
                 logger.info(
                     "audio_url_download_completed",
-                    size_bytes=total_size,
+                    size_bytes=spool.size,
                     filename=filename,
                     content_type=content_type,
+                    sha256=spool.sha256,
                 )
 
+                completed = True
                 return DownloadedAudio(
-                    content=content,
+                    audio=spool,
                     filename=filename,
                     content_type=content_type,
-                    size=total_size,
                 )
 
     except httpx.TimeoutException as e:
@@ -431,3 +442,6 @@ async def download_audio_from_url(
         raise
     except Exception as e:
         raise DownloadError(f"Unexpected error downloading audio: {e}") from e
+    finally:
+        if not completed:
+            spool.close()
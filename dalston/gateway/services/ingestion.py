@@ -2,10 +2,15 @@
 
 Consolidates the common audio acquisition logic used by both the native
 transcription API and the ElevenLabs-compatible speech-to-text API.
+
+Payloads are streamed into an ``AudioSpool`` (bounded memory, spills to
+disk), probed from their headers and later streamed to the artifact store,
+so no request ever holds a whole file in gateway memory.
 """
 
 import asyncio
 from dataclasses import dataclass
+from typing import BinaryIO
 
 from fastapi import HTTPException, UploadFile
 
@@ -16,6 +21,7 @@ from dalston.gateway.services.audio_probe import (
     InvalidAudioError,
     probe_audio,
 )
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.audio_url import (
     AudioUrlError,
     DownloadError,
@@ -29,10 +35,29 @@ READ_CHUNK_SIZE_BYTES = 1024 * 1024  # 1MB
 class IngestedAudio:
     """Result of ingesting audio from file upload or URL."""
 
-    content: bytes
+    audio: AudioSpool
     filename: str
     metadata: AudioMetadata
 
+    @property
+    def size(self) -> int:
+        """Payload size in bytes."""
+        return self.audio.size
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the payload."""
+        return self.audio.sha256
+
+    @property
+    def content(self) -> bytes:
+        """Whole payload as bytes (loads it into memory; lite mode only)."""
+        return self.audio.read_bytes()
+
+    def open(self) -> BinaryIO:
+        """Return a rewound file object for streaming the payload."""
+        return self.audio.open()
+
 
 class AudioIngestionService:
     """Service for ingesting audio from file uploads or URLs.
@@ -42,10 +67,20 @@ class AudioIngestionService:
     - URL downloading with size limits and timeouts
     - File content reading from uploads
     - Audio probing for metadata extraction and validation
+
+    Spooled payloads live until ``close()``, which the request-scoped
+    dependency calls once the response has been produced.
     """
 
     def __init__(self, settings: Settings):
         self.settings = settings
+        self._spools: list[AudioSpool] = []
+
+    def close(self) -> None:
+        """Release every payload ingested through this service."""
+        for spool in self._spools:
+            spool.close()
+        self._spools.clear()
 
     async def ingest(
         self,
@@ -60,7 +95,7 @@ class AudioIngestionService:
             url: URL to download audio from (mutually exclusive with file)
 
         Returns:
-            IngestedAudio with content, filename, and probed metadata
+            IngestedAudio with spooled payload, filename, and probed metadata
 
         Raises:
             HTTPException: On validation errors (400) or invalid audio (400)
@@ -79,22 +114,23 @@ class AudioIngestionService:
 
         # Acquire content from URL or file
         if url is not None:
-            content, filename = await self._download_from_url(url, max_bytes=max_bytes)
+            spool, filename = await self._download_from_url(url, max_bytes=max_bytes)
         else:
-            content, filename = await self._read_from_file(  # type: ignore[arg-type]
+            spool, filename = await self._read_from_file(  # type: ignore[arg-type]
                 file,
                 max_bytes=max_bytes,
             )
+        self._spools.append(spool)
 
-        # Probe audio to extract metadata and validate
+        # Probe audio headers to extract metadata and validate
         # Uses to_thread() because probe_audio uses tinytag synchronously
         try:
-            metadata = await asyncio.to_thread(probe_audio, content, filename)
+            metadata = await asyncio.to_thread(probe_audio, spool.open(), filename)
         except InvalidAudioError as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
 
         return IngestedAudio(
-            content=content,
+            audio=spool,
             filename=filename,
             metadata=metadata,
         )
@@ -104,14 +140,14 @@ class AudioIngestionService:
         url: str,
         *,
         max_bytes: int | None = None,
-    ) -> tuple[bytes, str]:
+    ) -> tuple[AudioSpool, str]:
         """Download audio from URL.
 
         Args:
             url: URL to download from
 
         Returns:
-            Tuple of (content bytes, filename)
+            Tuple of (spooled content, filename)
 
         Raises:
             HTTPException: On download errors
@@ -127,7 +163,7 @@ class AudioIngestionService:
                 max_size=max_size,
                 timeout=self.settings.audio_url_timeout_seconds,
             )
-            return downloaded.content, downloaded.filename
+            return downloaded.audio, downloaded.filename
         except DownloadError as e:
             if e.upstream_status is not None:
                 raise HTTPException(
@@ -147,14 +183,14 @@ class AudioIngestionService:
         file: UploadFile,
         *,
         max_bytes: int | None = None,
-    ) -> tuple[bytes, str]:
-        """Read content from uploaded file.
+    ) -> tuple[AudioSpool, str]:
+        """Stream content from uploaded file into a spool.
 
         Args:
             file: Uploaded file from FastAPI
 
         Returns:
-            Tuple of (content bytes, filename)
+            Tuple of (spooled content, filename)
 
         Raises:
             HTTPException: If file has no filename
@@ -177,21 +213,24 @@ class AudioIngestionService:
                 ),
             )
 
-        chunks: list[bytes] = []
-        total_size = 0
-        while True:
-            chunk = await file.read(READ_CHUNK_SIZE_BYTES)
-            if not chunk:
-                break
-            total_size += len(chunk)
-            if max_bytes is not None and total_size > max_bytes:
-                raise HTTPException(
-                    status_code=413,
-                    detail=(
-                        f"File too large: {total_size / (1024**3):.2f} GB. "
-                        f"Maximum: {max_bytes / (1024**3):.1f} GB"
-                    ),
-                )
-            chunks.append(chunk)
-
-        return b"".join(chunks), file.filename
+        spool = AudioSpool()
+        try:
+            while True:
+                chunk = await file.read(READ_CHUNK_SIZE_BYTES)
+                if not chunk:
+                    break
+                total_size = spool.size + len(chunk)
+                if max_bytes is not None and total_size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=(
+                            f"File too large: {total_size / (1024**3):.2f} GB. "
+                            f"Maximum: {max_bytes / (1024**3):.1f} GB"
+                        ),
+                    )
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+
+        return spool, file.filename
@@ -0,0 +1,137 @@
+"""Per-process dispatcher for job terminal-state notifications.
+
+The orchestrator publishes ``job.completed``, ``job.failed`` and
+``job.cancelled`` on the ``dalston:events`` pub/sub channel right after
+committing the terminal status. Each gateway process holds one subscription
+and wakes the sync-endpoint waiters registered for that job, so
+:func:`~dalston.gateway.services.polling.wait_for_job_completion` re-reads
+the job once, within milliseconds of completion, instead of polling
+Postgres every second.
+
+Pub/sub is fire-and-forget: a message published while the subscription is
+reconnecting is lost. Waiters therefore keep a slow DB poll as a backstop,
+and every waiter is woken when the subscription drops so nothing sleeps
+through a missed event.
+
+Lifecycle mirrors the SessionCoordinator start/stop pattern in
+gateway/main.py: created and started only in distributed mode, cancelled
+and awaited on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import Iterator
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+
+from dalston.common.events import EVENTS_CHANNEL
+from dalston.common.timeouts import REDIS_RECONNECT_DELAY_SECONDS
+
+logger = structlog.get_logger()
+
+JOB_TERMINAL_EVENT_TYPES = frozenset({"job.completed", "job.failed", "job.cancelled"})
+
+
+class JobCompletionNotifier:
+    """Fan out job terminal events from one Redis subscription to waiters."""
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._subscribed = False
+
+    @property
+    def subscribed(self) -> bool:
+        """True while the pub/sub subscription is live.
+
+        Waiters should fall back to normal-rate DB polling when False.
+        """
+        return self._subscribed
+
+    async def start(self) -> None:
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("job_completion_notifier_started")
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._wake_all()
+        logger.info("job_completion_notifier_stopped")
+
+    @contextlib.contextmanager
+    def watch(self, job_id: UUID | str) -> Iterator[asyncio.Event]:
+        """Register interest in a job for the duration of the block.
+
+        The yielded event is set whenever a terminal event for the job
+        arrives (or the subscription drops). It is only a hint to re-read
+        the job; callers clear it before each re-read.
+        """
+        key = str(job_id)
+        event = asyncio.Event()
+        self._waiters.setdefault(key, set()).add(event)
+        try:
+            yield event
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[key]
+
+    def dispatch(self, message: str) -> None:
+        """Wake the waiters for the job a raw channel message refers to."""
+        # Task events dominate the channel; skip them without parsing.
+        if '"job.' not in message or not self._waiters:
+            return
+        try:
+            event = json.loads(message)
+        except ValueError:
+            return
+        if event.get("type") not in JOB_TERMINAL_EVENT_TYPES:
+            return
+        for waiter in self._waiters.get(str(event.get("job_id")), ()):
+            waiter.set()
+
+    def _wake_all(self) -> None:
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.set()
+
+    async def _run_loop(self) -> None:
+        while self._running:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                self._subscribed = True
+                logger.debug("job_completion_notifier_subscribed")
+                while self._running:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None and message["type"] == "message":
+                        self.dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("job_completion_notifier_disconnected", exc_info=True)
+            finally:
+                self._subscribed = False
+                # Events may have been missed; let every waiter re-check.
+                self._wake_all()
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+            if self._running:
+                await asyncio.sleep(REDIS_RECONNECT_DELAY_SECONDS)
@@ -1,16 +1,20 @@
 """Job completion polling utilities.
 
 Provides a shared helper for sync API endpoints that need to wait
-for a job to reach a terminal state.
+for a job to reach a terminal state. When a
+:class:`~dalston.gateway.services.job_notifications.JobCompletionNotifier`
+is available the wait is event-driven, with DB polling only as a fallback.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
 from dalston.common.models import JobStatus
 from dalston.common.timeouts import (
+    SYNC_NOTIFY_FALLBACK_POLL_SECONDS,
     SYNC_OPERATION_TIMEOUT_SECONDS,
     SYNC_POLL_INTERVAL_SECONDS,
 )
@@ -19,6 +23,13 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from dalston.db.models import JobModel
+    from dalston.gateway.services.job_notifications import JobCompletionNotifier
+
+_TERMINAL_STATUSES = {
+    JobStatus.COMPLETED.value: JobStatus.COMPLETED,
+    JobStatus.FAILED.value: JobStatus.FAILED,
+    JobStatus.CANCELLED.value: JobStatus.CANCELLED,
+}
 
 
 class JobCompletionResult:
@@ -60,17 +71,22 @@ async def wait_for_job_completion(
     job: JobModel,
     timeout_seconds: float = SYNC_OPERATION_TIMEOUT_SECONDS,
     poll_interval: float = SYNC_POLL_INTERVAL_SECONDS,
+    notifier: JobCompletionNotifier | None = None,
 ) -> JobCompletionResult:
     """Wait for a job to reach a terminal state.
 
-    Polls the database at regular intervals until the job reaches
-    COMPLETED, FAILED, or CANCELLED status, or until timeout.
+    Re-reads the job until it reaches COMPLETED, FAILED, or CANCELLED
+    status, or until timeout. With a subscribed ``notifier`` the job is
+    re-read when its terminal event arrives, plus every
+    ``SYNC_NOTIFY_FALLBACK_POLL_SECONDS`` in case the event was missed;
+    otherwise it is polled every ``poll_interval``.
 
     Args:
         db: Database session for refreshing job state
         job: Job model to monitor (will be refreshed in-place)
         timeout_seconds: Maximum time to wait (default: 5 minutes)
         poll_interval: Seconds between polls (default: 1 second)
+        notifier: Job completion notifier (None = poll only)
 
     Returns:
         JobCompletionResult with the terminal status and refreshed job
@@ -87,25 +103,36 @@ async def wait_for_job_completion(
         else:  # timed_out
             raise HTTPException(408, "Request timeout")
     """
-    elapsed = 0.0
-
-    while elapsed < timeout_seconds:
-        await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
-
-        # Expire cached state and refresh from DB
-        db.expire(job)
-        await db.refresh(job)
-
-        # Check for terminal states
-        if job.status == JobStatus.COMPLETED.value:
-            return JobCompletionResult(JobStatus.COMPLETED, job)
-
-        if job.status == JobStatus.FAILED.value:
-            return JobCompletionResult(JobStatus.FAILED, job)
-
-        if job.status == JobStatus.CANCELLED.value:
-            return JobCompletionResult(JobStatus.CANCELLED, job)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+
+    with contextlib.ExitStack() as stack:
+        # Register before the first read so an event published in between
+        # is not lost.
+        wakeup = (
+            stack.enter_context(notifier.watch(job.id))
+            if notifier is not None
+            else None
+        )
+
+        while (remaining := deadline - loop.time()) > 0:
+            if wakeup is not None and notifier is not None and notifier.subscribed:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        wakeup.wait(),
+                        min(SYNC_NOTIFY_FALLBACK_POLL_SECONDS, remaining),
+                    )
+                wakeup.clear()
+            else:
+                await asyncio.sleep(min(poll_interval, remaining))
+
+            # Expire cached state and refresh from DB
+            db.expire(job)
+            await db.refresh(job)
+
+            status = _TERMINAL_STATUSES.get(job.status)
+            if status is not None:
+                return JobCompletionResult(status, job)
 
     # Timeout
     return JobCompletionResult(None, job, timed_out=True)
@@ -3,14 +3,16 @@
 import json
 import mimetypes
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import urlsplit, urlunsplit
 from uuid import UUID
 
 from fastapi import UploadFile
 
+from dalston.common.payload_codec import decode_payload
 from dalston.common.s3 import get_s3_client
 from dalston.common.timeouts import S3_PRESIGNED_URL_EXPIRY_SECONDS
+from dalston.common.word_columns import expand_transcript_words
 from dalston.config import Settings
 from dalston.gateway.services.artifact_store import build_artifact_store
 
@@ -30,6 +32,7 @@ class StorageService:
         file_content: bytes | None = None,
         filename: str | None = None,
         content_type: str | None = None,
+        stream: BinaryIO | None = None,
     ) -> str:
         """Upload audio file to the configured artifact backend.
 
@@ -39,6 +42,8 @@ class StorageService:
             file_content: Pre-read file content (required if file is None)
             filename: Explicit filename (used when file is None)
             content_type: Explicit content type (used when file is None)
+            stream: Binary file object to stream from instead of buffering
+                the payload (takes precedence over file/file_content)
 
         Returns:
             Artifact URI (S3 in distributed mode, file URI in lite mode)
@@ -64,6 +69,13 @@ class StorageService:
         # Build canonical artifact key
         key = f"jobs/{job_id}/audio/original.{ext}"
 
+        if stream is not None:
+            return await self.artifact_store.write_stream(
+                key=key,
+                stream=stream,
+                content_type=resolved_content_type,
+            )
+
         # Use provided content or read from file
         if file_content is not None:
             content = file_content
@@ -285,7 +297,7 @@ class StorageService:
             body = await self.artifact_store.read_bytes(uri)
         except FileNotFoundError:
             return None
-        return json.loads(body.decode("utf-8"))
+        return decode_payload(body)
 
     async def get_task_response(
         self, job_id: UUID, task_id: UUID
@@ -305,4 +317,7 @@ class StorageService:
             body = await self.artifact_store.read_bytes(uri)
         except FileNotFoundError:
             return None
-        return json.loads(body.decode("utf-8"))
+        response = decode_payload(body)
+        if isinstance(response, dict) and "data" in response:
+            response["data"] = expand_transcript_words(response["data"])
+        return response
@@ -174,6 +174,22 @@ def _init_orchestrator_metrics() -> None:
         ["decision", "failure_reason", "event_type"],
     )
 
+    _orchestrator_metrics["event_lanes_active"] = Gauge(
+        "dalston_orchestrator_event_lanes_active",
+        "Job partitions with queued or running durable events",
+    )
+
+    _orchestrator_metrics["events_pending"] = Gauge(
+        "dalston_orchestrator_events_pending",
+        "Durable events queued or running in the dispatcher",
+    )
+
+    _orchestrator_metrics["event_lane_wait_seconds"] = Histogram(
+        "dalston_orchestrator_event_lane_wait_seconds",
+        "Time a durable event waits in its job lane before handling",
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+    )
+
     _orchestrator_metrics["dag_build_duration_seconds"] = Histogram(
         "dalston_orchestrator_dag_build_duration_seconds",
         "DAG construction time",
@@ -197,7 +213,7 @@ def _init_engine_metrics() -> None:
     """Initialize Engine-specific metrics."""
     if _engine_metrics:
         return
-    from prometheus_client import Counter, Histogram
+    from prometheus_client import Counter, Gauge, Histogram
 
     _engine_metrics["tasks_processed_total"] = Counter(
         "dalston_engine_tasks_processed_total",
@@ -233,6 +249,52 @@ def _init_engine_metrics() -> None:
         buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10),
     )
 
+    _engine_metrics["task_overhead_seconds"] = Histogram(
+        "dalston_engine_task_overhead_seconds",
+        "Per-task control-plane time outside engine processing "
+        "(S3 transfers, Redis, event publishing)",
+        ["engine_id", "execution_profile"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    )
+
+    _engine_metrics["admission_decisions_total"] = Counter(
+        "dalston_engine_admission_decisions_total",
+        "Batch/realtime admission decisions (batch_deferred, batch_limit_down, "
+        "batch_limit_up, batch_yield, batch_resume, batch_preempted)",
+        ["engine_id", "decision"],
+    )
+
+    _engine_metrics["admission_batch_limit"] = Gauge(
+        "dalston_engine_admission_batch_limit",
+        "Current adaptive limit on concurrent batch tasks",
+        ["engine_id"],
+    )
+
+    _engine_metrics["admission_rt_latency_p95_seconds"] = Gauge(
+        "dalston_engine_admission_rt_latency_p95_seconds",
+        "Realtime inference p95 latency seen by the admission controller",
+        ["engine_id"],
+    )
+
+    _engine_metrics["batch_yield_seconds"] = Histogram(
+        "dalston_engine_batch_yield_seconds",
+        "Time batch work paused at a chunk boundary for realtime load",
+        ["engine_id"],
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    )
+
+    _engine_metrics["prefetch_total"] = Counter(
+        "dalston_engine_prefetch_total",
+        "Task input prefetch outcomes (staged, failed, cancelled)",
+        ["engine_id", "outcome"],
+    )
+
+    _engine_metrics["artifact_cache_total"] = Counter(
+        "dalston_engine_artifact_cache_total",
+        "Node-local artifact cache lookups and evictions (hit, miss, evicted)",
+        ["engine_id", "outcome"],
+    )
+
     _engine_metrics["task_redelivery_total"] = Counter(
         "dalston_engine_task_redelivery_total",
         "Number of task redeliveries (delivery_count > 1)",
@@ -280,6 +342,13 @@ def _init_engine_metrics() -> None:
         buckets=(0.01, 0.03, 0.05, 0.1, 0.15, 0.25, 0.5, 1.0, 2.0, 5.0),
     )
 
+    _engine_metrics["diarize_phase_seconds"] = Histogram(
+        "dalston_engine_diarize_phase_seconds",
+        "Wall-clock time per phase of chunked diarization",
+        ["engine_id", "phase"],
+        buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+    )
+
     _engine_metrics["vad_segment_count"] = Histogram(
         "dalston_engine_vad_segment_count",
         "Number of VAD segments per transcription",
@@ -374,6 +443,20 @@ def _init_realtime_metrics() -> None:
         buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
     )
 
+    _realtime_metrics["transcribe_batch_size"] = Histogram(
+        "dalston_realtime_transcribe_batch_size",
+        "Utterances decoded together by the cross-session transcribe batcher",
+        ["model"],
+        buckets=(1, 2, 4, 8, 16, 32, 64),
+    )
+
+    _realtime_metrics["transcribe_batch_wait_seconds"] = Histogram(
+        "dalston_realtime_transcribe_batch_wait_seconds",
+        "Time an utterance waited in the transcribe batcher before decoding",
+        ["model"],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+
 
 def _init_queue_metrics() -> None:
     """Initialize Queue Exporter metrics."""
@@ -618,6 +701,30 @@ def inc_orchestrator_event_decision(
     ).inc()
 
 
+def set_orchestrator_event_lanes(active_lanes: int, pending: int) -> None:
+    """Set event dispatcher depth gauges.
+
+    Args:
+        active_lanes: Job partitions with queued or running events
+        pending: Events queued or running across all lanes
+    """
+    if not _metrics_enabled or "event_lanes_active" not in _orchestrator_metrics:
+        return
+    _orchestrator_metrics["event_lanes_active"].set(active_lanes)
+    _orchestrator_metrics["events_pending"].set(pending)
+
+
+def observe_orchestrator_event_lane_wait(duration: float) -> None:
+    """Record how long an event waited in its lane.
+
+    Args:
+        duration: Duration in seconds
+    """
+    if not _metrics_enabled or "event_lane_wait_seconds" not in _orchestrator_metrics:
+        return
+    _orchestrator_metrics["event_lane_wait_seconds"].observe(duration)
+
+
 def observe_orchestrator_dag_build(duration: float) -> None:
     """Record DAG build duration.
 
@@ -765,6 +872,100 @@ def observe_engine_s3_upload(
     ).observe(duration)
 
 
+def observe_engine_task_overhead(
+    engine_id: str,
+    duration: float,
+    execution_profile: str = "unknown",
+) -> None:
+    """Record per-task time spent outside engine processing.
+
+    Args:
+        engine_id: Runtime identifier
+        duration: Duration in seconds
+    """
+    if not _metrics_enabled or "task_overhead_seconds" not in _engine_metrics:
+        return
+    _engine_metrics["task_overhead_seconds"].labels(
+        engine_id=engine_id,
+        execution_profile=execution_profile,
+    ).observe(duration)
+
+
+def inc_engine_admission_decision(engine_id: str, decision: str) -> None:
+    """Increment admission decision counter.
+
+    Args:
+        engine_id: Runtime identifier
+        decision: Decision taken (batch_deferred, batch_limit_down,
+            batch_limit_up, batch_yield, batch_resume, batch_preempted)
+    """
+    if not _metrics_enabled or "admission_decisions_total" not in _engine_metrics:
+        return
+    _engine_metrics["admission_decisions_total"].labels(
+        engine_id=engine_id, decision=decision
+    ).inc()
+
+
+def set_engine_admission_state(
+    engine_id: str, batch_limit: int, rt_latency_p95: float | None
+) -> None:
+    """Set the adaptive batch limit and observed realtime p95 latency.
+
+    Args:
+        engine_id: Runtime identifier
+        batch_limit: Current concurrent batch task limit
+        rt_latency_p95: Realtime p95 inference latency in seconds, if known
+    """
+    if not _metrics_enabled or "admission_batch_limit" not in _engine_metrics:
+        return
+    _engine_metrics["admission_batch_limit"].labels(engine_id=engine_id).set(
+        batch_limit
+    )
+    if rt_latency_p95 is not None:
+        _engine_metrics["admission_rt_latency_p95_seconds"].labels(
+            engine_id=engine_id
+        ).set(rt_latency_p95)
+
+
+def observe_engine_batch_yield(engine_id: str, duration: float) -> None:
+    """Record time a batch task paused for realtime load.
+
+    Args:
+        engine_id: Runtime identifier
+        duration: Duration in seconds
+    """
+    if not _metrics_enabled or "batch_yield_seconds" not in _engine_metrics:
+        return
+    _engine_metrics["batch_yield_seconds"].labels(engine_id=engine_id).observe(duration)
+
+
+def inc_engine_prefetch(engine_id: str, outcome: str) -> None:
+    """Increment task input prefetch counter.
+
+    Args:
+        engine_id: Runtime identifier
+        outcome: Prefetch outcome (staged, failed, cancelled)
+    """
+    if not _metrics_enabled or "prefetch_total" not in _engine_metrics:
+        return
+    _engine_metrics["prefetch_total"].labels(engine_id=engine_id, outcome=outcome).inc()
+
+
+def inc_engine_artifact_cache(engine_id: str, outcome: str, count: int = 1) -> None:
+    """Increment node-local artifact cache counter.
+
+    Args:
+        engine_id: Runtime identifier
+        outcome: Cache outcome (hit, miss, evicted)
+        count: Number of artifacts
+    """
+    if not _metrics_enabled or "artifact_cache_total" not in _engine_metrics:
+        return
+    _engine_metrics["artifact_cache_total"].labels(
+        engine_id=engine_id, outcome=outcome
+    ).inc(count)
+
+
 def observe_engine_model_load(
     engine_id: str,
     model: str,
@@ -856,6 +1057,15 @@ def observe_engine_recognize(
     ).observe(duration)
 
 
+def observe_engine_diarize_phase(engine_id: str, phase: str, duration: float) -> None:
+    """Record time spent in one phase of chunked diarization."""
+    if not _metrics_enabled or "diarize_phase_seconds" not in _engine_metrics:
+        return
+    _engine_metrics["diarize_phase_seconds"].labels(
+        engine_id=engine_id, phase=phase
+    ).observe(duration)
+
+
 def observe_engine_realtime_factor(
     engine_id: str, model: str, device: str, rtf: float
 ) -> None:
@@ -1039,6 +1249,24 @@ def observe_realtime_chunk_latency(model: str, duration: float) -> None:
     _realtime_metrics["chunk_latency_seconds"].labels(model=model).observe(duration)
 
 
+def observe_realtime_transcribe_batch(
+    model: str, batch_size: int, max_wait: float
+) -> None:
+    """Record one cross-session transcribe batch.
+
+    Args:
+        model: Model identifier
+        batch_size: Number of utterances in the batch
+        max_wait: Longest time an utterance in the batch waited, in seconds
+    """
+    if not _metrics_enabled or "transcribe_batch_size" not in _realtime_metrics:
+        return
+    _realtime_metrics["transcribe_batch_size"].labels(model=model).observe(batch_size)
+    _realtime_metrics["transcribe_batch_wait_seconds"].labels(model=model).observe(
+        max_wait
+    )
+
+
 # =============================================================================
 # Public Initialization Functions
 # =============================================================================
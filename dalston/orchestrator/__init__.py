@@ -19,6 +19,7 @@ __all__ = [
     "handle_task_completed",
     "handle_task_failed",
     "queue_task",
+    "queue_tasks",
 ]
 
 _EXPORTS: dict[str, tuple[str, str]] = {
@@ -42,6 +43,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     ),
     "handle_task_failed": ("dalston.orchestrator.handlers", "handle_task_failed"),
     "queue_task": ("dalston.orchestrator.scheduler", "queue_task"),
+    "queue_tasks": ("dalston.orchestrator.scheduler", "queue_tasks"),
 }
 
 
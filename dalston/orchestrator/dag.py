@@ -64,19 +64,41 @@ def _audio_input_binding(
     producer_stage: str = "prepare",
     channel: int | None = None,
     role: str = "prepared",
+    speech_regions: bool = False,
 ) -> list[dict]:
-    """Create a single audio slot binding for a task."""
-    binding = RequestBinding(
-        slot="audio",
-        selector=ArtifactSelector(
-            producer_stage=producer_stage,
-            kind="audio",
-            channel=channel,
-            role=role,
-            required=True,
-        ),
-    )
-    return [binding.model_dump(exclude_none=True)]
+    """Create the audio slot binding for a task.
+
+    With ``speech_regions``, also bind prepare's speech-regions artifact
+    for the same channel to an optional ``speech_regions`` slot, so the
+    engine can reuse prepare's VAD pass. The slot stays empty when
+    prepare could not run detection.
+    """
+    bindings = [
+        RequestBinding(
+            slot="audio",
+            selector=ArtifactSelector(
+                producer_stage=producer_stage,
+                kind="audio",
+                channel=channel,
+                role=role,
+                required=True,
+            ),
+        )
+    ]
+    if speech_regions:
+        bindings.append(
+            RequestBinding(
+                slot="speech_regions",
+                selector=ArtifactSelector(
+                    producer_stage=producer_stage,
+                    kind="speech_regions",
+                    channel=channel,
+                    role=role,
+                    required=False,
+                ),
+            )
+        )
+    return [binding.model_dump(exclude_none=True) for binding in bindings]
 
 
 # Default engine IDs for each stage (engine_id IDs, not model variant IDs)
@@ -116,6 +138,7 @@ async def build_task_dag(
     registry: UnifiedEngineRegistry,
     catalog: EngineCatalog,
     db: AsyncSession | None = None,
+    audio_duration: float | None = None,
 ) -> list[Task]:
     """Build a task DAG for a job using capability-driven engine selection.
 
@@ -154,6 +177,8 @@ async def build_task_dag(
         registry: Batch engine registry (running engines)
         catalog: Engine catalog (all available engines)
         db: Optional database session for HF model lookup
+        audio_duration: Audio duration in seconds, if known, used to
+            estimate completion time when choosing between engines
 
     Returns:
         List of Task objects with dependencies wired
@@ -164,7 +189,9 @@ async def build_task_dag(
     from dalston.orchestrator.engine_selector import select_pipeline_engines
 
     # Select engines for all required stages
-    selection = await select_pipeline_engines(parameters, registry, catalog, db=db)
+    selection = await select_pipeline_engines(
+        parameters, registry, catalog, db=db, audio_duration_s=audio_duration
+    )
     selections = selection.stages
 
     # Build engines dict from selections
@@ -374,7 +401,8 @@ def _build_dag_with_engines(
     # hour of audio on CPU, which is poor value on long high-speech-ratio
     # files. Set DALSTON_PREPARE_SPEECH_REGIONS=1 to enable it (debug /
     # telephony diagnosis); the engine and coverage check stay dormant
-    # otherwise.
+    # otherwise. When enabled, transcribe and diarize also bind the
+    # resulting speech-regions artifact and skip their own VAD pass.
     prepare_config: dict = {}
     if _speech_regions_enabled():
         prepare_config["detect_speech_regions"] = True
@@ -423,7 +451,7 @@ def _build_dag_with_engines(
         engine_id=engines.get("transcribe", DEFAULT_ENGINES["transcribe"]),
         status=TaskStatus.PENDING,
         dependencies=[prepare_task.id],
-        input_bindings=_audio_input_binding(),
+        input_bindings=_audio_input_binding(speech_regions=_speech_regions_enabled()),
         config=transcribe_config,
         request_uri=None,
         response_uri=None,
@@ -491,7 +519,7 @@ def _create_diarize_task(
         engine_id=engines.get("diarize", DEFAULT_ENGINES["diarize"]),
         status=TaskStatus.PENDING,
         dependencies=dependencies,
-        input_bindings=_audio_input_binding(),
+        input_bindings=_audio_input_binding(speech_regions=_speech_regions_enabled()),
         config=config,
         request_uri=None,
         response_uri=None,
@@ -556,7 +584,9 @@ def _build_per_channel_dag_with_engines(
             engine_id=engines.get("transcribe", DEFAULT_ENGINES["transcribe"]),
             status=TaskStatus.PENDING,
             dependencies=[prepare_task.id],
-            input_bindings=_audio_input_binding(channel=channel),
+            input_bindings=_audio_input_binding(
+                channel=channel, speech_regions=_speech_regions_enabled()
+            ),
             config=channel_transcribe_config,
             request_uri=None,
             response_uri=None,
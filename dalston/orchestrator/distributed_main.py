@@ -42,6 +42,7 @@ from dalston.gateway.services.webhook import WebhookService
 from dalston.gateway.services.webhook_endpoints import WebhookEndpointService
 from dalston.orchestrator.cleanup import CleanupWorker
 from dalston.orchestrator.delivery import DeliveryWorker, create_webhook_delivery
+from dalston.orchestrator.event_dispatcher import PartitionedEventDispatcher
 from dalston.orchestrator.handlers import (
     handle_job_cancel_requested,
     handle_job_created,
@@ -224,6 +225,12 @@ async def orchestrator_loop() -> None:
     consumer_id = f"orchestrator-{hostname[:12]}"
     logger.info("orchestrator_consumer_id", consumer_id=consumer_id)
 
+    # Events are handled concurrently across jobs, in order within a job
+    dispatcher = PartitionedEventDispatcher(
+        concurrency=settings.events_concurrency,
+        max_pending=settings.events_max_pending,
+    )
+
     try:
         # Ensure durable events stream consumer group exists
         await ensure_events_stream_group(redis)
@@ -258,7 +265,12 @@ async def orchestrator_loop() -> None:
         # Claim pending events from crashed consumers (crash recovery)
         # Uses XAUTOCLAIM to take over messages idle for 60+ seconds from any consumer
         await _claim_and_replay_stale_events(
-            redis, consumer_id, settings, batch_registry, is_startup=True
+            redis,
+            consumer_id,
+            settings,
+            batch_registry,
+            dispatcher,
+            is_startup=True,
         )
 
         logger.info(
@@ -281,7 +293,7 @@ async def orchestrator_loop() -> None:
                     last_stale_claim_time = current_time
                     try:
                         await _claim_and_replay_stale_events(
-                            redis, consumer_id, settings, batch_registry
+                            redis, consumer_id, settings, batch_registry, dispatcher
                         )
                     except Exception as e:
                         logger.warning("periodic_stale_claim_error", error=str(e))
@@ -296,22 +308,15 @@ async def orchestrator_loop() -> None:
                     continue
 
                 for event in events:
-                    try:
-                        await _process_durable_event(
-                            event,
-                            redis,
-                            settings,
-                            batch_registry,
-                            consumer_id=consumer_id,
-                            source="live_consumer",
-                        )
-                    except Exception as e:
-                        logger.exception(
-                            "event_processing_error",
-                            error=str(e),
-                            message_id=event.message_id,
-                            event_type=event.event_type or "unknown",
-                        )
+                    await _submit_durable_event(
+                        dispatcher,
+                        event,
+                        redis,
+                        settings,
+                        batch_registry,
+                        consumer_id=consumer_id,
+                        source="live_consumer",
+                    )
 
             except Exception as e:
                 logger.exception("stream_read_error", error=str(e))
@@ -319,6 +324,10 @@ async def orchestrator_loop() -> None:
                 await asyncio.sleep(0.1)
 
     finally:
+        # Let in-flight events finish and ACK; queued ones stay pending in
+        # the stream and are reclaimed after restart.
+        await dispatcher.drain()
+
         # Stop stale task scanner
         if _stale_task_scanner:
             await _stale_task_scanner.stop()
@@ -348,6 +357,7 @@ async def _claim_and_replay_stale_events(
     consumer_id: str,
     settings: Settings,
     batch_registry: UnifiedEngineRegistry,
+    dispatcher: PartitionedEventDispatcher,
     *,
     is_startup: bool = False,
 ) -> None:
@@ -362,6 +372,7 @@ async def _claim_and_replay_stale_events(
         consumer_id: Consumer ID for this orchestrator instance
         settings: Application settings
         batch_registry: Batch engine registry for availability checks
+        dispatcher: Job-partitioned dispatcher the replayed events go through
         is_startup: If True, use higher limits for thorough startup recovery
     """
     logger.info("claiming_stale_events", consumer_id=consumer_id, is_startup=is_startup)
@@ -395,24 +406,76 @@ async def _claim_and_replay_stale_events(
     logger.info("claimed_stale_events", count=len(stale_events))
 
     for event in stale_events:
+        await _submit_durable_event(
+            dispatcher,
+            event,
+            redis,
+            settings,
+            batch_registry,
+            consumer_id=consumer_id,
+            source="crash_recovery",
+        )
+
+    logger.info("stale_event_replay_submitted", replayed=len(stale_events))
+
+
+def _event_partition_key(envelope: DurableEventEnvelope) -> str:
+    """Dispatcher lane for an event: its job, so per-job order is kept.
+
+    Events without a job_id (malformed or job-less) get their own lane.
+    """
+    payload = envelope.payload or {}
+    job_id = payload.get("job_id")
+    if job_id:
+        return f"job:{job_id}"
+    return f"message:{envelope.message_id}"
+
+
+async def _submit_durable_event(
+    dispatcher: PartitionedEventDispatcher,
+    envelope: DurableEventEnvelope,
+    redis: aioredis.Redis,
+    settings: Settings,
+    batch_registry: UnifiedEngineRegistry,
+    *,
+    consumer_id: str,
+    source: str,
+) -> None:
+    """Queue one durable event on its job lane (blocks on backpressure).
+
+    An event that is still queued or running (e.g. reclaimed by the stale
+    event scan while its lane is backed up) is not queued again.
+    """
+
+    async def work() -> None:
         try:
             await _process_durable_event(
-                event,
+                envelope,
                 redis,
                 settings,
                 batch_registry,
                 consumer_id=consumer_id,
-                source="crash_recovery",
+                source=source,
             )
         except Exception as e:
             logger.exception(
-                "claimed_event_replay_failed",
+                "event_processing_error",
                 error=str(e),
-                message_id=event.message_id,
-                event_type=event.event_type or "unknown",
+                message_id=envelope.message_id,
+                event_type=envelope.event_type or "unknown",
+                source=source,
             )
 
-    logger.info("stale_event_replay_complete", replayed=len(stale_events))
+    queued = await dispatcher.submit(
+        _event_partition_key(envelope), work, work_id=envelope.message_id
+    )
+    if not queued:
+        logger.debug(
+            "durable_event_already_queued",
+            message_id=envelope.message_id,
+            event_type=envelope.event_type or "unknown",
+            source=source,
+        )
 
 
 async def _process_durable_event(
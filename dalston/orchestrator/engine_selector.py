@@ -3,7 +3,9 @@
 This module replaces hardcoded engine defaults with dynamic selection based on:
 - Running engine capabilities from the registry
 - Job requirements (language, streaming, etc.)
-- Engine ranking by capabilities (word timestamps, diarization, speed)
+- Engine ranking by capabilities (word timestamps, diarization), then by
+  estimated completion time from queue depth, rolling task time and
+  whether the selected model is already loaded
 
 Example:
     requirements = extract_requirements(job_parameters)
@@ -18,6 +20,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import structlog
+from redis.exceptions import RedisError
 
 import dalston.telemetry
 from dalston.common.model_selection_keys import (
@@ -39,6 +42,12 @@ logger = structlog.get_logger()
 # Stages that require explicit engine_id model resolution from the registry.
 MODEL_BACKED_STAGES = {"transcribe", "diarize", "align", "pii_detect"}
 
+# Audio duration assumed for tasks whose length is unknown when estimating
+# completion time (queued tasks, and jobs without a probed duration).
+REFERENCE_AUDIO_S = 600.0
+# Added when no instance of an engine has the selected model loaded.
+MODEL_LOAD_PENALTY_S = 30.0
+
 
 class NoDownloadedModelError(Exception):
     """No downloaded model available for the selected engine_id.
@@ -384,20 +393,66 @@ def _meets_requirements(caps: EngineCapabilities, requirements: dict) -> bool:
     return True
 
 
+def _estimate_completion_s(
+    instances: list[EngineRecord],
+    queue_depth: int,
+    loaded_model_id: str | None = None,
+    audio_duration_s: float | None = None,
+) -> float:
+    """Estimate seconds until a task queued now on an engine_id finishes.
+
+    The engine's real-time factor is the mean of the instances' observed
+    RTF, or the declared ``rtf_gpu`` for engines that have not reported
+    one yet (1.0 when neither is known). Queued and in-flight tasks, whose
+    durations are unknown, are taken as ``REFERENCE_AUDIO_S`` each and
+    drain across every instance's batch slots before the new task runs.
+
+    Args:
+        instances: Healthy instances of one engine_id
+        queue_depth: Tasks queued or in flight on the engine_id's stream
+        loaded_model_id: Model the task would run; adds
+            ``MODEL_LOAD_PENALTY_S`` when no instance has it loaded
+        audio_duration_s: Duration of the task's audio, if known
+
+    Returns:
+        Estimated completion time in seconds.
+    """
+    observed = [i.rtf_ewma for i in instances if i.rtf_ewma is not None]
+    if observed:
+        rtf = sum(observed) / len(observed)
+    else:
+        caps = instances[0].capabilities
+        rtf = (caps.rtf_gpu if caps else None) or 1.0
+
+    slots = sum(max(1, i.capacity) for i in instances)
+    task_s = rtf * (audio_duration_s or REFERENCE_AUDIO_S)
+    estimate = queue_depth / slots * rtf * REFERENCE_AUDIO_S + task_s
+
+    if loaded_model_id is not None and not any(
+        i.loaded_model == loaded_model_id or loaded_model_id in (i.models_loaded or [])
+        for i in instances
+    ):
+        estimate += MODEL_LOAD_PENALTY_S
+    return estimate
+
+
 def _rank_capable_engines(
     capable: list[EngineRecord],
     requirements: dict,
+    estimates: dict[str, float] | None = None,
 ) -> list[EngineRecord]:
     """Rank capable engines, best first.
 
     Ranking criteria (in order of priority):
     1. Native word timestamps (skips alignment stage)
     2. Native diarization (skips diarize stage)
-    3. Speed (lower RTF is better)
+    3. Estimated completion time, when ``estimates`` is given
+       (see :func:`_estimate_completion_s`); otherwise speed (lower RTF)
 
     Args:
         capable: List of engines that meet hard requirements
         requirements: Job requirements (for context in reason)
+        estimates: Estimated completion seconds by engine_id
 
     Returns:
         Ranked list with best engine first.
@@ -405,8 +460,14 @@ def _rank_capable_engines(
 
     def score(engine: EngineRecord) -> tuple:
         caps = engine.capabilities
+        if estimates is not None:
+            # Sooner is better, so negate
+            speed = -estimates.get(engine.engine_id, float("inf"))
+        else:
+            # Prefer faster (lower RTF is better, so negate)
+            speed = -(caps.rtf_gpu if caps and caps.rtf_gpu else 999.0)
         if caps is None:
-            return (0, 0, -999.0)
+            return (0, 0, speed)
 
         # Prefer native word timestamps (skips alignment stage)
         native_ts = 1 if caps.supports_word_timestamps else 0
@@ -414,10 +475,6 @@ def _rank_capable_engines(
         # Prefer native diarization (skips diarize stage)
         native_diar = 1 if caps.includes_diarization else 0
 
-        # Prefer faster (lower RTF is better, so negate)
-        rtf = caps.rtf_gpu if caps.rtf_gpu else 999.0
-        speed = -rtf
-
         return (native_ts, native_diar, speed)
 
     return sorted(capable, key=score, reverse=True)
@@ -426,9 +483,10 @@ def _rank_capable_engines(
 def _rank_and_select(
     capable: list[EngineRecord],
     requirements: dict,
+    estimates: dict[str, float] | None = None,
 ) -> EngineSelectionResult:
     """Rank capable engines and select best."""
-    ranked = _rank_capable_engines(capable, requirements)
+    ranked = _rank_capable_engines(capable, requirements, estimates)
     winner = ranked[0]
 
     reasons = []
@@ -439,6 +497,8 @@ def _rank_and_select(
             reasons.append("native diarization")
     if len(capable) > 1:
         reasons.append(f"ranked first of {len(capable)}")
+    if estimates is not None and winner.engine_id in estimates:
+        reasons.append(f"est. completion {estimates[winner.engine_id]:.0f}s")
 
     return EngineSelectionResult(
         engine_id=winner.engine_id,
@@ -497,6 +557,7 @@ async def select_engine(
     db: AsyncSession | None = None,
     *,
     user_preference_is_model: bool = False,
+    audio_duration_s: float | None = None,
 ) -> EngineSelectionResult:
     """Select best engine for a pipeline stage.
 
@@ -517,6 +578,8 @@ async def select_engine(
         db: Optional database session for HF model lookup
         user_preference_is_model: If True, user preference must resolve to a
             model registry ID for this stage.
+        audio_duration_s: Job audio duration, used to estimate completion
+            time when several engine_ids are capable
 
     Returns:
         EngineSelectionResult with selected engine and optional loaded_model_id
@@ -704,15 +767,58 @@ async def select_engine(
             catalog_alternatives=catalog_alts,
         )
 
-    # 5. Select engine (single match or ranked), then resolve loaded_model_id if needed.
-    ranked_capable = (
-        capable if len(capable) == 1 else _rank_capable_engines(capable, requirements)
-    )
-    ranked_reason = (
-        "only capable engine"
-        if len(capable) == 1
-        else _rank_and_select(capable, requirements).selection_reason
-    )
+    # 5. Resolve each engine_id's model (model-backed stages), rank engine_ids
+    # by capabilities and estimated completion time, then pick the best one
+    # with a ready model. Tasks queue per engine_id, so instances are grouped.
+    instances_by_engine: dict[str, list[EngineRecord]] = {}
+    for e in capable:
+        instances_by_engine.setdefault(e.engine_id, []).append(e)
+
+    models: dict[str, ModelRegistryModel | None] = {}
+    if stage in MODEL_BACKED_STAGES and db is not None:
+        for engine_id in instances_by_engine:
+            models[engine_id] = await _find_best_downloaded_model(
+                engine_id=engine_id,
+                stage=stage,
+                requirements=requirements,
+                db=db,
+            )
+
+    representatives = [instances[0] for instances in instances_by_engine.values()]
+    if len(representatives) == 1:
+        ranked_capable = representatives
+        ranked_reason = "only capable engine"
+    else:
+        estimates: dict[str, float] | None = None
+        try:
+            queue_depths = await registry.get_queue_depths(instances_by_engine)
+        except RedisError as e:
+            # Rank on capabilities alone rather than failing the job
+            logger.warning("engine_queue_depths_unavailable", stage=stage, error=str(e))
+        else:
+            estimates = {
+                engine_id: _estimate_completion_s(
+                    instances,
+                    queue_depths.get(engine_id, 0),
+                    loaded_model_id=(
+                        _resolve_loaded_model_id(model, stage)
+                        if (model := models.get(engine_id)) is not None
+                        else None
+                    ),
+                    audio_duration_s=audio_duration_s,
+                )
+                for engine_id, instances in instances_by_engine.items()
+            }
+            logger.debug(
+                "engine_completion_estimates",
+                stage=stage,
+                estimates_s={k: round(v, 1) for k, v in estimates.items()},
+                queue_depths=queue_depths,
+            )
+        ranked_capable = _rank_capable_engines(representatives, requirements, estimates)
+        ranked_reason = _rank_and_select(
+            representatives, requirements, estimates
+        ).selection_reason
     auto_model_id: str | None = None
     engine = ranked_capable[0]
     selection_reason = ranked_reason
@@ -722,12 +828,7 @@ async def select_engine(
         attempted_engine_ids: list[str] = []
         for idx, candidate in enumerate(ranked_capable):
             attempted_engine_ids.append(candidate.engine_id)
-            model = await _find_best_downloaded_model(
-                engine_id=candidate.engine_id,
-                stage=stage,
-                requirements=requirements,
-                db=db,
-            )
+            model = models[candidate.engine_id]
             if model is None:
                 continue
 
@@ -829,6 +930,7 @@ async def select_pipeline_engines(
     registry: UnifiedEngineRegistry,
     catalog: EngineCatalog,
     db: AsyncSession | None = None,
+    audio_duration_s: float | None = None,
 ) -> PipelineEngineSelection:
     """Select engines for all required pipeline stages.
 
@@ -841,6 +943,8 @@ async def select_pipeline_engines(
         registry: Batch engine registry (running engines)
         catalog: Engine catalog (all available engines)
         db: Optional database session for HF model lookup
+        audio_duration_s: Job audio duration, if known, for completion-time
+            estimates
 
     Returns:
         PipelineEngineSelection with selected stages and effective parameters
@@ -867,6 +971,7 @@ async def select_pipeline_engines(
             catalog,
             user_preference=effective_parameters.get("engine_prepare"),
             db=db,
+            audio_duration_s=audio_duration_s,
         )
 
         # Transcription (always required)
@@ -877,6 +982,7 @@ async def select_pipeline_engines(
             catalog,
             user_preference=effective_parameters.get(MODEL_PARAM_TRANSCRIBE),
             db=db,
+            audio_duration_s=audio_duration_s,
         )
 
         # Alignment (conditional on transcriber capabilities)
@@ -896,6 +1002,7 @@ async def select_pipeline_engines(
                     catalog,
                     user_preference=align_model_preference,
                     db=db,
+                    audio_duration_s=audio_duration_s,
                     user_preference_is_model=True,
                 )
             except (NoDownloadedModelError, NoCapableEngineError) as exc:
@@ -925,6 +1032,7 @@ async def select_pipeline_engines(
                 catalog,
                 user_preference=effective_parameters.get(MODEL_PARAM_DIARIZE),
                 db=db,
+                audio_duration_s=audio_duration_s,
                 user_preference_is_model=False,
             )
 
@@ -938,6 +1046,7 @@ async def select_pipeline_engines(
                 catalog,
                 user_preference=effective_parameters.get(MODEL_PARAM_PII_DETECT),
                 db=db,
+                audio_duration_s=audio_duration_s,
                 user_preference_is_model=True,
             )
 
@@ -950,6 +1059,7 @@ async def select_pipeline_engines(
                     catalog,
                     user_preference=effective_parameters.get("engine_audio_redact"),
                     db=db,
+                    audio_duration_s=audio_duration_s,
                 )
 
         # Record selection results on span
@@ -0,0 +1,131 @@
+"""Job-partitioned concurrent dispatch for durable orchestrator events.
+
+Events for one job must be handled in stream order (a ``task.completed``
+must not race the ``job.created`` that built its DAG), but events for
+different jobs are independent. ``PartitionedEventDispatcher`` keeps one
+FIFO lane per partition key and drains up to ``concurrency`` lanes at a
+time, so a slow handler for one job (S3 reads, DB writes) only delays that
+job's later events.
+
+Each work item is awaited to completion, including its ACK/retry/DLQ
+decision, before the next item in its lane starts. ``submit()`` blocks
+once ``max_pending`` items are queued or running, which stops the stream
+reader from pulling events faster than they are handled.
+
+Work submitted with a ``work_id`` (the stream message ID) is dropped if
+that ID is already queued or running. An event can sit unACKed in a
+backed-up lane for longer than the stale-claim idle threshold, so
+XAUTOCLAIM can hand it back to the reader while it is still held here.
+
+Environment variables (via Settings):
+    DALSTON_EVENTS_CONCURRENCY: Lanes handled concurrently (default: 8)
+    DALSTON_EVENTS_MAX_PENDING: Queued + running events before the reader
+        blocks (default: 256)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+import dalston.metrics
+
+logger = structlog.get_logger()
+
+EventWork = Callable[[], Awaitable[None]]
+
+
+class PartitionedEventDispatcher:
+    """Run work items concurrently across keys and in order within a key."""
+
+    def __init__(self, *, concurrency: int = 8, max_pending: int = 256) -> None:
+        self._slots = asyncio.Semaphore(concurrency)
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._lanes: dict[str, deque[tuple[EventWork, float, str | None]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._held_ids: set[str] = set()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Work items queued or running."""
+        return self._pending
+
+    @property
+    def active_lanes(self) -> int:
+        """Partition keys with queued or running work."""
+        return len(self._lanes)
+
+    async def submit(
+        self, key: str, work: EventWork, *, work_id: str | None = None
+    ) -> bool:
+        """Queue ``work`` behind earlier work for ``key``.
+
+        Blocks while the dispatcher is at ``max_pending``.
+
+        Returns:
+            False if ``work_id`` is already queued or running (the work is
+            dropped), else True.
+        """
+        if work_id is not None:
+            if work_id in self._held_ids:
+                return False
+            self._held_ids.add(work_id)
+        try:
+            await self._capacity.acquire()
+        except BaseException:
+            if work_id is not None:
+                self._held_ids.discard(work_id)
+            raise
+        self._pending += 1
+        item = (work, time.monotonic(), work_id)
+
+        lane = self._lanes.get(key)
+        if lane is not None:
+            lane.append(item)
+        else:
+            self._lanes[key] = deque([item])
+            task = asyncio.create_task(self._drain_lane(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._report_depth()
+        return True
+
+    async def drain(self) -> None:
+        """Wait until all submitted work has finished."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _drain_lane(self, key: str) -> None:
+        lane = self._lanes[key]
+        try:
+            while lane:
+                work, submitted_at, work_id = lane[0]
+                async with self._slots:
+                    dalston.metrics.observe_orchestrator_event_lane_wait(
+                        time.monotonic() - submitted_at
+                    )
+                    try:
+                        await work()
+                    except Exception:
+                        # Work items make their own ack/retry decision; this
+                        # only keeps one failure from stalling the lane.
+                        logger.exception("event_lane_work_failed", partition=key)
+                lane.popleft()
+                if work_id is not None:
+                    self._held_ids.discard(work_id)
+                self._pending -= 1
+                self._capacity.release()
+                self._report_depth()
+        finally:
+            del self._lanes[key]
+            self._report_depth()
+
+    def _report_depth(self) -> None:
+        dalston.metrics.set_orchestrator_event_lanes(
+            active_lanes=len(self._lanes), pending=self._pending
+        )
@@ -6,6 +6,7 @@ Handles Redis pub/sub events:
 - task.failed: Retry or fail job
 """
 
+import asyncio
 import json
 import re
 import time
@@ -15,7 +16,7 @@ from uuid import UUID
 
 import structlog
 from redis.asyncio import Redis
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,6 +39,7 @@ from dalston.common.transcript import (
     assemble_per_channel_transcript,
     assemble_transcript,
 )
+from dalston.common.word_columns import expand_transcript_words
 from dalston.config import Settings, get_settings
 from dalston.db.models import JobModel, TaskDependency, TaskModel
 from dalston.gateway.services.artifacts import ArtifactService
@@ -69,6 +71,7 @@ from dalston.orchestrator.post_processor import (
 from dalston.orchestrator.scheduler import (
     get_task_response,
     queue_task,
+    queue_tasks,
 )
 from dalston.orchestrator.stats import extract_stats_from_transcript
 
@@ -235,6 +238,7 @@ async def handle_job_created(
             registry=registry,
             catalog=catalog,
             db=db,
+            audio_duration=job.audio_duration,
         )
     except NoDownloadedModelError as e:
         # No downloaded models for the auto-selected engine_id
@@ -277,9 +281,11 @@ async def handle_job_created(
 
     log.info("built_task_dag", task_count=len(tasks))
 
-    # 3. Save all tasks to the database.
+    # 3. Save all tasks to the database, one multi-row INSERT each for
+    # tasks and dependency edges (per-channel DAGs have 2N+1 tasks).
     # Wrap in try/except to handle race condition with other orchestrators
     try:
+        task_rows = []
         for task in tasks:
             task_config = dict(task.config)
             if task.input_bindings:
@@ -290,27 +296,31 @@ async def handle_job_created(
                 stage=task.stage,
                 engine_id=task.engine_id,
             )
-            task_model = TaskModel(
-                id=task.id,
-                job_id=task.job_id,
-                stage=task.stage,
-                engine_id=task.engine_id,
-                status=task.status.value,
-                config=task_config,
-                request_uri=task.request_uri,
-                response_uri=task.response_uri,
-                retries=task.retries,
-                max_retries=task.max_retries,
-                required=task.required,
+            task_rows.append(
+                {
+                    "id": task.id,
+                    "job_id": task.job_id,
+                    "stage": task.stage,
+                    "engine_id": task.engine_id,
+                    "status": task.status.value,
+                    "config": task_config,
+                    "request_uri": task.request_uri,
+                    "response_uri": task.response_uri,
+                    "retries": task.retries,
+                    "max_retries": task.max_retries,
+                    "required": task.required,
+                }
             )
-            db.add(task_model)
+        await db.execute(insert(TaskModel).values(task_rows))
 
-        # Flush so task PKs are visible before inserting FK-referencing dependencies.
-        await db.flush()
-
-        for task in tasks:
-            for dep_id in task.dependencies:
-                db.add(TaskDependency(task_id=task.id, depends_on_id=dep_id))
+        # Dependencies reference task PKs, so they go in after the tasks.
+        dependency_rows = [
+            {"task_id": task.id, "depends_on_id": dep_id}
+            for task in tasks
+            for dep_id in task.dependencies
+        ]
+        if dependency_rows:
+            await db.execute(insert(TaskDependency).values(dependency_rows))
 
         # 4. Update job status to 'running'
         job.status = JobStatus.RUNNING.value
@@ -349,57 +359,68 @@ async def handle_job_created(
         }
 
     # 5. Queue tasks with no dependencies
-    for task in tasks:
-        if not task.dependencies:
-            # Mark as ready
-            task_model = await db.get(TaskModel, task.id)
-            if task_model:
-                task_model.status = TaskStatus.READY.value
-                task_model.ready_at = datetime.now(UTC)
-                await db.commit()
+    root_tasks = [task for task in tasks if not task.dependencies]
+    if not root_tasks:
+        return
+    await db.execute(
+        update(TaskModel)
+        .where(TaskModel.id.in_([task.id for task in root_tasks]))
+        .values(status=TaskStatus.READY.value, ready_at=datetime.now(UTC))
+    )
+    await db.commit()
 
-            # Queue for execution (include audio metadata for prepare stage)
-            try:
-                await queue_task(
-                    redis=redis,
-                    task=task,
-                    settings=settings,
-                    registry=registry,
-                    previous_responses={},
-                    audio_metadata=audio_metadata if task.stage == "prepare" else None,
-                )
-            except (
-                EngineUnavailableError,
-                EngineCapabilityError,
-                CatalogValidationError,
-            ) as e:
-                # Fail the job immediately if engine is unavailable or incapable
-                # Serialize with full details (M30)
-                error_str = _serialize_engine_error(e)
-                job.status = JobStatus.FAILED.value
-                job.error = error_str
-                job.completed_at = datetime.now(UTC)
-                await db.commit()
-                await _decrement_concurrent_jobs(redis, job_id, job.tenant_id)
-                dalston.metrics.dec_orchestrator_jobs_in_progress()
-                dalston.metrics.inc_orchestrator_jobs("failed")
-                await publish_job_failed(redis, job_id, error_str)
-                log.error(
-                    "job_failed_engine_error",
-                    error_type=type(e).__name__,
-                    engine_id=getattr(e, "engine_id", None),
-                    stage=getattr(e, "stage", None),
-                )
-                return
+    # Queue for execution (include audio metadata for prepare stage)
+    try:
+        await queue_tasks(
+            redis=redis,
+            tasks=root_tasks,
+            settings=settings,
+            registry=registry,
+            audio_metadata={
+                task.id: audio_metadata
+                for task in root_tasks
+                if task.stage == "prepare" and audio_metadata is not None
+            },
+        )
+    except (
+        EngineUnavailableError,
+        EngineCapabilityError,
+        CatalogValidationError,
+    ) as e:
+        # Fail the job immediately if engine is unavailable or incapable
+        # Serialize with full details (M30)
+        error_str = _serialize_engine_error(e)
+        job.status = JobStatus.FAILED.value
+        job.error = error_str
+        job.completed_at = datetime.now(UTC)
+        await db.commit()
+        await _decrement_concurrent_jobs(redis, job_id, job.tenant_id)
+        dalston.metrics.dec_orchestrator_jobs_in_progress()
+        dalston.metrics.inc_orchestrator_jobs("failed")
+        await publish_job_failed(redis, job_id, error_str)
+        log.error(
+            "job_failed_engine_error",
+            error_type=type(e).__name__,
+            engine_id=getattr(e, "engine_id", None),
+            stage=getattr(e, "stage", None),
+        )
+        return
 
-            # Record task scheduled metric (M20)
-            dalston.metrics.inc_orchestrator_tasks_scheduled(
-                task.engine_id,
-                task.stage,
-                _get_engine_id_execution_profile(task.engine_id),
-            )
+    for task in root_tasks:
+        # Record task scheduled metric (M20)
+        dalston.metrics.inc_orchestrator_tasks_scheduled(
+            task.engine_id,
+            task.stage,
+            _get_engine_id_execution_profile(task.engine_id),
+        )
+        log.info("queued_initial_task", task_id=str(task.id), stage=task.stage)
 
-            log.info("queued_initial_task", task_id=str(task.id), stage=task.stage)
+    log.info(
+        "job_start_queued",
+        task_count=len(tasks),
+        queued_count=len(root_tasks),
+        seconds_since_dag_start=round(time.perf_counter() - dag_start, 4),
+    )
 
 
 async def handle_task_started(
@@ -592,6 +613,7 @@ async def handle_task_completed(
         return
 
     # 3. Find dependent tasks and check if they're ready
+    ready_dependents: list[TaskModel] = []
     for dependent in all_tasks:
         if dependent.status != TaskStatus.PENDING.value:
             continue
@@ -600,7 +622,7 @@ async def handle_task_completed(
         deps_met = all(dep_id in completed_ids for dep_id in dependent.dependencies)
 
         if deps_met:
-            # 4. Queue this dependent task - use atomic UPDATE to prevent
+            # 4. Claim this dependent task - use atomic UPDATE to prevent
             # race conditions in multi-orchestrator deployments
             result = await db.execute(
                 update(TaskModel)
@@ -623,51 +645,63 @@ async def handle_task_completed(
 
             # Refresh the dependent object to get updated status
             await db.refresh(dependent)
-
-            # Gather outputs from dependencies
-            previous_responses = await _gather_previous_responses(
-                dependency_ids=dependent.dependencies,
-                task_by_id=task_by_id,
-                settings=settings,
+            ready_dependents.append(dependent)
+
+    if ready_dependents:
+        # Gather outputs from dependencies for every ready dependent at once
+        # and queue them together (per-channel fan-out after prepare).
+        responses = await asyncio.gather(
+            *(
+                _gather_previous_responses(
+                    dependency_ids=dependent.dependencies,
+                    task_by_id=task_by_id,
+                    settings=settings,
+                )
+                for dependent in ready_dependents
             )
+        )
 
-            # Convert to Pydantic model for queue_task
-            from dalston.common.models import Task
+        # Convert to Pydantic models for queue_tasks
+        from dalston.common.models import Task
 
-            task_model = Task.model_validate(dependent)
+        ready_tasks = [Task.model_validate(dependent) for dependent in ready_dependents]
 
-            try:
-                await queue_task(
-                    redis=redis,
-                    task=task_model,
-                    settings=settings,
-                    registry=registry,
-                    previous_responses=previous_responses,
-                )
-            except (
-                EngineUnavailableError,
-                EngineCapabilityError,
-                CatalogValidationError,
-            ) as e:
-                # Fail the job immediately if engine is unavailable or incapable
-                # Serialize with full details (M30)
-                error_str = _serialize_engine_error(e)
-                job = await db.get(JobModel, job_id)
-                if job:
-                    job.status = JobStatus.FAILED.value
-                    job.error = error_str
-                    job.completed_at = datetime.now(UTC)
-                    await db.commit()
-                    await _decrement_concurrent_jobs(redis, job_id, job.tenant_id)
-                    await publish_job_failed(redis, job_id, error_str)
-                log.error(
-                    "job_failed_engine_error",
-                    error_type=type(e).__name__,
-                    engine_id=getattr(e, "engine_id", None),
-                    stage=getattr(e, "stage", None),
-                )
-                return
+        try:
+            await queue_tasks(
+                redis=redis,
+                tasks=ready_tasks,
+                settings=settings,
+                registry=registry,
+                previous_responses={
+                    task.id: previous
+                    for task, previous in zip(ready_tasks, responses, strict=True)
+                },
+            )
+        except (
+            EngineUnavailableError,
+            EngineCapabilityError,
+            CatalogValidationError,
+        ) as e:
+            # Fail the job immediately if engine is unavailable or incapable
+            # Serialize with full details (M30)
+            error_str = _serialize_engine_error(e)
+            job = await db.get(JobModel, job_id)
+            if job:
+                job.status = JobStatus.FAILED.value
+                job.error = error_str
+                job.completed_at = datetime.now(UTC)
+                await db.commit()
+                await _decrement_concurrent_jobs(redis, job_id, job.tenant_id)
+                await publish_job_failed(redis, job_id, error_str)
+            log.error(
+                "job_failed_engine_error",
+                error_type=type(e).__name__,
+                engine_id=getattr(e, "engine_id", None),
+                stage=getattr(e, "stage", None),
+            )
+            return
 
+        for dependent in ready_dependents:
             # Record task scheduled metric (M20)
             dalston.metrics.inc_orchestrator_tasks_scheduled(
                 dependent.engine_id,
@@ -1119,18 +1153,13 @@ async def _gather_previous_responses(
     """
     previous_responses: dict[str, Any] = {}
 
-    for dep_id in dependency_ids:
-        dep_task = task_by_id.get(dep_id)
-        if dep_task is None:
-            continue
-
-        output = await get_task_response(
-            job_id=dep_task.job_id,
-            task_id=dep_task.id,
-            settings=settings,
-        )
+    dep_tasks = [task_by_id[d] for d in dependency_ids if d in task_by_id]
+    outputs = await _fetch_task_responses(dep_tasks, settings)
 
+    for dep_task, output in zip(dep_tasks, outputs, strict=True):
         if output and "data" in output:
+            # Engines read previous responses as plain dicts
+            output["data"] = expand_transcript_words(output["data"])
             previous_responses[dep_task.stage] = output["data"]
 
             # For per-channel stages (e.g. transcribe_ch0), also add the
@@ -1143,6 +1172,19 @@ async def _gather_previous_responses(
     return previous_responses
 
 
+async def _fetch_task_responses(
+    tasks: list[TaskModel],
+    settings: Settings,
+) -> list[dict[str, Any] | None]:
+    """Fetch response.json for each task concurrently, in input order."""
+    return await asyncio.gather(
+        *(
+            get_task_response(job_id=t.job_id, task_id=t.id, settings=settings)
+            for t in tasks
+        )
+    )
+
+
 async def _assemble_linear_transcript(
     job: JobModel,
     all_tasks: list[TaskModel],
@@ -1167,27 +1209,23 @@ async def _assemble_linear_transcript(
     # Gather outputs from all completed tasks
     stage_outputs: dict[str, Any] = {}
     completed_stages: list[str] = []
-    for task in all_tasks:
-        if task.status == TaskStatus.COMPLETED.value:
-            output = await get_task_response(
-                job_id=task.job_id,
-                task_id=task.id,
-                settings=settings,
-            )
-            if output and "data" in output:
-                data = output["data"]
-                # Unpack multi-key envelope from combo engines (e.g.
-                # hf-asr-align-pyannote returns transcribe+align+diarize
-                # from a single task).
-                if isinstance(data, dict) and "stages_completed" in data:
-                    for stage_key in data["stages_completed"]:
-                        if stage_key in data:
-                            stage_outputs[stage_key] = data[stage_key]
-                            if stage_key not in completed_stages:
-                                completed_stages.append(stage_key)
-                else:
-                    stage_outputs[task.stage] = data
-                    completed_stages.append(task.stage)
+    completed_tasks = [t for t in all_tasks if t.status == TaskStatus.COMPLETED.value]
+    outputs = await _fetch_task_responses(completed_tasks, settings)
+    for task, output in zip(completed_tasks, outputs, strict=True):
+        if output and "data" in output:
+            data = output["data"]
+            # Unpack multi-key envelope from combo engines (e.g.
+            # hf-asr-align-pyannote returns transcribe+align+diarize
+            # from a single task).
+            if isinstance(data, dict) and "stages_completed" in data:
+                for stage_key in data["stages_completed"]:
+                    if stage_key in data:
+                        stage_outputs[stage_key] = data[stage_key]
+                        if stage_key not in completed_stages:
+                            completed_stages.append(stage_key)
+            else:
+                stage_outputs[task.stage] = data
+                completed_stages.append(task.stage)
 
     # Get job parameters for speaker detection and word timestamps config
     parameters = job.parameters or {}
@@ -1307,6 +1345,21 @@ async def _check_job_completion(
     """
     log = logger.bind(job_id=str(job_id))
 
+    # Runs after every task event, so first ask only for unfinished tasks.
+    # Any unfinished task means there is nothing to do: either the pipeline
+    # is still running, or only post-processing tasks remain, which are
+    # scheduled after the job is already terminal.
+    result = await db.execute(
+        select(TaskModel.stage).where(
+            TaskModel.job_id == job_id,
+            TaskModel.status.notin_(list(TERMINAL_TASK_STATES)),
+        )
+    )
+    pending_stages = list(result.scalars().all())
+    if pending_stages:
+        log.debug("job_not_complete_yet", pending_stages=pending_stages)
+        return
+
     # Fetch fresh data from DB (explicit SELECT avoids stale identity map)
     result = await db.execute(select(TaskModel).where(TaskModel.job_id == job_id))
     all_tasks = list(result.scalars().all())
@@ -393,6 +393,7 @@ class StaleTaskScanner:
             task.status = TaskStatus.FAILED.value
             task.error = error
             task.completed_at = datetime.now(UTC)
+            job_id_str = str(task.job_id)
             await db.commit()
 
             if reason == "timeout":
@@ -406,6 +407,7 @@ class StaleTaskScanner:
             "task.failed",
             {
                 "task_id": task_id,
+                "job_id": job_id_str,
                 "error": error,
                 "scanner_reason": reason,
             },
@@ -508,6 +510,7 @@ class StaleTaskScanner:
                     "task.wait_timeout",
                     {
                         "task_id": task_id,
+                        "job_id": str(task.job_id),
                         "error": error,
                         "engine_id": engine_id,
                         "queue_id": queue_id,
@@ -7,7 +7,11 @@ Handles:
 - Validating engine capabilities against job requirements (M29)
 """
 
+import asyncio
 import json
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
@@ -20,10 +24,22 @@ import dalston.telemetry
 from dalston.common.artifacts import ArtifactReference, ArtifactSelector, RequestBinding
 from dalston.common.events import publish_engine_needed
 from dalston.common.models import Task
+from dalston.common.payload_codec import (
+    JSON_CONTENT_TYPE,
+    PayloadFormat,
+    decode_payload,
+    encode_payload,
+    get_payload_format,
+)
 from dalston.common.pipeline_types import STAGE_CONFIG_MAP, AudioMedia, TaskRequestData
 from dalston.common.registry import UnifiedEngineRegistry
 from dalston.common.s3 import get_s3_client
-from dalston.common.streams import add_task, add_task_once
+from dalston.common.streams import (
+    add_task,
+    add_task_once,
+    add_task_to_pipeline,
+    ensure_stream_group,
+)
 from dalston.common.streams_types import WAITING_ENGINE_TASKS_KEY
 from dalston.common.timeouts import TASK_UNKNOWN_DURATION_TIMEOUT_S
 from dalston.config import Settings
@@ -42,6 +58,11 @@ logger = structlog.get_logger()
 TASK_METADATA_KEY = "dalston:task:{task_id}"
 # Note: ENGINE_QUEUE_KEY removed in M33 - now using Redis Streams via dalston.common.streams
 
+# Parsed task responses are read by every dependent and again at transcript
+# assembly. A response never changes once its task has completed, so raw
+# bodies are kept in a small size-bounded LRU to skip repeat S3 round-trips.
+TASK_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Timeout calculation constants (M30)
 MIN_TIMEOUT_S = 60  # Minimum timeout for any task
 DEFAULT_RTF = 1.0  # Fallback RTF if not specified
@@ -227,36 +248,27 @@ def _resolve_input_bindings(
     return resolved
 
 
-async def queue_task(
+@dataclass
+class _QueuePlan:
+    """Redis metadata and timeouts for one task, computed before any write."""
+
+    task: Task
+    metadata_key: str
+    metadata_mapping: dict[str, str]
+    waiting_for_engine: bool
+    timeout_s: int
+    metadata_ttl: int
+
+
+async def _plan_task(
     redis: Redis,
     task: Task,
     settings: Settings,
     registry: UnifiedEngineRegistry,
-    previous_responses: dict[str, Any] | None = None,
-    audio_metadata: dict[str, Any] | None = None,
-    catalog: EngineCatalog | None = None,
-    enqueue_idempotency_key: str | None = None,
-) -> None:
-    """Queue a task for execution by its engine.
-
-    Steps:
-    1. Validate catalog (does any engine support this stage + requirements?)
-    2. Check engine availability (fail fast if engine not running)
-    3. Validate capabilities (does running engine support job requirements?)
-    4. Store task metadata in Redis hash (for engine lookup)
-    5. Write task input.json to S3
-    6. Push task_id to engine queue
-
-    Args:
-        redis: Async Redis client
-        task: Task to queue
-        settings: Application settings (for S3 bucket)
-        registry: Batch engine registry for availability checks
-        previous_responses: Responses from dependency tasks (keyed by stage)
-        audio_metadata: Audio file metadata (format, duration, sample_rate, channels)
-        catalog: Engine catalog for validation (uses singleton if not provided)
-        enqueue_idempotency_key: Optional idempotency key for stream enqueue.
-            When provided, stream insertion is deduplicated atomically.
+    audio_metadata: dict[str, Any] | None,
+    catalog: EngineCatalog,
+) -> _QueuePlan:
+    """Run the catalog/registry checks for a task and build its metadata.
 
     Raises:
         CatalogValidationError: If no engine in catalog supports the requirements
@@ -264,11 +276,6 @@ async def queue_task(
     """
     task_id_str = str(task.id)
     job_id_str = str(task.job_id)
-    queue_id = task.engine_id
-    if not task.input_bindings and isinstance(task.config, dict):
-        bindings_from_config = task.config.get("request_bindings")
-        if isinstance(bindings_from_config, list):
-            task = task.model_copy(update={"input_bindings": bindings_from_config})
 
     # Get language from task config (if present)
     # Normalize "auto" to None - it means auto-detect, not a language requirement
@@ -277,8 +284,6 @@ async def queue_task(
         language = None
 
     # 1. Catalog check - does any engine in catalog support this?
-    if catalog is None:
-        catalog = get_catalog()
     catalog_entry = catalog.get_engine(task.engine_id)
     if catalog_entry is not None and catalog_entry.execution_profile != "container":
         raise CatalogValidationError(
@@ -332,8 +337,8 @@ async def queue_task(
                 "engine_not_available_waiting",
                 engine_id=task.engine_id,
                 stage=task.stage,
-                job_id=str(task.job_id),
-                task_id=str(task.id),
+                job_id=job_id_str,
+                task_id=task_id_str,
                 wait_timeout_seconds=engine_wait_timeout_seconds,
             )
             # Publish event for external scalers to start the engine
@@ -346,16 +351,13 @@ async def queue_task(
                 language=language,
             )
 
-    log = logger.bind(task_id=task_id_str, job_id=job_id_str, engine_id=task.engine_id)
-
-    # 1. Store task metadata in Redis hash (includes request_id for correlation)
-    metadata_key = TASK_METADATA_KEY.format(task_id=task_id_str)
+    # Task metadata for the Redis hash (includes request_id for correlation)
     ctx = structlog.contextvars.get_contextvars()
     metadata_mapping: dict[str, str] = {
         "job_id": job_id_str,
         "stage": task.stage,
         "engine_id": task.engine_id,
-        "queue_id": queue_id,
+        "queue_id": task.engine_id,
         "execution_profile": (
             catalog_entry.execution_profile
             if catalog_entry is not None
@@ -381,13 +383,6 @@ async def queue_task(
     if trace_context:
         metadata_mapping["_trace_context"] = json.dumps(trace_context)
 
-    await redis.hset(
-        metadata_key,
-        mapping=metadata_mapping,
-    )
-    if waiting_for_engine:
-        await redis.sadd(WAITING_ENGINE_TASKS_KEY, task_id_str)
-
     # Calculate TTL based on expected task duration (M30)
     # Get audio duration from metadata (prepare stage) or config
     audio_duration = None
@@ -409,8 +404,9 @@ async def queue_task(
     # Add engine wait timeout if waiting for engine to start
     if waiting_for_engine:
         base_timeout += engine_wait_timeout_seconds
-        log.debug(
+        logger.debug(
             "extended_timeout_for_engine_wait",
+            task_id=task_id_str,
             original_timeout=base_timeout - engine_wait_timeout_seconds,
             engine_wait_timeout=engine_wait_timeout_seconds,
             total_timeout=base_timeout,
@@ -419,13 +415,101 @@ async def queue_task(
     retry_factor = (task.max_retries + 1) if task.max_retries else 1
     metadata_ttl = base_timeout * retry_factor + 3600  # Add 1 hour buffer
 
-    await redis.expire(metadata_key, metadata_ttl)
+    return _QueuePlan(
+        task=task,
+        metadata_key=TASK_METADATA_KEY.format(task_id=task_id_str),
+        metadata_mapping=metadata_mapping,
+        waiting_for_engine=waiting_for_engine,
+        timeout_s=base_timeout,
+        metadata_ttl=metadata_ttl,
+    )
+
+
+def _with_config_bindings(task: Task) -> Task:
+    if not task.input_bindings and isinstance(task.config, dict):
+        bindings_from_config = task.config.get("request_bindings")
+        if isinstance(bindings_from_config, list):
+            return task.model_copy(update={"input_bindings": bindings_from_config})
+    return task
+
+
+def _request_binding_fields(request_doc: Any) -> dict[str, str]:
+    """Redis metadata fields describing the bindings used in request.json."""
+    if isinstance(request_doc, dict):
+        return {
+            "request_bindings_json": json.dumps(
+                request_doc.get("request_bindings", [])
+            ),
+            "resolved_artifact_ids_json": json.dumps(
+                request_doc.get("resolved_artifact_ids", {})
+            ),
+        }
+    return {"request_bindings_json": "[]", "resolved_artifact_ids_json": "{}"}
+
+
+async def queue_task(
+    redis: Redis,
+    task: Task,
+    settings: Settings,
+    registry: UnifiedEngineRegistry,
+    previous_responses: dict[str, Any] | None = None,
+    audio_metadata: dict[str, Any] | None = None,
+    catalog: EngineCatalog | None = None,
+    enqueue_idempotency_key: str | None = None,
+) -> None:
+    """Queue a task for execution by its engine.
+
+    Steps:
+    1. Validate catalog (does any engine support this stage + requirements?)
+    2. Check engine availability (fail fast if engine not running)
+    3. Validate capabilities (does running engine support job requirements?)
+    4. Store task metadata in Redis hash (for engine lookup)
+    5. Write task input.json to S3
+    6. Push task_id to engine queue
+
+    Use :func:`queue_tasks` to queue several tasks that become ready together.
+
+    Args:
+        redis: Async Redis client
+        task: Task to queue
+        settings: Application settings (for S3 bucket)
+        registry: Batch engine registry for availability checks
+        previous_responses: Responses from dependency tasks (keyed by stage)
+        audio_metadata: Audio file metadata (format, duration, sample_rate, channels)
+        catalog: Engine catalog for validation (uses singleton if not provided)
+        enqueue_idempotency_key: Optional idempotency key for stream enqueue.
+            When provided, stream insertion is deduplicated atomically.
+
+    Raises:
+        CatalogValidationError: If no engine in catalog supports the requirements
+        EngineUnavailableError: If the required engine is not running
+    """
+    task = _with_config_bindings(task)
+    task_id_str = str(task.id)
+    job_id_str = str(task.job_id)
+    queue_id = task.engine_id
+
+    if catalog is None:
+        catalog = get_catalog()
+    plan = await _plan_task(redis, task, settings, registry, audio_metadata, catalog)
+
+    log = logger.bind(task_id=task_id_str, job_id=job_id_str, engine_id=task.engine_id)
+
+    # 1. Store task metadata in Redis hash
+    metadata_key = plan.metadata_key
+    await redis.hset(
+        metadata_key,
+        mapping=plan.metadata_mapping,
+    )
+    if plan.waiting_for_engine:
+        await redis.sadd(WAITING_ENGINE_TASKS_KEY, task_id_str)
+
+    await redis.expire(metadata_key, plan.metadata_ttl)
 
     log.debug(
         "stored_task_metadata",
         redis_key=metadata_key,
-        ttl_seconds=metadata_ttl,
-        audio_duration=audio_duration,
+        ttl_seconds=plan.metadata_ttl,
     )
 
     # 2. Write task request.json to S3
@@ -436,22 +520,8 @@ async def queue_task(
         previous_responses=previous_responses or {},
         audio_metadata=audio_metadata,
     )
-    if isinstance(request_doc, dict):
-        request_bindings_json = json.dumps(request_doc.get("request_bindings", []))
-        resolved_artifact_ids_json = json.dumps(
-            request_doc.get("resolved_artifact_ids", {})
-        )
-    else:
-        request_bindings_json = "[]"
-        resolved_artifact_ids_json = "{}"
 
-    await redis.hset(
-        metadata_key,
-        mapping={
-            "request_bindings_json": request_bindings_json,
-            "resolved_artifact_ids_json": resolved_artifact_ids_json,
-        },
-    )
+    await redis.hset(metadata_key, mapping=_request_binding_fields(request_doc))
 
     # 3. Add task to stream (replaces lpush to queue)
     if enqueue_idempotency_key:
@@ -460,7 +530,7 @@ async def queue_task(
             stage=queue_id,
             task_id=task_id_str,
             job_id=job_id_str,
-            timeout_s=base_timeout,
+            timeout_s=plan.timeout_s,
             dedupe_key=enqueue_idempotency_key,
         )
         if message_id is None:
@@ -476,7 +546,7 @@ async def queue_task(
             stage=queue_id,
             task_id=task_id_str,
             job_id=job_id_str,
-            timeout_s=base_timeout,
+            timeout_s=plan.timeout_s,
         )
 
     await redis.hset(metadata_key, mapping={"stream_message_id": message_id})
@@ -484,12 +554,140 @@ async def queue_task(
     log.info("task_queued", stream=f"dalston:stream:{queue_id}", message_id=message_id)
 
 
+async def queue_tasks(
+    redis: Redis,
+    tasks: list[Task],
+    settings: Settings,
+    registry: UnifiedEngineRegistry,
+    previous_responses: dict[UUID, dict[str, Any]] | None = None,
+    audio_metadata: dict[UUID, dict[str, Any]] | None = None,
+    catalog: EngineCatalog | None = None,
+) -> None:
+    """Queue several tasks that became ready together, e.g. per-channel fan-out.
+
+    Same checks and stored state as :func:`queue_task`, batched: every task
+    is checked before anything is written, request.json objects are written
+    concurrently over one S3 client, and the metadata hashes and stream
+    entries for all tasks go out in one MULTI/EXEC pipeline, so engines never
+    see a stream entry without its metadata.
+
+    Args:
+        redis: Async Redis client
+        tasks: Tasks to queue
+        settings: Application settings (for S3 bucket)
+        registry: Batch engine registry for availability checks
+        previous_responses: Dependency responses per task ID
+        audio_metadata: Audio file metadata per task ID (prepare stage)
+        catalog: Engine catalog for validation (uses singleton if not provided)
+
+    Raises:
+        CatalogValidationError: If no engine in catalog supports the requirements
+        EngineUnavailableError: If a required engine is not running
+    """
+    if not tasks:
+        return
+    previous_responses = previous_responses or {}
+    audio_metadata = audio_metadata or {}
+    if catalog is None:
+        catalog = get_catalog()
+    tasks = [_with_config_bindings(task) for task in tasks]
+
+    # 1. Checks for every task before any write
+    plans = await asyncio.gather(
+        *(
+            _plan_task(
+                redis, task, settings, registry, audio_metadata.get(task.id), catalog
+            )
+            for task in tasks
+        )
+    )
+
+    # 2. Write request.json objects concurrently; one artifact index per job
+    job_ids = {str(task.job_id) for task in tasks}
+    artifact_indexes = dict(
+        zip(
+            job_ids,
+            await asyncio.gather(
+                *(_load_job_artifact_index(redis, job_id) for job_id in job_ids)
+            ),
+            strict=True,
+        )
+    )
+    async with get_s3_client(settings) as s3:
+        request_docs = await asyncio.gather(
+            *(
+                write_task_request(
+                    redis=redis,
+                    task=task,
+                    settings=settings,
+                    previous_responses=previous_responses.get(task.id, {}),
+                    audio_metadata=audio_metadata.get(task.id),
+                    artifact_index=dict(artifact_indexes[str(task.job_id)]),
+                    s3=s3,
+                )
+                for task in tasks
+            )
+        )
+
+    # 3. Metadata and stream entries for all tasks in one transaction
+    await asyncio.gather(
+        *(
+            ensure_stream_group(redis, queue_id)
+            for queue_id in {task.engine_id for task in tasks}
+        )
+    )
+    pipe = redis.pipeline(transaction=True)
+    for plan, request_doc in zip(plans, request_docs, strict=True):
+        task_id_str = str(plan.task.id)
+        pipe.hset(
+            plan.metadata_key,
+            mapping={**plan.metadata_mapping, **_request_binding_fields(request_doc)},
+        )
+        pipe.expire(plan.metadata_key, plan.metadata_ttl)
+        if plan.waiting_for_engine:
+            pipe.sadd(WAITING_ENGINE_TASKS_KEY, task_id_str)
+        add_task_to_pipeline(
+            pipe,
+            stage=plan.task.engine_id,
+            task_id=task_id_str,
+            job_id=str(plan.task.job_id),
+            timeout_s=plan.timeout_s,
+        )
+    # XADD is the last command queued for each task
+    results = await pipe.execute()
+    message_ids: list[str] = []
+    position = -1
+    for plan in plans:
+        position += 3 + int(plan.waiting_for_engine)
+        message_id = results[position]
+        message_ids.append(
+            message_id.decode() if isinstance(message_id, bytes) else str(message_id)
+        )
+
+    pipe = redis.pipeline(transaction=False)
+    for plan, message_id in zip(plans, message_ids, strict=True):
+        pipe.hset(plan.metadata_key, mapping={"stream_message_id": message_id})
+    await pipe.execute()
+
+    for plan, message_id in zip(plans, message_ids, strict=True):
+        logger.info(
+            "task_queued",
+            task_id=str(plan.task.id),
+            job_id=str(plan.task.job_id),
+            engine_id=plan.task.engine_id,
+            stream=f"dalston:stream:{plan.task.engine_id}",
+            message_id=message_id,
+        )
+
+
 async def write_task_request(
     redis: Redis,
     task: Task,
     settings: Settings,
     previous_responses: dict[str, Any],
     audio_metadata: dict[str, Any] | None = None,
+    artifact_index: dict[str, ArtifactReference] | None = None,
+    s3: Any = None,
 ) -> dict[str, Any]:
     """Write task request.json to S3.
 
@@ -498,6 +696,8 @@ async def write_task_request(
         settings: Application settings
         previous_responses: Responses from dependency tasks
         audio_metadata: Audio file metadata (for prepare stage)
+        artifact_index: Job artifact index, loaded from Redis when omitted
+        s3: Open S3 client to reuse; a new one is opened when omitted
 
     Returns:
         Dict containing S3 URI and resolved artifact metadata used in request.json
@@ -507,7 +707,8 @@ async def write_task_request(
     bindings = [
         RequestBinding.model_validate(binding) for binding in task.input_bindings
     ]
-    artifact_index = await _load_job_artifact_index(redis, job_id_str)
+    if artifact_index is None:
+        artifact_index = await _load_job_artifact_index(redis, job_id_str)
     payload: dict[str, Any] | None = None
 
     # Prepare is the root stage: resolve original upload as an artifact reference.
@@ -569,14 +770,21 @@ async def write_task_request(
     # S3 path: jobs/{job_id}/tasks/{task_id}/request.json
     s3_key = f"jobs/{job_id_str}/tasks/{task_id_str}/request.json"
 
-    async with get_s3_client(settings) as s3:
-        await s3.put_object(
+    if get_payload_format() is PayloadFormat.JSON:
+        body = request_data.model_dump_json(exclude_none=True).encode("utf-8")
+        content_type = JSON_CONTENT_TYPE
+    else:
+        body, content_type = encode_payload(
+            request_data.model_dump(mode="json", exclude_none=True)
+        )
+
+    s3_context = nullcontext(s3) if s3 is not None else get_s3_client(settings)
+    async with s3_context as s3_client:
+        await s3_client.put_object(
             Bucket=settings.s3_bucket,
             Key=s3_key,
-            Body=request_data.model_dump_json(indent=2, exclude_none=True).encode(
-                "utf-8"
-            ),
-            ContentType="application/json",
+            Body=body,
+            ContentType=content_type,
         )
 
     s3_uri = f"s3://{settings.s3_bucket}/{s3_key}"
@@ -613,6 +821,10 @@ async def get_task_response(
     """
     s3_key = f"jobs/{job_id}/tasks/{task_id}/response.json"
 
+    body = _task_response_cache.get(s3_key)
+    if body is not None:
+        return decode_payload(body)
+
     try:
         async with get_s3_client(settings) as s3:
             response = await s3.get_object(
@@ -620,7 +832,7 @@ async def get_task_response(
                 Key=s3_key,
             )
             body = await response["Body"].read()
-            return json.loads(body.decode("utf-8"))
+            parsed = decode_payload(body, response.get("ContentType"))
     except Exception as e:
         logger.warning(
             "task_output_not_found",
@@ -629,3 +841,44 @@ async def get_task_response(
             error=str(e),
         )
         return None
+
+    _task_response_cache.put(s3_key, body)
+    return parsed
+
+
+class _TaskResponseCache:
+    """LRU of raw response bodies bounded by total size in bytes.
+
+    Bodies are stored unparsed so every caller gets its own dict and cannot
+    mutate what another caller sees.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> bytes | None:
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if len(body) > self._max_bytes:
+            return
+        previous = self._bodies.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._bodies[key] = body
+        self._size += len(body)
+        while self._size > self._max_bytes:
+            _, evicted = self._bodies.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._bodies.clear()
+        self._size = 0
+
+
+_task_response_cache = _TaskResponseCache(TASK_RESPONSE_CACHE_MAX_BYTES)
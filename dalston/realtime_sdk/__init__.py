@@ -114,6 +114,10 @@ def __getattr__(name: str):
         from dalston.realtime_sdk.vad import VADState
 
         return VADState
+    elif name == "VADBatcher":
+        from dalston.realtime_sdk.vad import VADBatcher
+
+        return VADBatcher
     elif name == "AsyncModelManager":
         from dalston.realtime_sdk.model_manager import AsyncModelManager
 
@@ -140,6 +144,7 @@ __all__ = [
     "VADConfig",
     "VADResult",
     "VADState",
+    "VADBatcher",
     # Transcript assembly
     "TranscriptAssembler",
     "Segment",
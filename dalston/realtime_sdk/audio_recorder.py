@@ -1,13 +1,14 @@
 """Audio recorder for real-time sessions with S3 multipart upload.
 
-Records audio to S3 during real-time transcription sessions,
-using multipart upload for efficient handling of long recordings.
+Records audio to S3 during real-time transcription sessions. The WAV file
+is streamed to its final key as multipart parts while the session runs, so
+memory per session stays bounded and finalizing costs the same however
+long the session was.
 """
 
 from __future__ import annotations
 
-import io
-import wave
+import struct
 from typing import TYPE_CHECKING
 
 import structlog
@@ -19,13 +20,48 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+WAV_HEADER_SIZE = 44
+_MAX_RIFF_SIZE = 0xFFFFFFFF
+
+
+def wav_header(
+    data_size: int, sample_rate: int, channels: int, bits_per_sample: int
+) -> bytes:
+    """Build the 44-byte PCM WAV header for ``data_size`` bytes of audio.
+
+    Sizes above the 4 GiB RIFF limit are clamped.
+    """
+    block_align = channels * (bits_per_sample // 8)
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        min(WAV_HEADER_SIZE - 8 + data_size, _MAX_RIFF_SIZE),
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        bits_per_sample,
+        b"data",
+        min(data_size, _MAX_RIFF_SIZE),
+    )
+
 
 class AudioRecorder:
-    """Records audio to S3 using multipart upload.
+    """Streams session audio to S3 as a WAV file using multipart upload.
 
-    Buffers incoming audio chunks and uploads to S3 in parts
-    when the buffer reaches a threshold. Finalizes the upload
-    and adds WAV header on completion.
+    The WAV header needs the total data size, which is only known at the
+    end. S3 parts may be uploaded in any order, so the first
+    ``FLUSH_THRESHOLD`` bytes of audio are held back as part 1 while later
+    audio is uploaded as parts 2..n whenever the buffer fills. ``finalize``
+    uploads the last part and part 1 with the patched header, then completes
+    the upload: at most two part uploads, with no download or re-encode.
+
+    Memory per session is bounded by about twice ``FLUSH_THRESHOLD`` (the
+    held first part plus the current buffer).
 
     Example:
         recorder = AudioRecorder(
@@ -80,11 +116,12 @@ class AudioRecorder:
         # S3 multipart upload state
         self._upload_id: str | None = None
         self._parts: list[dict] = []
-        self._key = f"sessions/{session_id}/audio.raw"
-        self._final_key = f"sessions/{session_id}/audio.wav"
+        self._key = f"sessions/{session_id}/audio.wav"
 
-        # Buffer for accumulating audio
-        self._buffer = io.BytesIO()
+        # Audio held back for part 1 (uploaded with the header at the end)
+        # and the buffer for parts 2..n
+        self._head = bytearray()
+        self._buffer = bytearray()
         self._total_bytes = 0
 
         # State
@@ -102,7 +139,7 @@ class AudioRecorder:
         response = await self.s3_client.create_multipart_upload(
             Bucket=self.bucket,
             Key=self._key,
-            ContentType="application/octet-stream",
+            ContentType="audio/wav",
         )
         self._upload_id = response["UploadId"]
         self._started = True
@@ -127,24 +164,34 @@ class AudioRecorder:
         if self._finalized:
             raise RuntimeError("Cannot write to finalized recorder")
 
-        self._buffer.write(audio_data)
         self._total_bytes += len(audio_data)
 
-        # Check if we should flush to S3
-        if self._buffer.tell() >= self.FLUSH_THRESHOLD:
-            await self._flush_part()
+        head_room = self.FLUSH_THRESHOLD - len(self._head)
+        if head_room > 0:
+            self._head += audio_data[:head_room]
+            audio_data = audio_data[head_room:]
+
+        if audio_data:
+            self._buffer += audio_data
+            # Check if we should flush to S3
+            if len(self._buffer) >= self.FLUSH_THRESHOLD:
+                await self._flush_part()
 
     async def _flush_part(self) -> None:
-        """Upload buffered data as a part."""
-        if self._buffer.tell() == 0:
+        """Upload buffered data as the next part (2..n)."""
+        if not self._buffer:
             return
 
-        part_number = len(self._parts) + 1
-        self._buffer.seek(0)
-        data = self._buffer.read()
+        # Part 1 is reserved for the header and the held-back head
+        part_number = len(self._parts) + 2
+        data = bytes(self._buffer)
+        self._buffer = bytearray()
 
         # For S3 multipart, all parts except the last must be >= 5MB
         # We accumulate in buffer until threshold, then upload
+        await self._upload_part(part_number, data)
+
+    async def _upload_part(self, part_number: int, data: bytes) -> None:
         response = await self.s3_client.upload_part(
             Bucket=self.bucket,
             Key=self._key,
@@ -160,9 +207,6 @@ class AudioRecorder:
             }
         )
 
-        # Reset buffer
-        self._buffer = io.BytesIO()
-
         logger.debug(
             "audio_recorder_part_uploaded",
             session_id=self.session_id,
@@ -173,89 +217,55 @@ class AudioRecorder:
     async def finalize(self) -> str | None:
         """Finalize the recording and return S3 URI.
 
-        Uploads any remaining data, completes the multipart upload,
-        then converts to WAV format.
+        Uploads the remaining buffer and the header part, then completes
+        the multipart upload.
 
         Returns:
             S3 URI to the WAV file, or None if no audio was recorded
         """
         if self._finalized:
-            return f"s3://{self.bucket}/{self._final_key}"
+            return f"s3://{self.bucket}/{self._key}" if self._total_bytes else None
 
         if not self._started:
             return None
 
         self._finalized = True
 
-        # Flush remaining buffer
-        if self._buffer.tell() > 0:
-            await self._flush_part()
-
-        if not self._parts:
-            # No data was uploaded, abort
+        if self._total_bytes == 0:
+            # No data was recorded, abort
             await self._abort()
             return None
 
+        # Flush remaining buffer as the last part
+        await self._flush_part()
+
+        header = wav_header(
+            self._total_bytes, self.sample_rate, self.channels, self.bits_per_sample
+        )
+        await self._upload_part(1, header + bytes(self._head))
+        self._head = bytearray()
+
         # Complete multipart upload
         await self.s3_client.complete_multipart_upload(
             Bucket=self.bucket,
             Key=self._key,
             UploadId=self._upload_id,
-            MultipartUpload={"Parts": self._parts},
+            MultipartUpload={
+                "Parts": sorted(self._parts, key=lambda part: part["PartNumber"])
+            },
         )
+        # Nothing left to abort once the object exists
+        self._upload_id = None
 
         logger.info(
-            "audio_recorder_raw_completed",
+            "audio_recorder_wav_created",
             session_id=self.session_id,
+            key=self._key,
             total_bytes=self._total_bytes,
             parts=len(self._parts),
         )
 
-        # Convert to WAV
-        await self._convert_to_wav()
-
-        return f"s3://{self.bucket}/{self._final_key}"
-
-    async def _convert_to_wav(self) -> None:
-        """Convert raw PCM to WAV format by adding header.
-
-        Downloads raw file, prepends WAV header, uploads as new file.
-        """
-        # Download raw audio
-        response = await self.s3_client.get_object(
-            Bucket=self.bucket,
-            Key=self._key,
-        )
-        raw_data = await response["Body"].read()
-
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(self.bits_per_sample // 8)
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(raw_data)
-
-        # Upload WAV file
-        wav_buffer.seek(0)
-        await self.s3_client.put_object(
-            Bucket=self.bucket,
-            Key=self._final_key,
-            Body=wav_buffer.read(),
-            ContentType="audio/wav",
-        )
-
-        # Delete raw file
-        await self.s3_client.delete_object(
-            Bucket=self.bucket,
-            Key=self._key,
-        )
-
-        logger.info(
-            "audio_recorder_wav_created",
-            session_id=self.session_id,
-            key=self._final_key,
-        )
+        return f"s3://{self.bucket}/{self._key}"
 
     async def abort(self) -> None:
         """Abort the recording without finalizing.
@@ -279,7 +289,10 @@ class AudioRecorder:
                     session_id=self.session_id,
                     error=str(e),
                 )
+            self._upload_id = None
 
+        self._head = bytearray()
+        self._buffer = bytearray()
         self._finalized = True
 
     @property
@@ -52,8 +52,10 @@ from dalston.common.ws_close_codes import (
     WS_CLOSE_TRY_AGAIN_LATER,
 )
 from dalston.engine_sdk.types import EngineCapabilities
+from dalston.realtime_sdk.batching import TranscribeBatcher
 from dalston.realtime_sdk.model_manager import AsyncModelManager
 from dalston.realtime_sdk.session import SessionConfig, SessionHandler
+from dalston.realtime_sdk.vad import VADBatcher
 
 if TYPE_CHECKING:
     from dalston.common.node_identity import NodeIdentity
@@ -130,6 +132,7 @@ class RealtimeEngine(ABC):
         DALSTON_WORKER_PORT: WebSocket server port (default: 9000)
         DALSTON_WORKER_ENDPOINT: WebSocket endpoint URL for registration (auto-detected)
         DALSTON_MAX_SESSIONS: Maximum concurrent sessions (default: 2)
+        DALSTON_REALTIME_VAD_BATCH: Batch VAD across sessions (default: true)
         REDIS_URL: Redis connection URL (default: redis://localhost:6379)
     """
 
@@ -167,6 +170,11 @@ class RealtimeEngine(ABC):
         # M43: Dynamic model loading support
         self._model_manager: ModelManagerType | None = None
 
+        # Shared VAD scorer batching windows across sessions (set in run())
+        self._vad_batcher: VADBatcher | None = None
+        # Shared ASR batching across sessions, for engines that support it
+        self._transcribe_batcher: TranscribeBatcher | None = None
+
     @abstractmethod
     def load_models(self) -> None:
         """Load ASR models into memory.
@@ -200,6 +208,37 @@ class RealtimeEngine(ABC):
         """
         raise NotImplementedError
 
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        params: TranscriptionRequest,
+    ) -> list[Transcript]:
+        """Transcribe utterances from several sessions in one call.
+
+        Only used when :meth:`supports_batched_transcribe` returns True.
+        Override with a single batched model call; the default decodes the
+        utterances one by one.
+
+        Args:
+            audios: Utterances as float32 numpy arrays, mono, 16kHz
+            params: Transcriber parameters shared by every utterance
+
+        Returns:
+            One Transcript per utterance, in input order
+        """
+        return [self.transcribe(audio, params) for audio in audios]
+
+    def supports_batched_transcribe(self) -> bool:
+        """Whether :meth:`transcribe_batch` decodes a batch in one pass.
+
+        When True, utterances from concurrent sessions are collected for a
+        few milliseconds and decoded together (see ``TranscribeBatcher``).
+
+        Returns:
+            True if transcribe_batch is a real batched call. Default: False
+        """
+        return False
+
     def supports_native_streaming(self) -> bool:
         """Whether this engine supports native streaming with partial results.
 
@@ -410,6 +449,9 @@ class RealtimeEngine(ABC):
         # Load models
         logger.info("loading_models")
         self.load_models()
+        self._vad_batcher = VADBatcher.from_env()
+        if self.supports_batched_transcribe():
+            self._transcribe_batcher = TranscribeBatcher.from_env(self.transcribe_batch)
         logger.info("models_loaded")
 
         # M50: Get structured capabilities from engine.yaml
@@ -529,6 +571,11 @@ class RealtimeEngine(ABC):
         if self._model_manager is not None:
             await self._model_manager.shutdown()
 
+        if self._vad_batcher is not None:
+            await self._vad_batcher.close()
+        if self._transcribe_batcher is not None:
+            await self._transcribe_batcher.close()
+
         # Stop metrics server
         await self._stop_metrics_server()
 
@@ -675,6 +722,8 @@ class RealtimeEngine(ABC):
             on_session_end=self._on_session_end,
             supports_native_streaming=self.supports_native_streaming(),
             streaming_decode_fn=streaming_decode_fn,
+            vad_batcher=self._vad_batcher,
+            transcribe_batcher=self._transcribe_batcher,
         )
 
         # Track session
@@ -0,0 +1,192 @@
+"""Cross-session batching of realtime ASR inference.
+
+Without batching every session decodes its utterances on its own thread,
+so a worker with many sessions runs many batch-size-1 decodes side by
+side. :class:`TranscribeBatcher` collects utterances that arrive within a
+few milliseconds of each other into one ``transcribe_batch`` call on the
+engine, for engines whose model decodes a padded batch in one pass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import structlog
+
+import dalston.metrics
+
+if TYPE_CHECKING:
+    from dalston.common.pipeline_types import Transcript, TranscriptionRequest
+
+logger = structlog.get_logger()
+
+TranscribeBatchFn = Callable[
+    [list[np.ndarray], "TranscriptionRequest"], list["Transcript"]
+]
+
+
+@dataclass
+class _PendingUtterance:
+    audio: np.ndarray
+    future: asyncio.Future[Transcript]
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Queue:
+    params: TranscriptionRequest
+    items: list[_PendingUtterance] = field(default_factory=list)
+
+
+class TranscribeBatcher:
+    """Shared transcriber that batches utterances across sessions.
+
+    Utterances are queued per distinct :class:`TranscriptionRequest` (model,
+    language, vocabulary, ...), since one batch call runs with one set of
+    parameters. The queue whose oldest utterance has waited longest is
+    decoded first, once it holds ``max_batch`` utterances or its oldest
+    utterance has waited ``max_wait_ms``. One batch runs at a time; the
+    next batch fills up while the current one decodes, so batches grow
+    with load and stay at size 1 on an idle worker.
+
+    Environment variables:
+        DALSTON_REALTIME_ASR_BATCH: Enable cross-session batching for
+            engines that support it (default: true)
+        DALSTON_REALTIME_ASR_BATCH_WAIT_MS: Max time an utterance waits
+            for others to join its batch (default: 10)
+        DALSTON_REALTIME_ASR_BATCH_MAX: Max utterances per batch (default: 16)
+    """
+
+    def __init__(
+        self,
+        transcribe_batch: TranscribeBatchFn,
+        *,
+        max_wait_ms: float = 10.0,
+        max_batch: int = 16,
+    ) -> None:
+        self._transcribe_batch = transcribe_batch
+        self.max_wait_s = max_wait_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self._queues: dict[str, _Queue] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_env(cls, transcribe_batch: TranscribeBatchFn) -> TranscribeBatcher | None:
+        """Create a batcher from environment variables, or None if disabled."""
+        enabled = os.environ.get("DALSTON_REALTIME_ASR_BATCH", "true").lower()
+        if enabled not in ("true", "1", "yes"):
+            return None
+        batcher = cls(
+            transcribe_batch,
+            max_wait_ms=float(
+                os.environ.get("DALSTON_REALTIME_ASR_BATCH_WAIT_MS", "10")
+            ),
+            max_batch=int(os.environ.get("DALSTON_REALTIME_ASR_BATCH_MAX", "16")),
+        )
+        logger.info(
+            "transcribe_batcher_enabled",
+            max_wait_ms=batcher.max_wait_s * 1000,
+            max_batch=batcher.max_batch,
+        )
+        return batcher
+
+    async def transcribe(
+        self, audio: np.ndarray, params: TranscriptionRequest
+    ) -> Transcript:
+        """Transcribe one utterance as part of the next batch for ``params``."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        assert self._wakeup is not None
+
+        key = params.model_dump_json()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _Queue(params=params)
+        future: asyncio.Future[Transcript] = asyncio.get_running_loop().create_future()
+        queue.items.append(_PendingUtterance(audio=audio, future=future))
+        self._wakeup.set()
+        return await future
+
+    async def close(self) -> None:
+        """Stop the batching loop, cancelling utterances still waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for queue in self._queues.values():
+            for item in queue.items:
+                if not item.future.done():
+                    item.future.cancel()
+        self._queues.clear()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            await self._wakeup.wait()
+            key = self._oldest_queue()
+            if key is None:
+                self._wakeup.clear()
+                continue
+
+            queue = self._queues[key]
+            # Give other sessions a bounded window to join the batch
+            deadline = queue.items[0].queued_at + self.max_wait_s
+            delay = deadline - time.monotonic()
+            if len(queue.items) < self.max_batch and delay > 0:
+                await asyncio.sleep(delay)
+
+            batch = queue.items[: self.max_batch]
+            queue.items = queue.items[self.max_batch :]
+            if not queue.items:
+                del self._queues[key]
+            await self._decode(queue.params, batch)
+
+    def _oldest_queue(self) -> str | None:
+        oldest: tuple[float, str] | None = None
+        for key, queue in self._queues.items():
+            if queue.items and (oldest is None or queue.items[0].queued_at < oldest[0]):
+                oldest = (queue.items[0].queued_at, key)
+        return oldest[1] if oldest else None
+
+    async def _decode(
+        self, params: TranscriptionRequest, batch: list[_PendingUtterance]
+    ) -> None:
+        # Sessions that went away while waiting need no decode
+        batch = [item for item in batch if not item.future.done()]
+        if not batch:
+            return
+
+        dalston.metrics.observe_realtime_transcribe_batch(
+            params.loaded_model_id or "",
+            len(batch),
+            time.monotonic() - batch[0].queued_at,
+        )
+        try:
+            results = await asyncio.to_thread(
+                self._transcribe_batch, [item.audio for item in batch], params
+            )
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"transcribe_batch returned {len(results)} results "
+                    f"for {len(batch)} utterances"
+                )
+        except Exception as e:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        for item, result in zip(batch, results, strict=True):
+            if not item.future.done():
+                item.future.set_result(result)
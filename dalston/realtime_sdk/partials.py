@@ -0,0 +1,165 @@
+"""Incremental partial-result decoding for realtime sessions.
+
+Re-transcribing the whole utterance for every partial makes each partial
+cost grow with utterance length (quadratic over the utterance).
+``IncrementalPartialDecoder`` keeps that cost flat:
+
+- Words that two consecutive partial decodes agree on are committed
+  (LocalAgreement-2) and never decoded again.
+- Each partial decodes only the audio after the committed prefix, plus
+  ``context_s`` of already-committed audio as lead-in for the model.
+- The decoded window never exceeds ``max_window_s``; if the tail stays
+  unstable that long, its oldest words are committed as they are.
+
+Words come from the engine's word timestamps when present, otherwise from
+its segments. Partials are previews only: the final result for an
+utterance is still decoded from the full utterance audio.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from dalston.common.pipeline_types import Transcript
+
+DEFAULT_CONTEXT_S = 1.0
+DEFAULT_MAX_WINDOW_S = 8.0
+
+
+@dataclass(frozen=True)
+class PartialWindow:
+    """Audio to decode for one partial and where it starts in the utterance."""
+
+    audio: np.ndarray
+    offset_s: float
+
+
+@dataclass(frozen=True)
+class _Unit:
+    text: str
+    start: float
+    end: float
+
+    @property
+    def key(self) -> str:
+        return self.text.strip().lower()
+
+
+class IncrementalPartialDecoder:
+    """Committed-prefix state for partial results within one utterance.
+
+    Call :meth:`window` with the utterance's audio chunks to get the audio
+    to decode, then :meth:`update` with the engine's result for that window
+    to get the full partial text. Call :meth:`reset` at utterance end.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        context_s: float = DEFAULT_CONTEXT_S,
+        max_window_s: float = DEFAULT_MAX_WINDOW_S,
+    ) -> None:
+        self._sample_rate = sample_rate
+        self._context_s = context_s
+        self._max_window_s = max(max_window_s, context_s + 1.0)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current utterance."""
+        self._committed: list[str] = []
+        self._committed_end_s = 0.0
+        self._tail: list[_Unit] = []
+
+    @property
+    def committed_text(self) -> str:
+        return " ".join(self._committed)
+
+    def window(self, chunks: list[np.ndarray]) -> PartialWindow | None:
+        """Audio to decode next: context plus everything not yet committed.
+
+        Only the trailing chunks the window covers are concatenated.
+        """
+        total = sum(len(chunk) for chunk in chunks)
+        if total == 0:
+            return None
+        total_s = total / self._sample_rate
+
+        oldest_allowed_s = total_s - self._max_window_s + self._context_s
+        if self._committed_end_s < oldest_allowed_s:
+            # Tail never stabilised: commit what fell out of the window
+            self._force_commit(oldest_allowed_s)
+
+        start = max(
+            0, int((self._committed_end_s - self._context_s) * self._sample_rate)
+        )
+        start = min(start, total)
+        pieces: list[np.ndarray] = []
+        remaining = total - start
+        for chunk in reversed(chunks):
+            if remaining <= 0:
+                break
+            pieces.append(chunk[-remaining:] if len(chunk) > remaining else chunk)
+            remaining -= len(chunk)
+        pieces.reverse()
+        audio = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+        return PartialWindow(audio=audio, offset_s=start / self._sample_rate)
+
+    def update(self, window: PartialWindow, result: Transcript) -> str:
+        """Fold the decode of ``window`` into the state; returns partial text."""
+        units = [
+            unit
+            for unit in self._units(result, window)
+            # Words inside the lead-in context were committed already
+            if (unit.start + unit.end) / 2 > self._committed_end_s
+        ]
+
+        agreed = 0
+        for new, old in zip(units, self._tail, strict=False):
+            if new.key != old.key:
+                break
+            agreed += 1
+        if agreed:
+            self._committed.extend(unit.text for unit in units[:agreed])
+            self._committed_end_s = max(self._committed_end_s, units[agreed - 1].end)
+        self._tail = units[agreed:]
+
+        return " ".join([*self._committed, *(unit.text for unit in self._tail)])
+
+    def _force_commit(self, until_s: float) -> None:
+        keep: list[_Unit] = []
+        for unit in self._tail:
+            if unit.end <= until_s and not keep:
+                self._committed.append(unit.text)
+            else:
+                keep.append(unit)
+        self._tail = keep
+        self._committed_end_s = until_s
+
+    def _units(self, result: Transcript, window: PartialWindow) -> list[_Unit]:
+        """Words of ``result`` (segments if it has none) in utterance time."""
+        offset = window.offset_s
+        units: list[_Unit] = []
+        for segment in result.segments:
+            if segment.words:
+                units.extend(
+                    _Unit(w.text.strip(), w.start + offset, w.end + offset)
+                    for w in segment.words
+                    if w.text.strip()
+                )
+            elif segment.text.strip():
+                units.append(
+                    _Unit(
+                        segment.text.strip(),
+                        segment.start + offset,
+                        segment.end + offset,
+                    )
+                )
+        if not units and result.text.strip():
+            # No timing at all: the text spans the whole window
+            end = offset + len(window.audio) / self._sample_rate
+            units.append(_Unit(result.text.strip(), offset, end))
+        return units
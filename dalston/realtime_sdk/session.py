@@ -46,7 +46,9 @@ from dalston.realtime_sdk.assembler import (
     TranscriptAssembler,
     Word,
 )
+from dalston.realtime_sdk.batching import TranscribeBatcher
 from dalston.realtime_sdk.context import S3SessionStorage, SessionStorage
+from dalston.realtime_sdk.partials import IncrementalPartialDecoder
 from dalston.realtime_sdk.protocol import (
     ClearMessage,
     ConfigUpdateMessage,
@@ -67,7 +69,7 @@ from dalston.realtime_sdk.protocol import (
     WordInfo,
     parse_client_message,
 )
-from dalston.realtime_sdk.vad import VADConfig, VADProcessor
+from dalston.realtime_sdk.vad import VADBatcher, VADConfig, VADProcessor
 
 if TYPE_CHECKING:
     from websockets import WebSocketServerProtocol
@@ -150,10 +152,20 @@ class AudioBuffer:
     - pcm_f32le: 32-bit float PCM, little-endian
     - mulaw: μ-law encoded (8-bit, telephony)
     - alaw: A-law encoded (8-bit, telephony)
+
+    Samples live in a preallocated float32 array; ``get_chunk()`` and
+    ``flush()`` return views into it rather than copies.  Writes only ever
+    go past the unread region, and when the array fills up the unread tail
+    is moved into a freshly allocated array (grown if needed), so views
+    already handed out are never overwritten.
     """
 
     SUPPORTED_ENCODINGS = ["pcm_s16le", "pcm_f32le", "mulaw", "alaw"]
 
+    # Minimum storage capacity, in chunks; relocation copies at most the
+    # unread tail once per this many chunks.
+    MIN_CAPACITY_CHUNKS = 20
+
     def __init__(
         self,
         sample_rate: int,
@@ -193,8 +205,11 @@ class AudioBuffer:
         # Calculate chunk size in samples across all channels
         self.chunk_samples = int(sample_rate * chunk_duration_ms / 1000) * self.channels
 
-        # Buffer for accumulated samples (float32)
-        self._buffer: list[float] = []
+        # Unread samples are self._data[self._start : self._end] (float32)
+        self._capacity = max(1, self.chunk_samples) * self.MIN_CAPACITY_CHUNKS
+        self._data = np.empty(self._capacity, dtype=np.float32)
+        self._start = 0
+        self._end = 0
         self._total_samples = 0
 
     def add(self, data: bytes) -> None:
@@ -207,8 +222,12 @@ class AudioBuffer:
         """
         samples = self._decode_audio(data)
         samples = self._resample_if_needed(samples)
-        self._buffer.extend(samples.tolist())
-        self._total_samples += len(samples)
+        n = len(samples)
+        if self._end + n > len(self._data):
+            self._relocate(n)
+        self._data[self._end : self._end + n] = samples
+        self._end += n
+        self._total_samples += n
 
     def get_chunk(self) -> np.ndarray | None:
         """Extract next processing chunk if available.
@@ -216,11 +235,11 @@ class AudioBuffer:
         Returns:
             Float32 numpy array of chunk_samples length, or None if not enough data
         """
-        if len(self._buffer) < self.chunk_samples:
+        if self._end - self._start < self.chunk_samples:
             return None
 
-        chunk = np.array(self._buffer[: self.chunk_samples], dtype=np.float32)
-        self._buffer = self._buffer[self.chunk_samples :]
+        chunk = self._data[self._start : self._start + self.chunk_samples]
+        self._start += self.chunk_samples
         return chunk
 
     def flush(self) -> np.ndarray | None:
@@ -229,11 +248,11 @@ class AudioBuffer:
         Returns:
             Float32 numpy array of remaining samples, or None if empty
         """
-        if not self._buffer:
+        if self._end == self._start:
             return None
 
-        chunk = np.array(self._buffer, dtype=np.float32)
-        self._buffer.clear()
+        chunk = self._data[self._start : self._end]
+        self._start = self._end
         return chunk
 
     def clear(self) -> float:
@@ -245,7 +264,7 @@ class AudioBuffer:
             Discarded audio duration in seconds.
         """
         discarded_duration = self.get_buffered_duration()
-        self._buffer.clear()
+        self._start = self._end
         return discarded_duration
 
     def get_total_duration(self) -> float:
@@ -254,7 +273,24 @@ class AudioBuffer:
 
     def get_buffered_duration(self) -> float:
         """Buffered (unprocessed) audio duration in seconds."""
-        return len(self._buffer) / (self.sample_rate * self.channels)
+        return (self._end - self._start) / (self.sample_rate * self.channels)
+
+    def _relocate(self, incoming: int) -> None:
+        """Move unread samples to the front of a new array with room for more.
+
+        A new array is allocated (instead of shifting in place) so chunk
+        views returned earlier keep their contents.
+        """
+        unread = self._end - self._start
+        needed = unread + incoming
+        capacity = self._capacity
+        while capacity < needed * 2:
+            capacity *= 2
+        data = np.empty(capacity, dtype=np.float32)
+        data[:unread] = self._data[self._start : self._end]
+        self._data = data
+        self._start = 0
+        self._end = unread
 
     def _decode_audio(self, data: bytes) -> np.ndarray:
         """Decode raw bytes to float32 numpy array.
@@ -381,6 +417,8 @@ class SessionHandler:
         on_session_end: Callable[[str, float, str], Awaitable[None]] | None = None,
         supports_native_streaming: bool = False,
         streaming_decode_fn: StreamingDecodeCallback | None = None,
+        vad_batcher: VADBatcher | None = None,
+        transcribe_batcher: TranscribeBatcher | None = None,
     ) -> None:
         """Initialize session handler.
 
@@ -395,10 +433,15 @@ class SessionHandler:
                 streaming decoder, bypassing VAD accumulation. VAD still
                 runs for endpoint detection (to know when to flush and
                 send final results).
+            vad_batcher: Engine-wide VAD batcher shared by all sessions.
+                When None, the session scores VAD with its own model.
+            transcribe_batcher: Engine-wide ASR batcher shared by all
+                sessions. When None, each utterance is decoded on its own.
         """
         self.websocket = websocket
         self.config = config
         self._transcribe_fn = transcribe_fn
+        self._transcribe_batcher = transcribe_batcher
         self._on_session_end = on_session_end
         self._supports_native_streaming = supports_native_streaming
         self._streaming_decode_fn = streaming_decode_fn
@@ -423,7 +466,8 @@ class SessionHandler:
                         1,
                         int(round(config.prefix_padding_ms / 100.0)),
                     ),
-                )
+                ),
+                batcher=vad_batcher,
             )
         else:
             self._vad = None
@@ -438,6 +482,13 @@ class SessionHandler:
         # Streaming partial results state
         self._chunks_since_partial = 0
         self._speech_audio_buffer: list[np.ndarray] = []
+        # "incremental" decodes only the unstable tail for each partial;
+        # "full" re-decodes the whole utterance (previous behaviour)
+        self._partial_decoder: IncrementalPartialDecoder | None = (
+            IncrementalPartialDecoder(config.sample_rate * config.channels)
+            if os.environ.get("DALSTON_RT_PARTIAL_MODE", "incremental") != "full"
+            else None
+        )
 
         # Lag accounting state (M53)
         self._received_audio_seconds = 0.0
@@ -545,6 +596,9 @@ class SessionHandler:
             # cleanup on early termination (e.g., lag) or send_session_end failure.
             if self._session_storage is not None:
                 await self._cleanup_storage()
+            # Release this session's recurrent state in a shared VAD batcher
+            if self._vad is not None:
+                self._vad.reset()
 
         # Notify callback
         if self._on_session_end:
@@ -628,12 +682,11 @@ class SessionHandler:
             return
 
         # Run VAD
-        vad_result = self._vad.process_chunk(audio)
+        vad_result = await self._vad.process_chunk_async(audio)
 
         if vad_result.event == "speech_start":
             # Reset streaming state
-            self._chunks_since_partial = 0
-            self._speech_audio_buffer = []
+            self._reset_partial_state()
 
             # M76.4: VAD endpoint span (unsampled — these are infrequent)
             dalston.telemetry.set_span_attribute(
@@ -665,8 +718,7 @@ class SessionHandler:
                 )
 
             # Clear streaming state
-            self._speech_audio_buffer = []
-            self._chunks_since_partial = 0
+            self._reset_partial_state()
 
             # Transcribe if we have speech audio
             if vad_result.speech_audio is not None and len(vad_result.speech_audio) > 0:
@@ -709,7 +761,7 @@ class SessionHandler:
 
         # Run VAD in parallel for endpoint detection events
         if self._vad is not None:
-            vad_result = self._vad.process_chunk(audio)
+            vad_result = await self._vad.process_chunk_async(audio)
 
             if vad_result.event == "speech_start":
                 await self._send(
@@ -970,8 +1022,7 @@ class SessionHandler:
                     await self._transcribe_and_send(audio_to_transcribe)
 
                 # Reset buffer for next chunk
-                self._speech_audio_buffer = []
-                self._chunks_since_partial = 0
+                self._reset_partial_state()
 
     def _build_transcribe_params(self) -> TranscriptionRequest:
         """Build typed transcriber params from current session state."""
@@ -984,38 +1035,66 @@ class SessionHandler:
             task="transcribe",
         )
 
+    def _reset_partial_state(self) -> None:
+        """Drop the current utterance's audio and partial-decoding state."""
+        self._speech_audio_buffer = []
+        self._chunks_since_partial = 0
+        if self._partial_decoder is not None:
+            self._partial_decoder.reset()
+
     async def _send_partial_result(self) -> None:
         """Send partial transcription result during speech.
 
         Called periodically for streaming models while VAD is in speech state.
+        In incremental mode only the uncommitted tail of the utterance is
+        decoded, so a partial costs the same at 5s and at 60s. Partials are
+        skipped while the session is more than half its lag warning behind,
+        leaving the worker to catch up on audio that produces finals.
         """
         if self._ended or not self._speech_audio_buffer:
             return
 
+        lag = self._lag_seconds()
+        if lag >= self.config.lag_warning_seconds / 2:
+            logger.debug("partial_skipped_behind", lag_seconds=round(lag, 3))
+            return
+
         try:
-            # Concatenate accumulated audio
-            audio = np.concatenate(self._speech_audio_buffer)
             params = self._build_transcribe_params()
+            window = None
+            if self._partial_decoder is not None:
+                window = self._partial_decoder.window(self._speech_audio_buffer)
+                if window is None:
+                    return
+                audio = window.audio
+                # Word timings let the decoder commit a stable prefix
+                params = params.model_copy(update={"word_timestamps": True})
+            else:
+                audio = np.concatenate(self._speech_audio_buffer)
 
-            # Transcribe in thread pool to avoid blocking event loop
-            result = await asyncio.to_thread(
-                self._transcribe_fn,
-                audio,
-                params,
-            )
+            result = await self._run_transcribe(audio, params)
 
-            if self._ended or not result.text:
+            if self._ended:
+                return
+            text = (
+                self._partial_decoder.update(window, result)
+                if self._partial_decoder is not None and window is not None
+                else result.text
+            )
+            if not text:
                 return
 
             # Calculate timing
-            audio_duration = self._samples_to_seconds(len(audio))
+            audio_duration = self._samples_to_seconds(
+                sum(len(chunk) for chunk in self._speech_audio_buffer)
+            )
             start_time = self._assembler.current_time
             end_time = start_time + audio_duration
 
             # Send partial result
             await self._send(
                 TranscriptPartialMessage(
-                    text=result.text,
+                    text=text,
                     start=start_time,
                     end=end_time,
                 )
@@ -1054,8 +1133,7 @@ class SessionHandler:
                 await self._transcribe_and_send(speech_audio)
 
             # Clear streaming state
-            self._speech_audio_buffer = []
-            self._chunks_since_partial = 0
+            self._reset_partial_state()
 
             # Send VAD speech_start event (speech continues)
             if self.config.enable_vad:
@@ -1063,6 +1141,19 @@ class SessionHandler:
                     VADSpeechStartMessage(timestamp=self._assembler.current_time)
                 )
 
+    async def _run_transcribe(
+        self, audio: np.ndarray, params: TranscriptionRequest
+    ) -> Transcript:
+        """Decode one utterance via the shared batcher or a worker thread.
+
+        Either way ASR runs off the event loop. This is critical for slow
+        models (e.g., CPU inference) to prevent WebSocket keepalive ping
+        timeouts.
+        """
+        if self._transcribe_batcher is not None:
+            return await self._transcribe_batcher.transcribe(audio, params)
+        return await asyncio.to_thread(self._transcribe_fn, audio, params)
+
     async def _transcribe_and_send(self, audio: np.ndarray) -> None:
         """Transcribe audio and send result.
 
@@ -1091,20 +1182,9 @@ class SessionHandler:
                         "dalston.chunk_index": self._rt_chunk_counter,
                     },
                 ):
-                    result = await asyncio.to_thread(
-                        self._transcribe_fn,
-                        audio,
-                        params,
-                    )
+                    result = await self._run_transcribe(audio, params)
             else:
-                # Call ASR in thread pool to avoid blocking event loop
-                # This is critical for slow models (e.g., CPU inference) to
-                # prevent WebSocket keepalive ping timeouts
-                result = await asyncio.to_thread(
-                    self._transcribe_fn,
-                    audio,
-                    params,
-                )
+                result = await self._run_transcribe(audio, params)
 
             elapsed = time.perf_counter() - t0
 
@@ -1232,8 +1312,7 @@ class SessionHandler:
             discarded_duration = self._buffer.clear()
             self._record_discarded_audio(discarded_duration)
             # Clear streaming state
-            self._speech_audio_buffer = []
-            self._chunks_since_partial = 0
+            self._reset_partial_state()
             # M71: Clear streaming decode accumulated state
             self._streaming_session_text_parts = []
             self._streaming_word_results = []
@@ -1317,7 +1396,7 @@ class SessionHandler:
             # No VAD mode - transcribe any remaining buffered audio
             audio_to_transcribe = np.concatenate(self._speech_audio_buffer)
             await self._transcribe_and_send(audio_to_transcribe)
-            self._speech_audio_buffer = []
+            self._reset_partial_state()
 
         segments = [
             SegmentInfo(start=s.start, end=s.end, text=s.text)
@@ -12,9 +12,13 @@ not force a second runtime into an image that already has one.
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import uuid
 from dataclasses import dataclass
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import structlog
@@ -26,9 +30,14 @@ from dalston.common.audio_defaults import (
     DEFAULT_VAD_THRESHOLD,
 )
 from dalston.engine_sdk.silero_vad import (
+    CONTEXT_SAMPLES_8K,
+    CONTEXT_SAMPLES_16K,
+    WINDOW_SAMPLES_8K,
+    WINDOW_SAMPLES_16K,
     SileroModel,
     SileroOnnxModel,
     load_silero_model,
+    load_silero_session,
 )
 
 logger = structlog.get_logger()
@@ -40,6 +49,25 @@ logger = structlog.get_logger()
 # :func:`load_silero_model`.
 _SileroOnnxModel = SileroOnnxModel
 
+# Silero v5 recurrent state is (2, batch, 128); one (2, 128) slice per stream.
+_STATE_SHAPE = (2, 128)
+
+
+def _split_windows(audio: np.ndarray, sample_rate: int) -> list[np.ndarray]:
+    """Split a chunk into the fixed-size windows Silero scores.
+
+    Silero VAD requires exactly 512 samples at 16kHz (or 256 at 8kHz).
+    Short audio is zero-padded to one window; a trailing partial window
+    is dropped.
+    """
+    window_size = WINDOW_SAMPLES_16K if sample_rate == 16000 else WINDOW_SAMPLES_8K
+    if len(audio) < window_size:
+        audio = np.pad(audio, (0, window_size - len(audio)))
+    return [
+        audio[i : i + window_size]
+        for i in range(0, len(audio) - window_size + 1, window_size)
+    ]
+
 
 @dataclass
 class VADConfig:
@@ -118,13 +146,21 @@ class VADProcessor:
             transcribe(remaining)
     """
 
-    def __init__(self, config: VADConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: VADConfig | None = None,
+        batcher: VADBatcher | None = None,
+    ) -> None:
         """Initialize VAD processor.
 
         Args:
             config: VAD configuration. Uses defaults if not provided.
+            batcher: Optional shared batcher that scores chunks for
+                :meth:`process_chunk_async` instead of a per-processor model.
         """
         self.config = config or VADConfig()
+        self._batcher = batcher
+        self._stream_id = uuid.uuid4().hex
         self._model: SileroModel | None = None
         self._state = VADState.SILENCE
         self._speech_buffer: list[np.ndarray] = []
@@ -165,18 +201,9 @@ class VADProcessor:
         if audio.dtype != np.float32:
             audio = audio.astype(np.float32)
 
-        # Silero VAD requires exactly 512 samples at 16kHz (or 256 at 8kHz)
-        # Process in windows and return max probability
-        window_size = 512 if self.config.sample_rate == 16000 else 256
-
-        if len(audio) < window_size:
-            # Pad short audio with zeros
-            audio = np.pad(audio, (0, window_size - len(audio)))
-
         # Process all windows and return max probability
         max_prob = 0.0
-        for i in range(0, len(audio) - window_size + 1, window_size):
-            window = audio[i : i + window_size]
+        for window in _split_windows(audio, self.config.sample_rate):
             prob = self._model(window, self.config.sample_rate)
             max_prob = max(max_prob, prob)
 
@@ -191,10 +218,25 @@ class VADProcessor:
         Returns:
             VADResult with event type and speech audio if endpoint detected
         """
-        chunk_duration = len(audio) / self.config.sample_rate
+        return self._advance(audio, self._get_speech_prob(audio))
+
+    async def process_chunk_async(self, audio: np.ndarray) -> VADResult:
+        """Async variant of :meth:`process_chunk`.
+
+        With a shared :class:`VADBatcher` the speech probability is scored
+        in a batch alongside other sessions' chunks; otherwise this is the
+        same inline call as :meth:`process_chunk`.
+        """
+        if self._batcher is None:
+            return self.process_chunk(audio)
+        prob = await self._batcher.speech_prob(
+            self._stream_id, audio, self.config.sample_rate
+        )
+        return self._advance(audio, prob)
 
-        # Get speech probability
-        prob = self._get_speech_prob(audio)
+    def _advance(self, audio: np.ndarray, prob: float) -> VADResult:
+        """Advance the speech/silence state machine by one scored chunk."""
+        chunk_duration = len(audio) / self.config.sample_rate
         is_speech = prob > self.config.speech_threshold
 
         # Update lookback buffer (for capturing speech onset)
@@ -314,6 +356,8 @@ class VADProcessor:
         # Reset model state if needed
         if self._model is not None:
             self._model.reset_states()
+        if self._batcher is not None:
+            self._batcher.release(self._stream_id)
 
     @property
     def state(self) -> VADState:
@@ -361,3 +405,250 @@ class VADProcessor:
         # State remains SPEECH - caller sends speech_start to indicate continuation
 
         return speech_audio
+
+
+@dataclass
+class _PendingChunk:
+    stream_id: str
+    windows: list[np.ndarray]
+    sample_rate: int
+    future: asyncio.Future[float]
+
+
+class VADBatcher:
+    """Shared Silero VAD scorer that batches windows across sessions.
+
+    Each :class:`VADProcessor` created with a batcher submits its chunk via
+    :meth:`speech_prob`. Chunks arriving within ``max_wait_ms`` of each
+    other are scored together: window *j* of every pending chunk goes into
+    one ``(batch, context + window)`` ONNX call, so a worker with hundreds
+    of sessions makes a handful of model calls per tick instead of one per
+    window per session. Recurrent state and context are kept per stream
+    and threaded through the batch, so results match per-session scoring.
+
+    Only the ONNX backend exposes its state as graph inputs; the
+    TorchScript module keeps a single stream's state internally and
+    cannot be batched this way. :meth:`from_env` returns None when ONNX
+    Runtime is unavailable, and sessions fall back to per-session models.
+
+    Environment variables:
+        DALSTON_REALTIME_VAD_BATCH: Enable cross-session batching (default: true)
+        DALSTON_REALTIME_VAD_BATCH_WAIT_MS: Max time a chunk waits for
+            others to join its batch (default: 5)
+        DALSTON_REALTIME_VAD_BATCH_MAX: Max chunks per batch (default: 256)
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        *,
+        max_wait_ms: float = 5.0,
+        max_batch: int = 256,
+    ) -> None:
+        self._session = session
+        self.max_wait_s = max_wait_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self._states: dict[str, np.ndarray] = {}
+        self._contexts: dict[str, np.ndarray] = {}
+        # Guards per-stream state against release() racing a scoring thread;
+        # each in-flight score() collects streams released while it runs
+        self._state_lock = threading.Lock()
+        self._released_during_score: list[set[str]] = []
+        self._pending: list[_PendingChunk] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_env(cls) -> VADBatcher | None:
+        """Create a batcher from environment variables, or None if disabled."""
+        enabled = os.environ.get("DALSTON_REALTIME_VAD_BATCH", "true").lower()
+        if enabled not in ("true", "1", "yes"):
+            return None
+        try:
+            session = load_silero_session()
+        except RuntimeError as e:
+            logger.info("vad_batcher_unavailable", error=str(e)[:200])
+            return None
+
+        batcher = cls(
+            session,
+            max_wait_ms=float(
+                os.environ.get("DALSTON_REALTIME_VAD_BATCH_WAIT_MS", "5")
+            ),
+            max_batch=int(os.environ.get("DALSTON_REALTIME_VAD_BATCH_MAX", "256")),
+        )
+        logger.info(
+            "vad_batcher_enabled",
+            max_wait_ms=batcher.max_wait_s * 1000,
+            max_batch=batcher.max_batch,
+        )
+        return batcher
+
+    async def speech_prob(
+        self, stream_id: str, audio: np.ndarray, sample_rate: int
+    ) -> float:
+        """Score one chunk for a stream; returns the max window probability."""
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        assert self._wakeup is not None
+
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self._pending.append(
+            _PendingChunk(
+                stream_id=stream_id,
+                windows=_split_windows(audio, sample_rate),
+                sample_rate=sample_rate,
+                future=future,
+            )
+        )
+        self._wakeup.set()
+        return await future
+
+    def release(self, stream_id: str) -> None:
+        """Drop a stream's recurrent state (session reset or end).
+
+        A batch already being scored for the stream will not write its
+        state back, so the release sticks.
+        """
+        with self._state_lock:
+            self._states.pop(stream_id, None)
+            self._contexts.pop(stream_id, None)
+            for released in self._released_during_score:
+                released.add(stream_id)
+
+    async def close(self) -> None:
+        """Stop the batching loop, failing any chunks still waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for chunk in self._pending:
+            if not chunk.future.done():
+                chunk.future.cancel()
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            await self._wakeup.wait()
+            # Give other sessions' chunks a bounded window to join the batch
+            if len(self._pending) < self.max_batch:
+                await asyncio.sleep(self.max_wait_s)
+
+            batch = self._take_batch()
+            if not self._pending:
+                self._wakeup.clear()
+            if not batch:
+                continue
+
+            try:
+                probs = await asyncio.to_thread(self.score, batch)
+            except Exception as e:
+                for chunk in batch:
+                    if not chunk.future.done():
+                        chunk.future.set_exception(e)
+                continue
+
+            for chunk, prob in zip(batch, probs, strict=True):
+                if not chunk.future.done():
+                    chunk.future.set_result(prob)
+
+    def _take_batch(self) -> list[_PendingChunk]:
+        """Pop up to max_batch pending chunks, at most one per stream."""
+        batch: list[_PendingChunk] = []
+        deferred: list[_PendingChunk] = []
+        seen: set[str] = set()
+        for chunk in self._pending:
+            # A stream's chunks must be scored in order through its state
+            if len(batch) >= self.max_batch or chunk.stream_id in seen:
+                deferred.append(chunk)
+            else:
+                seen.add(chunk.stream_id)
+                batch.append(chunk)
+        self._pending = deferred
+        return batch
+
+    def score(self, batch: list[_PendingChunk]) -> list[float]:
+        """Run batched inference for chunks from distinct streams.
+
+        Blocking; called from a worker thread by the batching loop.
+        Chunks whose future is already done (e.g. cancelled) are skipped
+        and score 0.0, and streams released while scoring keep no state.
+        """
+        probs = [0.0] * len(batch)
+        by_rate: dict[int, list[int]] = {}
+        for i, chunk in enumerate(batch):
+            if not chunk.future.done():
+                by_rate.setdefault(chunk.sample_rate, []).append(i)
+
+        released: set[str] = set()
+        with self._state_lock:
+            self._released_during_score.append(released)
+        try:
+            self._score_by_rate(batch, by_rate, probs, released)
+        finally:
+            with self._state_lock:
+                self._released_during_score = [
+                    r for r in self._released_during_score if r is not released
+                ]
+        return probs
+
+    def _score_by_rate(
+        self,
+        batch: list[_PendingChunk],
+        by_rate: dict[int, list[int]],
+        probs: list[float],
+        released: set[str],
+    ) -> None:
+        """Score ``by_rate`` groups into ``probs`` and store their new state."""
+        for sample_rate, indices in by_rate.items():
+            context_size = (
+                CONTEXT_SAMPLES_16K if sample_rate == 16000 else CONTEXT_SAMPLES_8K
+            )
+            ids = [batch[i].stream_id for i in indices]
+            with self._state_lock:
+                state = np.stack(
+                    [
+                        self._states.get(sid, np.zeros(_STATE_SHAPE, np.float32))
+                        for sid in ids
+                    ],
+                    axis=1,
+                )
+                context = np.stack(
+                    [
+                        self._contexts.get(sid, np.zeros(context_size, np.float32))
+                        for sid in ids
+                    ]
+                )
+            sr = np.array(sample_rate, dtype=np.int64)
+
+            max_windows = max(len(batch[i].windows) for i in indices)
+            for step in range(max_windows):
+                # Rows whose chunk still has a window at this step
+                rows = [
+                    row for row, i in enumerate(indices) if step < len(batch[i].windows)
+                ]
+                windows = np.stack([batch[indices[row]].windows[step] for row in rows])
+                x = np.concatenate([context[rows], windows], axis=1)
+                out, new_state = self._session.run(
+                    None, {"input": x, "state": state[:, rows], "sr": sr}
+                )
+                state[:, rows] = new_state
+                context[rows] = x[:, -context_size:]
+                for row, prob in zip(rows, out[:, 0], strict=True):
+                    i = indices[row]
+                    probs[i] = max(probs[i], float(prob))
+
+            with self._state_lock:
+                for row, sid in enumerate(ids):
+                    if sid in released:
+                        continue
+                    self._states[sid] = state[:, row].copy()
+                    self._contexts[sid] = context[row].copy()
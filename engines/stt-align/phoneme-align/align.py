@@ -19,6 +19,8 @@ import torch
 from ctc_forced_align import CharSegment, backtrack, build_trellis, merge_repeats
 from model_loader import AlignModelMetadata
 
+from dalston.engine_sdk.prepared_audio import PreparedAudio
+
 logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 16_000
@@ -76,7 +78,7 @@ def align(
     transcript: list[InputSegment],
     model: Any,
     metadata: AlignModelMetadata,
-    audio: np.ndarray | torch.Tensor,
+    audio: np.ndarray | torch.Tensor | PreparedAudio,
     device: str,
     interpolate_method: str = "nearest",
     return_char_alignments: bool = False,
@@ -93,7 +95,9 @@ def align(
         transcript: List of segments with ``start``, ``end``, ``text`` keys.
         model: A loaded wav2vec2 alignment model.
         metadata: Model metadata including character dictionary.
-        audio: Audio waveform, 16 kHz mono. Shape ``(samples,)`` or ``(1, samples)``.
+        audio: Audio waveform, 16 kHz mono. Shape ``(samples,)`` or ``(1, samples)``,
+            or a memory-mapped :class:`PreparedAudio`, which is converted
+            to float32 one segment at a time.
         device: Torch device string.
         interpolate_method: Method for filling NaN timestamps (``"nearest"``).
         return_char_alignments: If True, include character-level detail
@@ -102,12 +106,16 @@ def align(
     Returns:
         AlignResult with aligned segments and a flat word list.
     """
-    if not isinstance(audio, torch.Tensor):
-        audio = torch.from_numpy(audio)
-    if len(audio.shape) == 1:
-        audio = audio.unsqueeze(0)
-
-    max_duration = audio.shape[1] / SAMPLE_RATE
+    if isinstance(audio, PreparedAudio):
+        prepared: PreparedAudio | None = audio
+        max_duration = audio.duration_s
+    else:
+        prepared = None
+        if not isinstance(audio, torch.Tensor):
+            audio = torch.from_numpy(audio)
+        if len(audio.shape) == 1:
+            audio = audio.unsqueeze(0)
+        max_duration = audio.shape[1] / SAMPLE_RATE
     dictionary = metadata.dictionary
     pipeline_type = metadata.pipeline_type
     lang = metadata.language
@@ -155,7 +163,10 @@ def align(
         # Extract audio slice
         f1 = int(t1 * SAMPLE_RATE)
         f2 = int(t2 * SAMPLE_RATE)
-        waveform = audio[:, f1:f2]
+        if prepared is not None:
+            waveform = torch.from_numpy(prepared[f1:f2].to_float32()).unsqueeze(0)
+        else:
+            waveform = audio[:, f1:f2]
 
         # wav2vec2 needs at least 400 samples (~25ms)
         lengths = None
@@ -171,7 +182,7 @@ def align(
                 emissions = model(waveform.to(device)).logits
             emissions = torch.log_softmax(emissions, dim=-1)
 
-        emission = emissions[0].cpu().detach()
+        emission = emissions[0].float().cpu().detach().numpy()
 
         # Determine blank token id
         blank_id = _find_blank_id(dictionary)
@@ -191,11 +202,11 @@ def align(
         char_segments = merge_repeats(path, text_clean)
 
         # Convert frame indices to absolute timestamps.
-        # ratio maps a frame index (0..trellis.size(0)-1) to seconds within
+        # ratio maps a frame index (0..trellis.shape[0]-1) to seconds within
         # the segment. Multiplying by waveform.size(1) was a bug that produced
         # timestamps in units of samples instead of seconds.
         duration = t2 - t1
-        ratio = duration / (trellis.size(0) - 1)
+        ratio = duration / (trellis.shape[0] - 1)
 
         char_timings = _assign_char_timestamps(text, sd, char_segments, ratio, t1, lang)
 
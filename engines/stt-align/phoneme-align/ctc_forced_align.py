@@ -17,9 +17,12 @@ Algorithm overview:
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from operator import itemgetter
 
-import torch
+import numpy as np
+from numpy.typing import ArrayLike
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,50 +45,71 @@ class _Point:
 
 
 def build_trellis(
-    emission: torch.Tensor,
+    emission: ArrayLike,
     tokens: list[int],
     blank_id: int = 0,
-) -> torch.Tensor:
+) -> np.ndarray:
     """Build the CTC alignment trellis (dynamic programming lattice).
 
     The trellis has shape (T, N) where T is the number of emission frames
     and N is the number of tokens. Each cell (t, n) holds the best cumulative
     log-probability of aligning tokens[0..n] to frames[0..t].
 
+    The recurrence is solved one token column at a time rather than one
+    frame at a time. Subtracting the cumulative blank score C turns "stay on
+    this token" into a running maximum, so each column is a handful of
+    vectorized ops over all T frames:
+
+        trellis[t, n] - C[t] = max over s <= t of
+            trellis[s - 1, n - 1] + token_emission[s - 1, n] - C[s]
+
+    Tokens per segment are far fewer than frames, so this replaces T Python
+    iterations with N. Accumulation is done in float64 to keep the
+    subtraction exact on long segments.
+
     Args:
-        emission: Log-softmax emission matrix of shape (T, V) where V is vocab size.
+        emission: Log-softmax emission matrix of shape (T, V) where V is vocab
+            size (numpy array or CPU tensor).
         tokens: Token indices to align. Use -1 for wildcard (unknown character).
         blank_id: CTC blank token index.
 
     Returns:
-        Trellis tensor of shape (T, N).
+        Float32 trellis array of shape (T, N).
     """
-    num_frames = emission.size(0)
+    emission = np.asarray(emission, dtype=np.float64)
+    num_frames = emission.shape[0]
     num_tokens = len(tokens)
 
-    trellis = torch.zeros((num_frames, num_tokens))
+    trellis = np.empty((num_frames, num_tokens), dtype=np.float64)
+
+    blank = emission[:, blank_id]
+    token_scores = _token_emission(emission, tokens, blank_id)
 
     # First column: cumulative blank probability (staying at first token)
-    trellis[1:, 0] = torch.cumsum(emission[1:, blank_id], 0)
-    # First row after (0,0): impossible to be at token>0 at frame 0
-    trellis[0, 1:] = -float("inf")
+    trellis[0, 0] = 0.0
+    trellis[1:, 0] = np.cumsum(blank[1:])
     # Prevent staying at first token too long when there are many tokens
-    trellis[-num_tokens + 1 :, 0] = float("inf")
-
-    for t in range(num_frames - 1):
-        trellis[t + 1, 1:] = torch.maximum(
-            # Stay at same token (emit blank)
-            trellis[t, 1:] + emission[t, blank_id],
-            # Advance to next token
-            trellis[t, :-1] + _token_emission(emission[t], tokens[1:], blank_id),
-        )
+    trellis[-num_tokens + 1 :, 0] = np.inf
 
-    return trellis
+    # C[t]: blank score accumulated over frames [0, t)
+    cum_blank = np.zeros(num_frames, dtype=np.float64)
+    np.cumsum(blank[:-1], out=cum_blank[1:])
+
+    advance = np.empty(num_frames, dtype=np.float64)
+    for n in range(1, num_tokens):
+        # Impossible to be at token>0 at frame 0
+        advance[0] = -np.inf
+        np.add(trellis[:-1, n - 1], token_scores[:-1, n], out=advance[1:])
+        advance[1:] -= cum_blank[1:]
+        np.maximum.accumulate(advance, out=trellis[:, n])
+        trellis[:, n] += cum_blank
+
+    return trellis.astype(np.float32)
 
 
 def backtrack(
-    trellis: torch.Tensor,
-    emission: torch.Tensor,
+    trellis: ArrayLike,
+    emission: ArrayLike,
     tokens: list[int],
     blank_id: int = 0,
     beam_width: int = 2,
@@ -95,6 +119,11 @@ def backtrack(
     Starting from the last frame and last token, traces backwards through
     the trellis to find the best alignment path.
 
+    Beams are indices into flat node lists holding each step's token,
+    probability and parent, so extending a beam appends one node instead
+    of copying its whole path, and trellis cells are read as plain floats
+    rather than as per-step tensor scalars.
+
     Args:
         trellis: The alignment trellis of shape (T, N).
         emission: Log-softmax emission matrix of shape (T, V).
@@ -106,71 +135,64 @@ def backtrack(
         Alignment path as a list of Points from first to last frame,
         or None if alignment failed.
     """
-    T = trellis.size(0) - 1  # noqa: N806
-    J = trellis.size(1) - 1  # noqa: N806
-
-    initial = _BeamState(
-        token_index=J,
-        time_index=T,
-        score=trellis[T, J],
-        path=[_Point(J, T, emission[T, blank_id].exp().item())],
-    )
-    beams = [initial]
-
-    while beams and beams[0].token_index > 0:
-        next_beams: list[_BeamState] = []
-
-        for beam in beams:
-            t, j = beam.time_index, beam.token_index
-            if t <= 0:
-                continue
-
-            p_stay = emission[t - 1, blank_id]
-            p_change = _token_emission(emission[t - 1], [tokens[j]], blank_id)[0]
-
-            stay_score = trellis[t - 1, j]
-            change_score = trellis[t - 1, j - 1] if j > 0 else float("-inf")
-
-            if not torch.isinf(stay_score):
-                new_path = beam.path.copy()
-                new_path.append(_Point(j, t - 1, p_stay.exp().item()))
-                next_beams.append(
-                    _BeamState(
-                        token_index=j,
-                        time_index=t - 1,
-                        score=stay_score,
-                        path=new_path,
-                    )
-                )
-
-            if j > 0 and not torch.isinf(change_score):
-                new_path = beam.path.copy()
-                new_path.append(_Point(j - 1, t - 1, p_change.exp().item()))
-                next_beams.append(
-                    _BeamState(
-                        token_index=j - 1,
-                        time_index=t - 1,
-                        score=change_score,
-                        path=new_path,
-                    )
-                )
-
-        beams = sorted(next_beams, key=lambda x: x.score, reverse=True)[:beam_width]
-        if not beams:
+    trellis = np.asarray(trellis)
+    emission = np.asarray(emission, dtype=np.float32)
+    T = trellis.shape[0] - 1  # noqa: N806
+    J = trellis.shape[1] - 1  # noqa: N806
+
+    p_stay = np.exp(emission[:, blank_id]).tolist()
+    token_scores = _token_emission(emission, tokens, blank_id)
+    # .item() reads a single cell as a Python float without a numpy scalar
+    score_at = trellis.item
+    token_score_at = token_scores.item
+
+    # Path nodes; each beam is (score, node index). Node k sits at frame
+    # T - depth(k), so only its token, probability and parent are stored.
+    node_token = [J]
+    node_prob = [p_stay[T]]
+    node_parent = [-1]
+    beams: list[tuple[float, int]] = [(score_at(T, J), 0)]
+
+    t = T
+    while beams and node_token[beams[0][1]] > 0:
+        if t <= 0:
+            beams = []
             break
 
+        candidates: list[tuple[float, int, float, int]] = []
+        for _score, node in beams:
+            j = node_token[node]
+
+            stay_score = score_at(t - 1, j)
+            if not math.isinf(stay_score):
+                candidates.append((stay_score, j, p_stay[t - 1], node))
+
+            change_score = score_at(t - 1, j - 1) if j > 0 else -math.inf
+            if j > 0 and not math.isinf(change_score):
+                p_change = math.exp(token_score_at(t - 1, j))
+                candidates.append((change_score, j - 1, p_change, node))
+
+        candidates.sort(key=itemgetter(0), reverse=True)
+        beams = []
+        for score, j, prob, parent in candidates[:beam_width]:
+            beams.append((score, len(node_token)))
+            node_token.append(j)
+            node_prob.append(prob)
+            node_parent.append(parent)
+        t -= 1
+
     if not beams:
         return None
 
-    best = beams[0]
-    t = best.time_index
-    j = best.token_index
-    while t > 0:
-        prob = emission[t - 1, blank_id].exp().item()
-        best.path.append(_Point(j, t - 1, prob))
-        t -= 1
+    # Remaining frames stay on the best beam's token (emit blank)
+    node = beams[0][1]
+    path = [_Point(node_token[node], k, p_stay[k]) for k in range(t)]
+    # Walk parents from the best node up to the last frame
+    for k in range(t, T + 1):
+        path.append(_Point(node_token[node], k, node_prob[node]))
+        node = node_parent[node]
 
-    return best.path[::-1]
+    return path
 
 
 def merge_repeats(path: list[_Point], transcript: str) -> list[CharSegment]:
@@ -207,21 +229,11 @@ def merge_repeats(path: list[_Point], transcript: str) -> list[CharSegment]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class _BeamState:
-    """Mutable state for a single beam during backtracking."""
-
-    token_index: int
-    time_index: int
-    score: float
-    path: list[_Point]
-
-
 def _token_emission(
-    frame_emission: torch.Tensor,
+    emission: ArrayLike,
     tokens: list[int],
     blank_id: int,
-) -> torch.Tensor:
+) -> np.ndarray:
     """Get emission scores for tokens, treating -1 as wildcard.
 
     Wildcard tokens (characters not in the model dictionary) receive the
@@ -229,22 +241,26 @@ def _token_emission(
     proceed even when some characters are missing from the vocabulary.
 
     Args:
-        frame_emission: Emission vector for a single frame, shape (V,).
+        emission: Emission scores of shape (V,) for one frame or (T, V)
+            for all frames.
         tokens: Token indices; -1 means wildcard.
         blank_id: CTC blank token index.
 
     Returns:
-        Tensor of emission scores, one per token.
+        Array of emission scores, one per token (per frame).
     """
-    tokens_t = torch.tensor(tokens) if not isinstance(tokens, torch.Tensor) else tokens
-    wildcard_mask = tokens_t == -1
+    emission = np.asarray(emission)
+    tokens_a = np.asarray(tokens, dtype=np.int64)
+    wildcard_mask = tokens_a == -1
 
     # Regular scores (clamp to avoid -1 indexing)
-    regular_scores = frame_emission[tokens_t.clamp(min=0).long()]
+    regular_scores = emission[..., np.maximum(tokens_a, 0)]
+    if not wildcard_mask.any():
+        return regular_scores
 
     # Wildcard score: max non-blank emission
-    masked = frame_emission.clone()
-    masked[blank_id] = float("-inf")
-    max_score = masked.max()
+    masked = emission.copy()
+    masked[..., blank_id] = -np.inf
+    max_score = masked.max(axis=-1, keepdims=True)
 
-    return torch.where(wildcard_mask, max_score, regular_scores)
+    return np.where(wildcard_mask, max_score, regular_scores)
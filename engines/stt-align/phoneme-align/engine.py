@@ -11,9 +11,8 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
-import soundfile as sf
 import torch
-from align import AlignedSegment, InputSegment, align
+from align import SAMPLE_RATE, AlignedSegment, InputSegment, align
 from model_loader import AlignModelMetadata, load_align_model
 
 from dalston.engine_sdk import (
@@ -28,6 +27,11 @@ from dalston.engine_sdk import (
     Word,
     detect_device,
 )
+from dalston.engine_sdk.prepared_audio import (
+    PreparedAudio,
+    load_audio_f32,
+    open_prepared_audio,
+)
 
 
 class PhonemeAlignEngine(Engine):
@@ -223,16 +227,17 @@ class PhonemeAlignEngine(Engine):
         finally:
             self._set_runtime_state(loaded_model=loaded_model_id, status="idle")
 
-    def _load_audio(self, audio_path: Path) -> np.ndarray:
-        """Load audio file as float32 numpy array.
+    def _load_audio(self, audio_path: Path) -> np.ndarray | PreparedAudio:
+        """Memory-map the prepared WAV, or decode it to a float32 array.
 
         The SDK's ensure_audio_format() guarantees 16 kHz mono before
-        process() is called, so no resampling is needed here.
+        process() is called, so the mapped path is the normal case and
+        align() converts one segment window at a time.
         """
-        data, _ = sf.read(str(audio_path), dtype="float32")
-        if data.ndim > 1:
-            data = data.mean(axis=1)
-        return data
+        prepared = open_prepared_audio(audio_path, SAMPLE_RATE)
+        if prepared is not None:
+            return prepared
+        return load_audio_f32(audio_path, SAMPLE_RATE)
 
     def _to_sdk_segments(
         self,
@@ -25,6 +25,7 @@ from dalston.engine_sdk.diarize_chunking import (
     overlap_stats_from_turns,
     run_chunked_diarization,
 )
+from dalston.engine_sdk.speech_regions import load_speech_regions
 
 
 class PyannoteEngine(Engine):
@@ -41,6 +42,8 @@ class PyannoteEngine(Engine):
     Environment Variables:
         HF_TOKEN: HuggingFace token for accessing gated pyannote models
         DALSTON_DEVICE: Device to use ("cuda", "mps", "cpu", or unset for auto-detect)
+        DALSTON_DIARIZE_CHUNK_WORKERS: Worker processes for chunked diarization
+            on CPU (default 1 = sequential)
     """
 
     def __init__(self) -> None:
@@ -51,10 +54,12 @@ class PyannoteEngine(Engine):
         self._max_chunk_s = float(
             os.environ.get("DALSTON_MAX_DIARIZE_CHUNK_S", DEFAULT_MAX_CHUNK_S)
         )
+        self._chunk_workers = int(os.environ.get("DALSTON_DIARIZE_CHUNK_WORKERS", "1"))
         self.logger.info(
             "pyannote_4_0_engine_initialized",
             device=self._device,
             max_chunk_s=self._max_chunk_s,
+            chunk_workers=self._chunk_workers,
         )
 
     def _get_hf_token(self, config: dict[str, Any]) -> str:
@@ -206,6 +211,12 @@ class PyannoteEngine(Engine):
                     )
 
             if use_chunked:
+                # Prepare's speech regions (when bound) keep chunk ends out
+                # of speech; read once for every backoff pass
+                regions = load_speech_regions(task_request)
+                speech_regions = (
+                    [(r.start, r.end) for r in regions] if regions else None
+                )
                 # Chunked path with OOM backoff on chunk size
                 while max_chunk_s >= 30:
                     try:
@@ -218,6 +229,9 @@ class PyannoteEngine(Engine):
                             convert_annotation=self._convert_annotation,
                             exclusive=bool(exclusive),
                             max_chunk_s=max_chunk_s,
+                            speech_regions=speech_regions,
+                            cpu_workers=self._chunk_workers,
+                            pipeline_model_id=loaded_model_id,
                             log=self.logger,
                         )
                         break
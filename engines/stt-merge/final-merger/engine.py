@@ -15,6 +15,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from dalston.common.artifacts import build_task_artifact_id
+from dalston.common.speaker_turns import SpeakerTurnIndex
 from dalston.engine_sdk import (
     BatchTaskContext,
     Engine,
@@ -172,6 +173,7 @@ class FinalMergerEngine(Engine):
 
         # Build segments with IDs and speaker assignments
         segments: list[MergedSegment] = []
+        turn_index = SpeakerTurnIndex(diarization_turns)
         for idx, seg in enumerate(segments_source):
             # Handle TranscriptSegment, Segment, and raw dict
             if isinstance(seg, TranscriptSegment):
@@ -208,9 +210,7 @@ class FinalMergerEngine(Engine):
             # Assign speaker based on diarization overlap
             speaker = None
             if diarization_turns:
-                speaker = self._find_speaker_by_overlap(
-                    seg_start, seg_end, diarization_turns
-                )
+                speaker = self._find_speaker_by_overlap(seg_start, seg_end, turn_index)
 
             # Normalize words
             words: list[Word] | None = None
@@ -1128,7 +1128,7 @@ class FinalMergerEngine(Engine):
         self,
         seg_start: float,
         seg_end: float,
-        speaker_turns: list[SpeakerTurn],
+        speaker_turns: list[SpeakerTurn] | SpeakerTurnIndex,
     ) -> str | None:
         """Find the speaker with maximum overlap for a transcript segment.
 
@@ -1139,7 +1139,8 @@ class FinalMergerEngine(Engine):
         Args:
             seg_start: Transcript segment start time (seconds)
             seg_end: Transcript segment end time (seconds)
-            speaker_turns: List of SpeakerTurn objects
+            speaker_turns: SpeakerTurn objects, ideally pre-indexed so only
+                turns near the segment are visited
 
         Returns:
             Speaker ID with maximum overlap, or None if no overlap found
@@ -1150,7 +1151,7 @@ class FinalMergerEngine(Engine):
         # Calculate overlap for each speaker
         speaker_overlaps: dict[str, float] = {}
 
-        for turn in speaker_turns:
+        for turn in SpeakerTurnIndex.of(speaker_turns).overlapping(seg_start, seg_end):
             # Calculate overlap: max(0, min(end1, end2) - max(start1, start2))
             overlap_start = max(seg_start, turn.start)
             overlap_end = min(seg_end, turn.end)
@@ -9,7 +9,7 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from dalston.common.artifacts import build_task_artifact_id
+from dalston.common.artifacts import ProducedArtifact, build_task_artifact_id
 from dalston.common.pipeline_types import SpeechRegion
 from dalston.engine_sdk import (
     AudioMedia,
@@ -89,23 +89,57 @@ class AudioPrepareEngine(Engine):
             return False
 
     def _detect_speech_regions(
-        self, audio_paths: list[Path], total_duration: float
-    ) -> tuple[list[SpeechRegion] | None, float | None]:
+        self,
+        audio_paths: list[Path],
+        total_duration: float,
+        ctx: BatchTaskContext,
+        channels: list[int] | None = None,
+    ) -> tuple[list[SpeechRegion] | None, float | None, list[ProducedArtifact]]:
         """Run Silero VAD over prepared files; union regions across channels.
 
-        The regions ground the assembler's missed-speech coverage check
-        (M92.7/R1). Degrades gracefully to (None, None) when the VAD stack
-        (onnxruntime + pre-baked Silero model) is unavailable in this
-        container — detection is best-effort, never a job failure.
+        The union grounds the assembler's missed-speech coverage check
+        (M92.7/R1). Each file's own regions are also published as a
+        speech-regions artifact (one per channel) that transcribe and
+        diarize reuse instead of running VAD again. Degrades gracefully to
+        (None, None, []) when the VAD stack (onnxruntime + pre-baked Silero
+        model) is unavailable in this container — detection is
+        best-effort, never a job failure.
         """
+        channels = channels if channels is not None else [0] * len(audio_paths)
         try:
+            from dalston.engine_sdk.speech_regions import (
+                SPEECH_REGIONS_KIND,
+                SPEECH_REGIONS_MEDIA_TYPE,
+                write_speech_regions,
+            )
             from dalston.engine_sdk.vad import VadChunker
 
             chunker = VadChunker()
             intervals: list[tuple[float, float]] = []
-            for path in audio_paths:
-                for seg in chunker.detect_speech(path):
-                    intervals.append((float(seg.start), float(seg.end)))
+            produced: list[ProducedArtifact] = []
+            for path, channel in zip(audio_paths, channels, strict=True):
+                segments = chunker.detect_speech(path)
+                intervals.extend((float(seg.start), float(seg.end)) for seg in segments)
+                logical_name = (
+                    "speech_regions"
+                    if len(audio_paths) == 1
+                    else f"speech_regions_ch{channel}"
+                )
+                produced.append(
+                    ctx.describe_artifact(
+                        logical_name=logical_name,
+                        local_path=write_speech_regions(
+                            path.parent / f"{logical_name}.json",
+                            segments,
+                            total_duration,
+                            chunker,
+                        ),
+                        kind=SPEECH_REGIONS_KIND,
+                        channel=channel,
+                        role="prepared",
+                        media_type=SPEECH_REGIONS_MEDIA_TYPE,
+                    )
+                )
         except Exception:
             self.logger.warning(
                 "speech_region_detection_unavailable",
@@ -113,7 +147,7 @@ class AudioPrepareEngine(Engine):
                 message="Continuing without speech regions; the missed-speech "
                 "coverage check will be inactive for this job",
             )
-            return None, None
+            return None, None, []
 
         merged = _merge_intervals(intervals)
         regions = [
@@ -132,7 +166,7 @@ class AudioPrepareEngine(Engine):
             speech_s=round(speech_total, 1),
             speech_ratio=speech_ratio,
         )
-        return regions, speech_ratio
+        return regions, speech_ratio, produced
 
     @staticmethod
     def _build_source_media(
@@ -252,10 +286,14 @@ class AudioPrepareEngine(Engine):
 
         speech_regions = None
         speech_ratio = None
+        produced_artifacts = [produced]
         if params.detect_speech_regions:
-            speech_regions, speech_ratio = self._detect_speech_regions(
-                [prepared_path], prepared_metadata["duration"]
+            speech_regions, speech_ratio, region_artifacts = (
+                self._detect_speech_regions(
+                    [prepared_path], prepared_metadata["duration"], ctx
+                )
             )
+            produced_artifacts.extend(region_artifacts)
 
         output = PreparationResponse(
             channel_files=[prepared],
@@ -266,7 +304,7 @@ class AudioPrepareEngine(Engine):
             engine_id="audio-prepare",
         )
 
-        return TaskResponse(data=output, produced_artifacts=[produced])
+        return TaskResponse(data=output, produced_artifacts=produced_artifacts)
 
     def _process_split_channels(
         self,
@@ -353,9 +391,15 @@ class AudioPrepareEngine(Engine):
                 audio_path.parent / f"prepared_ch{i}.wav"
                 for i in range(len(channel_files))
             ]
-            speech_regions, speech_ratio = self._detect_speech_regions(
-                channel_paths, source_media.duration
+            speech_regions, speech_ratio, region_artifacts = (
+                self._detect_speech_regions(
+                    channel_paths,
+                    source_media.duration,
+                    ctx,
+                    channels=list(range(len(channel_files))),
+                )
             )
+            produced_artifacts.extend(region_artifacts)
 
         # Build typed output
         output = PreparationResponse(
@@ -15,6 +15,11 @@ Environment variables (in addition to each adapter's own env vars):
     DALSTON_RT_RESERVATION: Min slots reserved for realtime (default: 2)
     DALSTON_BATCH_MAX_INFLIGHT: Max concurrent batch tasks (default: 4)
     DALSTON_TOTAL_CAPACITY: Total engine capacity (default: 6)
+    DALSTON_RT_LATENCY_TARGET_MS: RT p95 latency target; enables adaptive
+        batch limits and batch yielding between decode windows (default: off)
+    DALSTON_BATCH_MIN_INFLIGHT: Batch limit floor when adapting (default: 1)
+    DALSTON_BATCH_YIELD_MAX_S: Max pause per decode window for batch (default: 10)
+    DALSTON_BATCH_ADMIT_WAIT_S: Wait for a batch slot before deferring (default: 0)
 
 """
 
@@ -24,6 +29,7 @@ import asyncio
 import os
 import signal
 import threading
+import time
 from typing import Any
 
 import structlog
@@ -97,7 +103,9 @@ class UnifiedFasterWhisperRunner:
         original_process = self._batch_engine.process
 
         def admitted_process(task_request, ctx):
-            if not self._admission.admit_batch():
+            if not self._admission.admit_batch(
+                wait_s=self._admission.config.batch_admit_wait_s
+            ):
                 logger.info(
                     "batch_task_rejected_by_admission",
                     task_id=task_request.task_id,
@@ -105,7 +113,8 @@ class UnifiedFasterWhisperRunner:
                 )
                 raise BatchRejectedError("Admission controller rejected batch task")
             try:
-                return original_process(task_request, ctx)
+                with self._admission.preemptible():
+                    return original_process(task_request, ctx)
             finally:
                 self._admission.release_batch()
 
@@ -134,6 +143,19 @@ class UnifiedFasterWhisperRunner:
 
         self._rt_engine._handle_connection = admitted_handle
 
+        # Report RT inference latency so the controller can adapt batch
+        original_transcribe = self._rt_engine.transcribe_v1
+
+        def timed_transcribe(audio, params):
+            self._admission.rt_inference_started()
+            start = time.perf_counter()
+            try:
+                return original_transcribe(audio, params)
+            finally:
+                self._admission.rt_inference_finished(time.perf_counter() - start)
+
+        self._rt_engine.transcribe_v1 = timed_transcribe
+
         # Start the batch engine's HTTP server (TranscribeHTTPServer) on
         # port 9100 BEFORE the RT engine starts.  This gives the FastAPI
         # server the port, so /v1/transcribe is available.  The RT engine's
@@ -20,6 +20,7 @@ Environment variables:
     DALSTON_MODEL_PRELOAD: ASR model to preload on startup (optional)
     DALSTON_DEFAULT_DIARIZE_MODEL: Pyannote model (default: pyannote/speaker-diarization-community-1)
     DALSTON_MAX_DIARIZE_CHUNK_S: Max diarization chunk seconds (default: 3600)
+    DALSTON_DIARIZE_CHUNK_WORKERS: Chunked diarization worker processes on CPU (default: 1)
     HF_TOKEN: HuggingFace token for pyannote gated models
 """
 
@@ -93,6 +94,7 @@ class HfAsrAlignPyannoteEngine(BaseBatchTranscribeEngine):
         self._max_chunk_s = float(
             os.environ.get("DALSTON_MAX_DIARIZE_CHUNK_S", DEFAULT_MAX_CHUNK_S)
         )
+        self._chunk_workers = int(os.environ.get("DALSTON_DIARIZE_CHUNK_WORKERS", "1"))
 
         # ASR model manager (TTL/LRU lifecycle)
         if manager is not None:
@@ -647,6 +649,8 @@ class HfAsrAlignPyannoteEngine(BaseBatchTranscribeEngine):
                             convert_annotation=self._convert_annotation,
                             exclusive=bool(exclusive),
                             max_chunk_s=max_chunk_s,
+                            cpu_workers=self._chunk_workers,
+                            pipeline_model_id=loaded_model_id,
                             log=self.logger,
                         )
                         break
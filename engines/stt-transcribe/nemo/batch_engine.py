@@ -39,9 +39,12 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from dalston.common.pipeline_types import (
     AlignmentMethod,
     Transcript,
+    TranscriptionRequest,
     TranscriptSegment,
     TranscriptWord,
 )
@@ -51,7 +54,10 @@ from dalston.engine_sdk import (
     TaskRequest,
 )
 from dalston.engine_sdk.base_transcribe import BaseBatchTranscribeEngine
-from dalston.engine_sdk.inference.nemo_inference import NemoInference
+from dalston.engine_sdk.inference.nemo_inference import (
+    NemoInference,
+    NeMoTranscriptionResult,
+)
 
 # Default per-chunk audio ceiling on L4-class GPUs. Parakeet with local
 # attention grows activation linearly at ~3 MB/audio-s, peaking near
@@ -391,9 +397,29 @@ class NemoBatchEngine(BaseBatchTranscribeEngine):
         Returns:
             Transcript with text, segments, and words
         """
+        return self._transcribe(task_request)[0]
+
+    def transcribe_audio_batch(
+        self,
+        task_request: TaskRequest,
+        audio: list[np.ndarray],
+        ctx: BatchTaskContext,
+    ) -> list[Transcript]:
+        """Transcribe long-audio chunks in a single NeMo ``transcribe`` call.
+
+        Used by the base engine's chunked path; chunks arrive as in-memory
+        arrays so no temp WAV files are written or decoded.
+        """
+        return self._transcribe(task_request, audio)
+
+    def _transcribe(
+        self,
+        task_request: TaskRequest,
+        audio: list[np.ndarray] | None = None,
+    ) -> list[Transcript]:
+        """Run Parakeet on the task's audio file, or on ``audio`` if given."""
         audio_path = task_request.audio_path
         params = task_request.get_transcribe_params()
-        channel = params.channel
         vocabulary = params.vocabulary
 
         loaded_model_id = params.loaded_model_id or self._default_model_id
@@ -428,16 +454,27 @@ class NemoBatchEngine(BaseBatchTranscribeEngine):
             self.logger.info(
                 "transcribing",
                 audio_path=str(audio_path),
+                input_count=1 if audio is None else len(audio),
                 batch_size=adaptive_batch_size,
                 vocabulary_enabled=vocabulary_enabled,
             )
 
-            core_result = self._core.transcribe_with_model(
-                model,
-                str(audio_path),
-                batch_size=adaptive_batch_size,
-                model_id=model_id,
-            )
+            if audio is None:
+                core_results = [
+                    self._core.transcribe_with_model(
+                        model,
+                        str(audio_path),
+                        batch_size=adaptive_batch_size,
+                        model_id=model_id,
+                    )
+                ]
+            else:
+                core_results = self._core.transcribe_batch_with_model(
+                    model,
+                    list(audio),
+                    batch_size=adaptive_batch_size,
+                    model_id=model_id,
+                )
         finally:
             if vocab_file is not None:
                 try:
@@ -447,6 +484,30 @@ class NemoBatchEngine(BaseBatchTranscribeEngine):
                     pass
             self._core.manager.release(model_id)
 
+        return [
+            self._to_transcript(
+                core_result,
+                params,
+                model_id=model_id,
+                alignment_method=alignment_method,
+                vocabulary_enabled=vocabulary_enabled,
+            )
+            for core_result in core_results
+        ]
+
+    def _to_transcript(
+        self,
+        core_result: NeMoTranscriptionResult,
+        params: TranscriptionRequest,
+        *,
+        model_id: str,
+        alignment_method: AlignmentMethod,
+        vocabulary_enabled: bool,
+    ) -> Transcript:
+        """Convert a core result to a Transcript with request warnings."""
+        channel = params.channel
+        vocabulary = params.vocabulary
+
         # Convert core result to Transcript format
         segments: list[TranscriptSegment] = []
         all_words: list[TranscriptWord] = []
@@ -19,6 +19,9 @@ Environment variables:
     DALSTON_MODEL_PRELOAD: Model to preload on startup (optional)
     DALSTON_DEVICE: Device to use for inference (cuda, cpu). Defaults to cpu.
     DALSTON_QUANTIZATION: ONNX quantization level (none, int8). Defaults to none.
+    DALSTON_REALTIME_ASR_BATCH: Batch utterances across sessions (default: true)
+    DALSTON_REALTIME_ASR_BATCH_WAIT_MS: Max wait for a batch to fill (default: 10)
+    DALSTON_REALTIME_ASR_BATCH_MAX: Max utterances per batch (default: 16)
 """
 
 import os
@@ -131,7 +134,37 @@ class OnnxRealtimeEngine(BaseRealtimeTranscribeEngine):
 
         # Delegate to shared core
         result = self._core.transcribe(audio, model_id)
+        return self._to_transcript(result, language)
 
+    def transcribe_batch(
+        self, audios: list[np.ndarray], params: TranscriptionRequest
+    ) -> list[Transcript]:
+        """Transcribe utterances from concurrent sessions in one model call.
+
+        Args:
+            audios: Utterances as float32 numpy arrays, mono, 16kHz
+            params: Transcriber parameters shared by every utterance
+
+        Returns:
+            One Transcript per utterance, in input order
+        """
+        if self._core is None:
+            raise RuntimeError(
+                "OnnxInference not initialized — call load_models() first"
+            )
+
+        model_id = self._normalize_model_id(
+            params.loaded_model_id or self.DEFAULT_MODEL
+        )
+        language = params.language or "auto"
+        results = self._core.transcribe_batch(audios, model_id)
+        return [self._to_transcript(result, language) for result in results]
+
+    def supports_batched_transcribe(self) -> bool:
+        """The shared core decodes a padded batch of utterances in one pass."""
+        return True
+
+    def _to_transcript(self, result: Any, language: str) -> Transcript:
         resolved_lang = language if language != "auto" else "en"
         return self.build_transcript_from_core_result(
             result,
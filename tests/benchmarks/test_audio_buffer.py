@@ -0,0 +1,76 @@
+"""Micro-benchmark for realtime AudioBuffer throughput.
+
+Feeds 16 kHz PCM in 20 ms frames (a typical WebSocket frame size) and drains
+100 ms chunks, comparing the float32 array-backed ``AudioBuffer`` with the
+previous ``list[float]`` implementation.  Reports how many realtime sessions
+one core could buffer, i.e. seconds of audio per CPU second.
+
+Usage:
+    pytest tests/benchmarks/test_audio_buffer.py -m benchmark -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from dalston.realtime_sdk.session import AudioBuffer
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+AUDIO_SECONDS = 120
+
+
+class _ListAudioBuffer:
+    """The list-backed buffer AudioBuffer used before (baseline)."""
+
+    def __init__(self, sample_rate: int, chunk_duration_ms: int = 100) -> None:
+        self.chunk_samples = int(sample_rate * chunk_duration_ms / 1000)
+        self._buffer: list[float] = []
+
+    def add(self, data: bytes) -> None:
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+        self._buffer.extend(samples.tolist())
+
+    def get_chunk(self) -> np.ndarray | None:
+        if len(self._buffer) < self.chunk_samples:
+            return None
+        chunk = np.array(self._buffer[: self.chunk_samples], dtype=np.float32)
+        self._buffer = self._buffer[self.chunk_samples :]
+        return chunk
+
+
+def _frames() -> list[bytes]:
+    rng = np.random.default_rng(0)
+    frame_samples = SAMPLE_RATE * FRAME_MS // 1000
+    n_frames = AUDIO_SECONDS * 1000 // FRAME_MS
+    pcm = rng.integers(-20000, 20000, frame_samples * n_frames, dtype=np.int16)
+    return [chunk.tobytes() for chunk in np.split(pcm, n_frames)]
+
+
+def _sessions_per_core(buffer, frames: list[bytes]) -> float:
+    start = time.process_time()
+    for frame in frames:
+        buffer.add(frame)
+        while buffer.get_chunk() is not None:
+            pass
+    cpu_seconds = time.process_time() - start
+    return AUDIO_SECONDS / max(cpu_seconds, 1e-9)
+
+
+@pytest.mark.benchmark
+def test_array_buffer_outperforms_list_buffer() -> None:
+    frames = _frames()
+
+    before = _sessions_per_core(_ListAudioBuffer(SAMPLE_RATE), frames)
+    after = _sessions_per_core(
+        AudioBuffer(sample_rate=SAMPLE_RATE, encoding="pcm_s16le"), frames
+    )
+
+    print(
+        f"\nAudioBuffer sessions/core: list={before:,.0f} "
+        f"array={after:,.0f} ({after / before:.1f}x)"
+    )
+    assert after > before
@@ -0,0 +1,140 @@
+"""Benchmark for the phoneme-align CTC forced alignment core.
+
+Aligns a synthetic one-minute segment (50 emission frames/s, as wav2vec2
+produces) with the vectorized trellis and index-based backtrack, and with
+the previous per-frame torch implementation kept below as the baseline.
+Both must produce the same path.
+
+Usage:
+    pytest tests/benchmarks/test_ctc_forced_align.py -m benchmark -s
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+FRAMES = 3000  # 60 s at 20 ms per frame
+TOKENS = 900  # ~15 characters per second
+VOCAB = 32
+
+
+def _load_ctc_module():
+    path = Path("engines/stt-align/phoneme-align/ctc_forced_align.py")
+    spec = importlib.util.spec_from_file_location("ctc_forced_align", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["ctc_forced_align"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Baseline: the per-frame torch implementation used before
+# ---------------------------------------------------------------------------
+
+
+def _token_emission(frame_emission, tokens, blank_id):
+    tokens_t = torch.tensor(tokens)
+    regular_scores = frame_emission[tokens_t.clamp(min=0).long()]
+    masked = frame_emission.clone()
+    masked[blank_id] = float("-inf")
+    return torch.where(tokens_t == -1, masked.max(), regular_scores)
+
+
+def _baseline_trellis(emission, tokens, blank_id=0):
+    num_frames = emission.size(0)
+    num_tokens = len(tokens)
+    trellis = torch.zeros((num_frames, num_tokens))
+    trellis[1:, 0] = torch.cumsum(emission[1:, blank_id], 0)
+    trellis[0, 1:] = -float("inf")
+    trellis[-num_tokens + 1 :, 0] = float("inf")
+    for t in range(num_frames - 1):
+        trellis[t + 1, 1:] = torch.maximum(
+            trellis[t, 1:] + emission[t, blank_id],
+            trellis[t, :-1] + _token_emission(emission[t], tokens[1:], blank_id),
+        )
+    return trellis
+
+
+@dataclass
+class _Beam:
+    token_index: int
+    time_index: int
+    score: float
+    path: list[tuple[int, int, float]]
+
+
+def _baseline_backtrack(trellis, emission, tokens, blank_id=0, beam_width=2):
+    T = trellis.size(0) - 1  # noqa: N806
+    J = trellis.size(1) - 1  # noqa: N806
+    beams = [_Beam(J, T, trellis[T, J], [(J, T, emission[T, blank_id].exp().item())])]
+    while beams and beams[0].token_index > 0:
+        next_beams = []
+        for beam in beams:
+            t, j = beam.time_index, beam.token_index
+            if t <= 0:
+                continue
+            p_stay = emission[t - 1, blank_id]
+            p_change = _token_emission(emission[t - 1], [tokens[j]], blank_id)[0]
+            stay_score = trellis[t - 1, j]
+            change_score = trellis[t - 1, j - 1] if j > 0 else float("-inf")
+            if not torch.isinf(stay_score):
+                path = beam.path + [(j, t - 1, p_stay.exp().item())]
+                next_beams.append(_Beam(j, t - 1, stay_score, path))
+            if j > 0 and not torch.isinf(change_score):
+                path = beam.path + [(j - 1, t - 1, p_change.exp().item())]
+                next_beams.append(_Beam(j - 1, t - 1, change_score, path))
+        beams = sorted(next_beams, key=lambda x: x.score, reverse=True)[:beam_width]
+    if not beams:
+        return None
+    best = beams[0]
+    for t in range(best.time_index, 0, -1):
+        prob = emission[t - 1, blank_id].exp().item()
+        best.path.append((best.token_index, t - 1, prob))
+    return best.path[::-1]
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmark
+def test_vectorized_alignment_outperforms_per_frame_loop() -> None:
+    ctc = _load_ctc_module()
+    generator = torch.Generator().manual_seed(0)
+    emission = torch.log_softmax(
+        torch.randn(FRAMES, VOCAB, generator=generator) * 3, dim=-1
+    )
+    tokens = torch.randint(1, VOCAB, (TOKENS,), generator=generator).tolist()
+
+    start = time.perf_counter()
+    trellis = _baseline_trellis(emission, tokens)
+    expected = _baseline_backtrack(trellis, emission, tokens)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    emission_np = emission.numpy()
+    path = ctc.backtrack(ctc.build_trellis(emission_np, tokens), emission_np, tokens)
+    after = time.perf_counter() - start
+
+    print(
+        f"\nCTC align {FRAMES} frames x {TOKENS} tokens: "
+        f"per-frame={before * 1000:.0f} ms vectorized={after * 1000:.0f} ms "
+        f"({before / after:.1f}x)"
+    )
+    assert expected is not None and path is not None
+    assert [(p.token_index, p.time_index) for p in path] == [
+        (j, t) for j, t, _ in expected
+    ]
+    np.testing.assert_allclose(
+        [p.score for p in path], [s for _, _, s in expected], rtol=1e-5
+    )
+    assert after < before
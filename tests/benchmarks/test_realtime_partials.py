@@ -0,0 +1,99 @@
+"""Partial-result cost for short and long realtime utterances.
+
+Emits a partial every 500 ms over a 5 s and a 60 s utterance, once
+re-decoding the whole utterance for each partial (the ``full`` mode used
+before) and once with ``IncrementalPartialDecoder``. A fake recogniser
+stands in for the model, so cost is reported as seconds of audio decoded
+per partial, which is what drives model time.
+
+Usage:
+    pytest tests/benchmarks/test_realtime_partials.py -m benchmark -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from dalston.common.pipeline_types import Transcript
+from dalston.realtime_sdk.partials import IncrementalPartialDecoder
+
+SAMPLE_RATE = 16000
+WORD_S = 0.4
+CHUNKS_PER_PARTIAL = 5  # 100 ms chunks, as in SessionHandler
+
+
+def _speech(seconds: float) -> list[np.ndarray]:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = np.floor(t / WORD_S).astype(np.float32)
+    step = SAMPLE_RATE // 10
+    return [audio[i : i + step] for i in range(0, len(audio), step)]
+
+
+def _recognize(audio: np.ndarray) -> Transcript:
+    edges = np.flatnonzero(np.diff(audio)) + 1
+    bounds = [0, *edges.tolist(), len(audio)]
+    words = [
+        {
+            "text": f"w{int(audio[lo])}",
+            "start": lo / SAMPLE_RATE,
+            "end": hi / SAMPLE_RATE,
+        }
+        for lo, hi in zip(bounds, bounds[1:], strict=False)
+    ]
+    return Transcript.model_validate(
+        {
+            "text": " ".join(w["text"] for w in words),
+            "segments": [
+                {
+                    "start": 0.0,
+                    "end": bounds[-1] / SAMPLE_RATE,
+                    "text": "",
+                    "words": words,
+                }
+            ],
+            "language": "en",
+            "engine_id": "bench",
+        }
+    )
+
+
+def _partials(seconds: float, incremental: bool) -> tuple[float, float]:
+    """Mean seconds of audio decoded per partial and total wall time."""
+    chunks = _speech(seconds)
+    decoder = IncrementalPartialDecoder(SAMPLE_RATE)
+    decoded: list[float] = []
+    start = time.perf_counter()
+    for n in range(CHUNKS_PER_PARTIAL, len(chunks) + 1, CHUNKS_PER_PARTIAL):
+        if incremental:
+            window = decoder.window(chunks[:n])
+            decoder.update(window, _recognize(window.audio))
+            decoded.append(len(window.audio) / SAMPLE_RATE)
+        else:
+            audio = np.concatenate(chunks[:n])
+            _recognize(audio)
+            decoded.append(len(audio) / SAMPLE_RATE)
+    return sum(decoded) / len(decoded), time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_incremental_partial_cost_is_flat() -> None:
+    results = {
+        (seconds, mode): _partials(seconds, mode == "incremental")
+        for seconds in (5.0, 60.0)
+        for mode in ("full", "incremental")
+    }
+
+    print("\nAudio decoded per partial (every 500 ms):")
+    for (seconds, mode), (per_partial, wall) in results.items():
+        print(
+            f"  {seconds:4.0f} s utterance, {mode:11s}: "
+            f"{per_partial:5.2f} s/partial, {wall * 1000:7.1f} ms total"
+        )
+
+    short = results[(5.0, "incremental")][0]
+    long = results[(60.0, "incremental")][0]
+    assert long < short * 1.5
+    assert results[(60.0, "full")][0] > 10 * long
@@ -0,0 +1,110 @@
+"""Scaling benchmark for word-level speaker assignment.
+
+Assigns speakers to the words of a synthetic 3-hour meeting against 1 to
+10k diarization turns, comparing the indexed lookups used by transcript
+assembly with the previous linear scan over every turn (kept below as the
+baseline). Both must assign the same speakers.
+
+Usage:
+    pytest tests/benchmarks/test_speaker_assignment.py -m benchmark -s
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from dalston.common.pipeline_types import SpeakerTurn, Word
+from dalston.common.speaker_turns import SpeakerTurnIndex
+from dalston.common.transcript import _assign_speaker_to_word
+
+DURATION_S = 3 * 3600.0
+WORDS = 2000  # sampled from ~10k; the baseline is O(words x turns)
+TURN_COUNTS = (1, 10, 100, 1000, 10000)
+
+
+# ---------------------------------------------------------------------------
+# Baseline: linear scans used before
+# ---------------------------------------------------------------------------
+
+
+def _baseline_overlap(start: float, end: float, turns: list[SpeakerTurn]):
+    best, best_overlap = None, 0.0
+    for turn in turns:
+        overlap = max(0.0, min(end, turn.end) - max(start, turn.start))
+        if overlap > best_overlap:
+            best, best_overlap = turn.speaker, overlap
+    return best
+
+
+def _baseline_nearest(at_time: float, turns: list[SpeakerTurn]):
+    nearest, nearest_distance = None, None
+    for turn in turns:
+        if turn.start <= at_time <= turn.end:
+            return turn.speaker
+        distance = turn.start - at_time if at_time < turn.start else at_time - turn.end
+        if nearest_distance is None or distance < nearest_distance:
+            nearest, nearest_distance = turn.speaker, distance
+    return nearest
+
+
+def _baseline_assign(word: Word, turns: list[SpeakerTurn]):
+    if word.text.rstrip().endswith((".", "!", "?")):
+        for turn in turns:
+            if turn.start <= word.start <= turn.end:
+                return turn.speaker
+    speaker = _baseline_overlap(word.start, word.end, turns)
+    if speaker is not None:
+        return speaker
+    return _baseline_nearest((word.start + word.end) / 2.0, turns)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _turns(count: int, rng: random.Random) -> list[SpeakerTurn]:
+    bounds = sorted(rng.uniform(0, DURATION_S) for _ in range(2 * count))
+    return [
+        SpeakerTurn(start=bounds[2 * i], end=bounds[2 * i + 1], speaker=f"S{i % 6}")
+        for i in range(count)
+    ]
+
+
+def _words(rng: random.Random) -> list[Word]:
+    words = []
+    for i in range(WORDS):
+        start = rng.uniform(0, DURATION_S)
+        text = "end." if i % 12 == 0 else "word"
+        words.append(Word(text=text, start=start, end=start + rng.uniform(0.1, 0.6)))
+    return sorted(words, key=lambda w: w.start)
+
+
+@pytest.mark.benchmark
+def test_indexed_assignment_scales_with_turn_count() -> None:
+    rng = random.Random(0)
+    words = _words(rng)
+
+    print(f"\nSpeaker assignment, {WORDS} words over {DURATION_S / 3600:.0f} h:")
+    speedups = []
+    for count in TURN_COUNTS:
+        turns = _turns(count, rng)
+
+        start = time.perf_counter()
+        expected = [_baseline_assign(w, turns) for w in words]
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = SpeakerTurnIndex(turns)
+        assigned = [_assign_speaker_to_word(w, index) for w in words]
+        after = time.perf_counter() - start
+
+        assert assigned == expected
+        speedups.append(before / after)
+        print(
+            f"  {count:>6} turns: linear={before * 1000:8.1f} ms "
+            f"indexed={after * 1000:6.1f} ms ({before / after:.1f}x)"
+        )
+
+    assert speedups[-1] > 10
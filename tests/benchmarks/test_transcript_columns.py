@@ -0,0 +1,102 @@
+"""Size and parse-cost benchmark for columnar transcribe responses.
+
+Encodes a synthetic 4-hour transcribe response (~35k words) both as the
+plain per-word JSON written today (the baseline) and with columnar words,
+then compares body size, JSON parse peak memory and the time to parse and
+validate into a ``Transcript``. Both must yield the same transcript.
+
+Usage:
+    pytest tests/benchmarks/test_transcript_columns.py -m benchmark -s
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from dalston.common.pipeline_types import Transcript
+from dalston.common.transcript import _parse_transcript
+from dalston.common.word_columns import encode_transcript_words
+
+DURATION_S = 4 * 3600.0
+VOCABULARY = ["the", "a", "meeting", "budget", "okay", "so", "we", "agreed."]
+
+
+def _transcribe_output(rng: random.Random) -> dict:
+    segments = []
+    t = 0.0
+    while t < DURATION_S:
+        words = []
+        seg_start = t
+        for _ in range(rng.randint(8, 25)):
+            duration = rng.uniform(0.15, 0.5)
+            words.append(
+                {
+                    "text": rng.choice(VOCABULARY),
+                    "start": round(t, 3),
+                    "end": round(t + duration, 3),
+                    "confidence": round(rng.random(), 3),
+                    "alignment_method": "attention",
+                }
+            )
+            t += duration + 0.05
+        segments.append(
+            {
+                "start": round(seg_start, 3),
+                "end": round(t, 3),
+                "text": " ".join(w["text"] for w in words),
+                "words": words,
+            }
+        )
+        t += 0.5
+    return Transcript.model_validate(
+        {
+            "text": "",
+            "language": "en",
+            "engine_id": "faster-whisper",
+            "timestamp_granularity": "word",
+            "segments": segments,
+        }
+    ).model_dump(mode="json", exclude_none=False)
+
+
+def _parse(body: str) -> tuple[Transcript, float, int]:
+    tracemalloc.start()
+    data = json.loads(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    transcript = _parse_transcript(data)
+    return transcript, time.perf_counter() - start, peak
+
+
+@pytest.mark.benchmark
+def test_columnar_words_shrink_transcribe_response() -> None:
+    output = _transcribe_output(random.Random(0))
+    word_count = sum(len(s["words"]) for s in output["segments"])
+
+    plain_body = json.dumps(output, indent=2)
+    columnar_body = json.dumps(encode_transcript_words(output), indent=2)
+
+    plain, plain_s, plain_peak = _parse(plain_body)
+    columnar, columnar_s, columnar_peak = _parse(columnar_body)
+    assert columnar == plain
+
+    print(f"\nTranscribe response, {word_count} words over 4 h:")
+    print(
+        f"  plain:    {len(plain_body) / 1e6:6.2f} MB body, "
+        f"{plain_peak / 1e6:6.1f} MB parse peak, {plain_s * 1000:6.0f} ms validate"
+    )
+    print(
+        f"  columnar: {len(columnar_body) / 1e6:6.2f} MB body, "
+        f"{columnar_peak / 1e6:6.1f} MB parse peak, {columnar_s * 1000:6.0f} ms "
+        "expand+validate"
+    )
+
+    assert len(columnar_body) * 2 < len(plain_body)
+    assert columnar_peak * 2 < plain_peak
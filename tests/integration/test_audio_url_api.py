@@ -11,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from dalston.gateway.api.v1.transcription import router as transcription_router
 from dalston.gateway.services.audio_probe import AudioMetadata
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.audio_url import DownloadedAudio
 from dalston.gateway.services.auth import DEFAULT_EXPIRES_AT, APIKey, Scope
 
@@ -173,10 +174,9 @@ class TestAudioUrlTranscription:
         """Test successful transcription submission with audio URL."""
         # Mock download
         mock_download.return_value = DownloadedAudio(
-            content=b"fake audio content",
+            audio=AudioSpool.from_bytes(b"fake audio content"),
             filename="audio.mp3",
             content_type="audio/mpeg",
-            size=18,
         )
 
         # Mock audio probe
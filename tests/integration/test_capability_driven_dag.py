@@ -130,6 +130,7 @@ def create_mock_registry(engine_configs: dict[str, dict]) -> AsyncMock:
         return engines_by_stage.get(stage, [])
 
     registry.get_by_stage.side_effect = get_by_stage
+    registry.get_queue_depths.return_value = {}
 
     return registry
 
@@ -480,6 +481,7 @@ class TestEngineRanking:
             return []
 
         registry.get_by_stage.side_effect = get_by_stage
+        registry.get_queue_depths.return_value = {}
 
         tasks = await build_task_dag(
             job_id=job_id,
@@ -643,6 +645,7 @@ class TestMergedWavScenarios:
             return []
 
         registry.get_by_stage.side_effect = get_by_stage
+        registry.get_queue_depths.return_value = {}
 
         tasks = await build_task_dag(
             job_id=job_id,
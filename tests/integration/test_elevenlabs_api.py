@@ -16,6 +16,7 @@ from fastapi.testclient import TestClient
 from dalston.common.models import JobStatus
 from dalston.gateway.api.v1.speech_to_text import router as speech_to_text_router
 from dalston.gateway.services.audio_probe import AudioMetadata
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.auth import DEFAULT_EXPIRES_AT, APIKey, Scope
 from dalston.gateway.services.ingestion import AudioIngestionService, IngestedAudio
 from dalston.gateway.services.jobs import JobsService
@@ -63,7 +64,7 @@ class TestCreateTranscriptionEndpoint:
         """Create mock ingestion service that returns valid ingested audio."""
         service = AsyncMock(spec=AudioIngestionService)
         service.ingest.return_value = IngestedAudio(
-            content=b"fake audio content",
+            audio=AudioSpool.from_bytes(b"fake audio content"),
             filename="test.mp3",
             metadata=AudioMetadata(
                 format="mp3",
@@ -381,7 +382,7 @@ class TestCreateTranscriptionEndpoint:
         """use_multi_channel enforces the public 5-channel ceiling."""
         mock_jobs_service.create_job.return_value = mock_job
         mock_ingestion_service.ingest.return_value = IngestedAudio(
-            content=b"fake audio content",
+            audio=AudioSpool.from_bytes(b"fake audio content"),
             filename="test_6ch.wav",
             metadata=AudioMetadata(
                 format="wav",
@@ -82,6 +82,8 @@ class TestLiteJobAuditRecord:
         svc = AsyncMock()
         ingested = MagicMock()
         ingested.content = b"RIFF"
+        ingested.open.side_effect = lambda: BytesIO(b"RIFF")
+        ingested.size = 4
         ingested.filename = "test.wav"
         ingested.content_type = "audio/wav"
         ingested.file_size = 4
@@ -73,6 +73,8 @@ def _make_ingestion_service() -> AsyncMock:
     ingestion = AsyncMock()
     ingested = MagicMock()
     ingested.content = b"RIFF"
+    ingested.open.side_effect = lambda: BytesIO(b"RIFF")
+    ingested.size = 4
     ingested.filename = "test.wav"
     ingested.metadata = AudioMetadata(
         format="wav",
@@ -22,6 +22,7 @@ from dalston.gateway.api.v1.openai_audio import (
 from dalston.gateway.api.v1.openai_translation import router as translation_router
 from dalston.gateway.api.v1.transcription import router as transcription_router
 from dalston.gateway.services.audio_probe import AudioMetadata
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.auth import DEFAULT_EXPIRES_AT, APIKey, Scope
 from dalston.gateway.services.ingestion import AudioIngestionService, IngestedAudio
 from dalston.gateway.services.jobs import JobsService
@@ -202,7 +203,7 @@ class TestOpenAITranscriptionEndpoint:
     def mock_ingestion_service(self):
         service = AsyncMock(spec=AudioIngestionService)
         service.ingest.return_value = IngestedAudio(
-            content=b"fake audio content",
+            audio=AudioSpool.from_bytes(b"fake audio content"),
             filename="test.mp3",
             metadata=AudioMetadata(
                 format="mp3",
@@ -739,7 +740,7 @@ class TestOpenAITranslationEndpoint:
     def mock_ingestion_service(self):
         service = AsyncMock(spec=AudioIngestionService)
         service.ingest.return_value = IngestedAudio(
-            content=b"fake audio content",
+            audio=AudioSpool.from_bytes(b"fake audio content"),
             filename="test.mp3",
             metadata=AudioMetadata(
                 format="mp3",
@@ -10,7 +10,12 @@ import threading
 
 import pytest
 
-from dalston.engine_sdk.admission import AdmissionConfig, AdmissionController
+from dalston.engine_sdk import admission
+from dalston.engine_sdk.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    batch_checkpoint,
+)
 
 
 @pytest.fixture
@@ -283,3 +288,110 @@ class TestConfigFromEnv:
         assert config.rt_reservation == 3
         assert config.batch_max_inflight == 5
         assert config.total_capacity == 8
+
+    def test_from_env_latency_target(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DALSTON_RT_LATENCY_TARGET_MS", "250")
+        monkeypatch.setenv("DALSTON_BATCH_YIELD_MAX_S", "2.5")
+
+        config = AdmissionConfig.from_env()
+        assert config.rt_latency_target_s == 0.25
+        assert config.batch_yield_max_s == 2.5
+
+    def test_from_env_latency_target_off_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("DALSTON_RT_LATENCY_TARGET_MS", raising=False)
+        assert AdmissionConfig.from_env().rt_latency_target_s is None
+
+
+class TestAdaptiveScheduling:
+    """Latency-target mode reshapes the batch limit and yields batch to RT."""
+
+    @pytest.fixture(autouse=True)
+    def _no_adjust_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(admission, "ADJUST_INTERVAL_S", 0.0)
+
+    @staticmethod
+    def _adaptive(**overrides) -> AdmissionController:
+        config = AdmissionConfig(
+            rt_reservation=2,
+            batch_max_inflight=4,
+            total_capacity=6,
+            rt_latency_target_s=0.2,
+            **overrides,
+        )
+        return AdmissionController(config, engine_id="test")
+
+    @staticmethod
+    def _record(controller: AdmissionController, latency: float, n: int = 10) -> None:
+        for _ in range(n):
+            controller.rt_inference_started()
+            controller.rt_inference_finished(latency)
+
+    def test_static_without_target(self, controller: AdmissionController) -> None:
+        self._record(controller, 5.0)
+        status = controller.get_status()
+        assert status["batch_limit"] == 4
+        assert status["rt_latency_p95_s"] is None
+        assert controller.wait_for_batch_turn() == 0.0
+
+    def test_slow_rt_shrinks_batch_limit_to_floor(self) -> None:
+        controller = self._adaptive(batch_min_inflight=1)
+        self._record(controller, 0.3)
+
+        assert controller.get_status()["batch_limit"] == 1
+        assert controller.admit_batch()
+        assert not controller.can_accept_batch()
+
+    def test_fast_rt_grows_batch_limit_back(self) -> None:
+        controller = self._adaptive()
+        self._record(controller, 0.3)
+        assert controller.get_status()["batch_limit"] == 1
+
+        self._record(controller, 0.05, n=100)
+        assert controller.get_status()["batch_limit"] == 4
+
+    def test_rt_queue_depth_shrinks_batch_limit(self) -> None:
+        controller = self._adaptive()
+        for _ in range(3):
+            controller.rt_inference_started()
+
+        status = controller.get_status()
+        assert status["batch_limit"] < 4
+        assert status["batch_yielding"]
+
+    def test_checkpoint_yields_at_most_max(self) -> None:
+        controller = self._adaptive(batch_yield_max_s=0.05)
+        self._record(controller, 1.0)
+        assert controller.get_status()["batch_yielding"]
+
+        with controller.preemptible():
+            paused = controller.wait_for_batch_turn()
+        assert 0.05 <= paused < 1.0
+
+    def test_checkpoint_resumes_when_rt_recovers(self) -> None:
+        controller = self._adaptive(batch_yield_max_s=5.0)
+        self._record(controller, 1.0)
+
+        timer = threading.Timer(0.05, self._record, (controller, 0.01, 100))
+        timer.start()
+        with controller.preemptible():
+            paused = controller.wait_for_batch_turn()
+        timer.join()
+        assert paused < 5.0
+        assert not controller.get_status()["batch_yielding"]
+
+    def test_checkpoint_is_noop_outside_preemptible(self) -> None:
+        controller = self._adaptive(batch_yield_max_s=5.0)
+        self._record(controller, 1.0)
+        batch_checkpoint()  # would block for 5 s if active
+
+    def test_admit_batch_waits_for_release(self, config: AdmissionConfig) -> None:
+        controller = AdmissionController(config)
+        for _ in range(4):
+            controller.admit_batch()
+
+        timer = threading.Timer(0.05, controller.release_batch)
+        timer.start()
+        assert controller.admit_batch(wait_s=2.0)
+        timer.join()
@@ -0,0 +1,157 @@
+"""Tests for the node-local content-addressed artifact cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from dalston.common.artifacts import ArtifactReference, ProducedArtifact
+from dalston.engine_sdk.artifact_cache import NodeArtifactCache
+from dalston.engine_sdk.materializer import ArtifactMaterializer, ArtifactStore
+
+
+class _CountingStore(ArtifactStore):
+    def __init__(self) -> None:
+        self.remote_files: dict[str, bytes] = {}
+        self.downloads = 0
+
+    def download(self, locator: str, destination: Path) -> None:
+        self.downloads += 1
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(self.remote_files[locator])
+
+    def upload(self, source: Path, locator: str) -> None:
+        self.remote_files[locator] = source.read_bytes()
+
+
+def _ref(payload: bytes, artifact_id: str = "a1") -> ArtifactReference:
+    return ArtifactReference(
+        artifact_id=artifact_id,
+        kind="audio",
+        storage_locator=f"s3://bucket/jobs/j1/{artifact_id}.wav",
+        checksum=hashlib.sha256(payload).hexdigest(),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> NodeArtifactCache:
+    return NodeArtifactCache(tmp_path / "cache", max_gb=1)
+
+
+class TestNodeArtifactCache:
+    def test_from_env_disabled_without_dir(self, monkeypatch) -> None:
+        monkeypatch.delenv("DALSTON_ARTIFACT_CACHE_DIR", raising=False)
+
+        assert NodeArtifactCache.from_env() is None
+
+    def test_from_env_uses_dir_and_budget(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("DALSTON_ARTIFACT_CACHE_DIR", str(tmp_path / "c"))
+        monkeypatch.setenv("DALSTON_ARTIFACT_CACHE_MAX_GB", "2")
+
+        cache = NodeArtifactCache.from_env("faster-whisper")
+
+        assert cache is not None
+        assert cache.max_bytes == 2 * 1024**3
+        assert cache.engine_id == "faster-whisper"
+
+    def test_put_then_fetch_hardlinks_read_only_entry(
+        self, cache: NodeArtifactCache, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "prepared.wav"
+        source.write_bytes(b"audio")
+        ref = _ref(b"audio")
+
+        cache.put(source, checksum=ref.checksum)
+        destination = tmp_path / "task" / "audio.wav"
+        destination.parent.mkdir()
+
+        assert cache.fetch(ref, destination)
+        assert destination.read_bytes() == b"audio"
+        assert destination.stat().st_ino == source.stat().st_ino
+        assert not os.access(destination, os.W_OK) or os.geteuid() == 0
+
+    def test_fetch_miss_for_unknown_artifact(
+        self, cache: NodeArtifactCache, tmp_path: Path
+    ) -> None:
+        assert not cache.fetch(_ref(b"missing"), tmp_path / "out.wav")
+
+    def test_keys_by_artifact_id_without_checksum(
+        self, cache: NodeArtifactCache, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "src.bin"
+        source.write_bytes(b"x")
+        cache.put(source, artifact_id="task-1:audio")
+        ref = ArtifactReference(
+            artifact_id="task-1:audio", kind="audio", storage_locator="s3://b/k"
+        )
+
+        assert cache.fetch(ref, tmp_path / "dst.bin")
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path: Path) -> None:
+        cache = NodeArtifactCache(tmp_path / "cache", max_gb=25 / 1024**3)
+        refs = []
+        for i, name in enumerate(("old", "new")):
+            source = tmp_path / f"{name}.bin"
+            source.write_bytes(name.encode() * 5)
+            ref = _ref(source.read_bytes(), artifact_id=name)
+            cache.put(source, checksum=ref.checksum)
+            entry = cache._entry_path(cache.cache_key(ref.checksum, None))
+            os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+            refs.append(ref)
+
+        # Third entry pushes the cache over 25 bytes; "old" is evicted first
+        third = tmp_path / "third.bin"
+        third.write_bytes(b"t" * 10)
+        cache.put(third, checksum=hashlib.sha256(b"t" * 10).hexdigest())
+
+        assert not cache.fetch(refs[0], tmp_path / "o.bin")
+        assert cache.fetch(refs[1], tmp_path / "n.bin")
+
+
+class TestMaterializerCache:
+    def test_second_materialize_is_served_from_cache(
+        self, cache: NodeArtifactCache, tmp_path: Path
+    ) -> None:
+        store = _CountingStore()
+        store.remote_files["s3://bucket/jobs/j1/a1.wav"] = b"audio"
+        ref = _ref(b"audio")
+        materializer = ArtifactMaterializer(store=store, cache=cache)
+
+        for task in ("t1", "t2"):
+            materialized = materializer.materialize(
+                resolved_artifact_ids={"audio": "a1"},
+                artifact_index={"a1": ref},
+                target_dir=tmp_path / task,
+            )
+            assert materialized["audio"].local_path.read_bytes() == b"audio"
+
+        assert store.downloads == 1
+
+    def test_produced_artifacts_are_cached_on_upload(
+        self, cache: NodeArtifactCache, tmp_path: Path
+    ) -> None:
+        store = _CountingStore()
+        local_file = tmp_path / "prepared.wav"
+        local_file.write_bytes(b"prepared")
+        materializer = ArtifactMaterializer(store=store, cache=cache)
+
+        refs = materializer.persist_produced(
+            job_id="job-1",
+            task_id="prepare",
+            produced_artifacts=[
+                ProducedArtifact(
+                    logical_name="prepared_audio", local_path=local_file, kind="audio"
+                )
+            ],
+        )
+        materializer.materialize(
+            resolved_artifact_ids={"audio": refs[0].artifact_id},
+            artifact_index={refs[0].artifact_id: refs[0]},
+            target_dir=tmp_path / "transcribe",
+        )
+
+        assert store.downloads == 0
@@ -1,12 +1,15 @@
 """Unit tests for audio URL download service."""
 
+import hashlib
 from urllib.parse import urlparse
 
 import pytest
 
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.audio_url import (
     DEFAULT_USER_AGENT,
     DownloadError,
+    FileTooLargeError,
     InvalidUrlError,
     UnsupportedContentTypeError,
     _convert_dropbox_url,
@@ -276,3 +279,35 @@ class TestDownloadRequestHeaders:
         assert "X-Amz-Credential" not in reported
         assert "AKIA123" not in reported
         assert reported.endswith("/bucket/clip.mp3")
+
+    async def test_streams_body_into_spool(self, httpx_mock) -> None:
+        """The body is spooled with size and checksum, not returned as bytes."""
+        body = b"\x01" * (3 * 1024 * 1024)
+        httpx_mock.add_response(
+            url="https://audio.example.com/long.mp3",
+            headers={"content-type": "audio/mpeg"},
+            content=body,
+        )
+
+        downloaded = await download_audio_from_url("https://audio.example.com/long.mp3")
+
+        assert downloaded.size == len(body)
+        assert downloaded.audio.sha256 == hashlib.sha256(body).hexdigest()
+        assert downloaded.audio.read_bytes() == body
+        downloaded.audio.close()
+
+    async def test_oversized_body_closes_caller_spool(self, httpx_mock) -> None:
+        httpx_mock.add_response(
+            url="https://audio.example.com/big.mp3",
+            headers={"content-type": "audio/mpeg"},
+            content=b"\x00" * 2048,
+        )
+        spool = AudioSpool()
+
+        with pytest.raises(FileTooLargeError):
+            await download_audio_from_url(
+                "https://audio.example.com/big.mp3", max_size=1024, spool=spool
+            )
+
+        with pytest.raises(ValueError):
+            spool.open()
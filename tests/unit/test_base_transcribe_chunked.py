@@ -16,9 +16,11 @@ downloads or a real Silero model.
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from dalston.common.pipeline_types import (
@@ -30,6 +32,7 @@ from dalston.common.pipeline_types import (
 from dalston.engine_sdk.base_transcribe import BaseBatchTranscribeEngine
 from dalston.engine_sdk.context import BatchTaskContext
 from dalston.engine_sdk.types import TaskRequest
+from dalston.engine_sdk.vad import AudioArrayChunk
 
 
 def _make_transcript(
@@ -86,6 +89,7 @@ class _FakeVadChunker:
     """
 
     scenarios: dict[float, list[tuple[float, float]]] = {}
+    detect_calls: list[Path] = []
 
     def __init__(self, max_chunk_duration_s: float = 1500.0, **_: Any) -> None:
         self.max_chunk_duration_s = max_chunk_duration_s
@@ -95,26 +99,63 @@ class _FakeVadChunker:
         audio_path: Path,
         temp_dir: Path,
         start_offset_s: float = 0.0,
+    ) -> list[_FakeChunk]:
+        return self.write_chunks(np.zeros(0), [], temp_dir, start_offset_s)
+
+    def write_chunks(
+        self,
+        audio: np.ndarray,
+        segments: list[Any],
+        temp_dir: Path,
+        start_offset_s: float = 0.0,
     ) -> list[_FakeChunk]:
         temp_dir.mkdir(parents=True, exist_ok=True)
+        chunks: list[_FakeChunk] = []
+        for i, offset, duration in self._layout(start_offset_s):
+            p = temp_dir / f"chunk_{i:04d}.wav"
+            p.write_bytes(b"")  # presence only — we never decode in tests
+            chunks.append(_FakeChunk(p, offset=offset, duration=duration))
+        return chunks
+
+    def load_and_detect(
+        self, audio_path: Path, speech: list[Any] | None = None
+    ) -> tuple[np.ndarray, list[Any]]:
+        if speech is not None:
+            return np.zeros(0, dtype=np.float32), speech
+        self.detect_calls.append(audio_path)
+        return np.zeros(0, dtype=np.float32), []
+
+    def split_audio(
+        self,
+        audio: np.ndarray,
+        segments: list[Any],
+        start_offset_s: float = 0.0,
+    ) -> list[AudioArrayChunk]:
+        # Each chunk's single sample carries its offset so the spy engine
+        # can tell which chunks it received.
+        return [
+            AudioArrayChunk(
+                audio=np.array([offset], dtype=np.float32),
+                offset=offset,
+                duration=duration,
+            )
+            for _i, offset, duration in self._layout(start_offset_s)
+        ]
+
+    def _layout(self, start_offset_s: float) -> list[tuple[int, float, float]]:
         raw = self.scenarios.get(self.max_chunk_duration_s)
         if raw is None:
             raise AssertionError(
                 f"_FakeVadChunker has no scenario for max_s={self.max_chunk_duration_s}"
             )
-        chunks: list[_FakeChunk] = []
+        layout: list[tuple[int, float, float]] = []
         for i, (offset, duration) in enumerate(raw):
             end = offset + duration
             if end <= start_offset_s + 1e-3:
                 continue
             trimmed_offset = max(offset, start_offset_s)
-            trimmed_duration = end - trimmed_offset
-            p = temp_dir / f"chunk_{i:04d}.wav"
-            p.write_bytes(b"")  # presence only — we never decode in tests
-            chunks.append(
-                _FakeChunk(p, offset=trimmed_offset, duration=trimmed_duration)
-            )
-        return chunks
+            layout.append((i, trimmed_offset, end - trimmed_offset))
+        return layout
 
 
 class _SpyEngine(BaseBatchTranscribeEngine):
@@ -160,6 +201,7 @@ def _ctx() -> BatchTaskContext:
 @pytest.fixture(autouse=True)
 def _reset_fake_chunker() -> None:
     _FakeVadChunker.scenarios = {}
+    _FakeVadChunker.detect_calls = []
     yield
     _FakeVadChunker.scenarios = {}
 
@@ -466,6 +508,8 @@ class TestOomBackoff:
         assert result.data.segments[2].start == pytest.approx(1800.0, abs=1e-3)
         # OOM cap cached
         assert engine._chunked_oom_cap_s == 600.0
+        # VAD ran once; pass 2 re-grouped the same speech regions
+        assert len(_FakeVadChunker.detect_calls) == 1
 
     def test_floor_aborts_loop(self, tmp_path: Path) -> None:
         """When OOM persists below the floor, raise loudly."""
@@ -732,3 +776,142 @@ class TestMergeTranscripts:
         t2 = _make_transcript("b", [(0.0, 1.0, "b")], warnings=["low confidence"])
         merged = engine._merge_chunk_transcripts([(t1, 0.0), (t2, 1.0)])
         assert merged.warnings == ["low confidence", "boundary cut"]
+
+
+class _BatchSpyEngine(_SpyEngine):
+    """Spy that implements transcribe_audio_batch (in-memory chunk path).
+
+    Each scripted side effect is either an exception or one transcript per
+    chunk in the batch. Calls record the chunk offsets of each batch.
+    """
+
+    def __init__(
+        self,
+        max_chunk_s: float | None,
+        side_effects: list[Any],
+        batch_size: int = 2,
+        max_speech_s: float = 600.0,
+    ) -> None:
+        super().__init__(max_chunk_s, side_effects)
+        self._batch_calls: list[list[float]] = []
+        vram_params = SimpleNamespace(
+            vad_batch_size=batch_size, vad_max_speech_s=max_speech_s
+        )
+        self._runner = SimpleNamespace(
+            get_adaptive_params=lambda: SimpleNamespace(
+                select=lambda depth: vram_params
+            ),
+            get_queue_depth=lambda: 0,
+        )
+
+    def transcribe_audio_batch(
+        self,
+        task_request: TaskRequest,
+        audio: list[np.ndarray],
+        ctx: BatchTaskContext,
+    ) -> list[Transcript]:
+        self._batch_calls.append([float(a[0]) for a in audio])
+        if not self._side_effects:
+            raise AssertionError("Ran out of scripted side effects")
+        effect = self._side_effects.pop(0)
+        if isinstance(effect, Exception):
+            raise effect
+        return effect
+
+
+def _words(*texts: str) -> list[Transcript]:
+    return [_make_transcript(t, [(0.0, 1.0, t)], engine_id="spy-engine") for t in texts]
+
+
+class TestBatchedChunks:
+    """Engines implementing transcribe_audio_batch get in-memory batches."""
+
+    def _run(self, tmp_path: Path, engine: _BatchSpyEngine, duration_s: float):
+        audio = tmp_path / "long.wav"
+        audio.write_bytes(b"")
+        request = TaskRequest(task_id="t", job_id="j", audio_path=audio)
+        with (
+            patch.object(
+                BaseBatchTranscribeEngine, "_audio_duration_s", return_value=duration_s
+            ),
+            patch("dalston.engine_sdk.base_transcribe.VadChunker", _FakeVadChunker),
+        ):
+            return engine.process(request, _ctx())
+
+    def test_chunks_batched_within_budget(self, tmp_path: Path) -> None:
+        # Budget = 2 x 600s: the three 400s chunks fit in one batch, the
+        # fourth starts the next.
+        _FakeVadChunker.scenarios = {
+            600.0: [(0.0, 400.0), (400.0, 400.0), (800.0, 400.0), (1200.0, 400.0)],
+        }
+        engine = _BatchSpyEngine(
+            max_chunk_s=600.0,
+            side_effects=[_words("a", "b", "c"), _words("d")],
+        )
+
+        result = self._run(tmp_path, engine, 1600.0)
+
+        assert engine._batch_calls == [[0.0, 400.0, 800.0], [1200.0]]
+        assert engine._calls == []  # per-file path never used
+        assert len(_FakeVadChunker.detect_calls) == 1
+        assert result.data.text == "a b c d"
+        assert [s.start for s in result.data.segments] == pytest.approx(
+            [0.0, 400.0, 800.0, 1200.0], abs=1e-3
+        )
+
+    def test_batch_oom_halves_budget(self, tmp_path: Path) -> None:
+        _FakeVadChunker.scenarios = {
+            600.0: [(0.0, 500.0), (500.0, 500.0), (1000.0, 500.0)],
+        }
+        engine = _BatchSpyEngine(
+            max_chunk_s=600.0,
+            side_effects=[
+                RuntimeError("CUDA out of memory"),
+                _words("a"),
+                _words("b"),
+                _words("c"),
+            ],
+        )
+
+        result = self._run(tmp_path, engine, 1500.0)
+
+        # Full batch of two OOMs; budget drops to 500s → one chunk per call.
+        assert engine._batch_calls == [[0.0, 500.0], [0.0], [500.0], [1000.0]]
+        # Chunk cap untouched — only the batch shrank
+        assert getattr(engine, "_chunked_oom_cap_s", None) is None
+        assert result.data.text == "a b c"
+
+    def test_single_chunk_oom_halves_cap_without_redetecting(
+        self, tmp_path: Path
+    ) -> None:
+        _FakeVadChunker.scenarios = {
+            1200.0: [(0.0, 1200.0), (1200.0, 1200.0)],
+            600.0: [(0.0, 600.0), (600.0, 600.0), (1200.0, 600.0), (1800.0, 600.0)],
+        }
+        engine = _BatchSpyEngine(
+            max_chunk_s=1200.0,
+            side_effects=[
+                _words("a"),
+                RuntimeError("CUDA out of memory"),
+                _words("c", "d"),
+            ],
+            batch_size=1,
+            max_speech_s=1200.0,
+        )
+
+        result = self._run(tmp_path, engine, 2400.0)
+
+        assert engine._batch_calls == [[0.0], [1200.0], [1200.0, 1800.0]]
+        assert engine._chunked_oom_cap_s == 600.0
+        assert len(_FakeVadChunker.detect_calls) == 1
+        assert result.data.text == "a c d"
+        assert [s.start for s in result.data.segments] == pytest.approx(
+            [0.0, 1200.0, 1800.0], abs=1e-3
+        )
+
+    def test_transcript_count_mismatch_raises(self, tmp_path: Path) -> None:
+        _FakeVadChunker.scenarios = {600.0: [(0.0, 300.0), (300.0, 300.0)]}
+        engine = _BatchSpyEngine(max_chunk_s=600.0, side_effects=[_words("a")])
+
+        with pytest.raises(RuntimeError, match="returned 1 transcripts for 2"):
+            self._run(tmp_path, engine, 700.0)
@@ -0,0 +1,138 @@
+"""Tests for in-memory chunk slicing and phased chunked diarization."""
+
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import dalston.engine_sdk.diarize_chunking as dc
+from dalston.common.pipeline_types import SpeakerTurn
+
+SR = 16000
+
+
+def _write_wav(path: Path, samples: np.ndarray) -> Path:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SR)
+        wf.writeframes(samples.astype("<i2").tobytes())
+    return path
+
+
+class _Annotation:
+    """Minimal stand-in for a pyannote Annotation."""
+
+    def __init__(self, tracks: list[tuple[float, float, str]]) -> None:
+        self.tracks = tracks
+
+    def itertracks(self, yield_label: bool = False):
+        for start, end, speaker in self.tracks:
+            yield (
+                SimpleNamespace(start=start, end=end, duration=end - start),
+                None,
+                speaker,
+            )
+
+
+def _convert(annotation: _Annotation) -> tuple[list[str], list[SpeakerTurn]]:
+    turns = [SpeakerTurn(speaker=s, start=a, end=b) for a, b, s in annotation.tracks]
+    return sorted({t.speaker for t in turns}), turns
+
+
+class _FakePipeline:
+    """Labels every chunk with two fixed turns and records its inputs."""
+
+    def __init__(self) -> None:
+        self.inputs: list[dict] = []
+
+    def __call__(self, audio, **params):
+        self.inputs.append(audio)
+        return _Annotation([(1.0, 4.5, "A"), (5.0, 7.2, "B")])
+
+
+class _FakeEmbedding:
+    """Embeds a crop as (mean, length) and counts batched calls."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def infer(self, crops: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(len(crops))
+        return np.stack([[1.0, float(c.shape[-1])] for c in crops])
+
+
+@pytest.fixture
+def in_memory(monkeypatch):
+    # The fakes take numpy waveforms; real runs wrap them in torch tensors
+    monkeypatch.setattr(
+        dc,
+        "_waveform_input",
+        lambda waveform, sample_rate: {
+            "waveform": waveform,
+            "sample_rate": sample_rate,
+        },
+    )
+    monkeypatch.setattr(
+        dc, "_infer_batch", lambda model, crops: list(model.infer(crops))
+    )
+
+
+def test_batched_embeddings_group_equal_length_crops(in_memory):
+    model = _FakeEmbedding()
+    waveform = np.zeros(SR * 20, dtype=np.float32)
+    chunks = [
+        (0, waveform, _Annotation([(0.0, 2.5, "A"), (3.0, 5.9, "B"), (6, 6.5, "C")])),
+        (1, waveform, _Annotation([(1.0, 3.1, "A"), (4.0, 8.0, "A")])),
+    ]
+
+    centroids = dc.extract_speaker_embeddings_batched(chunks, model, SR)
+
+    # Three 2 s crops share one batch; the 4 s crop gets its own; C is too short
+    assert sorted(model.batch_sizes) == [1, 3]
+    assert set(centroids[0]) == {"A", "B"}
+    assert centroids[1]["A"][1] == pytest.approx((2 * SR + 4 * SR) / 2)
+
+
+def test_run_chunked_slices_in_memory_and_times_phases(
+    in_memory, monkeypatch, tmp_path
+):
+    audio = _write_wav(tmp_path / "long.wav", np.zeros(SR * 100, np.int16))
+    pipeline = _FakePipeline()
+    embedding = _FakeEmbedding()
+    phases: list[str] = []
+
+    def _no_ffmpeg(*args, **kwargs):
+        raise AssertionError("ffmpeg must not run for PCM16 input")
+
+    monkeypatch.setattr(dc, "extract_chunk", _no_ffmpeg)
+    monkeypatch.setattr(dc, "load_embedding_model", lambda token, device: embedding)
+    monkeypatch.setattr(
+        dc.dalston.metrics,
+        "observe_engine_diarize_phase",
+        lambda engine_id, phase, seconds: phases.append(phase),
+    )
+
+    speakers, turns = dc.run_chunked_diarization(
+        pipeline,
+        audio,
+        {},
+        hf_token="t",
+        device="cpu",
+        convert_annotation=_convert,
+        max_chunk_s=40.0,
+        overlap_s=10.0,
+        cpu_workers=4,  # ignored without pipeline_model_id
+    )
+
+    # Chunks are (0, 40) and (30, 100): the short tail is absorbed
+    assert [len(a["waveform"]) for a in pipeline.inputs] == [40 * SR, 70 * SR]
+    # Both chunks' 3 s and 2 s turns share one batch per crop length
+    assert embedding.batch_sizes == [2, 2]
+    assert phases == ["segmentation", "embedding", "linking", "merge"]
+    assert turns and turns[0].start == pytest.approx(1.0)
+    assert speakers
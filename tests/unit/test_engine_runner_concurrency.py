@@ -0,0 +1,185 @@
+"""Tests for the EngineRunner bounded concurrent task mode."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import threading
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dalston.engine_sdk.runner as runner_module
+from dalston.common.streams_sync import read_own_pending
+from dalston.common.streams_types import StreamMessage
+from dalston.engine_sdk.runner import EngineRunner
+
+
+def _make_runner(concurrency: str | None) -> EngineRunner:
+    env = {"DALSTON_ENGINE_ID": "audio-prepare"}
+    if concurrency is not None:
+        env["DALSTON_ENGINE_TASK_CONCURRENCY"] = concurrency
+    engine = MagicMock()
+    engine.engine_id = "audio-prepare"
+    with patch.dict(os.environ, env):
+        if concurrency is None:
+            os.environ.pop("DALSTON_ENGINE_TASK_CONCURRENCY", None)
+        runner = EngineRunner(engine)
+    runner._redis = MagicMock()
+    return runner
+
+
+def _message(n: int) -> StreamMessage:
+    return StreamMessage(
+        id=f"{n}-0",
+        task_id=f"task-{n}",
+        job_id="job-1",
+        enqueued_at=datetime.now(UTC),
+        timeout_at=datetime.now(UTC),
+        delivery_count=1,
+    )
+
+
+class TestConcurrencyConfig:
+    def test_defaults_to_serial_mode(self) -> None:
+        runner = _make_runner(None)
+
+        assert runner._max_concurrent_tasks == 1
+        assert runner._admission is None
+        assert runner._create_task_executor() is None
+
+    def test_env_enables_bounded_concurrency(self) -> None:
+        runner = _make_runner("3")
+
+        executor = runner._create_task_executor()
+
+        assert executor is not None
+        executor.shutdown()
+        assert runner._admission is not None
+        status = runner._admission.get_status()
+        assert status["batch_max_inflight"] == 3
+        assert status["rt_reservation"] == 0
+
+
+class TestPollAndDispatch:
+    def test_does_not_read_when_all_slots_taken(self) -> None:
+        runner = _make_runner("2")
+        runner.TASK_SLOT_WAIT_S = 0.01
+        assert runner._admission.admit_batch()
+        assert runner._admission.admit_batch()
+        executor = MagicMock()
+
+        with patch.object(runner, "_receive_message") as receive:
+            runner._poll_and_dispatch(executor)
+
+        receive.assert_not_called()
+        executor.submit.assert_not_called()
+
+    def test_releases_slot_on_poll_timeout(self) -> None:
+        runner = _make_runner("2")
+        executor = MagicMock()
+
+        with patch.object(runner, "_receive_message", return_value=None):
+            runner._poll_and_dispatch(executor)
+
+        executor.submit.assert_not_called()
+        assert runner._admission.get_status()["active_batch"] == 0
+
+    def test_excludes_inflight_messages_from_pending_reclaim(self) -> None:
+        runner = _make_runner("2")
+        runner._inflight_message_ids.add("1-0")
+        executor = MagicMock()
+
+        with patch.object(runner, "_receive_message", return_value=None) as receive:
+            runner._poll_and_dispatch(executor)
+
+        assert receive.call_args.kwargs["exclude"] == frozenset({"1-0"})
+
+    def test_runs_tasks_in_parallel_and_acks_each_message(self) -> None:
+        runner = _make_runner("2")
+        messages = [_message(1), _message(2)]
+        barrier = threading.Barrier(2, timeout=5)
+        acked: list[str] = []
+
+        def process_task(task_id, metadata, staged=None):
+            del task_id, metadata, staged
+            barrier.wait()  # Deadlocks (and times out) if tasks run serially
+
+        executor = runner._create_task_executor()
+        with (
+            patch.object(runner, "_receive_message", side_effect=messages),
+            patch.object(
+                runner, "_get_task_metadata", return_value={"job_id": "job-1"}
+            ),
+            patch.object(runner, "_clear_waiting_engine_marker"),
+            patch.object(runner, "_process_task", side_effect=process_task),
+            patch.object(runner_module, "is_job_cancelled", return_value=False),
+            patch.object(
+                runner_module,
+                "ack_task",
+                side_effect=lambda _r, _stream, message_id: acked.append(message_id),
+            ),
+        ):
+            runner._poll_and_dispatch(executor)
+            runner._poll_and_dispatch(executor)
+            executor.shutdown(wait=True)
+
+        assert sorted(acked) == ["1-0", "2-0"]
+        assert runner._inflight_message_ids == set()
+        assert runner._admission.get_status()["active_batch"] == 0
+
+    def test_worker_error_releases_slot_without_ack(self) -> None:
+        runner = _make_runner("2")
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        with (
+            patch.object(runner, "_receive_message", return_value=_message(1)),
+            patch.object(
+                runner, "_handle_message", side_effect=RuntimeError("redis down")
+            ),
+            patch.object(runner_module, "ack_task") as ack,
+        ):
+            runner._poll_and_dispatch(executor)
+            executor.shutdown(wait=True)
+
+        ack.assert_not_called()
+        assert runner._inflight_message_ids == set()
+        assert runner._admission.get_status()["active_batch"] == 0
+
+
+class TestReadOwnPendingExclude:
+    @pytest.fixture
+    def mock_redis(self) -> MagicMock:
+        mock_redis = MagicMock()
+        mock_redis.xreadgroup.return_value = [
+            (
+                "dalston:stream:audio-prepare",
+                [
+                    ("1-0", {"task_id": "task-1", "job_id": "job-1"}),
+                    ("2-0", {"task_id": "task-2", "job_id": "job-1"}),
+                ],
+            )
+        ]
+        return mock_redis
+
+    def test_skips_excluded_message_ids(self, mock_redis: MagicMock) -> None:
+        result = read_own_pending(
+            mock_redis, "audio-prepare", "consumer-1", exclude=frozenset({"1-0"})
+        )
+
+        assert result is not None
+        assert result.id == "2-0"
+        assert mock_redis.xreadgroup.call_args.kwargs["count"] == 2
+
+    def test_returns_none_when_all_pending_are_excluded(
+        self, mock_redis: MagicMock
+    ) -> None:
+        result = read_own_pending(
+            mock_redis,
+            "audio-prepare",
+            "consumer-1",
+            exclude=frozenset({"1-0", "2-0"}),
+        )
+
+        assert result is None
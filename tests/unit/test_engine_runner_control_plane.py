@@ -0,0 +1,124 @@
+"""Tests for EngineRunner Redis round trips and control-plane overhead."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dalston.engine_sdk.runner as runner_module
+from dalston.common.artifacts import ArtifactReference
+from dalston.common.streams_types import WAITING_ENGINE_TASKS_KEY
+from dalston.engine_sdk.runner import EngineRunner
+from dalston.engine_sdk.types import TaskResponse
+
+
+def _make_runner() -> EngineRunner:
+    engine = MagicMock()
+    engine.engine_id = "faster-whisper"
+    with patch.dict(os.environ, {"DALSTON_ENGINE_ID": "faster-whisper"}):
+        runner = EngineRunner(engine)
+    runner._redis = MagicMock()
+    return runner
+
+
+def _artifact(n: int) -> ArtifactReference:
+    return ArtifactReference(
+        artifact_id=f"artifact-{n}",
+        kind="audio",
+        storage_locator=f"s3://bucket/jobs/job-1/artifacts/{n}.wav",
+    )
+
+
+def test_clear_waiting_marker_is_one_transaction() -> None:
+    runner = _make_runner()
+    pipe = runner._redis.pipeline.return_value
+
+    runner._clear_waiting_engine_marker("task-1")
+
+    runner._redis.pipeline.assert_called_once_with(transaction=True)
+    pipe.hdel.assert_called_once()
+    pipe.srem.assert_called_once_with(WAITING_ENGINE_TASKS_KEY, "task-1")
+    pipe.execute.assert_called_once_with()
+    runner._redis.hdel.assert_not_called()
+    runner._redis.srem.assert_not_called()
+
+
+def test_save_task_output_writes_artifact_records_in_one_pipeline(
+    monkeypatch,
+) -> None:
+    runner = _make_runner()
+    pipe = runner._redis.pipeline.return_value
+    artifacts = [_artifact(1), _artifact(2), _artifact(3)]
+    monkeypatch.setattr(runner._materializer, "persist_produced", lambda **_: artifacts)
+    monkeypatch.setattr(runner_module.io, "upload_json", lambda payload, uri: None)
+
+    runner._save_task_output(
+        task_id="task-1",
+        job_id="job-1",
+        output=TaskResponse(data={}),
+        processing_time=1.0,
+        stage="prepare",
+    )
+
+    pipe.execute.assert_called_once_with()
+    assert pipe.hset.call_count == 2
+    job_records = pipe.hset.call_args_list[1]
+    assert job_records.args == ("dalston:job:job-1:artifacts",)
+    assert list(job_records.kwargs["mapping"]) == [
+        "artifact-1",
+        "artifact-2",
+        "artifact-3",
+    ]
+    runner._redis.hset.assert_not_called()
+
+
+def test_load_task_request_reuses_prefetched_metadata(tmp_path: Path) -> None:
+    runner = _make_runner()
+    metadata = {"job_id": "job-1", "stage": "prepare"}
+
+    with (
+        patch.object(runner_module.io, "download_json", return_value={}),
+        patch.object(runner, "_get_task_metadata") as get_metadata,
+    ):
+        request = runner._load_task_request("task-1", tmp_path, metadata)
+
+    get_metadata.assert_not_called()
+    assert request.job_id == "job-1"
+
+
+def test_successful_task_reports_control_plane_overhead() -> None:
+    runner = _make_runner()
+    task_request = MagicMock(job_id="job-1", stage="prepare", audio_path=None)
+    runner.engine.process.return_value = TaskResponse(data={})
+
+    with (
+        patch.object(runner, "_load_task_request", return_value=task_request),
+        patch.object(runner, "_save_task_output"),
+        patch.object(
+            runner_module.dalston.metrics, "observe_engine_task_overhead"
+        ) as observe,
+    ):
+        runner._process_task("task-1", {"job_id": "job-1", "stage": "prepare"})
+
+    observe.assert_called_once()
+    engine_id, overhead, _profile = observe.call_args.args
+    assert engine_id == "faster-whisper"
+    assert overhead >= 0
+
+
+def test_rtf_ewma_tracks_recent_tasks() -> None:
+    runner = _make_runner()
+
+    # 10 s for 100 s of audio, then 60 s for 300 s of audio
+    runner._record_task_rtf(10.0, 100.0)
+    assert runner._rtf_ewma == pytest.approx(0.1)
+
+    runner._record_task_rtf(60.0, 300.0)
+    assert runner._rtf_ewma == pytest.approx(0.1 + runner.RTF_EWMA_ALPHA * 0.1)
+
+    # Unknown audio duration does not move the estimate
+    runner._record_task_rtf(500.0, None)
+    assert runner._rtf_ewma == pytest.approx(0.1 + runner.RTF_EWMA_ALPHA * 0.1)
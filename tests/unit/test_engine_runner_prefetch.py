@@ -0,0 +1,192 @@
+"""Tests for pipelined input prefetch in EngineRunner."""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import dalston.engine_sdk.runner as runner_module
+from dalston.common.streams_types import StreamMessage
+from dalston.engine_sdk.prefetch import StagedTask, TaskPrefetcher
+from dalston.engine_sdk.runner import EngineRunner
+
+
+def _message(n: int, job_id: str = "job-1") -> StreamMessage:
+    return StreamMessage(
+        id=f"{n}-0",
+        task_id=f"task-{n}",
+        job_id=job_id,
+        enqueued_at=datetime.now(UTC),
+        timeout_at=datetime.now(UTC),
+        delivery_count=1,
+    )
+
+
+def _make_runner(prefetch: bool) -> EngineRunner:
+    engine = MagicMock()
+    engine.engine_id = "faster-whisper"
+    env = {
+        "DALSTON_ENGINE_ID": "faster-whisper",
+        "DALSTON_ENGINE_PREFETCH": "true" if prefetch else "false",
+        "DALSTON_ENGINE_TASK_CONCURRENCY": "1",
+    }
+    with patch.dict(os.environ, env):
+        runner = EngineRunner(engine)
+    runner._redis = MagicMock()
+    return runner
+
+
+class TestTaskPrefetcher:
+    def test_collect_returns_none_when_not_started(self) -> None:
+        prefetcher = TaskPrefetcher(receive=MagicMock(), stage_inputs=MagicMock())
+
+        assert prefetcher.collect() is None
+        prefetcher.shutdown()
+
+    def test_stages_next_message_excluding_current(self) -> None:
+        receive = MagicMock(return_value=_message(2))
+        stage_inputs = MagicMock(side_effect=lambda message: StagedTask(message))
+        prefetcher = TaskPrefetcher(receive=receive, stage_inputs=stage_inputs)
+
+        prefetcher.start(exclude=frozenset({"1-0"}))
+        staged = prefetcher.collect()
+
+        assert staged is not None
+        assert staged.message.id == "2-0"
+        receive.assert_called_once_with(frozenset({"1-0"}))
+        prefetcher.shutdown()
+
+    def test_poll_timeout_stages_nothing(self) -> None:
+        stage_inputs = MagicMock()
+        prefetcher = TaskPrefetcher(
+            receive=MagicMock(return_value=None), stage_inputs=stage_inputs
+        )
+
+        prefetcher.start(exclude=frozenset())
+
+        assert prefetcher.collect() is None
+        stage_inputs.assert_not_called()
+        prefetcher.shutdown()
+
+    def test_shutdown_discards_staged_dir(self, tmp_path: Path) -> None:
+        staging = tmp_path / "dalston_task_staged"
+        staging.mkdir()
+        prefetcher = TaskPrefetcher(
+            receive=MagicMock(return_value=_message(2)),
+            stage_inputs=lambda message: StagedTask(message, temp_dir=staging),
+        )
+        prefetcher.start(exclude=frozenset())
+        prefetcher._pending.result()
+
+        prefetcher.shutdown()
+
+        assert not staging.exists()
+
+
+class TestRunnerPrefetch:
+    def test_disabled_by_default(self) -> None:
+        runner = _make_runner(prefetch=False)
+
+        assert runner._prefetcher is None
+
+    def test_ignored_in_concurrent_mode(self) -> None:
+        engine = MagicMock()
+        engine.engine_id = "audio-prepare"
+        env = {
+            "DALSTON_ENGINE_PREFETCH": "true",
+            "DALSTON_ENGINE_TASK_CONCURRENCY": "4",
+        }
+        with patch.dict(os.environ, env):
+            runner = EngineRunner(engine)
+
+        assert runner._prefetcher is None
+
+    def test_second_task_uses_staged_inputs(self) -> None:
+        runner = _make_runner(prefetch=True)
+        staged_request = MagicMock(name="staged_request")
+        handled: list[tuple[str, StagedTask | None]] = []
+
+        def handle(message, staged=None):
+            handled.append((message.id, staged))
+
+        with (
+            patch.object(
+                runner, "_receive_message", side_effect=[_message(1), _message(2)]
+            ),
+            patch.object(
+                runner, "_load_task_request", return_value=staged_request
+            ) as load,
+            patch.object(runner, "_handle_message", side_effect=handle),
+            patch.object(runner_module, "is_job_cancelled", return_value=False),
+        ):
+            runner._poll_and_process()
+            runner._poll_and_process()
+
+        assert [message_id for message_id, _ in handled] == ["1-0", "2-0"]
+        first_staged, second_staged = handled[0][1], handled[1][1]
+        assert first_staged.task_request is None
+        assert second_staged.task_request is staged_request
+        load.assert_called_once()
+        assert load.call_args.args[0] == "task-2"
+        # Staging dir is cleaned up once the task has been handled
+        assert not second_staged.temp_dir.exists()
+        runner._prefetcher.shutdown()
+
+    def test_cancelled_job_is_not_staged(self) -> None:
+        runner = _make_runner(prefetch=True)
+
+        with (
+            patch.object(runner_module, "is_job_cancelled", return_value=True),
+            patch.object(runner, "_load_task_request") as load,
+        ):
+            staged = runner._stage_task_inputs(_message(2))
+
+        load.assert_not_called()
+        assert staged.task_request is None
+        assert staged.temp_dir is None
+        runner._prefetcher.shutdown()
+
+    def test_failed_staging_falls_back_to_inline_load(self) -> None:
+        runner = _make_runner(prefetch=True)
+
+        with (
+            patch.object(runner_module, "is_job_cancelled", return_value=False),
+            patch.object(
+                runner, "_load_task_request", side_effect=RuntimeError("s3 down")
+            ),
+        ):
+            staged = runner._stage_task_inputs(_message(2))
+
+        assert staged.task_request is None
+        assert staged.temp_dir is None
+        runner._prefetcher.shutdown()
+
+    def test_process_task_skips_download_for_staged_inputs(
+        self, tmp_path: Path
+    ) -> None:
+        runner = _make_runner(prefetch=True)
+        runner.engine.audio_format = None
+        staged_dir = tmp_path / "dalston_task_staged"
+        staged_dir.mkdir()
+        task_request = MagicMock()
+        task_request.job_id = "job-1"
+        task_request.stage = "transcribe"
+        task_request.config = {}
+        staged = StagedTask(_message(2), temp_dir=staged_dir, task_request=task_request)
+
+        with (
+            patch.object(runner, "_load_task_request") as load,
+            patch.object(runner, "_publish_task_started"),
+            patch.object(runner, "_publish_task_completed") as completed,
+            patch.object(runner, "_validate_transcript_output"),
+            patch.object(runner, "_save_task_output"),
+        ):
+            runner._process_task("task-2", {"job_id": "job-1"}, staged=staged)
+
+        load.assert_not_called()
+        completed.assert_called_once_with("task-2", "job-1")
+        assert runner.engine.process.call_args.args[0] is task_request
+        assert not staged_dir.exists()
+        runner._prefetcher.shutdown()
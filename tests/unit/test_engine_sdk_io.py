@@ -0,0 +1,95 @@
+"""Tests for engine SDK S3 I/O helpers."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from dalston.engine_sdk import io
+
+
+def _write(tmp_path: Path, payload: bytes) -> Path:
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(payload)
+    return path
+
+
+class TestHashingReader:
+    def test_sequential_reads_hash_whole_file(self, tmp_path: Path) -> None:
+        payload = b"0123456789" * 1000
+        path = _write(tmp_path, payload)
+
+        with path.open("rb") as f:
+            reader = io._HashingReader(f, path)
+            while reader.read(777):
+                pass
+
+            assert reader.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+    def test_rereads_after_seek_back_are_not_double_hashed(
+        self, tmp_path: Path
+    ) -> None:
+        payload = b"abcdefghij" * 100
+        path = _write(tmp_path, payload)
+
+        with path.open("rb") as f:
+            reader = io._HashingReader(f, path)
+            reader.read(500)
+            reader.seek(0)  # e.g. a retried PUT re-reading the body
+            reader.read()
+
+            assert reader.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+    def test_out_of_order_reads_fall_back_to_full_read(self, tmp_path: Path) -> None:
+        payload = b"xyz" * 1000
+        path = _write(tmp_path, payload)
+
+        with path.open("rb") as f:
+            reader = io._HashingReader(f, path)
+            reader.seek(1500)
+            reader.read()
+
+            assert reader.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+
+def test_upload_file_with_sha256_uses_managed_transfer(tmp_path: Path) -> None:
+    payload = b"prepared-audio" * 50
+    path = _write(tmp_path, payload)
+    s3 = MagicMock()
+    s3.upload_fileobj.side_effect = lambda fileobj, *_args, **_kwargs: fileobj.read()
+
+    with patch.object(io, "get_s3_client", return_value=s3):
+        checksum = io.upload_file_with_sha256(path, "s3://bucket/jobs/j1/a.wav")
+
+    assert checksum == hashlib.sha256(payload).hexdigest()
+    args, kwargs = s3.upload_fileobj.call_args
+    assert args[1:] == ("bucket", "jobs/j1/a.wav")
+    assert kwargs["Config"].multipart_threshold == 16 * 1024 * 1024
+
+
+def test_transfer_config_honours_env(monkeypatch) -> None:
+    monkeypatch.setenv("DALSTON_S3_MULTIPART_CHUNKSIZE_MB", "32")
+    monkeypatch.setenv("DALSTON_S3_TRANSFER_CONCURRENCY", "4")
+
+    config = io.get_transfer_config()
+
+    assert config.multipart_chunksize == 32 * 1024 * 1024
+    assert config.max_concurrency == 4
+
+
+def test_s3_client_is_shared_until_settings_change(monkeypatch) -> None:
+    monkeypatch.setattr(io, "_s3_client_cache", {})
+    monkeypatch.setenv("DALSTON_S3_MAX_POOL_CONNECTIONS", "64")
+
+    with patch.object(io.boto3, "client", side_effect=lambda *a, **kw: MagicMock()):
+        first = io.get_s3_client()
+        assert io.get_s3_client() is first
+
+        config = io.boto3.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 64
+        assert config.tcp_keepalive is True
+
+        monkeypatch.setenv("DALSTON_S3_REGION", "us-east-1")
+        assert io.get_s3_client() is not first
+        assert io.boto3.client.call_count == 2
@@ -7,6 +7,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from dalston.common.registry import EngineRecord
 from dalston.engine_sdk.types import EngineCapabilities
@@ -206,6 +207,7 @@ class TestSelectEngine:
     @pytest.fixture
     def mock_registry(self):
         registry = AsyncMock()
+        registry.get_queue_depths.return_value = {}
         return registry
 
     @pytest.fixture
@@ -265,6 +267,86 @@ class TestSelectEngine:
         assert error.attempted_engine_ids == ["engine_id-a", "engine_id-b"]
         assert "Attempted engine_ids: engine_id-a, engine_id-b." in str(error)
 
+    @pytest.mark.asyncio
+    async def test_least_loaded_engine_selected(self, mock_registry, mock_catalog):
+        busy = make_engine_state("busy", capabilities=make_capabilities("busy"))
+        idle = make_engine_state("idle", capabilities=make_capabilities("idle"))
+        busy.rtf_ewma = idle.rtf_ewma = 0.05
+
+        mock_registry.get_by_stage.return_value = [busy, idle]
+        mock_registry.get_queue_depths.return_value = {"busy": 6, "idle": 1}
+
+        result = await select_engine(
+            "transcribe", {}, mock_registry, mock_catalog, audio_duration_s=200.0
+        )
+
+        # One queued reference-length task (30s) plus this task's 200s of audio
+        assert result.engine_id == "idle"
+        assert "est. completion 40s" in result.selection_reason
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_errors_fall_back_to_capability_ranking(
+        self, mock_registry, mock_catalog
+    ):
+        native = make_engine_state(
+            "native",
+            capabilities=make_capabilities("native", supports_word_timestamps=True),
+        )
+        plain = make_engine_state("plain", capabilities=make_capabilities("plain"))
+
+        mock_registry.get_by_stage.return_value = [plain, native]
+        mock_registry.get_queue_depths.side_effect = RedisConnectionError("down")
+
+        result = await select_engine("transcribe", {}, mock_registry, mock_catalog)
+
+        assert result.engine_id == "native"
+        assert "est. completion" not in result.selection_reason
+
+    @pytest.mark.asyncio
+    async def test_capability_tier_outranks_queue_depth(
+        self, mock_registry, mock_catalog
+    ):
+        native = make_engine_state(
+            "native",
+            capabilities=make_capabilities("native", supports_word_timestamps=True),
+        )
+        plain = make_engine_state("plain", capabilities=make_capabilities("plain"))
+
+        mock_registry.get_by_stage.return_value = [plain, native]
+        mock_registry.get_queue_depths.return_value = {"native": 50}
+
+        result = await select_engine("transcribe", {}, mock_registry, mock_catalog)
+
+        assert result.engine_id == "native"
+
+    @pytest.mark.asyncio
+    async def test_engine_with_model_loaded_preferred(
+        self, mock_registry, mock_catalog, monkeypatch
+    ):
+        cold = make_engine_state("cold", capabilities=make_capabilities("cold"))
+        warm = make_engine_state("warm", capabilities=make_capabilities("warm"))
+        cold.rtf_ewma = warm.rtf_ewma = 0.05
+        warm.loaded_model = "model-warm"
+
+        mock_registry.get_by_stage.return_value = [cold, warm]
+
+        async def _mock_find_best_downloaded_model(engine_id, **kwargs):
+            return SimpleNamespace(
+                id=f"model-{engine_id}", loaded_model_id=f"model-{engine_id}"
+            )
+
+        monkeypatch.setattr(
+            "dalston.orchestrator.engine_selector._find_best_downloaded_model",
+            _mock_find_best_downloaded_model,
+        )
+
+        result = await select_engine(
+            "diarize", {}, mock_registry, mock_catalog, db=AsyncMock()
+        )
+
+        assert result.engine_id == "warm"
+        assert result.loaded_model_id == "model-warm"
+
     @pytest.mark.asyncio
     async def test_user_preference_validated(self, mock_registry, mock_catalog):
         caps = make_capabilities("preferred")
@@ -551,6 +633,7 @@ class TestSelectPipelineEngines:
     @pytest.fixture
     def mock_registry(self):
         registry = AsyncMock()
+        registry.get_queue_depths.return_value = {}
         return registry
 
     @pytest.fixture
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import HTTPException
 
+from dalston.gateway.services.audio_probe import AudioMetadata
+from dalston.gateway.services.audio_spool import AudioSpool
 from dalston.gateway.services.audio_url import (
     DownloadedAudio,
     DownloadError,
@@ -25,19 +28,18 @@ async def test_download_from_url_uses_explicit_max_bytes_override() -> None:
         "dalston.gateway.services.ingestion.download_audio_from_url",
         new=AsyncMock(
             return_value=DownloadedAudio(
-                content=b"data",
+                audio=AudioSpool.from_bytes(b"data"),
                 filename="test.wav",
                 content_type="audio/wav",
-                size=4,
             )
         ),
     ) as mock_download:
-        content, filename = await service._download_from_url(
+        spool, filename = await service._download_from_url(
             "https://example.com/audio.wav",
             max_bytes=1024,
         )
 
-    assert content == b"data"
+    assert spool.read_bytes() == b"data"
     assert filename == "test.wav"
     assert mock_download.await_args.kwargs["max_size"] == 1024
 
@@ -51,10 +53,9 @@ async def test_download_from_url_uses_settings_limit_by_default() -> None:
         "dalston.gateway.services.ingestion.download_audio_from_url",
         new=AsyncMock(
             return_value=DownloadedAudio(
-                content=b"data",
+                audio=AudioSpool.from_bytes(b"data"),
                 filename="test.wav",
                 content_type="audio/wav",
-                size=4,
             )
         ),
     ) as mock_download:
@@ -164,7 +165,46 @@ async def test_read_from_file_streaming_reads_all_chunks() -> None:
         chunks=[b"abc", b"def", b""],
     )
 
-    content, filename = await service._read_from_file(upload, max_bytes=1024)
+    spool, filename = await service._read_from_file(upload, max_bytes=1024)
 
     assert filename == "audio.wav"
-    assert content == b"abcdef"
+    assert spool.read_bytes() == b"abcdef"
+    assert spool.size == 6
+    assert spool.sha256 == hashlib.sha256(b"abcdef").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_ingest_probes_spooled_file_and_releases_on_close() -> None:
+    settings = SimpleNamespace(audio_url_max_size_gb=1.0, audio_url_timeout_seconds=10)
+    service = AudioIngestionService(settings)
+    upload = _FakeUploadFile(filename="audio.wav", chunks=[b"RIFF", b"data"])
+    metadata = AudioMetadata(
+        format="wav", duration=1.0, sample_rate=16000, channels=1, bit_depth=16
+    )
+    probed: list[object] = []
+
+    def fake_probe(data, filename):
+        probed.append(data)
+        return metadata
+
+    with patch("dalston.gateway.services.ingestion.probe_audio", new=fake_probe):
+        ingested = await service.ingest(file=upload, url=None)  # type: ignore[arg-type]
+
+    assert not isinstance(probed[0], bytes)
+    assert ingested.size == 8
+    assert ingested.open().read() == b"RIFFdata"
+
+    service.close()
+
+    with pytest.raises(ValueError):
+        ingested.open()
+
+
+def test_audio_spool_spills_to_disk_past_memory_limit() -> None:
+    with AudioSpool(max_memory_bytes=8) as spool:
+        spool.write(b"1234")
+        assert not spool.rolled_to_disk
+        spool.write(b"56789")
+
+        assert spool.rolled_to_disk
+        assert spool.read_bytes() == b"123456789"
@@ -0,0 +1,150 @@
+"""Unit tests for event-driven sync job waits.
+
+The notifier's contract: one subscription wakes only the waiters of the
+job a terminal event names, ignores everything else on the channel, and
+wakes every waiter when the subscription drops. wait_for_job_completion
+re-reads the job on wakeup and keeps plain polling when no notifier is
+subscribed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from dalston.common.models import JobStatus
+from dalston.gateway.services.job_notifications import JobCompletionNotifier
+from dalston.gateway.services.polling import wait_for_job_completion
+
+
+def _event(event_type: str, job_id) -> str:
+    return json.dumps({"type": event_type, "job_id": str(job_id)})
+
+
+def _subscribed_notifier() -> JobCompletionNotifier:
+    notifier = JobCompletionNotifier(redis=MagicMock())
+    notifier._subscribed = True
+    return notifier
+
+
+def _db_with_status_sequence(job, statuses: list[str]) -> MagicMock:
+    """DB double whose refresh() walks the job through ``statuses``."""
+    remaining = list(statuses)
+
+    async def refresh(obj) -> None:
+        obj.status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    db = MagicMock()
+    db.refresh = AsyncMock(side_effect=refresh)
+    return db
+
+
+class TestDispatch:
+    @pytest.mark.asyncio
+    async def test_terminal_event_wakes_only_that_job(self) -> None:
+        notifier = _subscribed_notifier()
+        job_a, job_b = uuid4(), uuid4()
+
+        with notifier.watch(job_a) as wake_a, notifier.watch(job_b) as wake_b:
+            notifier.dispatch(_event("job.completed", job_a))
+
+            assert wake_a.is_set()
+            assert not wake_b.is_set()
+
+    @pytest.mark.asyncio
+    async def test_non_terminal_events_ignored(self) -> None:
+        notifier = _subscribed_notifier()
+        job_id = uuid4()
+
+        with notifier.watch(job_id) as wakeup:
+            notifier.dispatch(_event("job.created", job_id))
+            notifier.dispatch(_event("task.completed", job_id))
+            notifier.dispatch("not json")
+
+            assert not wakeup.is_set()
+
+    @pytest.mark.asyncio
+    async def test_watch_unregisters_on_exit(self) -> None:
+        notifier = _subscribed_notifier()
+        job_id = uuid4()
+
+        with notifier.watch(job_id):
+            with notifier.watch(job_id):
+                pass
+            assert len(notifier._waiters[str(job_id)]) == 1
+
+        assert notifier._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_subscription_loss_wakes_all_waiters(self) -> None:
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock(side_effect=ConnectionError("redis down"))
+        pubsub.aclose = AsyncMock()
+        redis = MagicMock()
+        redis.pubsub = MagicMock(return_value=pubsub)
+        notifier = JobCompletionNotifier(redis=redis)
+
+        with notifier.watch(uuid4()) as wakeup:
+            await notifier.start()
+            await asyncio.wait_for(wakeup.wait(), timeout=1.0)
+            await notifier.stop()
+
+        assert not notifier.subscribed
+        pubsub.aclose.assert_awaited()
+
+
+class TestWaitForJobCompletion:
+    @pytest.mark.asyncio
+    async def test_event_wakes_waiter_without_polling(self) -> None:
+        notifier = _subscribed_notifier()
+        job = SimpleNamespace(id=uuid4(), status=JobStatus.RUNNING.value)
+        db = _db_with_status_sequence(job, [JobStatus.COMPLETED.value])
+
+        async def publish_soon() -> None:
+            await asyncio.sleep(0.01)
+            notifier.dispatch(_event("job.completed", job.id))
+
+        publisher = asyncio.create_task(publish_soon())
+        start = time.monotonic()
+        result = await wait_for_job_completion(
+            db, job, timeout_seconds=30.0, poll_interval=10.0, notifier=notifier
+        )
+        await publisher
+
+        assert result.completed
+        assert time.monotonic() - start < 1.0
+        assert db.refresh.await_count == 1
+        assert notifier._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_notifier_falls_back_to_polling(self) -> None:
+        notifier = JobCompletionNotifier(redis=MagicMock())  # never subscribed
+        job = SimpleNamespace(id=uuid4(), status=JobStatus.RUNNING.value)
+        db = _db_with_status_sequence(
+            job, [JobStatus.RUNNING.value, JobStatus.FAILED.value]
+        )
+
+        result = await wait_for_job_completion(
+            db, job, timeout_seconds=5.0, poll_interval=0.01, notifier=notifier
+        )
+
+        assert result.failed
+        assert db.refresh.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_terminal_status(self) -> None:
+        job = SimpleNamespace(id=uuid4(), status=JobStatus.RUNNING.value)
+        db = _db_with_status_sequence(job, [JobStatus.RUNNING.value])
+
+        result = await wait_for_job_completion(
+            db, job, timeout_seconds=0.05, poll_interval=0.01
+        )
+
+        assert result.timed_out
+        assert result.status is None
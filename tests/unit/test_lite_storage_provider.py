@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from dalston.gateway.services.artifact_store import (
@@ -15,6 +17,13 @@ async def test_local_fs_artifact_store_roundtrip(tmp_path) -> None:
     assert await store.exists(uri)
 
 
+@pytest.mark.asyncio
+async def test_local_fs_artifact_store_write_stream(tmp_path) -> None:
+    store = LocalFilesystemArtifactStoreAdapter(str(tmp_path))
+    uri = await store.write_stream("jobs/a/audio/original.wav", io.BytesIO(b"RIFF"))
+    assert await store.read_bytes(uri) == b"RIFF"
+
+
 @pytest.mark.asyncio
 async def test_local_fs_artifact_store_rejects_key_path_traversal(tmp_path) -> None:
     store = LocalFilesystemArtifactStoreAdapter(str(tmp_path))
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import threading
 from pathlib import Path
 
+import pytest
+
 from dalston.common.artifacts import ArtifactReference, ProducedArtifact
-from dalston.engine_sdk.materializer import ArtifactMaterializer, ArtifactStore
+from dalston.engine_sdk.materializer import (
+    ArtifactChecksumError,
+    ArtifactMaterializer,
+    ArtifactStore,
+)
 
 
 class _MemoryStore(ArtifactStore):
@@ -104,3 +113,79 @@ def test_final_transcript_persists_to_canonical_job_path(tmp_path: Path) -> None
         refs[0].storage_locator == "s3://dalston-artifacts/jobs/job-123/transcript.json"
     )
     assert refs[0].storage_locator in store.remote_files
+
+
+def test_materialize_downloads_slots_concurrently(tmp_path: Path) -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _BarrierStore(_MemoryStore):
+        def download(self, locator: str, destination: Path) -> None:
+            barrier.wait()  # Times out unless all three run at once
+            super().download(locator, destination)
+
+    store = _BarrierStore()
+    artifact_index = {}
+    for channel in range(3):
+        locator = f"s3://bucket/jobs/j1/ch{channel}.wav"
+        store.remote_files[locator] = f"ch{channel}".encode()
+        artifact_index[f"a{channel}"] = ArtifactReference(
+            artifact_id=f"a{channel}", kind="audio", storage_locator=locator
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        materializer = ArtifactMaterializer(store=store, transfer_pool=pool)
+        materialized = materializer.materialize(
+            resolved_artifact_ids={f"audio_ch{c}": f"a{c}" for c in range(3)},
+            artifact_index=artifact_index,
+            target_dir=tmp_path / "mat",
+        )
+
+    assert list(materialized) == ["audio_ch0", "audio_ch1", "audio_ch2"]
+    assert materialized["audio_ch2"].local_path.read_bytes() == b"ch2"
+
+
+def test_materialize_rejects_checksum_mismatch(tmp_path: Path) -> None:
+    store = _MemoryStore()
+    store.remote_files["s3://bucket/jobs/j1/a1.wav"] = b"corrupted"
+    materializer = ArtifactMaterializer(store=store)
+    artifact_index = {
+        "a1": ArtifactReference(
+            artifact_id="a1",
+            kind="audio",
+            storage_locator="s3://bucket/jobs/j1/a1.wav",
+            checksum=hashlib.sha256(b"audio-bytes").hexdigest(),
+        )
+    }
+
+    with pytest.raises(ArtifactChecksumError, match="a1"):
+        materializer.materialize(
+            resolved_artifact_ids={"audio": "a1"},
+            artifact_index=artifact_index,
+            target_dir=tmp_path / "mat",
+        )
+
+
+def test_persist_records_checksum_and_transfer_timings(tmp_path: Path) -> None:
+    store = _MemoryStore()
+    observed: list[str] = []
+    materializer = ArtifactMaterializer(
+        store=store,
+        transfer_observer=lambda direction, _seconds: observed.append(direction),
+    )
+    produced = []
+    for name in ("a", "b"):
+        local_file = tmp_path / f"{name}.json"
+        local_file.write_bytes(name.encode())
+        produced.append(
+            ProducedArtifact(logical_name=name, local_path=local_file, kind="json")
+        )
+
+    refs = materializer.persist_produced(
+        job_id="job-123",
+        task_id="task-456",
+        produced_artifacts=produced,
+    )
+
+    assert [ref.artifact_id for ref in refs] == ["task-456:a", "task-456:b"]
+    assert refs[1].checksum == hashlib.sha256(b"b").hexdigest()
+    assert observed == ["upload", "upload"]
@@ -92,10 +92,15 @@ def test_runner_uses_final_transcript_artifact_for_canonical_uri(
         "upload_json",
         lambda payload, locator: upload_json_calls.append((payload, locator)),
     )
+
+    def fake_upload_file_with_sha256(source: Path, locator: str) -> str:
+        upload_file_calls.append((source, locator))
+        return "0" * 64
+
     monkeypatch.setattr(
         runner_module.io,
-        "upload_file",
-        lambda source, locator: upload_file_calls.append((source, locator)),
+        "upload_file_with_sha256",
+        fake_upload_file_with_sha256,
     )
     monkeypatch.setattr(
         runner,
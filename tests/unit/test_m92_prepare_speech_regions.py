@@ -52,9 +52,18 @@ def _bare_engine(cls) -> SimpleNamespace:
     )
 
 
+class _FakeCtx:
+    def describe_artifact(self, **kwargs):
+        return SimpleNamespace(**kwargs)
+
+
 class _FakeChunker:
     """Per-path canned VAD segments keyed by filename."""
 
+    vad_threshold = 0.5
+    min_speech_duration_s = 0.25
+    min_silence_duration_s = 0.3
+
     RESULTS = {
         "prepared_ch0.wav": [(3.0, 16.0), (21.0, 24.0)],
         "prepared_ch1.wav": [(0.0, 3.5), (34.0, 37.5), (48.0, 56.0)],
@@ -68,16 +77,18 @@ class _FakeChunker:
 
 
 class TestDetectSpeechRegions:
-    def test_union_and_ratio(self, prepare_module, monkeypatch):
+    def test_union_and_ratio(self, prepare_module, monkeypatch, tmp_path):
         import dalston.engine_sdk.vad as vad_module
 
         monkeypatch.setattr(vad_module, "VadChunker", _FakeChunker)
         engine = _bare_engine(prepare_module.AudioPrepareEngine)
 
-        regions, ratio = engine._detect_speech_regions(
+        regions, ratio, _ = engine._detect_speech_regions(
             engine,
-            [Path("/tmp/prepared_ch0.wav"), Path("/tmp/prepared_ch1.wav")],
+            [tmp_path / "prepared_ch0.wav", tmp_path / "prepared_ch1.wav"],
             56.0,
+            _FakeCtx(),
+            channels=[0, 1],
         )
         assert regions is not None
         spans = [(r.start, r.end) for r in regions]
@@ -85,6 +96,34 @@ class TestDetectSpeechRegions:
         # speech total = 16 + 3 + 3.5 + 8 = 30.5s of 56s
         assert ratio == pytest.approx(30.5 / 56.0, abs=0.001)
 
+    def test_per_channel_artifacts_keep_own_regions(
+        self, prepare_module, monkeypatch, tmp_path
+    ):
+        import dalston.engine_sdk.vad as vad_module
+        from dalston.engine_sdk.speech_regions import read_speech_regions
+
+        monkeypatch.setattr(vad_module, "VadChunker", _FakeChunker)
+        engine = _bare_engine(prepare_module.AudioPrepareEngine)
+
+        _, _, artifacts = engine._detect_speech_regions(
+            engine,
+            [tmp_path / "prepared_ch0.wav", tmp_path / "prepared_ch1.wav"],
+            56.0,
+            _FakeCtx(),
+            channels=[0, 1],
+        )
+
+        assert [(a.logical_name, a.kind, a.channel) for a in artifacts] == [
+            ("speech_regions_ch0", "speech_regions", 0),
+            ("speech_regions_ch1", "speech_regions", 1),
+        ]
+        ch1 = read_speech_regions(artifacts[1].local_path, _FakeChunker())
+        assert [(r.start, r.end) for r in ch1] == [
+            (0.0, 3.5),
+            (34.0, 37.5),
+            (48.0, 56.0),
+        ]
+
     def test_unavailable_stack_degrades_to_none(self, prepare_module, monkeypatch):
         import dalston.engine_sdk.vad as vad_module
 
@@ -95,24 +134,27 @@ class TestDetectSpeechRegions:
         monkeypatch.setattr(vad_module, "VadChunker", _Broken)
         engine = _bare_engine(prepare_module.AudioPrepareEngine)
 
-        regions, ratio = engine._detect_speech_regions(
-            engine, [Path("/tmp/prepared.wav")], 30.0
+        regions, ratio, artifacts = engine._detect_speech_regions(
+            engine, [Path("/tmp/prepared.wav")], 30.0, _FakeCtx()
         )
         assert regions is None
         assert ratio is None
+        assert artifacts == []
 
-    def test_no_speech_yields_empty_regions_not_none(self, prepare_module, monkeypatch):
+    def test_no_speech_yields_empty_regions_not_none(
+        self, prepare_module, monkeypatch, tmp_path
+    ):
         import dalston.engine_sdk.vad as vad_module
 
-        class _Silent:
+        class _Silent(_FakeChunker):
             def detect_speech(self, path):
                 return []
 
         monkeypatch.setattr(vad_module, "VadChunker", _Silent)
         engine = _bare_engine(prepare_module.AudioPrepareEngine)
 
-        regions, ratio = engine._detect_speech_regions(
-            engine, [Path("/tmp/prepared.wav")], 30.0
+        regions, ratio, _ = engine._detect_speech_regions(
+            engine, [tmp_path / "prepared.wav"], 30.0, _FakeCtx()
         )
         # Detection ran and found nothing — that is data, not absence.
         assert regions == []
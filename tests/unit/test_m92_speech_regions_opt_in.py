@@ -35,3 +35,23 @@ class TestSpeechRegionsOptIn:
         for value in ("0", "false", "off", ""):
             config = _prepare_config(monkeypatch, value)
             assert "detect_speech_regions" not in config
+
+
+class TestSpeechRegionsBinding:
+    def _slots(self, monkeypatch, env_value: str | None) -> dict[str, list[dict]]:
+        if env_value is None:
+            monkeypatch.delenv("DALSTON_PREPARE_SPEECH_REGIONS", raising=False)
+        else:
+            monkeypatch.setenv("DALSTON_PREPARE_SPEECH_REGIONS", env_value)
+        tasks = build_task_dag_for_test(uuid4(), _AUDIO, {})
+        return {t.stage: t.input_bindings for t in tasks}
+
+    def test_transcribe_binds_optional_speech_regions(self, monkeypatch):
+        bindings = self._slots(monkeypatch, "1")["transcribe"]
+        regions = next(b for b in bindings if b["slot"] == "speech_regions")
+        assert regions["selector"]["kind"] == "speech_regions"
+        assert regions["selector"]["required"] is False
+
+    def test_no_speech_regions_slot_when_off(self, monkeypatch):
+        bindings = self._slots(monkeypatch, None)["transcribe"]
+        assert [b["slot"] for b in bindings] == ["audio"]
@@ -0,0 +1,142 @@
+"""Unit tests for per-event job-completion work in the orchestrator.
+
+Covers the unfinished-task short-circuit in _check_job_completion, the
+concurrent dependency-response fetch, and the task response cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from dalston.orchestrator import scheduler
+from dalston.orchestrator.handlers import (
+    _check_job_completion,
+    _gather_previous_responses,
+)
+from dalston.orchestrator.scheduler import _TaskResponseCache, get_task_response
+
+
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    scheduler._task_response_cache.clear()
+    yield
+    scheduler._task_response_cache.clear()
+
+
+def _fake_s3(bodies: dict[str, bytes]):
+    s3 = MagicMock()
+
+    async def get_object(Bucket, Key):  # noqa: N803
+        if Key not in bodies:
+            raise KeyError(Key)
+        body = MagicMock()
+        body.read = AsyncMock(return_value=bodies[Key])
+        return {"Body": body}
+
+    s3.get_object = AsyncMock(side_effect=get_object)
+
+    @asynccontextmanager
+    async def client(settings):
+        yield s3
+
+    return s3, client
+
+
+class TestTaskResponseCache:
+    def test_evicts_least_recently_used_beyond_byte_budget(self) -> None:
+        cache = _TaskResponseCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") == b"1234"  # a is now most recent
+
+        cache.put("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.get("c") == b"1234"
+
+    def test_skips_bodies_larger_than_budget(self) -> None:
+        cache = _TaskResponseCache(max_bytes=4)
+        cache.put("big", b"12345")
+        assert cache.get("big") is None
+
+    @pytest.mark.asyncio
+    async def test_get_task_response_reads_s3_once(self) -> None:
+        job_id, task_id = uuid4(), uuid4()
+        key = f"jobs/{job_id}/tasks/{task_id}/response.json"
+        s3, client = _fake_s3({key: json.dumps({"data": {"text": "hi"}}).encode()})
+        settings = MagicMock(s3_bucket="bucket")
+
+        with patch("dalston.orchestrator.scheduler.get_s3_client", client):
+            first = await get_task_response(job_id, task_id, settings)
+            first["data"]["text"] = "mutated"
+            second = await get_task_response(job_id, task_id, settings)
+
+        assert second == {"data": {"text": "hi"}}
+        assert s3.get_object.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_response_is_not_cached(self) -> None:
+        s3, client = _fake_s3({})
+        settings = MagicMock(s3_bucket="bucket")
+        job_id, task_id = uuid4(), uuid4()
+
+        with patch("dalston.orchestrator.scheduler.get_s3_client", client):
+            assert await get_task_response(job_id, task_id, settings) is None
+            assert await get_task_response(job_id, task_id, settings) is None
+
+        assert s3.get_object.await_count == 2
+
+
+class TestGatherPreviousResponses:
+    @pytest.mark.asyncio
+    async def test_fetches_dependencies_concurrently(self) -> None:
+        job_id = uuid4()
+        tasks = {}
+        for stage in ("prepare", "transcribe_ch0", "transcribe_ch1"):
+            task = MagicMock(id=uuid4(), job_id=job_id, stage=stage)
+            tasks[task.id] = task
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_get_task_response(job_id, task_id, settings):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"data": {"stage": tasks[task_id].stage}}
+
+        with patch(
+            "dalston.orchestrator.handlers.get_task_response",
+            side_effect=fake_get_task_response,
+        ):
+            result = await _gather_previous_responses(
+                dependency_ids=list(tasks), task_by_id=tasks, settings=MagicMock()
+            )
+
+        assert peak == 3
+        # Base key follows dependency order, as with sequential fetching
+        assert result["transcribe"] == {"stage": "transcribe_ch1"}
+        assert result["prepare"] == {"stage": "prepare"}
+
+
+class TestCheckJobCompletion:
+    @pytest.mark.asyncio
+    async def test_unfinished_tasks_short_circuit_after_one_query(self) -> None:
+        db = AsyncMock()
+        pending = MagicMock()
+        pending.scalars.return_value.all.return_value = ["transcribe_ch1"]
+        db.execute.return_value = pending
+
+        await _check_job_completion(uuid4(), db, AsyncMock(), MagicMock())
+
+        assert db.execute.await_count == 1
+        db.commit.assert_not_awaited()
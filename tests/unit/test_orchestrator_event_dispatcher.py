@@ -0,0 +1,198 @@
+"""Unit tests for the job-partitioned orchestrator event dispatcher.
+
+The dispatcher's contract: work for one key runs one item at a time in
+submission order, different keys run concurrently up to the limit, a
+failing item does not stall its lane, submit() blocks at max_pending, and
+work whose ID is already queued or running is not queued again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dalston.common.durable_events import DurableEventEnvelope
+from dalston.orchestrator.distributed_main import (
+    _event_partition_key,
+    _submit_durable_event,
+)
+from dalston.orchestrator.event_dispatcher import PartitionedEventDispatcher
+
+
+def _recording_work(log: list[str], label: str, gate: asyncio.Event | None = None):
+    async def work() -> None:
+        log.append(f"start:{label}")
+        if gate is not None:
+            await gate.wait()
+        else:
+            await asyncio.sleep(0)
+        log.append(f"end:{label}")
+
+    return work
+
+
+@pytest.mark.asyncio
+class TestPartitionedEventDispatcher:
+    async def test_same_key_runs_in_order_one_at_a_time(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=4)
+        log: list[str] = []
+
+        for label in ("a1", "a2", "a3"):
+            await dispatcher.submit("job:a", _recording_work(log, label))
+        await dispatcher.drain()
+
+        assert log == ["start:a1", "end:a1", "start:a2", "end:a2", "start:a3", "end:a3"]
+        assert dispatcher.pending == 0
+        assert dispatcher.active_lanes == 0
+
+    async def test_slow_job_does_not_block_other_jobs(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=4)
+        log: list[str] = []
+        slow_gate = asyncio.Event()
+
+        await dispatcher.submit("job:slow", _recording_work(log, "slow", slow_gate))
+        await dispatcher.submit("job:slow", _recording_work(log, "slow-next"))
+        await dispatcher.submit("job:fast", _recording_work(log, "fast"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert "end:fast" in log
+        assert "start:slow-next" not in log
+
+        slow_gate.set()
+        await dispatcher.drain()
+        assert log.index("end:slow") < log.index("start:slow-next")
+
+    async def test_concurrency_limits_running_lanes(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=2)
+        running = 0
+        peak = 0
+        gate = asyncio.Event()
+
+        async def work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await gate.wait()
+            running -= 1
+
+        for i in range(5):
+            await dispatcher.submit(f"job:{i}", work)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert running == 2
+        gate.set()
+        await dispatcher.drain()
+        assert peak == 2
+
+    async def test_failed_item_does_not_stall_lane(self) -> None:
+        dispatcher = PartitionedEventDispatcher()
+        log: list[str] = []
+
+        async def boom() -> None:
+            raise RuntimeError("handler blew up")
+
+        await dispatcher.submit("job:a", boom)
+        await dispatcher.submit("job:a", _recording_work(log, "after"))
+        await dispatcher.drain()
+
+        assert log == ["start:after", "end:after"]
+
+    async def test_submit_blocks_at_max_pending(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=1, max_pending=2)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        await dispatcher.submit("job:a", _recording_work(log, "a", gate))
+        await dispatcher.submit("job:b", _recording_work(log, "b"))
+        third = asyncio.create_task(
+            dispatcher.submit("job:c", _recording_work(log, "c"))
+        )
+        await asyncio.sleep(0)
+        assert not third.done()
+        assert dispatcher.pending == 2
+
+        gate.set()
+        await third
+        await dispatcher.drain()
+        assert log[-1] == "end:c"
+
+    async def test_duplicate_work_id_is_dropped_while_held(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=1)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        assert await dispatcher.submit(
+            "job:a", _recording_work(log, "first", gate), work_id="1-0"
+        )
+        assert not await dispatcher.submit(
+            "job:a", _recording_work(log, "again"), work_id="1-0"
+        )
+        assert dispatcher.pending == 1
+
+        gate.set()
+        await dispatcher.drain()
+        # Once finished, the same ID may be queued again (e.g. a retry)
+        assert await dispatcher.submit(
+            "job:a", _recording_work(log, "later"), work_id="1-0"
+        )
+        await dispatcher.drain()
+
+        assert log == ["start:first", "end:first", "start:later", "end:later"]
+
+    async def test_reclaimed_event_still_queued_runs_once(self) -> None:
+        dispatcher = PartitionedEventDispatcher(concurrency=1)
+        gate = asyncio.Event()
+        envelope = DurableEventEnvelope(
+            message_id="5-0",
+            event_type="task.completed",
+            payload={"task_id": "t1", "job_id": "j1"},
+        )
+
+        async def blocker() -> None:
+            await gate.wait()
+
+        await dispatcher.submit("job:j1", blocker)
+        with patch(
+            "dalston.orchestrator.distributed_main._process_durable_event",
+            new_callable=AsyncMock,
+        ) as process:
+            for source in ("live_consumer", "crash_recovery"):
+                await _submit_durable_event(
+                    dispatcher,
+                    envelope,
+                    AsyncMock(),
+                    MagicMock(),
+                    AsyncMock(),
+                    consumer_id="orchestrator-1",
+                    source=source,
+                )
+            gate.set()
+            await dispatcher.drain()
+
+        process.assert_awaited_once()
+        assert process.await_args.kwargs["source"] == "live_consumer"
+
+
+class TestEventPartitionKey:
+    def test_keyed_by_job_id(self) -> None:
+        started = DurableEventEnvelope(
+            message_id="1-0",
+            event_type="task.started",
+            payload={"task_id": "t1", "job_id": "j1"},
+        )
+        created = DurableEventEnvelope(
+            message_id="2-0", event_type="job.created", payload={"job_id": "j1"}
+        )
+
+        assert _event_partition_key(started) == _event_partition_key(created)
+
+    def test_invalid_envelope_gets_own_lane(self) -> None:
+        invalid = DurableEventEnvelope(
+            message_id="3-0", failure_reason="invalid_event_schema"
+        )
+
+        assert _event_partition_key(invalid) == "message:3-0"
@@ -168,3 +168,24 @@ class TestOnnxRTEngineMetadata:
         models = engine.get_models()
         assert isinstance(models, list)
         assert len(models) > 0
+
+
+class TestOnnxRTBatchedTranscribe:
+    """Verify cross-session batches go through one core call."""
+
+    def test_transcribe_batch_uses_one_core_call(self) -> None:
+        engine = _build_rt_engine(_make_core_result())
+        engine._core.transcribe_batch.return_value = [
+            _make_core_result(text="hello world"),
+            _make_core_result(text="good bye"),
+        ]
+
+        outputs = engine.transcribe_batch(
+            [np.zeros(16000, dtype=np.float32)] * 2,
+            TranscriptionRequest(language="en", loaded_model_id="ctc-0.6b"),
+        )
+
+        assert engine.supports_batched_transcribe() is True
+        assert [o.text for o in outputs] == ["hello world", "good bye"]
+        assert engine._core.transcribe_batch.call_args[0][1] == "ctc-0.6b"
+        engine._core.transcribe.assert_not_called()
@@ -0,0 +1,103 @@
+"""Tests for task payload serialization."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dalston.common import payload_codec
+from dalston.common.payload_codec import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_ZSTD_CONTENT_TYPE,
+    PayloadFormat,
+    decode_payload,
+    encode_payload,
+    get_payload_format,
+)
+from dalston.engine_sdk import io
+
+PAYLOAD = {
+    "task_id": "task-1",
+    "data": {"segments": [{"start": 0.0, "end": 1.5, "text": "héllo"}]},
+    "completed_at": None,
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_format_cache():
+    get_payload_format.cache_clear()
+    yield
+    get_payload_format.cache_clear()
+
+
+class TestJson:
+    def test_json_is_compact(self) -> None:
+        body, content_type = encode_payload(PAYLOAD, PayloadFormat.JSON)
+
+        assert content_type == JSON_CONTENT_TYPE
+        assert b"\n" not in body
+        assert b", " not in body
+        assert decode_payload(body, content_type) == PAYLOAD
+
+    def test_legacy_indented_json_still_decodes(self) -> None:
+        legacy = json.dumps(PAYLOAD, indent=2).encode("utf-8")
+        assert decode_payload(legacy) == PAYLOAD
+        assert decode_payload(legacy, JSON_CONTENT_TYPE) == PAYLOAD
+
+    def test_non_json_values_are_stringified(self) -> None:
+        body, _ = encode_payload({"path": payload_codec}, PayloadFormat.JSON)
+        assert decode_payload(body)["path"].startswith("<module")
+
+
+class TestFormatSelection:
+    def test_defaults_to_json(self, monkeypatch) -> None:
+        monkeypatch.delenv("DALSTON_TASK_PAYLOAD_FORMAT", raising=False)
+        assert get_payload_format() is PayloadFormat.JSON
+
+    def test_unknown_value_falls_back_to_json(self, monkeypatch) -> None:
+        monkeypatch.setenv("DALSTON_TASK_PAYLOAD_FORMAT", "yaml")
+        assert get_payload_format() is PayloadFormat.JSON
+
+    def test_msgpack_without_packages_falls_back_to_json(self, monkeypatch) -> None:
+        monkeypatch.setenv("DALSTON_TASK_PAYLOAD_FORMAT", "msgpack-zstd")
+        monkeypatch.setattr(payload_codec, "_msgpack_zstd_available", lambda: False)
+        assert get_payload_format() is PayloadFormat.JSON
+
+
+class TestMsgpackZstd:
+    def test_round_trip_and_sniffing(self) -> None:
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+        body, content_type = encode_payload(PAYLOAD, PayloadFormat.MSGPACK_ZSTD)
+
+        assert content_type == MSGPACK_ZSTD_CONTENT_TYPE
+        assert decode_payload(body, content_type) == PAYLOAD
+        # Readers without the content type detect the zstd frame
+        assert decode_payload(body) == PAYLOAD
+
+    def test_missing_packages_raise_clear_error(self) -> None:
+        zstd_frame = b"\x28\xb5\x2f\xfd" + b"\x00" * 8
+        with patch.dict("sys.modules", {"msgpack": None, "zstandard": None}):
+            with pytest.raises(RuntimeError, match="compact-payloads"):
+                decode_payload(zstd_frame)
+
+
+class TestEngineIo:
+    def test_upload_and_download_negotiate_content_type(self) -> None:
+        stored: dict = {}
+        s3 = MagicMock()
+        s3.put_object.side_effect = lambda **kwargs: stored.update(kwargs)
+        s3.get_object.side_effect = lambda **_: {
+            "Body": MagicMock(read=lambda: stored["Body"]),
+            "ContentType": stored["ContentType"],
+        }
+
+        with patch.object(io, "get_s3_client", return_value=s3):
+            io.upload_json(PAYLOAD, "s3://bucket/jobs/j/tasks/t/response.json")
+            result = io.download_json("s3://bucket/jobs/j/tasks/t/response.json")
+
+        assert stored["ContentType"] == JSON_CONTENT_TYPE
+        assert result == PAYLOAD
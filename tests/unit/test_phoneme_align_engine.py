@@ -109,6 +109,25 @@ class TestBuildTrellis:
 
         assert trellis.shape == (10, 1)
 
+    def test_trellis_matches_per_frame_recurrence(self, ctc_module):
+        """Column-wise solution equals the frame-by-frame DP, wildcards included."""
+        emission = torch.log_softmax(torch.randn(40, 6) * 3, dim=-1).numpy()
+        tokens = [1, -1, 3, 2, 5]
+
+        expected = np.zeros((40, len(tokens)))
+        expected[1:, 0] = np.cumsum(emission[1:, 0])
+        expected[0, 1:] = -np.inf
+        expected[-len(tokens) + 1 :, 0] = np.inf
+        for t in range(39):
+            advance = ctc_module._token_emission(emission[t], tokens[1:], 0)
+            expected[t + 1, 1:] = np.maximum(
+                expected[t, 1:] + emission[t, 0], expected[t, :-1] + advance
+            )
+
+        trellis = ctc_module.build_trellis(emission, tokens)
+
+        np.testing.assert_allclose(trellis, expected, rtol=1e-5)
+
 
 class TestBacktrack:
     """Tests for beam-search backtracking."""
@@ -0,0 +1,110 @@
+"""Tests for the memory-mapped prepared-audio reader."""
+
+from __future__ import annotations
+
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dalston.engine_sdk import prepared_audio
+from dalston.engine_sdk.prepared_audio import (
+    PreparedAudio,
+    load_audio_f32,
+    open_prepared_audio,
+    probe_audio,
+)
+from dalston.engine_sdk.vad import SpeechSegment, VadChunker
+
+SR = 16000
+
+
+def _write_wav(
+    path: Path, samples: np.ndarray, channels: int = 1, rate: int = SR
+) -> Path:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(samples.astype("<i2").tobytes())
+    return path
+
+
+class TestOpenPreparedAudio:
+    def test_slices_are_zero_copy_int16_views(self, tmp_path):
+        samples = np.arange(-8000, 8000, dtype=np.int16)
+        audio = open_prepared_audio(_write_wav(tmp_path / "a.wav", samples), SR)
+
+        assert isinstance(audio, PreparedAudio)
+        assert isinstance(audio.samples, np.memmap)
+        assert audio.size == len(samples)
+        assert audio.duration_s == pytest.approx(1.0)
+
+        view = audio.view(0.25, 0.5)
+        assert view.samples.dtype == np.int16
+        assert np.shares_memory(view.samples, audio.samples)
+        np.testing.assert_array_equal(view.samples, samples[4000:8000])
+
+    def test_float_conversion_happens_per_window(self, tmp_path):
+        samples = np.full(SR, 16384, dtype=np.int16)
+        audio = open_prepared_audio(_write_wav(tmp_path / "a.wav", samples))
+        assert audio is not None
+
+        window = audio.window(0.5, 0.75)
+        assert window.dtype == np.float32
+        assert len(window) == SR // 4
+        assert window[0] == pytest.approx(0.5)
+        assert np.asarray(audio[:10]).dtype == np.float32
+
+    def test_rejects_what_it_cannot_map(self, tmp_path):
+        stereo = _write_wav(tmp_path / "s.wav", np.zeros(200, np.int16), channels=2)
+        hi_rate = _write_wav(tmp_path / "h.wav", np.zeros(200, np.int16), rate=48000)
+        other = tmp_path / "x.mp3"
+        other.write_bytes(b"ID3" + bytes(64))
+
+        assert open_prepared_audio(stereo) is None
+        assert open_prepared_audio(hi_rate, SR) is None
+        assert open_prepared_audio(other) is None
+        assert open_prepared_audio(tmp_path / "missing.wav") is None
+
+
+def test_probe_is_cached_until_the_file_changes(tmp_path, monkeypatch):
+    path = _write_wav(tmp_path / "a.wav", np.zeros(SR, np.int16))
+    calls: list[Path] = []
+    real = prepared_audio._probe_wav
+
+    def counting(audio_path, file_size):
+        calls.append(audio_path)
+        return real(audio_path, file_size)
+
+    monkeypatch.setattr(prepared_audio, "_probe_wav", counting)
+
+    assert probe_audio(path).num_frames == SR
+    assert probe_audio(path).num_frames == SR
+    assert len(calls) == 1
+
+    _write_wav(path, np.zeros(2 * SR, np.int16))
+    os.utime(path, ns=(0, 10**18))
+    assert probe_audio(path).num_frames == 2 * SR
+    assert len(calls) == 2
+
+
+def test_load_audio_f32_matches_soundfile_decode(tmp_path):
+    sf = pytest.importorskip("soundfile")
+    samples = (np.sin(np.arange(SR) / 10) * 20000).astype(np.int16)
+    path = _write_wav(tmp_path / "a.wav", samples)
+
+    expected, _ = sf.read(str(path), dtype="float32")
+    np.testing.assert_allclose(load_audio_f32(path, SR), expected, atol=1e-6)
+
+
+def test_vad_reuses_regions_without_decoding(tmp_path):
+    path = _write_wav(tmp_path / "a.wav", np.zeros(10 * SR, np.int16))
+    regions = [SpeechSegment(start=1.0, end=3.0)]
+
+    audio, speech = VadChunker().load_and_detect(path, speech=regions)
+
+    assert isinstance(audio, PreparedAudio)
+    assert speech == regions
@@ -157,6 +157,64 @@ class TestResampleQualityProfiles:
         assert buf._soxr_quality == "HQ"
 
 
+class TestAudioBufferStorage:
+    """Tests for the preallocated float32 sample storage."""
+
+    def test_chunks_preserve_sample_order_across_relocations(self):
+        buf = AudioBuffer(sample_rate=1000, encoding="pcm_f32le", chunk_duration_ms=10)
+        samples = np.arange(5003, dtype=np.float32)
+
+        for piece in np.array_split(samples, 37):
+            buf.add(piece.tobytes())
+        chunks = _drain_chunks(buf)
+        remaining = buf.flush()
+
+        np.testing.assert_array_equal(np.concatenate([*chunks, remaining]), samples)
+        assert buf.flush() is None
+
+    def test_returned_chunks_are_not_overwritten_by_later_writes(self):
+        buf = AudioBuffer(sample_rate=1000, encoding="pcm_f32le", chunk_duration_ms=10)
+        buf.add(np.full(10, 1.0, dtype=np.float32).tobytes())
+        first = buf.get_chunk()
+
+        # Enough data to force the storage to relocate several times
+        for value in range(2, 200):
+            buf.add(np.full(10, float(value), dtype=np.float32).tobytes())
+            buf.get_chunk()
+
+        assert first.dtype == np.float32
+        np.testing.assert_array_equal(first, np.ones(10, dtype=np.float32))
+
+    def test_large_add_grows_storage(self):
+        buf = AudioBuffer(sample_rate=1000, encoding="pcm_f32le", chunk_duration_ms=10)
+        samples = np.linspace(-1, 1, 1000 * 30, dtype=np.float32)
+
+        buf.add(samples.tobytes())
+
+        assert buf.get_buffered_duration() == pytest.approx(30.0)
+        np.testing.assert_array_equal(buf.flush(), samples)
+
+    def test_multichannel_chunks_hold_interleaved_frames(self):
+        buf = AudioBuffer(
+            sample_rate=1000, encoding="pcm_s16le", channels=2, chunk_duration_ms=10
+        )
+        buf.add(np.zeros(30, dtype=np.int16).tobytes())  # 15 stereo frames
+
+        chunk = buf.get_chunk()
+
+        assert chunk is not None and len(chunk) == 20
+        assert buf.get_buffered_duration() == pytest.approx(0.005)
+        assert buf.get_total_duration() == pytest.approx(0.015)
+
+    def test_clear_discards_buffered_audio(self):
+        buf = AudioBuffer(sample_rate=1000, encoding="pcm_f32le", chunk_duration_ms=10)
+        buf.add(np.zeros(25, dtype=np.float32).tobytes())
+
+        assert buf.clear() == pytest.approx(0.025)
+        assert buf.get_chunk() is None
+        assert buf.flush() is None
+
+
 # --- helpers ---
 
 
@@ -0,0 +1,143 @@
+"""Unit tests for incremental partial-result decoding."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from dalston.common.pipeline_types import Transcript
+from dalston.realtime_sdk.partials import IncrementalPartialDecoder
+from dalston.realtime_sdk.session import SessionConfig, SessionHandler
+
+SAMPLE_RATE = 16000
+WORD_S = 0.4
+CHUNK_S = 0.1
+
+
+def _speech(seconds: float) -> list[np.ndarray]:
+    """100 ms chunks whose samples carry the index of the word spoken."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = np.floor(t / WORD_S).astype(np.float32)
+    step = int(CHUNK_S * SAMPLE_RATE)
+    return [audio[i : i + step] for i in range(0, len(audio), step)]
+
+
+def _recognize(audio: np.ndarray, _params=None) -> Transcript:
+    """Fake ASR: one word per run of equal samples; cut-off words get a '?'."""
+    edges = np.flatnonzero(np.diff(audio)) + 1
+    bounds = [0, *edges.tolist(), len(audio)]
+    words = []
+    for lo, hi in zip(bounds, bounds[1:], strict=False):
+        text = f"w{int(audio[lo])}"
+        if (hi - lo) / SAMPLE_RATE < WORD_S - 1e-6:
+            text += "?"
+        words.append({"text": text, "start": lo / SAMPLE_RATE, "end": hi / SAMPLE_RATE})
+    return Transcript.model_validate(
+        {
+            "text": " ".join(w["text"] for w in words),
+            "segments": [
+                {
+                    "start": 0.0,
+                    "end": len(audio) / SAMPLE_RATE,
+                    "text": "",
+                    "words": words,
+                }
+            ]
+            if words
+            else [],
+            "language": "en",
+            "engine_id": "test",
+        }
+    )
+
+
+def _run(decoder: IncrementalPartialDecoder, seconds: float, every: int = 5):
+    chunks = _speech(seconds)
+    texts, windows = [], []
+    for n in range(every, len(chunks) + 1, every):
+        window = decoder.window(chunks[:n])
+        windows.append(len(window.audio) / SAMPLE_RATE)
+        texts.append(decoder.update(window, _recognize(window.audio)))
+    return texts, windows
+
+
+class TestIncrementalPartialDecoder:
+    def test_partials_match_full_decode(self) -> None:
+        decoder = IncrementalPartialDecoder(SAMPLE_RATE)
+        texts, _ = _run(decoder, 6.0)
+
+        full = _recognize(np.concatenate(_speech(6.0))).text
+        assert texts[-1] == full
+        assert decoder.committed_text.startswith("w0 w1 w2")
+
+    def test_window_stays_flat_for_long_utterances(self) -> None:
+        _, short = _run(IncrementalPartialDecoder(SAMPLE_RATE), 5.0)
+        _, long = _run(IncrementalPartialDecoder(SAMPLE_RATE), 60.0)
+
+        assert max(long) <= 2.5
+        assert max(long) <= max(short) + 0.5
+
+    def test_unstable_tail_is_committed_at_max_window(self) -> None:
+        decoder = IncrementalPartialDecoder(SAMPLE_RATE, max_window_s=4.0)
+        chunks = _speech(20.0)
+        for n in range(5, len(chunks) + 1, 5):
+            window = decoder.window(chunks[:n])
+            assert len(window.audio) / SAMPLE_RATE <= 4.0 + 1e-6
+            # Every decode disagrees with the previous one
+            noisy = _recognize(window.audio + np.float32(n * 1000))
+            decoder.update(window, noisy)
+
+    def test_text_without_timings_spans_window(self) -> None:
+        decoder = IncrementalPartialDecoder(SAMPLE_RATE)
+        window = decoder.window(_speech(1.0))
+        result = Transcript(text="hello", segments=[], language="en", engine_id="t")
+
+        assert decoder.update(window, result) == "hello"
+
+    def test_reset_forgets_utterance(self) -> None:
+        decoder = IncrementalPartialDecoder(SAMPLE_RATE)
+        _run(decoder, 3.0)
+        decoder.reset()
+
+        assert decoder.committed_text == ""
+        assert decoder.window(_speech(1.0)).offset_s == 0.0
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent_messages: list[str] = []
+
+    async def send(self, payload: str) -> None:
+        self.sent_messages.append(payload)
+
+
+def test_session_skips_partials_when_behind() -> None:
+    calls: list[int] = []
+
+    def transcribe(audio, params):
+        calls.append(len(audio))
+        return _recognize(audio)
+
+    ws = _FakeWebSocket()
+    handler = SessionHandler(
+        websocket=ws,
+        config=SessionConfig(
+            session_id="sess_test",
+            enable_vad=False,
+            max_utterance_duration=0.0,
+            store_audio=False,
+            store_transcript=False,
+        ),
+        transcribe_fn=transcribe,
+        supports_native_streaming=True,
+    )
+    handler._speech_audio_buffer = _speech(2.0)
+
+    asyncio.run(handler._send_partial_result())
+    assert len(calls) == 1
+    assert "transcript.partial" in ws.sent_messages[-1]
+
+    handler._received_audio_seconds = handler.config.lag_warning_seconds
+    asyncio.run(handler._send_partial_result())
+    assert len(calls) == 1
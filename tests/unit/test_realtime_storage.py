@@ -3,7 +3,9 @@
 Tests the M24 audio and transcript persistence functionality.
 """
 
+import io
 import json
+import wave
 from unittest.mock import AsyncMock
 
 import pytest
@@ -81,11 +83,6 @@ class TestAudioRecorder:
         client.create_multipart_upload.return_value = {"UploadId": "upload-123"}
         client.upload_part.return_value = {"ETag": '"abc123"'}
         client.complete_multipart_upload.return_value = {}
-        client.get_object.return_value = {
-            "Body": AsyncMock(read=AsyncMock(return_value=b"\x00" * 100))
-        }
-        client.put_object.return_value = {}
-        client.delete_object.return_value = {}
         return client
 
     @pytest.mark.asyncio
@@ -101,8 +98,8 @@ class TestAudioRecorder:
 
         mock_s3_client.create_multipart_upload.assert_called_once_with(
             Bucket="test-bucket",
-            Key="sessions/sess_123/audio.raw",
-            ContentType="application/octet-stream",
+            Key="sessions/sess_123/audio.wav",
+            ContentType="audio/wav",
         )
         assert recorder._started is True
         assert recorder._upload_id == "upload-123"
@@ -136,15 +133,22 @@ class TestAudioRecorder:
         recorder.FLUSH_THRESHOLD = 1000
         await recorder.start()
 
-        # Write enough data to trigger flush
+        # The first 1000 bytes are held back for the header part; the
+        # next full buffer is uploaded as part 2.
         await recorder.write(b"\x00" * 1500)
+        mock_s3_client.upload_part.assert_not_called()
+
+        await recorder.write(b"\x00" * 500)
 
         mock_s3_client.upload_part.assert_called_once()
+        assert mock_s3_client.upload_part.call_args.kwargs["PartNumber"] == 2
         assert len(recorder._parts) == 1
+        assert len(recorder._head) == 1000
+        assert len(recorder._buffer) == 0
 
     @pytest.mark.asyncio
     async def test_finalize_completes_upload(self, mock_s3_client):
-        """finalize() completes multipart upload and converts to WAV."""
+        """finalize() uploads the header part and completes the upload."""
         recorder = AudioRecorder(
             session_id="sess_123",
             s3_client=mock_s3_client,
@@ -158,8 +162,57 @@ class TestAudioRecorder:
 
         assert uri == "s3://test-bucket/sessions/sess_123/audio.wav"
         mock_s3_client.complete_multipart_upload.assert_called_once()
-        mock_s3_client.put_object.assert_called_once()  # WAV file
-        mock_s3_client.delete_object.assert_called_once()  # Raw file deleted
+        parts = mock_s3_client.complete_multipart_upload.call_args.kwargs[
+            "MultipartUpload"
+        ]["Parts"]
+        assert [part["PartNumber"] for part in parts] == [1, 2]
+        mock_s3_client.get_object.assert_not_called()
+        mock_s3_client.put_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_uploaded_parts_form_a_valid_wav(self, mock_s3_client):
+        """Parts joined in order are a WAV whose header covers all audio."""
+        bodies: dict[int, bytes] = {}
+
+        async def upload_part(**kwargs):
+            bodies[kwargs["PartNumber"]] = kwargs["Body"]
+            return {"ETag": f'"{kwargs["PartNumber"]}"'}
+
+        mock_s3_client.upload_part.side_effect = upload_part
+        recorder = AudioRecorder(
+            session_id="sess_123",
+            s3_client=mock_s3_client,
+            bucket="test-bucket",
+        )
+        recorder.FLUSH_THRESHOLD = 1000
+        await recorder.start()
+        audio = bytes(range(256)) * 20
+        for offset in range(0, len(audio), 320):
+            await recorder.write(audio[offset : offset + 320])
+            # Memory stays bounded whatever the session length
+            assert len(recorder._head) + len(recorder._buffer) < 2 * 1000 + 320
+
+        await recorder.finalize()
+
+        wav_bytes = b"".join(bodies[n] for n in sorted(bodies))
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.readframes(wav_file.getnframes()) == audio
+
+    @pytest.mark.asyncio
+    async def test_finalize_without_audio_aborts_upload(self, mock_s3_client):
+        """finalize() aborts the multipart upload when nothing was written."""
+        recorder = AudioRecorder(
+            session_id="sess_123",
+            s3_client=mock_s3_client,
+            bucket="test-bucket",
+        )
+        await recorder.start()
+
+        assert await recorder.finalize() is None
+        mock_s3_client.abort_multipart_upload.assert_called_once()
+        mock_s3_client.complete_multipart_upload.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_finalize_returns_none_if_no_data(self, mock_s3_client):
@@ -188,7 +241,7 @@ class TestAudioRecorder:
 
         mock_s3_client.abort_multipart_upload.assert_called_once_with(
             Bucket="test-bucket",
-            Key="sessions/sess_123/audio.raw",
+            Key="sessions/sess_123/audio.wav",
             UploadId="upload-123",
         )
 
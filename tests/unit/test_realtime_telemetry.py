@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -171,7 +171,7 @@ class TestRealtimeVADEndpointSpans:
         mock_vad_result.speech_audio = np.zeros(8000, dtype=np.float32)
 
         handler._vad = MagicMock()
-        handler._vad.process_chunk.return_value = mock_vad_result
+        handler._vad.process_chunk_async = AsyncMock(return_value=mock_vad_result)
         handler._vad.is_speaking = False
 
         with patch(
@@ -192,7 +192,7 @@ class TestRealtimeVADEndpointSpans:
         mock_vad_result.event = "speech_start"
 
         handler._vad = MagicMock()
-        handler._vad.process_chunk.return_value = mock_vad_result
+        handler._vad.process_chunk_async = AsyncMock(return_value=mock_vad_result)
         handler._vad.is_speaking = True
 
         with patch(
@@ -0,0 +1,99 @@
+"""Tests for cross-session batching of realtime ASR inference."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from dalston.common.pipeline_types import Transcript, TranscriptionRequest
+from dalston.realtime_sdk.batching import TranscribeBatcher
+
+
+class _FakeBatchModel:
+    """Echoes each utterance's length and records batch sizes."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[int, str | None]] = []
+
+    def __call__(
+        self, audios: list[np.ndarray], params: TranscriptionRequest
+    ) -> list[Transcript]:
+        self.batches.append((len(audios), params.loaded_model_id))
+        return [
+            Transcript(text=str(len(audio)), segments=[], language="en", engine_id="x")
+            for audio in audios
+        ]
+
+
+def _audio(n: int) -> np.ndarray:
+    return np.zeros(n, dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_utterances_share_a_batch() -> None:
+    model = _FakeBatchModel()
+    batcher = TranscribeBatcher(model, max_wait_ms=20)
+    params = TranscriptionRequest(loaded_model_id="m")
+
+    try:
+        results = await asyncio.gather(
+            *(batcher.transcribe(_audio(100 + i), params) for i in range(6))
+        )
+    finally:
+        await batcher.close()
+
+    # Each session gets its own utterance's result back
+    assert [r.text for r in results] == [str(100 + i) for i in range(6)]
+    assert model.batches == [(6, "m")]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_params_and_max_batch() -> None:
+    model = _FakeBatchModel()
+    batcher = TranscribeBatcher(model, max_wait_ms=20, max_batch=2)
+    a = TranscriptionRequest(loaded_model_id="a")
+    b = TranscriptionRequest(loaded_model_id="b")
+
+    try:
+        await asyncio.gather(
+            *(batcher.transcribe(_audio(10), a) for _ in range(3)),
+            batcher.transcribe(_audio(10), b),
+        )
+    finally:
+        await batcher.close()
+
+    assert sorted(model.batches) == [(1, "a"), (1, "b"), (2, "a")]
+
+
+@pytest.mark.asyncio
+async def test_model_errors_reach_every_waiting_session() -> None:
+    def failing(audios, params):
+        raise RuntimeError("decode failed")
+
+    batcher = TranscribeBatcher(failing, max_wait_ms=5)
+    params = TranscriptionRequest()
+
+    try:
+        results = await asyncio.gather(
+            batcher.transcribe(_audio(10), params),
+            batcher.transcribe(_audio(10), params),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.close()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_from_env(monkeypatch) -> None:
+    monkeypatch.setenv("DALSTON_REALTIME_ASR_BATCH_WAIT_MS", "25")
+    monkeypatch.setenv("DALSTON_REALTIME_ASR_BATCH_MAX", "4")
+    batcher = TranscribeBatcher.from_env(_FakeBatchModel())
+    assert batcher is not None
+    assert batcher.max_wait_s == pytest.approx(0.025)
+    assert batcher.max_batch == 4
+
+    monkeypatch.setenv("DALSTON_REALTIME_ASR_BATCH", "false")
+    assert TranscribeBatcher.from_env(_FakeBatchModel()) is None
@@ -339,6 +339,7 @@ class TestFailTask:
         # Create mock task model
         mock_task = MagicMock()
         mock_task.status = TaskStatus.RUNNING.value
+        mock_task.job_id = uuid4()
         mock_task.error = None
         mock_task.completed_at = None
 
@@ -363,7 +364,7 @@ class TestFailTask:
 
         with patch(
             "dalston.orchestrator.scanner.publish_event", new_callable=AsyncMock
-        ):
+        ) as mock_publish:
             result = await scanner._fail_task(
                 task_id=str(task_id),
                 queue_id="transcribe",
@@ -374,6 +375,8 @@ class TestFailTask:
         assert result is True
         assert mock_task.status == TaskStatus.FAILED.value
         assert mock_task.error == "Engine crashed"
+        # job_id keeps the event in its job's dispatcher lane
+        assert mock_publish.call_args.args[2]["job_id"] == str(mock_task.job_id)
 
     @pytest.mark.asyncio
     async def test_skips_non_running_task(self, mock_redis):
@@ -479,6 +482,7 @@ class TestWaitEngineTimeoutScan:
         mock_task = MagicMock()
         mock_task.status = TaskStatus.READY.value
         mock_task.engine_id = "whisper-cpu"
+        mock_task.job_id = uuid4()
 
         class MockSession:
             async def get(self, model, key):
@@ -504,6 +508,7 @@ class TestWaitEngineTimeoutScan:
         assert timed_out == 1
         mock_publish.assert_called_once()
         assert mock_publish.call_args.args[1] == "task.wait_timeout"
+        assert mock_publish.call_args.args[2]["job_id"] == str(mock_task.job_id)
         mock_redis.xdel.assert_called_once()
 
     @pytest.mark.asyncio
@@ -0,0 +1,237 @@
+"""Tests for bulk task queueing and DAG persistence on job.created."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.sql.dml import Insert, Update
+
+from dalston.common.models import JobStatus, Task, TaskStatus
+from dalston.common.streams_types import WAITING_ENGINE_TASKS_KEY
+from dalston.orchestrator.exceptions import EngineUnavailableError
+from dalston.orchestrator.scheduler import queue_tasks
+
+
+class _Settings:
+    s3_bucket = "test-bucket"
+    engine_unavailable_behavior = "fail_fast"
+    engine_wait_timeout_seconds = 300
+
+
+class _Pipeline:
+    """Records queued commands; XADD results are synthetic message IDs."""
+
+    def __init__(self, log: list[list[tuple[str, tuple, dict]]]) -> None:
+        self.commands: list[tuple[str, tuple, dict]] = []
+        log.append(self.commands)
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [
+            f"{i}-0" if name == "xadd" else 1
+            for i, (name, _, _) in enumerate(self.commands)
+        ]
+
+
+def _redis(pipelines: list) -> MagicMock:
+    redis = MagicMock()
+    redis.hgetall = AsyncMock(return_value={})
+    redis.xgroup_create = AsyncMock()
+    redis.pipeline = MagicMock(side_effect=lambda transaction: _Pipeline(pipelines))
+    return redis
+
+
+def _channel_tasks(job_id, channels: int) -> list[Task]:
+    return [
+        Task(
+            id=uuid4(),
+            job_id=job_id,
+            stage=f"transcribe_ch{channel}",
+            engine_id="faster-whisper",
+            status=TaskStatus.READY,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            config={"language": "en"},
+        )
+        for channel in range(channels)
+    ]
+
+
+def _catalog() -> MagicMock:
+    catalog = MagicMock()
+    catalog.get_engine = MagicMock(return_value=None)
+    return catalog
+
+
+@pytest.fixture
+def s3():
+    client = MagicMock()
+    client.put_object = AsyncMock()
+    opened: list[MagicMock] = []
+
+    @asynccontextmanager
+    async def get_s3_client(settings):
+        opened.append(client)
+        yield client
+
+    with patch("dalston.orchestrator.scheduler.get_s3_client", get_s3_client):
+        yield client, opened
+
+
+@pytest.mark.asyncio
+async def test_queue_tasks_batches_s3_and_redis_writes(s3) -> None:
+    client, opened = s3
+    pipelines: list = []
+    redis = _redis(pipelines)
+    registry = MagicMock()
+    registry.is_engine_available = AsyncMock(return_value=True)
+    tasks = _channel_tasks(uuid4(), channels=4)
+
+    await queue_tasks(redis, tasks, _Settings(), registry, catalog=_catalog())
+
+    # One S3 client for all request.json writes, one artifact index read
+    assert len(opened) == 1
+    assert client.put_object.await_count == 4
+    redis.hgetall.assert_awaited_once()
+
+    # Metadata and stream entries in one transaction, message IDs after
+    queue_commands, message_id_commands = pipelines
+    assert [name for name, _, _ in queue_commands] == ["hset", "expire", "xadd"] * 4
+    first_metadata = queue_commands[0][2]["mapping"]
+    assert first_metadata["stage"] == "transcribe_ch0"
+    assert first_metadata["request_bindings_json"] == "[]"
+    assert [kwargs["mapping"] for _, _, kwargs in message_id_commands] == [
+        {"stream_message_id": "2-0"},
+        {"stream_message_id": "5-0"},
+        {"stream_message_id": "8-0"},
+        {"stream_message_id": "11-0"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queue_tasks_tracks_waiting_tasks(s3) -> None:
+    pipelines: list = []
+    redis = _redis(pipelines)
+    registry = MagicMock()
+    registry.is_engine_available = AsyncMock(return_value=False)
+    settings = _Settings()
+    settings.engine_unavailable_behavior = "wait"
+    tasks = _channel_tasks(uuid4(), channels=2)
+
+    with patch(
+        "dalston.orchestrator.scheduler.publish_engine_needed", new_callable=AsyncMock
+    ):
+        await queue_tasks(redis, tasks, settings, registry, catalog=_catalog())
+
+    queue_commands, message_id_commands = pipelines
+    sadds = [args for name, args, _ in queue_commands if name == "sadd"]
+    assert sadds == [(WAITING_ENGINE_TASKS_KEY, str(task.id)) for task in tasks]
+    assert [kwargs["mapping"] for _, _, kwargs in message_id_commands] == [
+        {"stream_message_id": "3-0"},
+        {"stream_message_id": "7-0"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queue_tasks_checks_every_task_before_writing(s3) -> None:
+    client, _ = s3
+    pipelines: list = []
+    redis = _redis(pipelines)
+    registry = MagicMock()
+    registry.is_engine_available = AsyncMock(side_effect=[True, False])
+    tasks = _channel_tasks(uuid4(), channels=2)
+
+    with (
+        patch(
+            "dalston.orchestrator.scheduler._build_error_details",
+            new_callable=AsyncMock,
+        ),
+        pytest.raises(EngineUnavailableError),
+    ):
+        await queue_tasks(redis, tasks, _Settings(), registry, catalog=_catalog())
+
+    client.put_object.assert_not_awaited()
+    assert pipelines == []
+
+
+@pytest.mark.asyncio
+async def test_job_created_inserts_dag_in_bulk_and_queues_roots() -> None:
+    from dalston.orchestrator.handlers import handle_job_created
+
+    job_id = uuid4()
+    job = MagicMock(
+        id=job_id,
+        status=JobStatus.PENDING.value,
+        audio_uri="s3://dalston/test.wav",
+        parameters={},
+        audio_format="wav",
+        audio_duration=12.0,
+        audio_sample_rate=16000,
+        audio_channels=2,
+        audio_bit_depth=16,
+    )
+    prepare = Task(
+        id=uuid4(),
+        job_id=job_id,
+        stage="prepare",
+        engine_id="audio-prepare",
+        status=TaskStatus.PENDING,
+        request_uri="s3://dalston/test.wav",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+    transcribes = [
+        task.model_copy(
+            update={"status": TaskStatus.PENDING, "dependencies": [prepare.id]}
+        )
+        for task in _channel_tasks(job_id, channels=2)
+    ]
+
+    db = AsyncMock()
+    db.get = AsyncMock(return_value=job)
+    no_existing_tasks = MagicMock()
+    no_existing_tasks.scalar_one_or_none.return_value = None
+    db.execute = AsyncMock(return_value=no_existing_tasks)
+
+    with (
+        patch("dalston.orchestrator.handlers.get_catalog", return_value=MagicMock()),
+        patch(
+            "dalston.orchestrator.handlers.build_task_dag",
+            new_callable=AsyncMock,
+            return_value=[prepare, *transcribes],
+        ),
+        patch(
+            "dalston.orchestrator.handlers.queue_tasks", new_callable=AsyncMock
+        ) as mock_queue_tasks,
+    ):
+        await handle_job_created(
+            job_id=job_id,
+            db=db,
+            redis=AsyncMock(),
+            settings=MagicMock(),
+            registry=MagicMock(),
+        )
+
+    statements = [call.args[0] for call in db.execute.await_args_list[1:]]
+    task_insert, dependency_insert, mark_ready = statements
+    assert isinstance(task_insert, Insert)
+    assert len(task_insert._multi_values[0]) == 3
+    assert isinstance(dependency_insert, Insert)
+    assert len(dependency_insert._multi_values[0]) == 2
+    assert isinstance(mark_ready, Update)
+    db.add.assert_not_called()
+    assert job.status == JobStatus.RUNNING.value
+
+    queued = mock_queue_tasks.await_args.kwargs
+    assert queued["tasks"] == [prepare]
+    assert queued["audio_metadata"][prepare.id]["channels"] == 2
@@ -0,0 +1,109 @@
+"""Unit tests for SpeakerTurnIndex.
+
+The index must answer exactly like a linear scan over the input list,
+including which turn wins a tie, so these tests compare it against
+straightforward reference scans on random and hand-picked layouts.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from dalston.common.pipeline_types import SpeakerTurn
+from dalston.common.speaker_turns import SpeakerTurnIndex
+
+
+def _linear_best_overlap(start: float, end: float, turns: list[SpeakerTurn]):
+    best, best_overlap = None, 0.0
+    for turn in turns:
+        overlap = max(0.0, min(end, turn.end) - max(start, turn.start))
+        if overlap > best_overlap:
+            best, best_overlap = turn.speaker, overlap
+    return best
+
+
+def _linear_nearest(at_time: float, turns: list[SpeakerTurn]):
+    nearest, nearest_distance = None, None
+    for turn in turns:
+        if turn.start <= at_time <= turn.end:
+            return turn.speaker
+        distance = turn.start - at_time if at_time < turn.start else at_time - turn.end
+        if nearest_distance is None or distance < nearest_distance:
+            nearest, nearest_distance = turn.speaker, distance
+    return nearest
+
+
+def _random_turns(rng: random.Random, count: int, *, on_grid: bool):
+    turns = []
+    for i in range(count):
+        if on_grid:  # coarse grid so equal starts/ends and ties are common
+            start = rng.randint(0, 40) / 2
+            end = start + rng.randint(0, 10) / 2
+        else:
+            start = rng.uniform(0, 20)
+            end = start + rng.uniform(0, 5)
+        turns.append(SpeakerTurn(start=start, end=end, speaker=f"S{i}"))
+    return turns
+
+
+class TestMatchesLinearScan:
+    @pytest.mark.parametrize("on_grid", [True, False])
+    def test_random_layouts(self, on_grid: bool) -> None:
+        rng = random.Random(7)
+        for _ in range(300):
+            turns = _random_turns(rng, rng.randint(0, 25), on_grid=on_grid)
+            index = SpeakerTurnIndex(turns)
+            for _ in range(20):
+                start = rng.randint(-2, 45) / 2 if on_grid else rng.uniform(-1, 22)
+                end = start + (rng.randint(0, 8) / 2 if on_grid else rng.uniform(0, 4))
+
+                assert index.best_overlap_speaker(start, end) == _linear_best_overlap(
+                    start, end, turns
+                )
+                assert index.nearest_speaker(start) == _linear_nearest(start, turns)
+                assert index.overlapping(start, end) == [
+                    t for t in turns if t.start < end and t.end > start
+                ]
+
+
+class TestTieBreaking:
+    def test_equal_overlap_prefers_earlier_input(self) -> None:
+        turns = [
+            SpeakerTurn(speaker="late", start=4.0, end=6.0),
+            SpeakerTurn(speaker="early", start=0.0, end=2.0),
+        ]
+        # Segment 1-5 overlaps both turns by exactly 1s
+        assert SpeakerTurnIndex(turns).best_overlap_speaker(1.0, 5.0) == "late"
+
+    def test_equidistant_gap_prefers_earlier_input(self) -> None:
+        turns = [
+            SpeakerTurn(speaker="after", start=6.0, end=8.0),
+            SpeakerTurn(speaker="before", start=0.0, end=5.0),
+        ]
+        assert SpeakerTurnIndex(turns).nearest_speaker(5.5) == "after"
+
+    def test_long_turn_containing_later_turns(self) -> None:
+        turns = [
+            SpeakerTurn(speaker="short", start=3.0, end=4.0),
+            SpeakerTurn(speaker="long", start=0.0, end=100.0),
+        ]
+        index = SpeakerTurnIndex(turns)
+        assert index.containing_speaker(3.5) == "short"
+        assert index.containing_speaker(50.0) == "long"
+        assert index.best_overlap_speaker(2.0, 10.0) == "long"
+
+
+class TestEmpty:
+    def test_empty_index(self) -> None:
+        index = SpeakerTurnIndex([])
+        assert not index
+        assert index.best_overlap_speaker(0.0, 1.0) is None
+        assert index.nearest_speaker(0.0) is None
+        assert index.containing_speaker(0.0) is None
+        assert index.overlapping(0.0, 1.0) == []
+
+    def test_of_reuses_existing_index(self) -> None:
+        index = SpeakerTurnIndex([SpeakerTurn(speaker="A", start=0.0, end=1.0)])
+        assert SpeakerTurnIndex.of(index) is index
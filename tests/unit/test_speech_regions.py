@@ -0,0 +1,113 @@
+"""Tests for the prepare-stage speech-regions artifact and its consumers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dalston.common.artifacts import MaterializedArtifact
+from dalston.engine_sdk import speech_regions
+from dalston.engine_sdk.diarize_chunking import compute_chunk_boundaries
+from dalston.engine_sdk.speech_regions import (
+    SPEECH_REGIONS_KIND,
+    load_speech_regions,
+    read_speech_regions,
+    write_speech_regions,
+)
+from dalston.engine_sdk.types import TaskRequest
+from dalston.engine_sdk.vad import SpeechSegment, VadChunker
+
+SEGMENTS = [SpeechSegment(0.5, 4.0), SpeechSegment(6.25, 9.0)]
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    speech_regions._memo.clear()
+    yield
+    speech_regions._memo.clear()
+
+
+def _request(path: Path, artifact_id: str = "prep:speech_regions") -> TaskRequest:
+    return TaskRequest(
+        task_id="t1",
+        job_id="j1",
+        audio_path=path.with_suffix(".wav"),
+        materialized_artifacts={
+            "speech_regions": MaterializedArtifact(
+                artifact_id=artifact_id,
+                kind=SPEECH_REGIONS_KIND,
+                local_path=path,
+            )
+        },
+    )
+
+
+class TestArtifact:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = write_speech_regions(tmp_path / "r.json", SEGMENTS, 10.0, VadChunker())
+        assert read_speech_regions(path, VadChunker()) == SEGMENTS
+
+    def test_unknown_version_is_ignored(self, tmp_path: Path) -> None:
+        path = write_speech_regions(tmp_path / "r.json", SEGMENTS, 10.0, VadChunker())
+        document = json.loads(path.read_text())
+        document["version"] = 99
+        path.write_text(json.dumps(document))
+        assert read_speech_regions(path) is None
+
+    def test_other_detection_settings_are_ignored(self, tmp_path: Path) -> None:
+        path = write_speech_regions(
+            tmp_path / "r.json", SEGMENTS, 10.0, VadChunker(vad_threshold=0.3)
+        )
+        assert read_speech_regions(path, VadChunker(vad_threshold=0.6)) is None
+        # Readers that do not care about detection settings still get them
+        assert read_speech_regions(path) == SEGMENTS
+
+
+class TestLoadSpeechRegions:
+    def test_missing_slot_returns_none(self, tmp_path: Path) -> None:
+        request = TaskRequest(task_id="t1", job_id="j1", audio_path=tmp_path / "a")
+        assert load_speech_regions(request) is None
+
+    def test_artifact_is_read_once_per_process(self, tmp_path: Path) -> None:
+        path = write_speech_regions(tmp_path / "r.json", SEGMENTS, 10.0, VadChunker())
+        request = _request(path)
+
+        assert load_speech_regions(request, VadChunker()) == SEGMENTS
+        path.unlink()
+        # OOM retry passes and redeliveries reuse the parsed regions
+        assert load_speech_regions(request, VadChunker()) == SEGMENTS
+
+    def test_unreadable_artifact_returns_none(self, tmp_path: Path) -> None:
+        path = tmp_path / "r.json"
+        path.write_text("{not json")
+        assert load_speech_regions(_request(path)) is None
+
+
+class TestDiarizeChunkBoundaries:
+    def test_chunk_end_moves_to_speech_start_inside_overlap(self) -> None:
+        # Chunks of 100 s with 30 s overlap: the first chunk would end at
+        # 100 s, in the middle of speech that starts at 85 s.
+        boundaries = compute_chunk_boundaries(
+            250.0,
+            max_chunk_s=100.0,
+            overlap_s=30.0,
+            min_chunk_s=10.0,
+            speech_regions=[(10.0, 60.0), (85.0, 120.0)],
+        )
+        assert boundaries[0] == (0.0, 85.0)
+        # The next chunk still starts before the moved end
+        assert boundaries[1][0] == 70.0
+
+    def test_speech_starting_before_overlap_keeps_end(self) -> None:
+        boundaries = compute_chunk_boundaries(
+            250.0,
+            max_chunk_s=100.0,
+            overlap_s=30.0,
+            min_chunk_s=10.0,
+            speech_regions=[(50.0, 120.0)],
+        )
+        assert boundaries == compute_chunk_boundaries(
+            250.0, max_chunk_s=100.0, overlap_s=30.0, min_chunk_s=10.0
+        )
@@ -781,7 +781,7 @@ class TestHandleTaskCompletedReplaySafety:
         mock_db_session.execute = AsyncMock(return_value=mock_update_result)
 
         with (
-            patch("dalston.orchestrator.handlers.queue_task", new_callable=AsyncMock),
+            patch("dalston.orchestrator.handlers.queue_tasks", new_callable=AsyncMock),
             patch(
                 "dalston.orchestrator.handlers._check_job_completion",
                 new_callable=AsyncMock,
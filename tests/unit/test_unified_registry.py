@@ -8,6 +8,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from redis.exceptions import ResponseError
 
 from dalston.common.registry import (
     HEARTBEAT_TIMEOUT_SECONDS,
@@ -155,6 +156,22 @@ class TestRecordSerialization:
         assert restored.loaded_model == original.loaded_model
         assert restored.capabilities is not None
         assert restored.capabilities.supports_word_timestamps is True
+        assert restored.rtf_ewma is None
+
+    def test_round_trip_rtf_ewma(self):
+        original = EngineRecord(
+            instance="fw-abc123",
+            engine_id="faster-whisper",
+            stage="transcribe",
+            status="idle",
+            interfaces=["batch"],
+            rtf_ewma=42.5,
+        )
+
+        restored = _mapping_to_record("fw-abc123", _record_to_mapping(original))
+
+        assert restored is not None
+        assert restored.rtf_ewma == 42.5
 
     def test_round_trip_realtime(self):
         now = datetime.now(UTC)
@@ -587,6 +604,27 @@ class TestUnifiedEngineRegistry:
             f"{UNIFIED_INSTANCE_KEY_PREFIX}fw-abc123", "status", "offline"
         )
 
+    @pytest.mark.asyncio
+    async def test_get_queue_depths(self, registry, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            return_value=[
+                [
+                    {"name": b"other", "lag": 9, "pending": 9},
+                    {"name": b"engines", "lag": 3, "pending": 2},
+                ],
+                ResponseError("no such key"),
+                [{"name": "engines", "lag": None, "pending": 1}],
+            ]
+        )
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        depths = await registry.get_queue_depths(["fw", "missing", "nemo", "fw"])
+
+        assert depths == {"fw": 5, "missing": 0, "nemo": 1}
+        pipe.xinfo_groups.assert_any_call("dalston:stream:fw")
+        assert pipe.xinfo_groups.call_count == 3
+
 
 # ---------------------------------------------------------------------------
 # UnifiedRegistryWriter (sync, client-side) tests
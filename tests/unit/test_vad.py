@@ -238,3 +238,159 @@ class TestVADProcessor:
 
         vad_processor._state = VADState.SPEECH
         assert vad_processor.state == VADState.SPEECH
+
+
+class _FakeSileroSession:
+    """Deterministic stand-in for the Silero ONNX graph.
+
+    Probability depends on the window, the carried context and the
+    recurrent state, so mis-threaded state changes the output.
+    """
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def run(self, _outputs, inputs):
+        x = inputs["input"]
+        state = inputs["state"]
+        self.batch_sizes.append(x.shape[0])
+        energy = np.abs(x).mean(axis=1)
+        new_state = state * 0.5 + energy[None, :, None]
+        prob = 1.0 / (1.0 + np.exp(-(energy * 4 + new_state[0, :, 0] - 1)))
+        return prob[:, None].astype(np.float32), new_state.astype(np.float32)
+
+
+def _future(done: bool = False) -> MagicMock:
+    future = MagicMock()
+    future.done.return_value = done
+    return future
+
+
+class TestVADBatcher:
+    """Tests for cross-session batched VAD scoring."""
+
+    @staticmethod
+    def _chunks(seed: int, n: int = 4) -> list[np.ndarray]:
+        rng = np.random.default_rng(seed)
+        return [
+            rng.uniform(-0.5, 0.5, 1600).astype(np.float32) * (i % 2) for i in range(n)
+        ]
+
+    def test_batched_scores_match_per_session_model(self):
+        from dalston.engine_sdk.silero_vad import SileroOnnxModel
+        from dalston.realtime_sdk.vad import VADBatcher, _PendingChunk, _split_windows
+
+        streams = {f"s{i}": self._chunks(i) for i in range(3)}
+
+        expected = {}
+        for sid, chunks in streams.items():
+            model = SileroOnnxModel(_FakeSileroSession())
+            expected[sid] = [
+                max(model(w, 16000) for w in _split_windows(c, 16000)) for c in chunks
+            ]
+
+        session = _FakeSileroSession()
+        batcher = VADBatcher(session)
+        actual = {sid: [] for sid in streams}
+        for step in range(4):
+            batch = [
+                _PendingChunk(sid, _split_windows(c[step], 16000), 16000, _future())
+                for sid, c in streams.items()
+            ]
+            for chunk, prob in zip(batch, batcher.score(batch), strict=True):
+                actual[chunk.stream_id].append(prob)
+
+        for sid in streams:
+            assert actual[sid] == pytest.approx(expected[sid], rel=1e-5)
+        # One model call per window step, covering every stream at once
+        assert set(session.batch_sizes) == {3}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_share_a_batch(self):
+        import asyncio
+
+        from dalston.realtime_sdk.vad import VADBatcher
+
+        session = _FakeSileroSession()
+        batcher = VADBatcher(session, max_wait_ms=20)
+        vads = [VADProcessor(batcher=batcher) for _ in range(8)]
+        audio = np.full(1600, 0.3, dtype=np.float32)
+
+        try:
+            results = await asyncio.gather(
+                *(vad.process_chunk_async(audio) for vad in vads)
+            )
+        finally:
+            await batcher.close()
+
+        assert all(r.event is None or r.event == "speech_start" for r in results)
+        assert session.batch_sizes == [8, 8, 8]
+
+    def test_release_drops_stream_state(self):
+        from dalston.realtime_sdk.vad import VADBatcher
+
+        batcher = VADBatcher(_FakeSileroSession())
+        vad = VADProcessor(batcher=batcher)
+        batcher._states[vad._stream_id] = np.ones((2, 128), dtype=np.float32)
+
+        vad.reset()
+
+        assert vad._stream_id not in batcher._states
+
+    def test_release_during_score_is_not_undone(self):
+        import threading
+
+        from dalston.realtime_sdk.vad import VADBatcher, _PendingChunk, _split_windows
+
+        class _BlockingSession(_FakeSileroSession):
+            def __init__(self) -> None:
+                super().__init__()
+                self.entered = threading.Event()
+                self.proceed = threading.Event()
+
+            def run(self, _outputs, inputs):
+                self.entered.set()
+                assert self.proceed.wait(timeout=5)
+                return super().run(_outputs, inputs)
+
+        session = _BlockingSession()
+        batcher = VADBatcher(session)
+        batcher._states["reset"] = np.ones((2, 128), dtype=np.float32)
+        windows = _split_windows(self._chunks(0, n=2)[1], 16000)
+        batch = [
+            _PendingChunk("ended", windows, 16000, _future()),
+            _PendingChunk("reset", windows, 16000, _future()),
+            _PendingChunk("kept", windows, 16000, _future()),
+            _PendingChunk("cancelled", windows, 16000, _future(done=True)),
+        ]
+
+        scorer = threading.Thread(target=batcher.score, args=(batch,))
+        scorer.start()
+        assert session.entered.wait(timeout=5)
+        batcher.release("ended")
+        batcher.release("reset")
+        session.proceed.set()
+        scorer.join(timeout=5)
+
+        # Released streams start fresh; the cancelled chunk never ran
+        assert set(batcher._states) == {"kept"}
+        assert set(batcher._contexts) == {"kept"}
+        assert set(session.batch_sizes) == {3}
+        assert batcher._released_during_score == []
+
+    def test_from_env_disabled(self, monkeypatch):
+        from dalston.realtime_sdk.vad import VADBatcher
+
+        monkeypatch.setenv("DALSTON_REALTIME_VAD_BATCH", "false")
+        assert VADBatcher.from_env() is None
+
+    def test_from_env_without_onnxruntime_falls_back(self, monkeypatch):
+        from dalston.realtime_sdk import vad as vad_module
+
+        monkeypatch.delenv("DALSTON_REALTIME_VAD_BATCH", raising=False)
+        monkeypatch.setattr(
+            vad_module,
+            "load_silero_session",
+            MagicMock(side_effect=RuntimeError("onnxruntime missing")),
+        )
+        assert vad_module.VADBatcher.from_env() is None
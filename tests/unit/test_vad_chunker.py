@@ -240,6 +240,32 @@ class TestSplit:
             assert c.audio_path.stat().st_size > 44  # WAV header is 44 bytes
 
 
+class TestSplitAudio:
+    def test_matches_split_without_writing_files(self, tmp_path: Path) -> None:
+        audio = tmp_path / "speech.wav"
+        _write_silent_wav(audio, duration_s=200.0)
+        spans = [(0.0, 50.0), (60.0, 100.0), (110.0, 170.0)]
+
+        chunker = VadChunker(max_chunk_duration_s=60.0)
+        _install_fake_vad(chunker, spans)
+        decoded, segments = chunker.load_and_detect(audio)
+        in_memory = chunker.split_audio(decoded, segments, start_offset_s=20.0)
+        on_disk = chunker.split(audio, tmp_path / "chunks", start_offset_s=20.0)
+
+        assert [(c.offset, c.duration) for c in in_memory] == [
+            (c.offset, c.duration) for c in on_disk
+        ]
+        for chunk in in_memory:
+            assert chunk.audio.dtype == np.float32
+            assert chunk.audio.size == int(round(chunk.duration * SAMPLE_RATE))
+            # Prepared WAVs are memory-mapped: chunks are int16 views
+            assert np.shares_memory(chunk.audio.samples, decoded.samples)
+
+    def test_no_speech_returns_empty(self) -> None:
+        chunker = VadChunker(max_chunk_duration_s=60.0)
+        assert chunker.split_audio(np.zeros(SAMPLE_RATE, np.float32), []) == []
+
+
 class TestAudioChunkDataclass:
     def test_fields(self) -> None:
         chunk = AudioChunk(audio_path=Path("/tmp/x.wav"), offset=1.5, duration=30.0)
@@ -0,0 +1,178 @@
+"""Unit tests for the columnar word encoding of transcribe output."""
+
+from __future__ import annotations
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dalston.engine_sdk.runner as runner_module
+from dalston.common.pipeline_types import AlignmentMethod, Transcript
+from dalston.common.transcript import assemble_transcript
+from dalston.common.word_columns import (
+    WordColumns,
+    encode_transcript_words,
+    expand_transcript_words,
+    is_columnar_transcript,
+)
+from dalston.engine_sdk.base import Engine
+from dalston.engine_sdk.runner import EngineRunner
+from dalston.engine_sdk.types import TaskResponse
+
+
+def _transcript_data() -> dict:
+    transcript = Transcript.model_validate(
+        {
+            "text": "Hello world. Bonjour",
+            "language": "en",
+            "engine_id": "faster-whisper",
+            "timestamp_granularity": "word",
+            "segments": [
+                {
+                    "start": 0.0,
+                    "end": 1.2,
+                    "text": "Hello world.",
+                    "metadata": {"avg_logprob": -0.2},
+                    "words": [
+                        {
+                            "text": "Hello",
+                            "start": 0.0,
+                            "end": 0.5,
+                            "confidence": 0.91,
+                            "alignment_method": "attention",
+                        },
+                        {
+                            "text": "world.",
+                            "start": 0.6,
+                            "end": 1.2,
+                            "metadata": {"logprob": -0.1},
+                            "characters": [{"char": "w", "start": 0.6, "end": 0.7}],
+                        },
+                    ],
+                },
+                {"start": 1.5, "end": 2.0, "text": "Bonjour", "language": "fr"},
+                {
+                    "start": 2.5,
+                    "end": 3.0,
+                    "text": "Hello",
+                    "words": [
+                        {"text": "Hello", "start": 2.5, "end": 3.0, "language": "en"}
+                    ],
+                },
+            ],
+        }
+    )
+    return transcript.model_dump(mode="json", exclude_none=False)
+
+
+class TestWordColumns:
+    def test_dict_round_trip_shares_string_table(self) -> None:
+        words = [
+            {"text": "the", "start": 0.0, "end": 0.1, "confidence": 0.5},
+            {"text": "the", "start": 0.2, "end": 0.3},
+        ]
+        columns = WordColumns.from_dict(
+            json.loads(json.dumps(WordColumns.from_words(words).to_dict()))
+        )
+
+        assert columns.strings == ["the"]
+        assert columns.to_dicts() == words
+
+    def test_unknown_version_is_rejected(self) -> None:
+        data = WordColumns.from_words([]).to_dict()
+        data["version"] = 99
+        with pytest.raises(ValueError, match="version"):
+            WordColumns.from_dict(data)
+
+
+class TestTranscriptEncoding:
+    def test_expand_restores_plain_words(self) -> None:
+        data = _transcript_data()
+        encoded = json.loads(json.dumps(encode_transcript_words(data)))
+
+        assert is_columnar_transcript(encoded)
+        assert "words" not in encoded["segments"][0]
+        expanded = expand_transcript_words(encoded)
+        assert Transcript.model_validate(expanded) == Transcript.model_validate(data)
+
+    def test_plain_data_passes_through_expand(self) -> None:
+        data = _transcript_data()
+        assert expand_transcript_words(data) is data
+
+    def test_expanded_words_keep_sparse_fields(self) -> None:
+        encoded = encode_transcript_words(_transcript_data())
+        parsed = Transcript.model_validate(expand_transcript_words(encoded))
+
+        assert parsed.segments[1].words is None
+        first, second = parsed.segments[0].words
+        assert first.alignment_method is AlignmentMethod.ATTENTION
+        assert second.characters[0].char == "w"
+        assert second.metadata == {"logprob": -0.1}
+
+    def test_assembly_output_is_unchanged(self) -> None:
+        data = _transcript_data()
+        stage_outputs = {
+            "transcribe": data,
+            "diarize": {
+                "turns": [
+                    {"speaker": "SPEAKER_00", "start": 0.0, "end": 1.4},
+                    {"speaker": "SPEAKER_01", "start": 1.4, "end": 3.0},
+                ],
+                "speakers": ["SPEAKER_00", "SPEAKER_01"],
+            },
+        }
+
+        def assemble(outputs: dict) -> dict:
+            result = assemble_transcript(
+                job_id="job",
+                stage_outputs=outputs,
+                speaker_detection="diarize",
+                word_timestamps_requested=True,
+            ).model_dump(mode="json")
+            result["metadata"].pop("created_at")
+            result["metadata"].pop("completed_at")
+            return result
+
+        columnar = {
+            **stage_outputs,
+            "transcribe": json.loads(json.dumps(encode_transcript_words(data))),
+        }
+        assert assemble(columnar) == assemble(stage_outputs)
+
+
+class _NoopEngine(Engine):
+    def process(self, input, ctx):
+        return TaskResponse(data={})
+
+
+@pytest.mark.parametrize(
+    ("flag", "stage", "columnar"),
+    [
+        ("true", "transcribe_ch1", True),
+        ("true", "align", False),
+        ("false", "transcribe", False),
+    ],
+)
+def test_runner_writes_columnar_words_when_enabled(
+    monkeypatch, flag: str, stage: str, columnar: bool
+) -> None:
+    env = {"DALSTON_ENGINE_ID": "engine", "DALSTON_COLUMNAR_WORDS": flag}
+    with patch.dict(os.environ, env):
+        runner = EngineRunner(_NoopEngine())
+    runner._redis = MagicMock()
+    uploads: list[dict] = []
+    monkeypatch.setattr(
+        runner_module.io, "upload_json", lambda payload, uri: uploads.append(payload)
+    )
+
+    runner._save_task_output(
+        task_id="task-1",
+        job_id="job-1",
+        output=TaskResponse(data=_transcript_data()),
+        processing_time=1.0,
+        stage=stage,
+    )
+
+    assert is_columnar_transcript(uploads[0]["data"]) is columnar